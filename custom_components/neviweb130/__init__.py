@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import requests
 import json
+import threading
+import time
 from datetime import timedelta
+from functools import partial
 
+import aiohttp
 import voluptuous as vol
 
 import homeassistant.helpers.config_validation as cv
+from homeassistant.core import SupportsResponse, callback
 from homeassistant.helpers import discovery
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
     CONF_USERNAME,
     CONF_EMAIL,
     CONF_PASSWORD,
     CONF_SCAN_INTERVAL,
+    EVENT_HOMEASSISTANT_STOP,
 )
 from homeassistant.util import Throttle
 
@@ -30,6 +43,34 @@ from .const import (
     CONF_NETWORK2,
     CONF_HOMEKIT_MODE,
     CONF_STAT_INTERVAL,
+    CONF_POOL_SIZE,
+    CONF_READ_RATE,
+    CONF_READ_BURST,
+    CONF_WRITE_RATE,
+    CONF_WRITE_BURST,
+    CONF_STAT_RATE,
+    CONF_STAT_BURST,
+    CONF_RETRY_ATTEMPTS,
+    CONF_RETRY_DELAY,
+    CONF_RETRY_BUDGET,
+    CONF_WARM_INTERVAL,
+    CONF_COLD_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_POLL_BUDGET,
+    CONF_RECORDER_MODE,
+    CONF_BREAKER_ERRORS,
+    CONF_BREAKER_THRESHOLD,
+    CONF_BREAKER_OPEN_TIME,
+    CONF_EXECUTOR_SIZE,
+    CONF_PARALLEL_UPDATES,
+    DEVICE_PARENT_ID,
+    PLATFORMS,
+    SIGNAL_DEVICES_DISCOVERED,
+    SERVICE_GET_DIAGNOSTICS,
+    SERVICE_RESYNC_ENERGY_STATISTICS,
+    STORAGE_VERSION,
+    STORAGE_KEY_INVENTORY,
     ATTR_INTENSITY,
     ATTR_ONOFF,
     ATTR_ONOFF2,
@@ -110,11 +151,45 @@ from .const import (
     MODE_MANUAL
 )
 
+from .breaker import Neviweb130CircuitBreaker
+from .capabilities import Neviweb130Capabilities
+from .coordinator import Neviweb130Coordinator, Neviweb130PollBudget
+from .executor import Neviweb130Executor
+from .limiter import Neviweb130RateLimiter, RateLimitedAdapter
+from .retry import Neviweb130RetryPolicy, error_code
+from .stats import Neviweb130StatsScheduler
+from .energy import Neviweb130EnergyImporter
+from .diagnostics import Neviweb130RecorderMeter, device_diagnostics
 from .schema import (
     CONFIG_SCHEMA,
+    GET_DIAGNOSTICS_SCHEMA,
+    RESYNC_ENERGY_STATISTICS_SCHEMA,
     SCAN_INTERVAL,
     HOMEKIT_MODE,
     STAT_INTERVAL,
+    POOL_SIZE,
+    READ_RATE,
+    READ_BURST,
+    WRITE_RATE,
+    WRITE_BURST,
+    STAT_RATE,
+    STAT_BURST,
+    RETRY_ATTEMPTS,
+    RETRY_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_BUDGET,
+    WARM_INTERVAL,
+    COLD_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    POLL_BUDGET,
+    RECORDER_MODE,
+    BREAKER_ERRORS,
+    BREAKER_THRESHOLD,
+    BREAKER_OPEN_TIME,
+    BREAKER_MAX_OPEN_TIME,
+    EXECUTOR_SIZE,
+    PARALLEL_UPDATES,
 )
 VERSION = '2.6.1'
 
@@ -126,44 +201,363 @@ LOGIN_URL = "{}/api/login".format(HOST)
 LOCATIONS_URL = "{}/api/locations?account$id=".format(HOST)
 GATEWAY_DEVICE_URL = "{}/api/devices?location$id=".format(HOST)
 DEVICE_DATA_URL = "{}/api/device/".format(HOST)
-
-
-def setup(hass, hass_config):
+SIGNATURE_RETRY_DELAY = 30
+SIGNATURE_RETRY_MAX_DELAY = 900
+# Neviweb ends a session after about 10 minutes without request, a cheap
+# request keeps an idle session alive.
+SESSION_KEEP_ALIVE = 480
+SESSION_CHECK_INTERVAL = timedelta(seconds=60)
+SESSION_RENEW_MIN_AGE = 30
+# Writes to the same device within this delay are sent in one request.
+WRITE_COALESCE_DELAY = 0.1
+
+
+async def async_setup(hass, hass_config):
     """Set up neviweb130."""
-    data = Neviweb130Data(hass_config[DOMAIN])
+    store = Store(hass, STORAGE_VERSION, STORAGE_KEY_INVENTORY)
+    inventory = await store.async_load()
+    # Blocking requests run on their own threads, a slow Neviweb must not
+    # hold the executor shared by every integration.
+    executor = Neviweb130Executor(hass,
+        hass_config[DOMAIN].get(CONF_EXECUTOR_SIZE, EXECUTOR_SIZE),
+        hass_config[DOMAIN].get(CONF_PARALLEL_UPDATES, PARALLEL_UPDATES))
+    data = await executor.async_run(Neviweb130Data, hass_config[DOMAIN],
+        inventory, executor)
+    data.executor = executor
+    data.neviweb130_async_client = Neviweb130AsyncClient(hass,
+        data.neviweb130_client, executor)
     hass.data[DOMAIN] = data
+    if data.neviweb130_client.from_cache:
+        # Entities are created from cached inventory, check it against
+        # Neviweb once HA is started.
+        async def async_reconcile(hass):
+            await async_reconcile_inventory(hass, data, store)
+        async_at_started(hass, async_reconcile)
+    else:
+        await store.async_save(data.neviweb130_client.get_inventory())
+        data.neviweb130_async_client.async_schedule_signature_retry()
 
     global SCAN_INTERVAL 
     SCAN_INTERVAL = hass_config[DOMAIN].get(CONF_SCAN_INTERVAL)
     _LOGGER.debug("Setting scan interval to: %s", SCAN_INTERVAL)
 
+    pool_size = hass_config[DOMAIN].get(CONF_POOL_SIZE, POOL_SIZE)
+    warm_interval = hass_config[DOMAIN].get(CONF_WARM_INTERVAL, WARM_INTERVAL)
+    cold_interval = hass_config[DOMAIN].get(CONF_COLD_INTERVAL, COLD_INTERVAL)
+    _LOGGER.debug("Setting warm attributes interval to: %s, cold " +
+        "attributes interval to: %s", warm_interval, cold_interval)
+    budget = Neviweb130PollBudget(SCAN_INTERVAL,
+        hass_config[DOMAIN].get(CONF_MIN_SCAN_INTERVAL, MIN_SCAN_INTERVAL),
+        hass_config[DOMAIN].get(CONF_MAX_SCAN_INTERVAL, MAX_SCAN_INTERVAL),
+        hass_config[DOMAIN].get(CONF_POLL_BUDGET, POLL_BUDGET))
+    _LOGGER.debug("Setting device poll interval between %s and %s sec",
+        budget.min_interval, budget.max_interval)
+    data.capabilities = Neviweb130Capabilities(hass)
+    await data.capabilities.async_load()
+    new_breaker = partial(Neviweb130CircuitBreaker,
+        set(hass_config[DOMAIN].get(CONF_BREAKER_ERRORS, BREAKER_ERRORS)),
+        hass_config[DOMAIN].get(CONF_BREAKER_THRESHOLD, BREAKER_THRESHOLD),
+        hass_config[DOMAIN].get(CONF_BREAKER_OPEN_TIME,
+            BREAKER_OPEN_TIME).total_seconds(),
+        BREAKER_MAX_OPEN_TIME.total_seconds())
+    data.coordinator = Neviweb130Coordinator(hass,
+        data.neviweb130_async_client, "neviweb130 gateway", budget,
+        data.capabilities, new_breaker, pool_size, warm_interval,
+        cold_interval)
+    data.coordinator2 = Neviweb130Coordinator(hass,
+        data.neviweb130_async_client, "neviweb130 gateway 2", budget,
+        data.capabilities, new_breaker, pool_size, warm_interval,
+        cold_interval)
+
+    @callback
+    def async_verify_write(device_id, attributes):
+        """Read back attributes written by a command."""
+        data.get_coordinator(device_id).async_verify(device_id, attributes)
+
+    data.neviweb130_async_client.write_listener = async_verify_write
+    # Writes of services go through the asyncio client to be coalesced,
+    # which reads them back
+    data.neviweb130_client.write_handler = \
+        data.neviweb130_async_client.queue_device_attributes
+
     global HOMEKIT_MODE
     HOMEKIT_MODE = hass_config[DOMAIN].get(CONF_HOMEKIT_MODE)
     _LOGGER.debug("Setting Homekit mode to: %s", HOMEKIT_MODE)
 
+    global RECORDER_MODE
+    RECORDER_MODE = hass_config[DOMAIN].get(CONF_RECORDER_MODE, RECORDER_MODE)
+    _LOGGER.debug("Setting recorder mode to: %s", RECORDER_MODE)
+    data.meter = Neviweb130RecorderMeter(hass)
+    data.meter.async_start()
+
     global STAT_INTERVAL
     STAT_INTERVAL = hass_config[DOMAIN].get(CONF_STAT_INTERVAL)
     _LOGGER.debug("Setting stat interval to: %s", STAT_INTERVAL)
+    data.stats = Neviweb130StatsScheduler(hass, data.neviweb130_async_client,
+        (data.coordinator, data.coordinator2), STAT_INTERVAL)
+    data.energy = Neviweb130EnergyImporter(hass)
+    await data.energy.async_load()
+    data.stats.history_listener = data.energy.async_import
+    data.stats.async_start()
+
+    def device_entities(entity_ids):
+        """Return device entities of both gateways, only those of
+        entity_ids if given."""
+        return [entity for coordinator in (data.coordinator, data.coordinator2)
+            for entity in coordinator.async_contexts()
+            if entity_ids is None or entity.entity_id in entity_ids]
+
+    @callback
+    def resync_energy_statistics_service(service):
+        """Clear imported energy statistics and import the history again."""
+        for entity in device_entities(service.data.get(ATTR_ENTITY_ID)):
+            if entity.energy_stats:
+                data.energy.async_reset(entity)
+                data.stats.async_refetch(entity)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESYNC_ENERGY_STATISTICS,
+        resync_energy_statistics_service,
+        schema=RESYNC_ENERGY_STATISTICS_SCHEMA,
+    )
+
+    @callback
+    def get_diagnostics_service(service):
+        """Return diagnostics of devices and of the integration."""
+        entities = device_entities(service.data.get(ATTR_ENTITY_ID))
+        return {
+            "devices": {entity.entity_id: device_diagnostics(hass, entity)
+                for entity in entities},
+            "polls": {coordinator.name: coordinator.get_stats()
+                for coordinator in (data.coordinator, data.coordinator2)},
+            "energy_stats": data.stats.get_stats(),
+            "capabilities": data.capabilities.get_stats(),
+            "recorder": data.meter.get_stats(len(device_entities(None))),
+            "executor": data.executor.get_stats(),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DIAGNOSTICS,
+        get_diagnostics_service,
+        schema=GET_DIAGNOSTICS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
 
-    discovery.load_platform(hass, 'climate', DOMAIN, {}, hass_config)
-    discovery.load_platform(hass, 'light', DOMAIN, {}, hass_config)
-    discovery.load_platform(hass, 'switch', DOMAIN, {}, hass_config)
-    discovery.load_platform(hass, 'sensor', DOMAIN, {}, hass_config)
-    discovery.load_platform(hass, 'valve', DOMAIN, {}, hass_config)
+    @callback
+    def async_stop_stats(event):
+        """Cancel energy statistics fetches and stop the Neviweb threads
+        on shutdown."""
+        data.stats.async_stop()
+        data.meter.async_stop()
+        data.executor.shutdown()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop_stats)
+
+    last_stats = data.neviweb130_client.get_stats()
+    last_async_stats = data.neviweb130_async_client.get_stats()
+    last_limiter_stats = data.neviweb130_client.limiter.get_stats()
+    last_retry_stats = data.neviweb130_client.retry_policy.get_stats()
+    last_poll_stats = {coordinator.name: coordinator.get_stats()
+        for coordinator in (data.coordinator, data.coordinator2)}
+
+    @callback
+    def log_http_stats(now):
+        """Log requests, new connections and request time for last scan interval."""
+        stats = data.neviweb130_client.get_stats()
+        async_stats = data.neviweb130_async_client.get_stats()
+        _LOGGER.debug("Neviweb http stats for last %s: requests=%s, " +
+            "new connections=%s, request time=%ss, logins=%s, " +
+            "async requests=%s, async request time=%ss, async writes=%s " +
+            "sent in %s requests, peak concurrent async requests=%s",
+            SCAN_INTERVAL,
+            stats["requests"] - last_stats["requests"],
+            stats["connections"] - last_stats["connections"],
+            round(stats["request_time"] - last_stats["request_time"], 3),
+            stats["logins"] - last_stats["logins"],
+            async_stats["requests"] - last_async_stats["requests"],
+            round(async_stats["request_time"] - last_async_stats["request_time"], 3),
+            async_stats["writes"] - last_async_stats["writes"],
+            async_stats["puts"] - last_async_stats["puts"],
+            data.neviweb130_async_client.pop_peak_concurrency())
+        limiter_stats = data.neviweb130_client.limiter.get_stats()
+        for kind, counters in limiter_stats.items():
+            last = last_limiter_stats[kind]
+            _LOGGER.debug("Neviweb rate limit for last %s: %s requests=%s, " +
+                "delayed=%s, delay=%ss", SCAN_INTERVAL, kind,
+                counters["requests"] - last["requests"],
+                counters["delayed"] - last["delayed"],
+                round(counters["delay"] - last["delay"], 3))
+        last_stats.update(stats)
+        last_async_stats.update(async_stats)
+        last_limiter_stats.update(limiter_stats)
+        retry_stats = data.neviweb130_client.retry_policy.get_stats()
+        _LOGGER.debug("Neviweb retries for last %s: retries=%s, given up=%s, " +
+            "refused by budget=%s, total retries by error: %s", SCAN_INTERVAL,
+            retry_stats["retries"] - last_retry_stats["retries"],
+            retry_stats["given_up"] - last_retry_stats["given_up"],
+            retry_stats["budget_exhausted"] - last_retry_stats["budget_exhausted"],
+            retry_stats["retries_by_code"])
+        last_retry_stats.update(retry_stats)
+        for coordinator in (data.coordinator, data.coordinator2):
+            poll_stats = coordinator.get_stats()
+            last = last_poll_stats[coordinator.name]
+            polls = poll_stats["polls"] - last["polls"]
+            requests = poll_stats["requests"] - last["requests"]
+            _LOGGER.debug("%s polls for last %s: polls=%s, requests=%s, " +
+                "requests per device poll=%s, attributes requested=%s, " +
+                "not due=%s, writes verified=%s, not applied by the " +
+                "device=%s, states written=%s, unchanged not written=%s, " +
+                "probes=%s, devices halted=%s, gateways offline=%s, " +
+                "devices suspended=%s",
+                coordinator.name, SCAN_INTERVAL, polls, requests,
+                round(requests / polls, 2) if polls else 0,
+                poll_stats["attributes_requested"] - last["attributes_requested"],
+                poll_stats["attributes_skipped"] - last["attributes_skipped"],
+                poll_stats["verified"] - last["verified"],
+                poll_stats["rollbacks"] - last["rollbacks"],
+                poll_stats["writes"] - last["writes"],
+                poll_stats["writes_suppressed"] - last["writes_suppressed"],
+                poll_stats["probes"] - last["probes"],
+                poll_stats["open_breakers"], poll_stats["offline_gateways"],
+                poll_stats["suspended_devices"])
+            last.update(poll_stats)
+        _LOGGER.debug("Device polls per hour at current intervals: %s",
+            budget.polls_per_hour())
+        executor_stats = data.executor.get_stats()
+        _LOGGER.debug("Neviweb threads since start (%s threads): jobs=%s, " +
+            "queued now=%s, highest queue=%s, waited for a thread=%s, " +
+            "mean wait=%s sec, highest wait=%s sec",
+            executor_stats["workers"], executor_stats["jobs"],
+            executor_stats["queued"], executor_stats["peak_queued"],
+            executor_stats["waited"], executor_stats["mean_wait"],
+            executor_stats["max_wait"])
+        energy_stats = data.stats.get_stats()
+        _LOGGER.debug("Energy stats requests since start: %s, failed: %s",
+            energy_stats["fetches"], energy_stats["failures"])
+        recorder_stats = data.meter.get_stats(len(device_entities(None)))
+        _LOGGER.debug("Recorder since start (%s mode): states=%s, bytes " +
+            "per device and day with every attribute=%s, recorded=%s",
+            RECORDER_MODE, recorder_stats["states"],
+            recorder_stats["full_bytes_per_device_day"],
+            recorder_stats["recorded_bytes_per_device_day"])
+
+    async_track_time_interval(hass, log_http_stats, SCAN_INTERVAL)
+
+    async def async_keep_session_alive(now):
+        """Send a request before Neviweb ends an idle session, instead of
+        logging in again and leaving the old session open."""
+        if data.neviweb130_client.idle_time() > SESSION_KEEP_ALIVE:
+            _LOGGER.debug("Keeping idle Neviweb session alive")
+            await data.neviweb130_async_client.async_keep_alive()
+
+    async_track_time_interval(hass, async_keep_session_alive,
+        SESSION_CHECK_INTERVAL)
+
+    for platform in PLATFORMS:
+        hass.async_create_task(
+            discovery.async_load_platform(hass, platform, DOMAIN, {}, hass_config)
+        )
 
     return True
 
+def _device_signature_key(device):
+    """Return what identifies entities and device info of a device."""
+    signature = device.get(ATTR_SIGNATURE)
+    if signature is None:
+        return None
+    return (signature.get("model"), signature.get("modelCfg"),
+        json.dumps(signature.get("softVersion"), sort_keys=True),
+        device.get("sku"), device.get("name"))
+
+async def async_reconcile_inventory(hass, data, store):
+    """Compare cached inventory with Neviweb, add new devices and save the
+    inventory if anything changed."""
+    client = data.neviweb130_client
+    cached = {}
+    for device in list(client.gateway_data) + list(client.gateway_data2):
+        cached[device["id"]] = _device_signature_key(device)
+    try:
+        await data.executor.async_run(client.refresh_inventory)
+    except PyNeviweb130Error as err:
+        _LOGGER.warning("Cannot refresh Neviweb inventory, keeping cached " +
+            "devices: %s", err)
+        return
+    added = [[], []]
+    changed = []
+    received = set()
+    for index, devices in enumerate((client.gateway_data,
+        client.gateway_data2)):
+        for device in devices:
+            received.add(device["id"])
+            key = _device_signature_key(device)
+            if cached.get(device["id"]) is None:
+                if key is not None:
+                    added[index].append(device)
+            elif key != cached[device["id"]]:
+                changed.append(device.get("name"))
+    removed = [device_id for device_id in cached if device_id not in received]
+    if added[0] or added[1]:
+        _LOGGER.info("Adding %s devices not found in cached inventory",
+            len(added[0]) + len(added[1]))
+        async_dispatcher_send(hass, SIGNAL_DEVICES_DISCOVERED, added[0],
+            added[1])
+    if changed:
+        _LOGGER.warning("Model, firmware or name changed in Neviweb for %s, " +
+            "restart Home Assistant to update them", changed)
+    if removed:
+        _LOGGER.warning("Devices %s are no longer in Neviweb, restart Home " +
+            "Assistant to remove them", removed)
+    if added[0] or added[1] or changed or removed or \
+        client.pending_signatures:
+        await store.async_save(client.get_inventory())
+    _LOGGER.debug("Cached inventory checked: %s added, %s changed, %s removed",
+        len(added[0]) + len(added[1]), len(changed), len(removed))
+    data.neviweb130_async_client.async_schedule_signature_retry()
+
 class Neviweb130Data:
     """Get the latest data and update the states."""
 
-    def __init__(self, config):
-        """Init the neviweb130 data object."""
+    def __init__(self, config, inventory=None, executor=None):
+        """Init the neviweb130 data object, blocking requests run in
+        executor."""
         # from pyneviweb130 import Neviweb130Client
         username = config.get(CONF_USERNAME)
         password = config.get(CONF_PASSWORD)
         network = config.get(CONF_NETWORK)
         network2 = config.get(CONF_NETWORK2)
-        self.neviweb130_client = Neviweb130Client(username, password, network, network2)
+        pool_size = config.get(CONF_POOL_SIZE, POOL_SIZE)
+        limiter = Neviweb130RateLimiter(
+            config.get(CONF_READ_RATE, READ_RATE),
+            config.get(CONF_READ_BURST, READ_BURST),
+            config.get(CONF_WRITE_RATE, WRITE_RATE),
+            config.get(CONF_WRITE_BURST, WRITE_BURST),
+            config.get(CONF_STAT_RATE, STAT_RATE),
+            config.get(CONF_STAT_BURST, STAT_BURST))
+        retry_policy = Neviweb130RetryPolicy(
+            config.get(CONF_RETRY_ATTEMPTS, RETRY_ATTEMPTS),
+            config.get(CONF_RETRY_DELAY, RETRY_DELAY),
+            RETRY_MAX_DELAY,
+            config.get(CONF_RETRY_BUDGET, RETRY_BUDGET),
+            config.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL).total_seconds())
+        self.neviweb130_client = Neviweb130Client(username, password, network,
+            network2, pool_size=pool_size, inventory=inventory,
+            limiter=limiter, retry_policy=retry_policy, executor=executor)
+        self.neviweb130_async_client = None
+        self.coordinator = None
+        self.coordinator2 = None
+        self.stats = None
+        self.energy = None
+        self.meter = None
+        self.capabilities = None
+
+    def get_coordinator(self, device_id):
+        """Return coordinator of the gateway where the device is registered."""
+        for device in self.neviweb130_client.gateway_data2:
+            if device["id"] == device_id:
+                return self.coordinator2
+        return self.coordinator
 
 # According to HA: 
 # https://developers.home-assistant.io/docs/en/creating_component_code_review.html
@@ -174,348 +568,35 @@ class Neviweb130Data:
 class PyNeviweb130Error(Exception):
     pass
 
-class Neviweb130Client(object):
-
-    def __init__(self, username, password, network, network2, timeout=REQUESTS_TIMEOUT):
-        """Initialize the client object."""
-        self._email = username
-        self._password = password
-        self._network_name = network
-        self._network_name2 = network2
-        self._gateway_id = None
-        self._gateway_id2 = None
-        self.gateway_data = {}
-        self.gateway_data2 = {}
-        self._headers = None
-        self._account = None
-        self._cookies = None
-        self._timeout = timeout
-        self.user = None
-
-        self.__post_login_page()
-        self.__get_network()
-        self.__get_gateway_data()
-
-    def update(self):
-        self.__get_gateway_data()
-
-    def reconnect(self):
-        self.__post_login_page()
-        self.__get_network()
-        self.__get_gateway_data()
-
-    def __post_login_page(self):
-        """Login to Neviweb."""
-        data = {"username": self._email, "password": self._password, 
-            "interface": "neviweb", "stayConnected": 1}
-        try:
-            raw_res = requests.post(LOGIN_URL, data=data, 
-                cookies = self._cookies, allow_redirects=False, 
-                timeout = self._timeout)
-        except OSError:
-            raise PyNeviweb130Error("Cannot submit login form")
-        if raw_res.status_code != 200:
-            raise PyNeviweb130Error("Cannot log in")
-
-        # Update session
-        self._cookies = raw_res.cookies
-        data = raw_res.json()
-        _LOGGER.debug("Login response: %s", data)
-        if "error" in data:
-            if data["error"]["code"] == "ACCSESSEXC":
-                _LOGGER.error("Too many active sessions. Close all neviweb130 " +
-                "sessions you have opened on other platform (mobile, browser" +
-                ", ...), wait a few minutes, then reboot Home Assistant.")
-            return False
-        else:
-            self.user = data["user"]
-            self._headers = {"Session-Id": data["session"]}
-            self._account = str(data["account"]["id"])
-            _LOGGER.debug("Successfully logged in to: %s", self._account)
-            return True
-
-    def __get_network(self):
-        """Get gateway id associated to the desired network."""
-        # Http request
-        try:
-            raw_res = requests.get(LOCATIONS_URL + self._account, headers=self._headers, 
-                cookies=self._cookies, timeout=self._timeout)
-            networks = raw_res.json()
-            _LOGGER.debug("Number of networks found on Neviweb: %s", len(networks))
-            _LOGGER.debug("networks: %s", networks)
-            if self._network_name == None and self._network_name2 == None: # Use 1st network found and second if found
-                self._gateway_id = networks[0]["id"]
-                self._network_name = networks[0]["name"]
-                _LOGGER.debug("Selecting %s as first network", self._network_name)
-                if len(networks) > 1:
-                    self._gateway_id2 = networks[1]["id"]
-                    self._network_name2 = networks[1]["name"]
-                    _LOGGER.debug("Selecting %s as second network", self._network_name2)
-            else:
-                for network in networks:
-                    if network["name"] == self._network_name:
-                        self._gateway_id = network["id"]
-                        _LOGGER.debug("Selecting %s network among: %s",self._network_name, networks)
-                        continue
-                    elif (network["name"] == self._network_name.capitalize()) or (network["name"] == self._network_name[0].lower()+self._network_name[1:]):
-                        self._gateway_id = network["id"]
-                        _LOGGER.debug("Please check first letter of your network name, In capital letter or not? Selecting %s network among: %s",
-                            self._network_name, networks)
-                        continue
-                    else:
-                        _LOGGER.debug("Your network name %s do not correspond to discovered network %s, skipping this one.... Please check your config if nothing is discovered.", self._network_name, network["name"])
-                    if self._network_name2 is not None:
-                        if network["name"] == self._network_name2:
-                            self._gateway_id2 = network["id"]
-                            _LOGGER.debug("Selecting %s network among: %s",
-                                self._network_name2, networks)
-                            continue
-                        elif (network["name"] == self._network_name2.capitalize()) or (network["name"] == self._network_name2[0].lower()+self._network_name2[1:]):
-                            self._gateway_id = network["id"]
-                            _LOGGER.debug("Please check first letter of your network2 name, In capital letter or not? Selecting %s network among: %s",
-                                self._network_name2, networks)
-                            continue
-                        else:
-                            _LOGGER.debug("Your network name %s do not correspond to discovered network %s, skipping this one...",
-                                self._network_name2, network["name"])
-
-        except OSError:
-            raise PyNeviweb130Error("Cannot get network")
-        # Update cookies
-        self._cookies.update(raw_res.cookies)
-        # Prepare data
-        self.gateway_data = raw_res.json()
-
-    def __get_gateway_data(self):
-        """Get gateway data."""
-        # Http request
-        try:
-            raw_res = requests.get(GATEWAY_DEVICE_URL + str(self._gateway_id),
-                headers=self._headers, cookies=self._cookies, 
-                timeout=self._timeout)
-            _LOGGER.debug("Received gateway data: %s", raw_res.json())
-        except OSError:
-            raise PyNeviweb130Error("Cannot get gateway data")
-        # Update cookies
-        self._cookies.update(raw_res.cookies)
-        # Prepare data
-        self.gateway_data = raw_res.json()
-        _LOGGER.debug("Gateway_data : %s", self.gateway_data)
-        if self._gateway_id2 is not None:
-            try:
-                raw_res2 = requests.get(GATEWAY_DEVICE_URL + str(self._gateway_id2),
-                    headers=self._headers, cookies=self._cookies, 
-                    timeout=self._timeout)
-                _LOGGER.debug("Received gateway data 2: %s", raw_res2.json())
-            except OSError:
-                raise PyNeviweb130Error("Cannot get gateway data 2")
-            # Prepare data
-            self.gateway_data2 = raw_res2.json()
-            _LOGGER.debug("Gateway_data2 : %s", self.gateway_data2)
-        for device in self.gateway_data:
-            data = self.get_device_attributes(device["id"], [ATTR_SIGNATURE])
-            if ATTR_SIGNATURE in data:
-                device[ATTR_SIGNATURE] = data[ATTR_SIGNATURE]
-            _LOGGER.debug("Received signature data: %s", data)
-        if self._gateway_id2 is not None:          
-            for device in self.gateway_data2:
-                data2 = self.get_device_attributes(device["id"], [ATTR_SIGNATURE])
-                if ATTR_SIGNATURE in data2:
-                    device[ATTR_SIGNATURE] = data2[ATTR_SIGNATURE]
-                _LOGGER.debug("Received signature data: %s", data2)
-#        _LOGGER.debug("Updated gateway data: %s", self.gateway_data) 
-#        _LOGGER.debug("Updated gateway data2: %s", self.gateway_data2)
-
-    def get_device_attributes(self, device_id, attributes):
-        """Get device attributes."""
-        # Prepare return
-        data = {}
-        # Http request
-        try:
-            raw_res = requests.get(DEVICE_DATA_URL + str(device_id) +
-                "/attribute?attributes=" + ",".join(attributes), 
-                headers=self._headers, cookies=self._cookies,
-                timeout=self._timeout)
-#            _LOGGER.debug("Received devices data: %s", raw_res.json())
-        except requests.exceptions.ReadTimeout:
-            return {"errorCode": "ReadTimeout"}
-        except Exception as e:
-            raise PyNeviweb130Error("Cannot get device attributes", e)
-        # Update cookies
-        self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
-        if "error" in data:
-            if data["error"]["code"] == "USRSESSEXP":
-                _LOGGER.error("Session expired. Set a scan_interval less" +
-                "than 10 minutes, otherwise the session will end.")
-                #raise PyNeviweb130Error("Session expired... reconnecting...")
-        return data
-
-    def get_device_status(self, device_id):
-        """Get device status for the GT130."""
-        # Prepare return
-        data = {}
-        # Http request
-        try:
-            raw_res = requests.get(DEVICE_DATA_URL + str(device_id) +
-                "/status", headers=self._headers, cookies=self._cookies,
-                timeout=self._timeout)
-            _LOGGER.debug("Received devices status: %s", raw_res.json())
-        except requests.exceptions.ReadTimeout:
-            return {"errorCode": "ReadTimeout"}
-        except Exception as e:
-            raise PyNeviweb130Error("Cannot get device status", e)
-        # Update cookies
-        #self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
-        if "error" in data:
-            if data["error"]["code"] == "USRSESSEXP":
-                _LOGGER.error("Session expired. Set a scan_interval less" +
-                "than 10 minutes, otherwise the session will end.")
-                #raise PyNeviweb130Error("Session expired... reconnecting...")
-        return data
-
-    def get_device_alert(self, device_id):
-        """Get device alert for Sedna valve."""
-        # Prepare return
-        data = {}
-        # Http request
-        try:
-            raw_res = requests.get(DEVICE_DATA_URL + str(device_id) +
-                "/alert", headers=self._headers, cookies=self._cookies,
-                timeout=self._timeout)
-            _LOGGER.debug("Received devices alert (%s): %s",str(device_id), raw_res.json())
-        except requests.exceptions.ReadTimeout:
-            return {"errorCode": "ReadTimeout"}
-        except Exception as e:
-            raise PyNeviweb130Error("Cannot get device alert", e)
-        # Update cookies
-        #self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
-        if "error" in data:
-            if data["error"]["code"] == "USRSESSEXP":
-                _LOGGER.error("Session expired. Set a scan_interval less" +
-                "than 10 minutes, otherwise the session will end.")
-                #raise PyNeviweb130Error("Session expired... reconnecting...")
-        return data
-
-    def get_device_monthly_stats(self, device_id):
-        """Get device power consumption (in Wh) for the last 24 months."""
-        # Prepare return
-        data = {}
-        # Http request
-        try:
-            raw_res = requests.get(DEVICE_DATA_URL + str(device_id) +
-                    "/energy/monthly", headers=self._headers,
-                    cookies=self._cookies, timeout=self._timeout)
-        except OSError:
-            raise PyNeviweb130Error("Cannot get device monthly stats...")
-            return None
-        # Update cookies
-        self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
-        #_LOGGER.debug("Monthly_stats data: %s", data)
-        if "history" in data:
-            return data["history"]
-        else:
-            _LOGGER.debug("Monthly stat error: %s", data)
-            return None
-
-    def get_device_daily_stats(self, device_id):
-        """Get device power consumption (in Wh) for the last 30 days."""
-        # Prepare return
-        data = {}
-        # Http request
-        try:
-            raw_res = requests.get(DEVICE_DATA_URL + str(device_id) +
-                    "/energy/daily", headers=self._headers,
-                    cookies=self._cookies, timeout=self._timeout)
-        except OSError:
-            raise PyNeviweb130Error("Cannot get device daily stats...")
-            return None
-        # Update cookies
-        self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
-        #_LOGGER.debug("Daily_stats data: %s", data)
-        if "history" in data:
-            return data["history"]
-        else:
-            _LOGGER.debug("Daily stat error: %s", data)
-            return None
-
-    def get_device_hourly_stats(self, device_id):
-        """Get device power consumption (in Wh) for the last 24 hours."""
-        # Prepare return
-        data = {}
-        # Http request
-        try:
-            raw_res = requests.get(DEVICE_DATA_URL + str(device_id) +
-                "/energy/hourly", headers=self._headers,
-                cookies=self._cookies, timeout=self._timeout)
-        except OSError:
-            raise PyNeviweb130Error("Cannot get device hourly stats...")
-            return None
-        # Update cookies
-        self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
-        #_LOGGER.debug("Hourly_stats data: %s", data)
-        if "history" in data:
-            return data["history"]
-        else:
-            _LOGGER.debug("Hourly stat error: %s", data)
-            return None
-
-    def get_device_sensor_error(self, device_id):
-        """Get device error code status."""
-        # Prepare return
-        data = {}
-        # Http request
-        try:
-            raw_res = requests.get(DEVICE_DATA_URL + str(device_id) +
-                "/attribute?attributes=errorCodeSet1", headers=self._headers,
-                cookies=self._cookies, timeout=self._timeout)
-        except OSError:
-            raise PyNeviweb130Error("Cannot get device error code status...")
-            return None
-        # Update cookies
-        self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
-        if "errorCodeSet1" in data:
-            return data["errorCodeSet1"]
-        _LOGGER.debug("Error code status data: %s", data)
-        return None
+class Neviweb130BaseClient(object):
+    """Device commands shared by the sync and asyncio clients. Each command
+    prepare the attributes and return the result of set_device_attributes,
+    a coroutine when called on Neviweb130AsyncClient."""
 
     def set_brightness(self, device_id, brightness):
         """Set device brightness."""
         data = {ATTR_INTENSITY: brightness}
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_onoff(self, device_id, onoff):
         """Set device onOff state."""
         data = {ATTR_ONOFF: onoff}
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_light_onoff(self, device_id, onoff, brightness):
         """Set light device onOff state."""
         data = {ATTR_ONOFF: onoff, ATTR_INTENSITY: brightness}
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_valve_onoff(self, device_id, onoff):
         """Set sedna valve onOff state."""
         data = {ATTR_MOTOR_TARGET: onoff}
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_mode(self, device_id, mode):
         """Set device operation mode."""
         data = {ATTR_POWER_MODE: mode}
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_setpoint_mode(self, device_id, mode, wifi):
         """Set thermostat operation mode."""
@@ -526,7 +607,7 @@ class Neviweb130Client(object):
             data = {ATTR_SETPOINT_MODE: mode}
         else:
             data = {ATTR_SYSTEM_MODE: mode}
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_occupancy_mode(self, device_id, mode, wifi):
         """Set thermostat preset mode."""
@@ -536,12 +617,12 @@ class Neviweb130Client(object):
                 data = {ATTR_OCCUPANCY: mode}
         else:
             data = {ATTR_SYSTEM_MODE: mode}
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_temperature(self, device_id, temperature):
         """Set device temperature."""
         data = {ATTR_ROOM_SETPOINT: temperature}
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_backlight(self, device_id, level, device):
         """ Set backlight intensity when idle, on or auto """
@@ -551,13 +632,13 @@ class Neviweb130Client(object):
         else:
             data = {ATTR_BACKLIGHT: level}
         _LOGGER.debug("backlight.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_second_display(self, device_id, display):
         """Set device second display for outside temperature or setpoint temperature."""
         data = {ATTR_DISPLAY2: display}
         _LOGGER.debug("display.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_keypad_lock(self, device_id, lock, wifi):
         """Set device keyboard locked/unlocked."""
@@ -566,43 +647,43 @@ class Neviweb130Client(object):
         else:
             data = {ATTR_KEYPAD: lock}
         _LOGGER.debug("lock.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_phase(self, device_id, phase):
         """Set device phase control mode."""
         data = {ATTR_PHASE_CONTROL: phase}
         _LOGGER.debug("phase.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_double_up(self, device_id, double):
         """Set device key double up action."""
         data = {ATTR_KEY_DOUBLE_UP: double}
         _LOGGER.debug("double_up.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_timer(self, device_id, time):
         """Set device auto off for timer on switch and multi controller."""
         data = {ATTR_TIMER: time}
         _LOGGER.debug("timer.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_timer2(self, device_id, time):
         """Set device auto off for timer2 on multi controller."""
         data = {ATTR_TIMER2: time}
         _LOGGER.debug("timer2.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_time_format(self, device_id, time):
         """Set device time format 12h or 24h."""
         data = {ATTR_TIME: time}
         _LOGGER.debug("time.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_temperature_format(self, device_id, deg):
         """Set device temperature format: celsius or fahrenheit."""
         data = {ATTR_TEMP: deg}
         _LOGGER.debug("temperature.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_floor_air_limit(self, device_id, status, temp):
         """ Set device maximum air temperature limit. """
@@ -610,85 +691,85 @@ class Neviweb130Client(object):
             temp = None
         data = {ATTR_FLOOR_AIR_LIMIT:{"status":status,"value":temp}}
         _LOGGER.debug("floorairlimit.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_early_start(self, device_id, start):
         """Set early start on/off for wifi thermostats."""
         data = {ATTR_EARLY_START: start}
         _LOGGER.debug("early_start.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_air_floor_mode(self, device_id, mode):
         """switch temperature control between floor and ambiant sensor."""
         data = {ATTR_FLOOR_MODE: mode}
         _LOGGER.debug("floor_mode.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_setpoint_min(self, device_id, temp):
         """Set device setpoint minimum temperature."""
         data = {ATTR_ROOM_SETPOINT_MIN: temp}
         _LOGGER.debug("setpointMin.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_setpoint_max(self, device_id, temp):
         """Set device setpoint maximum temperature."""
         data = {ATTR_ROOM_SETPOINT_MAX: temp}
         _LOGGER.debug("setpointMax.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_cool_setpoint_min(self, device_id, temp):
         """Set device cooling setpoint minimum temperature."""
         data = {ATTR_COOL_SETPOINT_MIN: temp}
         _LOGGER.debug("CoolsetpointMin.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_cool_setpoint_max(self, device_id, temp):
         """Set device cooling setpoint maximum temperature."""
         data = {ATTR_COOL_SETPOINT_MAX: temp}
         _LOGGER.debug("CoolsetpointMax.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_aux_cycle_output(self, device_id, status, val):
         """set low voltage thermostat aux cycle status and length."""
         data = {ATTR_CYCLE_OUTPUT2:{"status":status,"value":val}}
         _LOGGER.debug("auxCycleoutput.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_cycle_output(self, device_id, val):
         """set low voltage thermostat main cycle length."""
         data = {ATTR_CYCLE:val}
         _LOGGER.debug("Cycleoutput.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_tank_size(self, device_id, val):
         """set water heater tank size for RM3500ZB."""
         data = {ATTR_TANK_SIZE:val}
         _LOGGER.debug("TankSize.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_remaining_time(self, device_id, time):
         """Activate or deactivate calypso for time period."""
         data = {ATTR_COLD_LOAD_PICKUP_REMAIN_TIME:time}
         _LOGGER.debug("RemainingTime.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_sensor_type(self, device_id, val):
         """set floor sensor type 10k, 12k."""
         data = {ATTR_FLOOR_SENSOR:val, ATTR_FLOOR_OUTPUT2:{ "status": "off", "value": 0}}
         _LOGGER.debug("sensor.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_low_temp_protection(self, device_id, val):
         """set water heater temperature protection for RM3500ZB."""
         data = {ATTR_WATER_TEMP_MIN:val}
         _LOGGER.debug("Low temp protection.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_controlled_device(self, device_id, val):
         """set device name controlled by RM3250ZB."""
         data = {ATTR_CONTROLLED_DEVICE:val}
         _LOGGER.debug("ControlledDevice.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_aux_heat(self, device_id, heat, low, sec):
         """Set floor, low voltage, wifi floor and low voltage wifi thermostats auxiliary heat slave/off or on/off."""
@@ -699,7 +780,7 @@ class Neviweb130Client(object):
         else:
             data = {ATTR_FLOOR_AUX: heat}
         _LOGGER.debug("aux_heat.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_floor_limit(self, device_id, level, low, wifi):
         """Set floor setpoint limit low and high for zigbee and wifi thermostats. (0 = off)"""
@@ -726,7 +807,7 @@ class Neviweb130Client(object):
                 else:
                     data = {ATTR_FLOOR_MAX:{"status": "on", "value": level}, ATTR_FLOOR_OUTPUT2:{ "status": "off", "value": 0}}
         _LOGGER.debug("Floor limit = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_pump_protection(self, device_id, status, wifi):
         """Set low voltage thermostat pump protection status."""
@@ -739,7 +820,7 @@ class Neviweb130Client(object):
             else:
                 data = {ATTR_PUMP_PROTEC_DURATION:{"status": "off"}, ATTR_PUMP_PROTEC_PERIOD:{"status": "off"}}
         _LOGGER.debug("pump.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_flow_meter_model(self, device_id, model):
         """ Set flow meter model connected to the Sedna valve 2e gen """
@@ -750,88 +831,73 @@ class Neviweb130Client(object):
         else:
             data = {ATTR_FLOW_METER_CONFIG:{"multiplier":0,"offset":0,"divisor":1},ATTR_FLOW_ENABLED: False}
         _LOGGER.debug("Flowmeter model.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_flow_meter_delay(self, device_id, delay):
         """ Set flow meter delay before alarm is activated on Sedna valve 2e gen """
         data = {ATTR_FLOW_ALARM1_PERIOD:delay}
         _LOGGER.debug("Flowmeter delay.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_flow_meter_options(self, device_id, alarm, action, lenght, threshold):
         """ Set flow meter options when leak alarm is activated on Sedna valve 2e gen """
         data = {ATTR_FLOW_ALARM1_OPTION:{"triggerAlarm":alarm,"closeValve":action},ATTR_FLOW_ALARM1_LENGHT:lenght,ATTR_FLOW_THRESHOLD:threshold}
         _LOGGER.debug("Flowmeter options.data = %s", data)
-        self.set_device_attributes(device_id, data)
-
-    def set_led_indicator(self, device_id, state, intensity, red, green, blue):
-        """Set devive led indicator intensity and color for on and off state"""
-        if state == 1:
-            data = {ATTR_LED_ON_COLOR:{"red":red,"green":green,"blue":blue}}
-            self.set_device_attributes(device_id, data)
-            data2 = {ATTR_LED_ON_INTENSITY:intensity}
-            self.set_device_attributes(device_id, data2)
-        else:
-            data = {ATTR_LED_OFF_COLOR:{"red":red,"green":green,"blue":blue}}
-            self.set_device_attributes(device_id, data)
-            data2 = {ATTR_LED_OFF_INTENSITY:intensity}
-            self.set_device_attributes(device_id, data2)
-        _LOGGER.debug("led.data = %s, led.data2 = %s", data, data2)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_wattage(self, device_id, watt):
         """Set light and dimmer watt load."""
         data = {ATTR_LIGHT_WATTAGE:{"status":"on","value":watt}}
         _LOGGER.debug("wattage.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_auxiliary_load(self, device_id, status, load):
         """ Set auxiliary output load in watt. """
         data = {ATTR_FLOOR_OUTPUT2:{"status":status,"value":load}}
         _LOGGER.debug("auxiliary_load.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_valve_alert(self, device_id, batt):
         """Set Sedna valve battery alert on/off."""
         data = {ATTR_BATT_ALERT: batt}
         _LOGGER.debug("valve.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_valve_temp_alert(self, device_id, temp):
         """Set Sedna valve temperature alert on/off."""
         data = {ATTR_TEMP_ALERT: temp}
         _LOGGER.debug("valve.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_battery_type(self, device_id, batt):
         """Set water leak sensor battery type, lithium or alkaline."""
         data = {ATTR_BATTERY_TYPE: batt}
         _LOGGER.debug("battery_type.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_sensor_alert(self, device_id, leak, batt, temp, close):
         """Set leak detector alert, battery, temperature, leak, Sedna valve closing."""
         data = {ATTR_LEAK_ALERT: leak, ATTR_BATT_ALERT: batt, ATTR_TEMP_ALERT: temp, ATTR_CONF_CLOSURE: close}
         _LOGGER.debug("leak.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_load_dr_options(self, device_id, onoff, optout, dr):
         """ Set load controler Eco Sinope attributes """
         data = {ATTR_DRSTATUS:{"drActive":dr,"optOut":optout,"onOff":onoff}}
         _LOGGER.debug("Load.DR.options = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_hvac_dr_options(self, device_id, dr, optout, setpoint):
         """ Set load controler Eco Sinope attributes """
         data = {ATTR_DRSTATUS:{"drActive":dr,"optOut":optout,"setpoint":setpoint}}
         _LOGGER.debug("hvac.DR.options = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_hvac_dr_setpoint(self, device_id, status, val):
         """ Set load controler Eco Sinope attributes """
         data = {ATTR_DRSETPOINT:{"status":status,"value":val}}
         _LOGGER.debug("hvac.DR.setpoint = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_control_onoff(self, device_id, number, status):
         """Set valve controller onOff or OnOff2 status, on or off."""
@@ -840,49 +906,49 @@ class Neviweb130Client(object):
         else:
             data = {ATTR_ONOFF2: status}
         _LOGGER.debug("control.valve.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_tank_type(self, device_id, tank):
         """Set tank type for LM4110-ZB sensor."""
         data = {ATTR_TANK_TYPE: tank}
         _LOGGER.debug("tank_type.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_gauge_type(self, device_id, gauge):
         """Set gauge type for LM4110-ZB sensor on propane tank."""
         data = {ATTR_GAUGE_TYPE: gauge}
         _LOGGER.debug("gauge_type.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_low_fuel_alert(self, device_id, alert):
         """Set low fuel alert limit for LM4110-ZB sensor."""
         data = {ATTR_FUEL_PERCENT_ALERT: alert}
         _LOGGER.debug("low_fuel_alert.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_tank_height(self, device_id, height):
         """Set low fuel alert limit for LM4110-ZB sensor."""
         data = {ATTR_TANK_HEIGHT: height}
         _LOGGER.debug("tank_height.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_fuel_alert(self, device_id, fuel):
         """Set low fuel alert limit for LM4110-ZB sensor."""
         data = {ATTR_FUEL_ALERT: fuel}
         _LOGGER.debug("tank_height.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_battery_alert(self, device_id, batt):
         """Set low fuel alert limit for LM4110-ZB sensor."""
         data = {ATTR_BATT_ALERT: batt}
         _LOGGER.debug("battery_alert.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_power_supply(self, device_id, supply):
         """Set power supply for Sedna valve."""
         data = {ATTR_POWER_SUPPLY: supply}
         _LOGGER.debug("power_supply.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_on_off_input_delay(self, device_id, delay, onoff, inputnumber):
         """ set input 1 or 2 on/off delay in seconds"""
@@ -899,7 +965,7 @@ class Neviweb130Client(object):
                 case _:
                     data = {ATTR_INPUT_2_OFF_DELAY: delay}
         _LOGGER.debug("input_delay.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
     def set_input_output_names(self, device_id, in1, in2, out1, out2):
         """ Set names for input 1 and 2, output 1 and 2 for MC3100ZB device. """
@@ -921,27 +987,867 @@ class Neviweb130Client(object):
         else:
             data.update({ATTR_OUTPUT_NAME_2: ""})
         _LOGGER.debug("in/out names.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        return self.set_device_attributes(device_id, data)
 
-    def set_device_attributes(self, device_id, data):
-        result = 1
-        while result < 4:
+class Neviweb130Client(Neviweb130BaseClient):
+
+    def __init__(self, username, password, network, network2,
+            timeout=REQUESTS_TIMEOUT, pool_size=POOL_SIZE, inventory=None,
+            limiter=None, retry_policy=None, executor=None):
+        """Initialize the client object. When a cached inventory matching
+        the configured networks is given, network and gateway discovery are
+        skipped and devices are taken from it."""
+        self._email = username
+        self._password = password
+        self._network_name = network
+        self._network_name2 = network2
+        self._config_networks = [network, network2]
+        self._gateway_id = None
+        self._gateway_id2 = None
+        self.gateway_data = {}
+        self.gateway_data2 = {}
+        # Gateway id of each device connected through one, by device id
+        self.parent_ids = {}
+        self._headers = None
+        self._account = None
+        self._timeout = timeout
+        self.user = None
+        self._request_count = 0
+        self._request_time = 0.0
+        self._pool_size = pool_size
+        # Neviweb130Executor running the signature requests, one after
+        # the other without it
+        self._executor = executor
+        # Signatures already fetched, by device id, and device ids for which
+        # the signature could not be fetched yet.
+        self._signatures = {}
+        self._pending_signatures = set()
+        self._discovery_lock = threading.Lock()
+        # Only one login at a time, callers failing with an expired session
+        # wait for it and reuse the new session.
+        self._login_lock = threading.Lock()
+        self._login_count = 0
+        self.login_time = 0.0
+        self.last_activity = time.monotonic()
+        # One keep-alive session for all calls, cookies are handled by the
+        # session cookie jar and TLS connections are reused from the pool.
+        self._session = requests.Session()
+        # All requests, from this client and the asyncio one, share the
+        # same rate limiter.
+        if limiter is None:
+            limiter = Neviweb130RateLimiter(READ_RATE, READ_BURST, WRITE_RATE,
+                WRITE_BURST, STAT_RATE, STAT_BURST)
+        self.limiter = limiter
+        if retry_policy is None:
+            retry_policy = Neviweb130RetryPolicy(RETRY_ATTEMPTS, RETRY_DELAY,
+                RETRY_MAX_DELAY, RETRY_BUDGET, SCAN_INTERVAL.total_seconds())
+        self.retry_policy = retry_policy
+        # Called with device id and attributes after each write
+        self.write_listener = None
+        # Called with device id and attributes instead of sending the write,
+        # to merge it with other writes to the device
+        self.write_handler = None
+        self._adapter = RateLimitedAdapter(limiter, pool_connections=1,
+            pool_maxsize=pool_size)
+        self._session.mount(HOST, self._adapter)
+        self._session.hooks["response"].append(self.__count_response)
+        self._session.hooks["response"].append(self.__replay_expired)
+
+        self.__post_login_page()
+        self.from_cache = self.__load_inventory(inventory)
+        if not self.from_cache:
+            self.__get_network()
+            self.__get_gateway_data()
+
+    def update(self):
+        self.__get_gateway_data()
+
+    def close(self):
+        """Close the http session and all pooled connections."""
+        self._session.close()
+
+    @property
+    def headers(self):
+        """Return headers with current session id."""
+        return self._headers
+
+    @property
+    def cookies(self):
+        """Return current session cookies."""
+        return self._session.cookies.get_dict()
+
+    @property
+    def account_id(self):
+        """Return Neviweb account id of the session."""
+        return self._account
+
+    @property
+    def session_id(self):
+        """Return current Neviweb session id."""
+        if self._headers is None:
+            return None
+        return self._headers["Session-Id"]
+
+    def idle_time(self):
+        """Return seconds since last request sent to Neviweb."""
+        return time.monotonic() - self.last_activity
+
+    @property
+    def pending_signatures(self):
+        """Return ids of devices still waiting for their signature."""
+        return list(self._pending_signatures)
+
+    def __count_response(self, response, *args, **kwargs):
+        """Response hook used to count requests sent to Neviweb."""
+        self._request_count += 1
+        self._request_time += response.elapsed.total_seconds() - \
+            getattr(response.request, "rate_limit_wait", 0)
+        self.last_activity = time.monotonic()
+
+    def __replay_expired(self, response, *args, **kwargs):
+        """Response hook renewing an expired session and sending the failed
+        request again with the new session id."""
+        request = response.request
+        if "Session-Id" not in request.headers or \
+            getattr(request, "replayed", False) or \
+            b"USRSESSEXP" not in response.content:
+            return response
+        if not self.renew_session(request.headers["Session-Id"]):
+            return response
+        replay = request.copy()
+        replay.replayed = True
+        replay.headers["Session-Id"] = self.session_id
+        replay.headers.pop("Cookie", None)
+        replay.prepare_cookies(self._session.cookies)
+        _LOGGER.debug("Session expired, sending request again: %s",
+            replay.url)
+        return self._session.send(replay, timeout=self._timeout)
+
+    def renew_session(self, session_id=None):
+        """Log in again unless the session which failed (session_id) was
+        already renewed by another caller. Return True if a valid session
+        is available."""
+        with self._login_lock:
+            if session_id is not None and session_id != self.session_id:
+                return True
+            try:
+                return self.__post_login_page()
+            except PyNeviweb130Error as e:
+                _LOGGER.warning("Cannot renew Neviweb session: %s", e)
+                return False
+
+    def get_stats(self):
+        """Return http counters: requests sent, connections opened (TLS
+        handshakes) and cumulated request time in seconds."""
+        connections = 0
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+        return {"requests": self._request_count,
+            "connections": connections,
+            "request_time": round(self._request_time, 3),
+            "logins": self._login_count}
+
+    def reconnect(self):
+        self.__post_login_page()
+        self.__get_network()
+        self.__get_gateway_data()
+
+    def refresh_inventory(self):
+        """Discover networks, gateway devices and all signatures again,
+        ignoring signatures already known."""
+        with self._discovery_lock:
+            self._signatures = {}
+            self._pending_signatures = set()
+        self.__get_network()
+        self.__get_gateway_data()
+
+    def get_inventory(self):
+        """Return networks and devices with their signature, to be cached."""
+        return {"networks": self._config_networks,
+            "network": self._network_name,
+            "network2": self._network_name2,
+            "gateway_id": self._gateway_id,
+            "gateway_id2": self._gateway_id2,
+            "gateway_data": list(self.gateway_data),
+            "gateway_data2": list(self.gateway_data2)}
+
+    def __load_inventory(self, inventory):
+        """Load networks and devices from cached inventory, return False if
+        there is none or it was made for other networks."""
+        if not inventory or inventory.get("networks") != self._config_networks:
+            return False
+        self._network_name = inventory["network"]
+        self._network_name2 = inventory["network2"]
+        self._gateway_id = inventory["gateway_id"]
+        self._gateway_id2 = inventory["gateway_id2"]
+        self.gateway_data = inventory["gateway_data"]
+        self.gateway_data2 = inventory["gateway_data2"]
+        self.__index_parents()
+        for device in list(self.gateway_data) + list(self.gateway_data2):
+            if ATTR_SIGNATURE in device:
+                self._signatures[device["id"]] = device[ATTR_SIGNATURE]
+        _LOGGER.debug("Loaded %s devices from cached inventory",
+            len(self._signatures))
+        return True
+
+    def __index_parents(self):
+        """Index the gateway of devices of both networks by device id."""
+        self.parent_ids = {device["id"]: device[DEVICE_PARENT_ID]
+            for device in list(self.gateway_data) + list(self.gateway_data2)
+            if device.get(DEVICE_PARENT_ID) is not None}
+
+    def __post_login_page(self):
+        """Login to Neviweb."""
+        data = {"username": self._email, "password": self._password, 
+            "interface": "neviweb", "stayConnected": 1}
+        try:
+            raw_res = self._session.post(LOGIN_URL, data=data, 
+                allow_redirects=False, timeout = self._timeout)
+        except OSError:
+            raise PyNeviweb130Error("Cannot submit login form")
+        if raw_res.status_code != 200:
+            raise PyNeviweb130Error("Cannot log in")
+
+        # Session cookies are kept in self._session cookie jar
+        data = raw_res.json()
+        _LOGGER.debug("Login response: %s", data)
+        if "error" in data:
+            if data["error"]["code"] == "ACCSESSEXC":
+                _LOGGER.error("Too many active sessions. Close all neviweb130 " +
+                "sessions you have opened on other platform (mobile, browser" +
+                ", ...), wait a few minutes, then reboot Home Assistant.")
+            return False
+        else:
+            self.user = data["user"]
+            self._headers = {"Session-Id": data["session"]}
+            self._account = str(data["account"]["id"])
+            self._login_count += 1
+            self.login_time = time.monotonic()
+            _LOGGER.debug("Successfully logged in to: %s", self._account)
+            return True
+
+    def __get_network(self):
+        """Get gateway id associated to the desired network."""
+        # Http request
+        try:
+            raw_res = self._session.get(LOCATIONS_URL + self._account, headers=self._headers, 
+                timeout=self._timeout)
+            networks = raw_res.json()
+            _LOGGER.debug("Number of networks found on Neviweb: %s", len(networks))
+            _LOGGER.debug("networks: %s", networks)
+            if self._network_name == None and self._network_name2 == None: # Use 1st network found and second if found
+                self._gateway_id = networks[0]["id"]
+                self._network_name = networks[0]["name"]
+                _LOGGER.debug("Selecting %s as first network", self._network_name)
+                if len(networks) > 1:
+                    self._gateway_id2 = networks[1]["id"]
+                    self._network_name2 = networks[1]["name"]
+                    _LOGGER.debug("Selecting %s as second network", self._network_name2)
+            else:
+                for network in networks:
+                    if network["name"] == self._network_name:
+                        self._gateway_id = network["id"]
+                        _LOGGER.debug("Selecting %s network among: %s",self._network_name, networks)
+                        continue
+                    elif (network["name"] == self._network_name.capitalize()) or (network["name"] == self._network_name[0].lower()+self._network_name[1:]):
+                        self._gateway_id = network["id"]
+                        _LOGGER.debug("Please check first letter of your network name, In capital letter or not? Selecting %s network among: %s",
+                            self._network_name, networks)
+                        continue
+                    else:
+                        _LOGGER.debug("Your network name %s do not correspond to discovered network %s, skipping this one.... Please check your config if nothing is discovered.", self._network_name, network["name"])
+                    if self._network_name2 is not None:
+                        if network["name"] == self._network_name2:
+                            self._gateway_id2 = network["id"]
+                            _LOGGER.debug("Selecting %s network among: %s",
+                                self._network_name2, networks)
+                            continue
+                        elif (network["name"] == self._network_name2.capitalize()) or (network["name"] == self._network_name2[0].lower()+self._network_name2[1:]):
+                            self._gateway_id = network["id"]
+                            _LOGGER.debug("Please check first letter of your network2 name, In capital letter or not? Selecting %s network among: %s",
+                                self._network_name2, networks)
+                            continue
+                        else:
+                            _LOGGER.debug("Your network name %s do not correspond to discovered network %s, skipping this one...",
+                                self._network_name2, network["name"])
+
+        except OSError:
+            raise PyNeviweb130Error("Cannot get network")
+        # Prepare data
+        self.gateway_data = raw_res.json()
+
+    def __get_gateway_data(self):
+        """Get gateway data."""
+        # Http request
+        try:
+            raw_res = self._session.get(GATEWAY_DEVICE_URL + str(self._gateway_id),
+                headers=self._headers, timeout=self._timeout)
+            _LOGGER.debug("Received gateway data: %s", raw_res.json())
+        except OSError:
+            raise PyNeviweb130Error("Cannot get gateway data")
+        # Prepare data
+        self.gateway_data = raw_res.json()
+        _LOGGER.debug("Gateway_data : %s", self.gateway_data)
+        if self._gateway_id2 is not None:
             try:
-                resp = requests.put(DEVICE_DATA_URL + str(device_id) + "/attribute",
-                    json=data, headers=self._headers, cookies=self._cookies,
-                    timeout=self._timeout)
-                _LOGGER.debug("Data = %s", data)
-                _LOGGER.debug("Request response = %s", resp.status_code)
-                _LOGGER.debug("Json Data received= %s", resp.json())
-                _LOGGER.debug("Content = %s", resp.content)
-                _LOGGER.debug("Text = %s", resp.text)
+                raw_res2 = self._session.get(GATEWAY_DEVICE_URL + str(self._gateway_id2),
+                    headers=self._headers, timeout=self._timeout)
+                _LOGGER.debug("Received gateway data 2: %s", raw_res2.json())
             except OSError:
-                raise PyNeviweb130Error("Cannot set device %s attributes: %s", 
-                    device_id, data)
-            finally:
-                if "error" in resp.json():
-                    result += 1
-                    _LOGGER.debug("Service error received: %s, resending request %s",resp.json(), result)
-                    continue
-                else:
-                    break
+                raise PyNeviweb130Error("Cannot get gateway data 2")
+            # Prepare data
+            self.gateway_data2 = raw_res2.json()
+            _LOGGER.debug("Gateway_data2 : %s", self.gateway_data2)
+        self.__index_parents()
+        with self._discovery_lock:
+            missing = [device["id"] for device in self.__apply_signatures()
+                if device["id"] not in self._pending_signatures]
+            if missing:
+                failed = self.__fetch_signatures(missing)
+                self._pending_signatures.update(failed)
+                self.__apply_signatures()
+                if failed:
+                    _LOGGER.warning("Could not get signature of %s devices, " +
+                        "they will be added when Neviweb answers: %s",
+                        len(failed), failed)
+
+    def retry_pending_signatures(self):
+        """Fetch again signatures which failed during discovery. Return
+        devices resolved for gateway_data and gateway_data2."""
+        with self._discovery_lock:
+            pending = list(self._pending_signatures)
+            if not pending:
+                return [], []
+            failed = self.__fetch_signatures(pending)
+            self._pending_signatures = set(failed)
+            self.__apply_signatures()
+            resolved = [device_id for device_id in pending
+                if device_id not in failed]
+            return ([device for device in self.gateway_data
+                    if device["id"] in resolved],
+                [device for device in self.gateway_data2
+                    if device["id"] in resolved])
+
+    def __apply_signatures(self):
+        """Copy known signatures into gateway_data and gateway_data2. Return
+        devices with no signature fetched yet."""
+        missing = []
+        for device in list(self.gateway_data) + list(self.gateway_data2):
+            if device["id"] not in self._signatures:
+                missing.append(device)
+            elif self._signatures[device["id"]] is not None:
+                device[ATTR_SIGNATURE] = self._signatures[device["id"]]
+        return missing
+
+    def __fetch_signatures(self, device_ids):
+        """Fetch signatures of both networks, on the threads of the
+        Neviweb130Executor the discovery job runs in. Return ids of devices
+        that failed."""
+        if self._executor is None:
+            results = [self.__fetch_signature(device_id)
+                for device_id in device_ids]
+        else:
+            results = self._executor.map(self.__fetch_signature, device_ids)
+        return [device_id for device_id, done in zip(device_ids, results)
+            if not done]
+
+    def __fetch_signature(self, device_id):
+        """Fetch signature of one device, return False if Neviweb did not
+        answer."""
+        try:
+            data = self.get_device_attributes(device_id, [ATTR_SIGNATURE])
+        except PyNeviweb130Error as e:
+            _LOGGER.debug("Cannot get signature for %s: %s", device_id, e)
+            return False
+        _LOGGER.debug("Received signature data: %s", data)
+        if ATTR_SIGNATURE in data:
+            self._signatures[device_id] = data[ATTR_SIGNATURE]
+            return True
+        if "error" in data or "errorCode" in data:
+            return False
+        # Device without signature, do not ask again
+        self._signatures[device_id] = None
+        return True
+
+    def get_device_attributes(self, device_id, attributes):
+        """Get device attributes."""
+        # Prepare return
+        data = {}
+        # Http request
+        try:
+            data = self.__request("get", DEVICE_DATA_URL + str(device_id) +
+                "/attribute?attributes=" + ",".join(attributes))
+#            _LOGGER.debug("Received devices data: %s", data)
+        except requests.exceptions.ReadTimeout:
+            return {"errorCode": "ReadTimeout"}
+        except Exception as e:
+            raise PyNeviweb130Error("Cannot get device attributes", e)
+        if "error" in data:
+            if data["error"]["code"] == "USRSESSEXP":
+                _LOGGER.error("Session expired. Set a scan_interval less" +
+                "than 10 minutes, otherwise the session will end.")
+                #raise PyNeviweb130Error("Session expired... reconnecting...")
+        return data
+
+    def get_device_status(self, device_id):
+        """Get device status for the GT130."""
+        # Prepare return
+        data = {}
+        # Http request
+        try:
+            data = self.__request("get", DEVICE_DATA_URL + str(device_id) +
+                "/status")
+            _LOGGER.debug("Received devices status: %s", data)
+        except requests.exceptions.ReadTimeout:
+            return {"errorCode": "ReadTimeout"}
+        except Exception as e:
+            raise PyNeviweb130Error("Cannot get device status", e)
+        if "error" in data:
+            if data["error"]["code"] == "USRSESSEXP":
+                _LOGGER.error("Session expired. Set a scan_interval less" +
+                "than 10 minutes, otherwise the session will end.")
+                #raise PyNeviweb130Error("Session expired... reconnecting...")
+        return data
+
+    def get_device_alert(self, device_id):
+        """Get device alert for Sedna valve."""
+        # Prepare return
+        data = {}
+        # Http request
+        try:
+            data = self.__request("get", DEVICE_DATA_URL + str(device_id) +
+                "/alert")
+            _LOGGER.debug("Received devices alert (%s): %s",str(device_id), data)
+        except requests.exceptions.ReadTimeout:
+            return {"errorCode": "ReadTimeout"}
+        except Exception as e:
+            raise PyNeviweb130Error("Cannot get device alert", e)
+        if "error" in data:
+            if data["error"]["code"] == "USRSESSEXP":
+                _LOGGER.error("Session expired. Set a scan_interval less" +
+                "than 10 minutes, otherwise the session will end.")
+                #raise PyNeviweb130Error("Session expired... reconnecting...")
+        return data
+
+    def __get_history(self, device_id, period):
+        """Get device energy history for hourly, daily or monthly period."""
+        try:
+            data = self.__request("get", DEVICE_DATA_URL + str(device_id) +
+                "/energy/" + period)
+        except (OSError, ValueError):
+            raise PyNeviweb130Error("Cannot get device " + period + " stats...")
+        if "history" in data:
+            return data["history"]
+        _LOGGER.debug("%s stat error: %s", period.capitalize(), data)
+        return None
+
+    def get_device_monthly_stats(self, device_id):
+        """Get device power consumption (in Wh) for the last 24 months."""
+        return self.__get_history(device_id, "monthly")
+
+    def get_device_daily_stats(self, device_id):
+        """Get device power consumption (in Wh) for the last 30 days."""
+        return self.__get_history(device_id, "daily")
+
+    def get_device_hourly_stats(self, device_id):
+        """Get device power consumption (in Wh) for the last 24 hours."""
+        return self.__get_history(device_id, "hourly")
+
+    def get_device_sensor_error(self, device_id):
+        """Get device error code status."""
+        try:
+            data = self.__request("get", DEVICE_DATA_URL + str(device_id) +
+                "/attribute?attributes=errorCodeSet1")
+        except (OSError, ValueError):
+            raise PyNeviweb130Error("Cannot get device error code status...")
+        if "errorCodeSet1" in data:
+            return data["errorCodeSet1"]
+        _LOGGER.debug("Error code status data: %s", data)
+        return None
+
+    def set_led_indicator(self, device_id, state, intensity, red, green, blue):
+        """Set devive led indicator intensity and color for on and off state"""
+        if state == 1:
+            data = {ATTR_LED_ON_COLOR:{"red":red,"green":green,"blue":blue}}
+            data2 = {ATTR_LED_ON_INTENSITY:intensity}
+        else:
+            data = {ATTR_LED_OFF_COLOR:{"red":red,"green":green,"blue":blue}}
+            data2 = {ATTR_LED_OFF_INTENSITY:intensity}
+        _LOGGER.debug("led.data = %s, led.data2 = %s", data, data2)
+        # Intensity then color in one request, color is applied last
+        data2.update(data)
+        self.set_device_attributes(device_id, data2)
+
+    def set_device_attributes(self, device_id, data):
+        """Send attributes to device, retryable errors are sent again
+        according to the retry policy. With a write_handler, the write is
+        merged with the other writes to the device and sent by it."""
+        if self.write_handler is not None:
+            return self.write_handler(device_id, data)
+        try:
+            resp = self.__request("put", DEVICE_DATA_URL + str(device_id) +
+                "/attribute", json=data)
+        except (OSError, ValueError):
+            raise PyNeviweb130Error("Cannot set device %s attributes: %s",
+                device_id, data)
+        _LOGGER.debug("Data = %s, Json Data received= %s", data, resp)
+        if self.write_listener is not None:
+            self.write_listener(device_id, data)
+        return resp
+
+    def __request(self, method, url, json=None):
+        """Send request with current session and return json response.
+        Timeouts and retryable errors are sent again after the backoff
+        delay given by the retry policy."""
+        attempt = 0
+        while True:
+            try:
+                data = self._session.request(method, url, json=json,
+                    headers=self._headers, timeout=self._timeout).json()
+                error = None
+                code = error_code(data)
+            except requests.exceptions.Timeout as e:
+                error = e
+                code = "ReadTimeout"
+            if code is None:
+                return data
+            delay = self.retry_policy.next_delay(attempt, code)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return data
+            attempt += 1
+            _LOGGER.debug("Error %s, retry %s in %s sec: %s", code, attempt,
+                round(delay, 3), url)
+            time.sleep(delay)
+
+def _session_expired(data):
+    """Return True if Neviweb answered that the session expired."""
+    return isinstance(data, dict) and isinstance(data.get("error"), dict) \
+        and data["error"].get("code") == "USRSESSEXP"
+
+class Neviweb130AsyncClient(Neviweb130BaseClient):
+    """Asyncio client for device calls. Login, network and gateway discovery
+    stay in Neviweb130Client, this client reuse its session id and cookies
+    and send requests on HA shared aiohttp session."""
+
+    def __init__(self, hass, client, executor, timeout=REQUESTS_TIMEOUT):
+        """Initialize the asyncio client object, blocking calls of client
+        run in executor."""
+        self._hass = hass
+        self._client = client
+        self._executor = executor
+        self._session = async_get_clientsession(hass)
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._request_count = 0
+        self._request_time = 0.0
+        # Requests waiting for Neviweb answer, and highest number since
+        # last pop_peak_concurrency
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._retry_delay = SIGNATURE_RETRY_DELAY
+        self._retry_unsub = None
+        self._login_lock = asyncio.Lock()
+        # Attributes waiting to be written and future of the write, by device
+        self._pending_writes = {}
+        self._write_count = 0
+        self._put_count = 0
+        # Called with device id and attributes after each write
+        self.write_listener = None
+
+    @property
+    def gateway_data(self):
+        return self._client.gateway_data
+
+    @property
+    def gateway_data2(self):
+        return self._client.gateway_data2
+
+    @property
+    def parent_ids(self):
+        """Return the gateway id of devices connected through one."""
+        return self._client.parent_ids
+
+    async def update(self):
+        await self._executor.async_run(self._client.update)
+        self.async_schedule_signature_retry()
+
+    async def async_keep_alive(self):
+        """Read the locations of the account, a cheap authenticated request
+        keeping the session alive. An expired session is renewed by the
+        request and the locations read again."""
+        try:
+            await self.__request("get", LOCATIONS_URL +
+                self._client.account_id)
+        except Exception as e:
+            _LOGGER.debug("Cannot keep Neviweb session alive: %s", e)
+
+    async def reconnect(self):
+        """Renew the session after an error. Entities failing together
+        share one login."""
+        await self.async_renew_session(self._client.session_id,
+            SESSION_RENEW_MIN_AGE)
+
+    async def async_renew_session(self, session_id, min_age=0):
+        """Log in again, once for all callers which failed with the same
+        session, or if the session is younger than min_age seconds. Return
+        True if a valid session is available."""
+        async with self._login_lock:
+            if session_id != self._client.session_id or \
+                time.monotonic() - self._client.login_time < min_age:
+                return True
+            return await self._executor.async_run(
+                self._client.renew_session, session_id)
+
+    @callback
+    def async_schedule_signature_retry(self):
+        """Schedule a background retry of signatures which could not be
+        fetched during discovery, with increasing delay."""
+        if self._retry_unsub is not None or \
+            not self._client.pending_signatures:
+            return
+        _LOGGER.debug("Retrying %s signatures in %s sec",
+            len(self._client.pending_signatures), self._retry_delay)
+        self._retry_unsub = async_call_later(self._hass, self._retry_delay,
+            self.__async_retry_signatures)
+
+    async def __async_retry_signatures(self, now):
+        """Retry pending signatures and add the resolved devices."""
+        self._retry_unsub = None
+        devices, devices2 = await self._executor.async_run(
+            self._client.retry_pending_signatures)
+        if devices or devices2:
+            _LOGGER.info("Signature received for %s devices, adding them",
+                len(devices) + len(devices2))
+            async_dispatcher_send(self._hass, SIGNAL_DEVICES_DISCOVERED,
+                devices, devices2)
+        if self._client.pending_signatures:
+            self._retry_delay = min(self._retry_delay * 2,
+                SIGNATURE_RETRY_MAX_DELAY)
+        else:
+            self._retry_delay = SIGNATURE_RETRY_DELAY
+        self.async_schedule_signature_retry()
+
+    def get_stats(self):
+        """Return requests sent, cumulated request time in seconds, writes
+        asked and write requests sent after coalescing."""
+        return {"requests": self._request_count,
+            "request_time": round(self._request_time, 3),
+            "writes": self._write_count,
+            "puts": self._put_count}
+
+    def pop_peak_concurrency(self):
+        """Return the highest number of requests waiting for Neviweb at the
+        same time since last call."""
+        peak = self._peak_in_flight
+        self._peak_in_flight = self._in_flight
+        return peak
+
+    async def __request(self, method, url, json=None):
+        """Send request to Neviweb and return json response. If the session
+        expired, it is renewed and the request is sent again. Timeouts and
+        retryable errors are sent again after the backoff delay given by
+        the retry policy."""
+        attempt = 0
+        while True:
+            try:
+                data = await self.__send_session(method, url, json)
+                error = None
+                code = error_code(data)
+            except asyncio.TimeoutError as e:
+                error = e
+                code = "ReadTimeout"
+            if code is None:
+                return data
+            delay = self._client.retry_policy.next_delay(attempt, code)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return data
+            attempt += 1
+            _LOGGER.debug("Error %s, retry %s in %s sec: %s", code, attempt,
+                round(delay, 3), url)
+            await asyncio.sleep(delay)
+
+    async def __send_session(self, method, url, json=None):
+        """Send request, renew the session and send it again if the
+        session expired."""
+        session_id = self._client.session_id
+        data = await self.__send(method, url, json)
+        if _session_expired(data) and \
+            await self.async_renew_session(session_id):
+            _LOGGER.debug("Session expired, sending request again: %s", url)
+            data = await self.__send(method, url, json)
+        return data
+
+    async def __send(self, method, url, json=None):
+        """Send one request with current session id and cookies."""
+        wait = self._client.limiter.reserve(method, url)
+        if wait:
+            await asyncio.sleep(wait)
+        start = time.monotonic()
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            async with self._session.request(method, url, json=json,
+                headers=self._client.headers, cookies=self._client.cookies,
+                timeout=self._timeout) as resp:
+                return await resp.json(content_type=None)
+        finally:
+            self._in_flight -= 1
+            self._request_count += 1
+            self._request_time += time.monotonic() - start
+            self._client.last_activity = time.monotonic()
+
+    async def get_device_attributes(self, device_id, attributes):
+        """Get device attributes."""
+        try:
+            data = await self.__request("get", DEVICE_DATA_URL +
+                str(device_id) + "/attribute?attributes=" + ",".join(attributes))
+        except asyncio.TimeoutError:
+            return {"errorCode": "ReadTimeout"}
+        except Exception as e:
+            raise PyNeviweb130Error("Cannot get device attributes", e)
+        if "error" in data:
+            if data["error"]["code"] == "USRSESSEXP":
+                _LOGGER.error("Session expired. Set a scan_interval less" +
+                "than 10 minutes, otherwise the session will end.")
+        return data
+
+    async def get_device_status(self, device_id):
+        """Get device status for the GT130."""
+        try:
+            data = await self.__request("get", DEVICE_DATA_URL +
+                str(device_id) + "/status")
+            _LOGGER.debug("Received devices status: %s", data)
+        except asyncio.TimeoutError:
+            return {"errorCode": "ReadTimeout"}
+        except Exception as e:
+            raise PyNeviweb130Error("Cannot get device status", e)
+        if "error" in data:
+            if data["error"]["code"] == "USRSESSEXP":
+                _LOGGER.error("Session expired. Set a scan_interval less" +
+                "than 10 minutes, otherwise the session will end.")
+        return data
+
+    async def get_device_alert(self, device_id):
+        """Get device alert for Sedna valve."""
+        try:
+            data = await self.__request("get", DEVICE_DATA_URL +
+                str(device_id) + "/alert")
+            _LOGGER.debug("Received devices alert (%s): %s",str(device_id), data)
+        except asyncio.TimeoutError:
+            return {"errorCode": "ReadTimeout"}
+        except Exception as e:
+            raise PyNeviweb130Error("Cannot get device alert", e)
+        if "error" in data:
+            if data["error"]["code"] == "USRSESSEXP":
+                _LOGGER.error("Session expired. Set a scan_interval less" +
+                "than 10 minutes, otherwise the session will end.")
+        return data
+
+    async def __get_history(self, device_id, period):
+        """Get device energy history for hourly, daily or monthly period."""
+        try:
+            data = await self.__request("get", DEVICE_DATA_URL +
+                str(device_id) + "/energy/" + period)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            raise PyNeviweb130Error("Cannot get device " + period + " stats...")
+        if "history" in data:
+            return data["history"]
+        _LOGGER.debug("%s stat error: %s", period.capitalize(), data)
+        return None
+
+    async def get_device_monthly_stats(self, device_id):
+        """Get device power consumption (in Wh) for the last 24 months."""
+        return await self.__get_history(device_id, "monthly")
+
+    async def get_device_daily_stats(self, device_id):
+        """Get device power consumption (in Wh) for the last 30 days."""
+        return await self.__get_history(device_id, "daily")
+
+    async def get_device_hourly_stats(self, device_id):
+        """Get device power consumption (in Wh) for the last 24 hours."""
+        return await self.__get_history(device_id, "hourly")
+
+    async def get_device_sensor_error(self, device_id):
+        """Get device error code status."""
+        try:
+            data = await self.__request("get", DEVICE_DATA_URL +
+                str(device_id) + "/attribute?attributes=errorCodeSet1")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            raise PyNeviweb130Error("Cannot get device error code status...")
+        if "errorCodeSet1" in data:
+            return data["errorCodeSet1"]
+        _LOGGER.debug("Error code status data: %s", data)
+        return None
+
+    async def set_led_indicator(self, device_id, state, intensity, red, green, blue):
+        """Set devive led indicator intensity and color for on and off state"""
+        if state == 1:
+            data = {ATTR_LED_ON_COLOR:{"red":red,"green":green,"blue":blue}}
+            data2 = {ATTR_LED_ON_INTENSITY:intensity}
+        else:
+            data = {ATTR_LED_OFF_COLOR:{"red":red,"green":green,"blue":blue}}
+            data2 = {ATTR_LED_OFF_INTENSITY:intensity}
+        _LOGGER.debug("led.data = %s, led.data2 = %s", data, data2)
+        # Intensity then color in one request, color is applied last
+        data2.update(data)
+        return await self.set_device_attributes(device_id, data2)
+
+    async def set_device_attributes(self, device_id, data):
+        """Send attributes to device. Attributes written to the same device
+        within WRITE_COALESCE_DELAY are merged in one request, last value
+        wins, and every caller gets the response or error of that request."""
+        self._write_count += 1
+        pending = self._pending_writes.get(device_id)
+        if pending is None:
+            pending = {"data": {}, "future": self._hass.loop.create_future()}
+            self._pending_writes[device_id] = pending
+            self._hass.loop.call_later(WRITE_COALESCE_DELAY,
+                lambda: self._hass.async_create_task(
+                    self.__flush_writes(device_id)))
+        pending["data"].update(data)
+        # Shield the shared write from cancellation of one caller
+        return await asyncio.shield(pending["future"])
+
+    def queue_device_attributes(self, device_id, data):
+        """Queue attributes written by a blocking call, from a thread of the
+        executor, with the writes of the event loop and return the response
+        of the merged request. Used as write_handler of the requests client,
+        commands of custom services are then coalesced too."""
+        return asyncio.run_coroutine_threadsafe(
+            self.set_device_attributes(device_id, data),
+            self._hass.loop).result()
+
+    async def __flush_writes(self, device_id):
+        """Send merged attributes of a device and complete its callers."""
+        pending = self._pending_writes.pop(device_id)
+        try:
+            resp = await self.__put_attributes(device_id, pending["data"])
+        except Exception as e:
+            pending["future"].set_exception(e)
+            # Callers may all have been cancelled, do not log it as unhandled
+            pending["future"].exception()
+        else:
+            pending["future"].set_result(resp)
+        if self.write_listener is not None:
+            # Also read back after a failed write, to roll back the state
+            # shown before it was sent
+            self.write_listener(device_id, pending["data"])
+
+    async def __put_attributes(self, device_id, data):
+        """Send attributes to device, retryable errors are sent again
+        according to the retry policy."""
+        self._put_count += 1
+        try:
+            resp = await self.__request("put", DEVICE_DATA_URL +
+                str(device_id) + "/attribute", json=data)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            raise PyNeviweb130Error("Cannot set device %s attributes: %s",
+                device_id, data)
+        _LOGGER.debug("Data = %s, Json Data received= %s", data, resp)
+        return resp
@@ -0,0 +1,126 @@
+"""Circuit breaker of device polls."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Errors meaning the device is disconnected from Neviweb, opening the
+# breaker at once when they are counted as failures.
+TRIP_AT_ONCE_ERRORS = {"DVCUNVLB"}
+
+# Error code recorded when a request raised instead of returning an answer.
+REQUEST_ERROR = "RequestError"
+
+# Reason of a breaker opened by the set_activation service.
+REASON_DEACTIVATED = "deactivated"
+
+
+class Neviweb130CircuitBreaker:
+    """Breaker of the polls of one device.
+
+    Closed, the device is polled normally. After threshold consecutive
+    requests failed with one of errors, or at once for an error of
+    TRIP_AT_ONCE_ERRORS, it opens and the device is not polled for
+    open_time seconds. The time doubles with each consecutive opening, up
+    to max_open_time. Once elapsed, the breaker is half open: one cheap
+    request probes the device and closes the breaker if it answers, or
+    opens it again. Other errors mean the device answered and count as a
+    success. A device deactivated with the set_activation service stays
+    open until it is activated again.
+    """
+
+    def __init__(self, errors, threshold, open_time, max_open_time):
+        """Initialize a closed breaker."""
+        self._errors = errors
+        self._threshold = threshold
+        self._open_time = open_time
+        self._max_open_time = max_open_time
+        self.state = STATE_CLOSED
+        # Consecutive failures and consecutive openings
+        self.failures = 0
+        self.trips = 0
+        self.total_trips = 0
+        self.reason = None
+        self._opened = 0
+
+    @property
+    def closed(self):
+        """Return True if the device is polled normally."""
+        return self.state == STATE_CLOSED
+
+    def open_time(self):
+        """Return seconds the breaker stays open since last opened."""
+        return min(self._max_open_time,
+            self._open_time * 2 ** max(self.trips - 1, 0))
+
+    def retry_in(self):
+        """Return seconds before the breaker is half open, None if it was
+        opened by the set_activation service."""
+        if self.reason == REASON_DEACTIVATED:
+            return None
+        return max(self._opened + self.open_time() - time.monotonic(), 0)
+
+    def allow(self):
+        """Return True if the device can be polled, turning an open breaker
+        half open when its open time elapsed."""
+        if self.state == STATE_OPEN:
+            retry_in = self.retry_in()
+            if retry_in is None or retry_in > 0:
+                return False
+            self.state = STATE_HALF_OPEN
+        return True
+
+    def record(self, code):
+        """Record the result of a request of the device, code is its error
+        code or None. Return True if the breaker opened or closed."""
+        if self.state == STATE_OPEN:
+            return False
+        if code not in self._errors:
+            changed = self.state != STATE_CLOSED
+            self.state = STATE_CLOSED
+            self.failures = 0
+            self.trips = 0
+            return changed
+        self.failures += 1
+        self.reason = code
+        if self.state == STATE_HALF_OPEN or code in TRIP_AT_ONCE_ERRORS \
+            or self.failures >= self._threshold:
+            self._trip()
+            return True
+        return False
+
+    def set_active(self, active):
+        """Close the breaker, or keep it open until activated again."""
+        self.failures = 0
+        self.trips = 0
+        if active:
+            self.state = STATE_CLOSED
+            self.reason = None
+        else:
+            self.state = STATE_OPEN
+            self.reason = REASON_DEACTIVATED
+
+    def _trip(self):
+        """Open the breaker."""
+        self.state = STATE_OPEN
+        self.trips += 1
+        self.total_trips += 1
+        self._opened = time.monotonic()
+
+    def diagnostics(self):
+        """Return state, consecutive failures and openings, openings since
+        start, last failure and seconds before the breaker is half open."""
+        retry_in = self.retry_in() if self.state == STATE_OPEN else None
+        return {"state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "total_trips": self.total_trips,
+            "reason": self.reason,
+            "retry_in": round(retry_in) if retry_in is not None else None}
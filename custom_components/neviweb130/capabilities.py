@@ -0,0 +1,127 @@
+"""Attributes supported by each device model and firmware, learned from
+Neviweb errors and kept across restarts."""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.helpers.storage import Store
+
+from .const import STORAGE_VERSION, STORAGE_KEY_CAPABILITIES
+
+_LOGGER = logging.getLogger(__name__)
+
+# Error code of Neviweb when a requested attribute is not supported.
+UNSUPPORTED_ERROR = "DVCATTRNSPTD"
+
+# Delay before saving capabilities, probes of several devices are saved at
+# once.
+CAPABILITY_SAVE_DELAY = 30
+
+
+def unsupported_error(data):
+    """Return True if Neviweb answered that an attribute requested is not
+    supported by the device."""
+    return isinstance(data, dict) and isinstance(data.get("error"), dict) \
+        and data["error"].get("code") == UNSUPPORTED_ERROR
+
+
+def _failed(data):
+    """Return True if a request failed for another reason."""
+    return not isinstance(data, dict) or "error" in data \
+        or "errorCode" in data
+
+
+class Neviweb130Capabilities:
+    """Attributes not supported by each device model and firmware.
+
+    When a device request fails because an attribute is not supported,
+    attributes of the device are probed once for its model and firmware, by
+    halves while a request fails, to find those Neviweb refuses. They are
+    then removed from requests of every device with the same model and
+    firmware, and saved so they are not probed again after a restart. A
+    device with a new firmware is probed again on its first failure.
+    """
+
+    def __init__(self, hass):
+        """Initialize the capabilities."""
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY_CAPABILITIES)
+        # Unsupported attributes, by model and firmware already probed
+        self._unsupported = {}
+        self._probing = set()
+        self.probes = 0
+        self.probe_requests = 0
+
+    async def async_load(self):
+        """Load capabilities probed by previous runs."""
+        self._unsupported = await self._store.async_load() or {}
+
+    @staticmethod
+    def key(signature):
+        """Return the key of a device model and firmware."""
+        return "{}:{}".format(*signature)
+
+    def supported(self, signature, attributes):
+        """Return attributes without those not supported by the device
+        model and firmware."""
+        unsupported = self._unsupported.get(self.key(signature))
+        if not unsupported:
+            return attributes
+        return [attribute for attribute in attributes
+            if attribute not in unsupported]
+
+    async def async_probe(self, client, device_id, signature, attributes):
+        """Find attributes of a device not supported by its model and
+        firmware, unless already probed. Return True if some were found and
+        requests must be planned again."""
+        key = self.key(signature)
+        if key in self._unsupported or key in self._probing:
+            return False
+        self._probing.add(key)
+        try:
+            unsupported = await self._async_find_unsupported(client,
+                device_id, list(attributes))
+        finally:
+            self._probing.discard(key)
+        if unsupported is None:
+            # Probe stopped by another error, try again on next failure
+            return False
+        self.probes += 1
+        self._unsupported[key] = unsupported
+        self._store.async_delay_save(lambda: self._unsupported,
+            CAPABILITY_SAVE_DELAY)
+        if not unsupported:
+            _LOGGER.debug("All attributes supported by model %s, firmware "
+                "%s", *signature)
+            return False
+        _LOGGER.warning("Attributes not supported by model %s, firmware %s, "
+            "no longer requested: %s", signature[0], signature[1],
+            unsupported)
+        return True
+
+    async def _async_find_unsupported(self, client, device_id, attributes):
+        """Return attributes refused by Neviweb, requesting both halves of
+        attributes while a request fails, or None on another error."""
+        self.probe_requests += 1
+        data = await client.get_device_attributes(device_id, attributes)
+        if not unsupported_error(data):
+            return None if _failed(data) else []
+        if len(attributes) == 1:
+            return attributes
+        middle = len(attributes) // 2
+        unsupported = []
+        for half in (attributes[:middle], attributes[middle:]):
+            found = await self._async_find_unsupported(client, device_id,
+                half)
+            if found is None:
+                return None
+            unsupported += found
+        return unsupported
+
+    def get_stats(self):
+        """Return probes done and probe requests sent since start, and
+        attributes not supported by model and firmware."""
+        return {"probes": self.probes,
+            "probe_requests": self.probe_requests,
+            "unsupported": {key: value for key, value in
+                self._unsupported.items() if value}}
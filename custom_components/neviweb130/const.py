@@ -5,6 +5,68 @@ CONF_NETWORK = 'network'
 CONF_NETWORK2 = 'network2'
 CONF_HOMEKIT_MODE = 'homekit_mode'
 CONF_STAT_INTERVAL = 'stat_interval'
+CONF_POOL_SIZE = 'pool_size'
+CONF_READ_RATE = 'read_rate'
+CONF_READ_BURST = 'read_burst'
+CONF_WRITE_RATE = 'write_rate'
+CONF_WRITE_BURST = 'write_burst'
+CONF_STAT_RATE = 'stat_rate'
+CONF_STAT_BURST = 'stat_burst'
+CONF_RETRY_ATTEMPTS = 'retry_attempts'
+CONF_RETRY_DELAY = 'retry_delay'
+CONF_RETRY_BUDGET = 'retry_budget'
+CONF_WARM_INTERVAL = 'warm_interval'
+CONF_COLD_INTERVAL = 'cold_interval'
+CONF_MIN_SCAN_INTERVAL = 'min_scan_interval'
+CONF_MAX_SCAN_INTERVAL = 'max_scan_interval'
+CONF_POLL_BUDGET = 'poll_budget'
+CONF_RECORDER_MODE = 'recorder_mode'
+CONF_BREAKER_ERRORS = 'breaker_errors'
+CONF_BREAKER_THRESHOLD = 'breaker_threshold'
+CONF_BREAKER_OPEN_TIME = 'breaker_open_time'
+CONF_EXECUTOR_SIZE = 'executor_size'
+CONF_PARALLEL_UPDATES = 'parallel_updates'
+
+RECORDER_MODE_FULL = "full"
+RECORDER_MODE_REDUCED = "reduced"
+
+PLATFORMS = ["climate", "light", "switch", "sensor", "valve"]
+
+SIGNAL_DEVICES_DISCOVERED = "neviweb130_devices_discovered"
+SIGNAL_DEVICE_SUBSCRIBED = "neviweb130_device_subscribed"
+SIGNAL_DEVICE_UNSUBSCRIBED = "neviweb130_device_unsubscribed"
+SIGNAL_DEVICE_UPDATED = "neviweb130_device_updated_{}"
+
+# Device endpoints read with the attributes on each poll, because they can
+# not be merged in the attribute request.
+ENDPOINT_ALERT = "alert"
+
+# Key of the gateway a device is connected through, in the device list of a
+# location, and status of a gateway disconnected from Neviweb.
+DEVICE_PARENT_ID = "parentDevice$id"
+GATEWAY_OFFLINE = "offline"
+
+STORAGE_VERSION = 1
+STORAGE_KEY_INVENTORY = "neviweb130.inventory"
+STORAGE_KEY_STATISTICS = "neviweb130.statistics"
+STORAGE_KEY_CAPABILITIES = "neviweb130.capabilities"
+
+# State attributes never written to the recorder: static device data and
+# diagnostic values.
+UNRECORDED_ATTRIBUTES = frozenset({
+    "sku", "device_model", "device_model_cfg", "firmware", "device_type",
+    "id", "Id", "Activation", "poll_interval", "rssi", "Rssi",
+    "status air sensor", "status air bottom", "status base",
+    "status compensation sensor", "status current sensor",
+    "status end of life sensor", "status floor sensor", "status gfci base",
+    "status inductive mode", "status j2 connector", "status j3 connector",
+    "status line error", "status load sensor", "status reference sensor",
+    "status stm mcu", "status temp", "status thermal overload",
+    "status thermal sensor", "status wire sensor",
+})
+# Diagnostic attributes changing without the device state changing, only
+# given by the diagnostics service in reduced recorder mode.
+DIAGNOSTIC_ATTRIBUTES = frozenset({"poll_interval", "rssi", "Rssi"})
 
 ATTR_ALERT = "alert"
 ATTR_SIGNATURE = "signature"
@@ -242,3 +304,5 @@ SERVICE_SET_KEY_DOUBLE_UP = "set_key_double_up"
 SERVICE_SET_SENSOR_TYPE = "set_sensor_type"
 SERVICE_SET_REMAINING_TIME = "set_remaining_time"
 SERVICE_SET_ON_OFF_INPUT_DELAY = "set_on_off_input_delay"
+SERVICE_RESYNC_ENERGY_STATISTICS = "resync_energy_statistics"
+SERVICE_GET_DIAGNOSTICS = "get_diagnostics"
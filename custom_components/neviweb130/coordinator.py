@@ -0,0 +1,699 @@
+"""Neviweb130 data update coordinator, devices of a gateway are polled on
+their own adaptive schedule."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+import zlib
+
+from functools import partial
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .breaker import (
+    REASON_DEACTIVATED,
+    REQUEST_ERROR,
+    STATE_HALF_OPEN,
+    TRIP_AT_ONCE_ERRORS,
+)
+from .capabilities import unsupported_error
+from .const import (
+    ATTR_STATUS,
+    ENDPOINT_ALERT,
+    GATEWAY_OFFLINE,
+    SIGNAL_DEVICE_SUBSCRIBED,
+    SIGNAL_DEVICE_UNSUBSCRIBED,
+    SIGNAL_DEVICE_UPDATED,
+)
+from .retry import error_code
+
+_LOGGER = logging.getLogger(__name__)
+
+# Delay before reading back attributes written to a device, to let Neviweb
+# and the device apply them.
+VERIFY_DELAY = 5
+
+# Attribute refresh tiers. Hot attributes are read on every poll, warm and
+# cold ones only when their refresh period has elapsed.
+TIER_HOT = "hot"
+TIER_WARM = "warm"
+TIER_COLD = "cold"
+
+# Poll interval of a device is divided by POLL_FASTER when its state changed
+# since last poll, and multiplied by POLL_SLOWER when it did not.
+POLL_FASTER = 2
+POLL_SLOWER = 1.25
+# Random part added to each poll interval, as a fraction of the interval,
+# so devices polled at the same interval do not line up again.
+POLL_JITTER = 0.1
+
+# Polls of the devices of a gateway back online are spread over this delay,
+# in seconds, each device at its offset.
+GATEWAY_RESUME_SPREAD = 60
+# A failed device poll reads the status of its gateway at once, unless read
+# less than this delay ago, in seconds.
+GATEWAY_CHECK_INTERVAL = 60
+
+
+class Neviweb130PollBudget:
+    """Poll interval of every device of both gateways, kept within floor and
+    ceiling bounds and a global number of device polls per hour."""
+
+    def __init__(self, scan_interval, min_interval, max_interval, max_polls):
+        """Initialize the budget. With max_polls 0, devices are polled no
+        more often than with a fixed scan_interval."""
+        self.scan_interval = scan_interval.total_seconds()
+        self.min_interval = min(min_interval.total_seconds(),
+            self.scan_interval)
+        self.max_interval = max(max_interval.total_seconds(),
+            self.scan_interval)
+        self._max_polls = max_polls
+        self._intervals = {}
+
+    def interval(self, device_id):
+        """Return the current poll interval of a device in seconds."""
+        return self._intervals.get(device_id, self.scan_interval)
+
+    def adapt(self, device_id, changed):
+        """Shorten the interval of a device whose state changed, lengthen
+        it otherwise, then slow it down if all devices together would be
+        polled more than the budget allows. Return the new interval."""
+        interval = self.interval(device_id)
+        if changed:
+            interval /= POLL_FASTER
+        else:
+            interval *= POLL_SLOWER
+        self._intervals[device_id] = interval
+        max_polls = self._max_polls or \
+            len(self._intervals) * 3600 / self.scan_interval
+        # Polls per hour left for this device by the other devices
+        left = max_polls - sum(3600 / value for key, value in
+            self._intervals.items() if key != device_id)
+        if left <= 0:
+            interval = self.max_interval
+        else:
+            interval = max(interval, 3600 / left)
+        interval = min(self.max_interval, max(self.min_interval, interval))
+        self._intervals[device_id] = interval
+        return interval
+
+    def release(self, device_id):
+        """Stop counting a device removed or no longer polled in the budget,
+        it starts again at scan_interval when polled again."""
+        self._intervals.pop(device_id, None)
+
+    def polls_per_hour(self):
+        """Return the number of device polls per hour at current intervals."""
+        return round(sum(3600 / value for value in self._intervals.values()),
+            1)
+
+
+class Neviweb130Coordinator(DataUpdateCoordinator):
+    """Poll devices of a gateway (gateway_data or gateway_data2) and push
+    the result to subscribed entities. Each device is polled on its own
+    timer, at an interval adapted to how often its state changes. After the
+    startup read, first poll of each device is delayed by a fixed offset
+    within its interval, so polls are spread over the interval instead of
+    being sent in bursts. The state of a device is only written after a
+    poll when its data or activation changed since last written.
+
+    Each poll is planned for the whole device: every attribute needed is
+    requested in one attribute request, and only endpoints that can not be
+    merged in it are sent as separate requests, at the same time. When
+    Neviweb answers that an attribute is not supported, attributes of the
+    device are probed once for its model and firmware, and the poll is sent
+    again without those not supported.
+
+    Polls of each device go through its Neviweb130CircuitBreaker. While the
+    breaker is open, the device is not polled. When it is half open, only
+    its first attribute is requested to probe it before polling it again.
+
+    Devices connected through a gateway (GT130) are not polled while the
+    gateway status read by its entity is offline, and shown unavailable. A
+    failed poll of such a device reads the gateway status at once, so one
+    status request stops the timeouts of every device behind it. When the
+    gateway is back online, its devices are polled again, spread over
+    GATEWAY_RESUME_SPREAD.
+
+    Entities subscribe with themselves as listener context and must provide:
+    - update_attributes(), the list of attributes to fetch for the device,
+      or None for a gateway which is polled on its /status endpoint.
+    - attribute_tiers(), the lists of warm and cold attributes. Others are
+      hot. Warm and cold attributes are only requested when their period
+      is due, the values last received are passed to the entity otherwise.
+    - update_endpoints(), the endpoints read on each poll besides the
+      attributes, like ENDPOINT_ALERT. Their data is passed to the entity
+      under the endpoint name, with the attributes.
+    - device_signature, the model and firmware of the device. Attributes
+      not supported by them are not requested.
+    - async_notify_ha(msg), to notify the user that polls of a device
+      disconnected from Neviweb restarted.
+    - async_update_from_data(device_data, start, verify), to parse received
+      data. verify is True for a verification read after a command, only
+      the device state is parsed then, without statistics or alert requests.
+
+    - power_sensor, True if current_power gives the power drawn in W.
+
+    SIGNAL_DEVICE_SUBSCRIBED is sent with each entity subscribing,
+    SIGNAL_DEVICE_UNSUBSCRIBED with each entity unsubscribing, and
+    SIGNAL_DEVICE_UPDATED for the device each time its state is written, for
+    the energy and power sensors fed from it.
+    """
+
+    def __init__(self, hass, client, name, budget, capabilities,
+            new_breaker, max_requests, warm_interval, cold_interval):
+        """Initialize the gateway coordinator, budget and capabilities are
+        the Neviweb130PollBudget and Neviweb130Capabilities shared by both
+        gateways, new_breaker returns a circuit breaker for a device."""
+        super().__init__(hass, _LOGGER, name=name)
+        self._client = client
+        self._capabilities = capabilities
+        self._new_breaker = new_breaker
+        # Circuit breaker of each device, by device id
+        self._breakers = {}
+        self._endpoints = {ENDPOINT_ALERT: client.get_device_alert}
+        self._budget = budget
+        # Cancel callback of the next poll, by device id
+        self._unsub_poll = {}
+        # Devices already polled once on their offset
+        self._phased = set()
+        self.polls = 0
+        self.requests = 0
+        self.probes = 0
+        self._semaphore = asyncio.Semaphore(max_requests)
+        # Last data received for each device, by device id
+        self._device_data = {}
+        self._tier_intervals = {TIER_WARM: warm_interval.total_seconds(),
+            TIER_COLD: cold_interval.total_seconds()}
+        # Last refresh of warm and cold attributes, by device id
+        self._tier_refreshed = {}
+        self.attributes_requested = 0
+        self.attributes_skipped = 0
+        # Attributes written and waiting for verification, by device id
+        self._pending_verify = {}
+        self.verify_count = 0
+        self.verify_rollback = 0
+        # Activation and data of each device at last state written by a poll
+        self._written = {}
+        self.writes = 0
+        self.writes_suppressed = 0
+        # Gateways offline, devices not polled because their gateway is
+        # offline and last status read of each gateway, by device id
+        self._offline_gateways = set()
+        self._suspended = set()
+        self._gateway_checked = {}
+        self.suspensions = 0
+
+    async def _async_update_data(self):
+        """Fetch data for every subscribed device of the gateway."""
+        start = time.time()
+        entities = list(self.async_contexts())
+        results = await asyncio.gather(
+            *[self._async_update_device(entity) for entity in entities]
+        )
+        data = {}
+        for entity, device_data in zip(entities, results):
+            if device_data is not None:
+                data[entity.unique_id] = device_data
+        _LOGGER.debug("%s: %s devices updated in %s sec", self.name,
+            len(data), round(time.time() - start, 3))
+        return data
+
+    @callback
+    def async_add_listener(self, update_callback, context=None):
+        """Subscribe an entity and announce it to the sensor platform and
+        the energy statistics scheduler. When it unsubscribes, its polls
+        stop, it leaves the poll budget and it is announced again."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        if context is None:
+            return remove_listener
+        async_dispatcher_send(self.hass, SIGNAL_DEVICE_SUBSCRIBED, context)
+
+        @callback
+        def remove_device_listener():
+            remove_listener()
+            unsub = self._unsub_poll.pop(context.unique_id, None)
+            if unsub is not None:
+                unsub()
+            self._budget.release(context.unique_id)
+            async_dispatcher_send(self.hass, SIGNAL_DEVICE_UNSUBSCRIBED,
+                context)
+
+        return remove_device_listener
+
+    @callback
+    def async_write_device_state(self, entity):
+        """Write the state of a device entity and of its sensors."""
+        self.writes += 1
+        entity.async_write_ha_state()
+        async_dispatcher_send(self.hass,
+            SIGNAL_DEVICE_UPDATED.format(entity.unique_id))
+
+    def get_stats(self):
+        """Return device polls, requests sent and requests per device poll,
+        probes of devices with a half open breaker, devices with an open
+        breaker, attributes requested and not due, writes verified and not
+        applied, and states written and not written because unchanged since
+        start, gateways offline, devices not polled because of them and
+        times their polls were suspended."""
+        return {"polls": self.polls,
+            "probes": self.probes,
+            "open_breakers": sum(not breaker.closed
+                for breaker in self._breakers.values()),
+            "offline_gateways": len(self._offline_gateways),
+            "suspended_devices": len(self._suspended),
+            "suspensions": self.suspensions,
+            "requests": self.requests,
+            "requests_per_poll": round(self.requests / self.polls, 2)
+                if self.polls else 0,
+            "attributes_requested": self.attributes_requested,
+            "attributes_skipped": self.attributes_skipped,
+            "verified": self.verify_count,
+            "rollbacks": self.verify_rollback,
+            "writes": self.writes,
+            "writes_suppressed": self.writes_suppressed}
+
+    def device_diagnostics(self, device_id):
+        """Return poll interval and offset of a device, its circuit breaker,
+        its gateway and if its polls are suspended, seconds since its warm
+        and cold attributes were refreshed and last data received."""
+        now = time.monotonic()
+        refreshed = self._tier_refreshed.get(device_id, {})
+        return {"poll_interval": self.poll_interval(device_id),
+            "breaker": self.breaker(device_id).diagnostics(),
+            "gateway": self._gateway_id(device_id),
+            "suspended": device_id in self._suspended,
+            "poll_offset": round(self.poll_offset(device_id), 3),
+            "tiers_refreshed": {tier: round(now - value)
+                for tier, value in refreshed.items()},
+            "device_data": self._device_data.get(device_id)}
+
+    def breaker(self, device_id):
+        """Return the circuit breaker of a device."""
+        breaker = self._breakers.get(device_id)
+        if breaker is None:
+            breaker = self._breakers[device_id] = self._new_breaker()
+        return breaker
+
+    def device_available(self, device_id):
+        """Return False while the gateway of a device is offline."""
+        return device_id not in self._suspended
+
+    def _gateway_id(self, device_id):
+        """Return the id of the gateway a device is connected through, None
+        for a gateway or a Wi-Fi device."""
+        return self._client.parent_ids.get(device_id)
+
+    def poll_interval(self, device_id):
+        """Return the current poll interval of a device in seconds."""
+        return round(self._budget.interval(device_id))
+
+    @staticmethod
+    def poll_offset(device_id):
+        """Return the offset of a device within its poll interval, as a
+        fraction of the interval. It only depends on the device id."""
+        return zlib.crc32(str(device_id).encode()) / 2 ** 32
+
+    @callback
+    def _schedule_poll(self, entity, interval):
+        """Schedule next poll of a device, replacing any pending one. First
+        poll waits for the device offset, others for the interval with a
+        random part of POLL_JITTER."""
+        if entity.unique_id in self._phased:
+            delay = interval * random.uniform(1 - POLL_JITTER,
+                1 + POLL_JITTER)
+        else:
+            delay = interval * self.poll_offset(entity.unique_id)
+        _LOGGER.debug("Next poll of %s in %s sec", entity.name, round(delay))
+        unsub = self._unsub_poll.pop(entity.unique_id, None)
+        if unsub is not None:
+            unsub()
+        self._unsub_poll[entity.unique_id] = async_call_later(self.hass,
+            delay, partial(self._async_scheduled_poll, entity))
+
+    async def _async_scheduled_poll(self, entity, now):
+        """Poll a device when its interval elapsed and write its state."""
+        self._unsub_poll.pop(entity.unique_id, None)
+        if entity not in self.async_contexts():
+            # Entity removed since last poll
+            return
+        self._phased.add(entity.unique_id)
+        device_data = await self._async_update_device(entity)
+        written = (entity.activ, device_data)
+        if self._written.get(entity.unique_id) == written:
+            # Same data as last written, the state would not change
+            self.writes_suppressed += 1
+            return
+        self._written[entity.unique_id] = written
+        self.async_write_device_state(entity)
+
+    async def _async_update_device(self, entity):
+        """Fetch and push data for one device, limited to max_requests
+        devices at a time. A device with an open breaker is not polled, one
+        with a half open breaker is probed first. A device of a gateway
+        offline is suspended instead."""
+        if self._gateway_id(entity.unique_id) in self._offline_gateways:
+            self._suspend(entity)
+            return None
+        breaker = self.breaker(entity.unique_id)
+        if breaker.allow() and breaker.state == STATE_HALF_OPEN:
+            async with self._semaphore:
+                await self._async_probe(entity, breaker)
+        if not breaker.closed:
+            # Breaker opened by the set_activation service
+            self._budget.release(entity.unique_id)
+            self._schedule_poll(entity, breaker.retry_in()
+                or self._budget.interval(entity.unique_id))
+            return None
+        device_data = None
+        changed = None
+        code = REQUEST_ERROR
+        async with self._semaphore:
+            start = time.time()
+            self.polls += 1
+            try:
+                attributes, endpoints, tiers = self._plan_requests(entity)
+                device_data = await self._async_fetch(entity.unique_id,
+                    attributes, endpoints)
+                if attributes is not None and unsupported_error(device_data) \
+                    and await self._capabilities.async_probe(self._client,
+                    entity.unique_id, entity.device_signature,
+                    self._supported_attributes(entity)):
+                    # Poll again without attributes not supported
+                    attributes, endpoints, tiers = self._plan_requests(entity)
+                    device_data = await self._async_fetch(entity.unique_id,
+                        attributes, endpoints)
+                code = error_code(device_data)
+                changed = self._state_changed(entity, device_data)
+                device_data = self._merge_device_data(entity.unique_id,
+                    device_data, tiers)
+                await entity.async_update_from_data(device_data, start)
+            except Exception:
+                # One failing device must not stop polling other devices
+                _LOGGER.exception("Update failed for %s", entity.name)
+                device_data = None
+        await self._async_record(entity, breaker, code)
+        if entity.update_attributes() is None:
+            self._update_gateway(entity, device_data)
+        elif code is not None:
+            self._check_gateway(entity)
+        if entity.unique_id in self._suspended:
+            # Gateway found offline during the poll
+            return device_data
+        if entity.unique_id in self._offline_gateways:
+            # Poll an offline gateway often to resume its devices soon
+            interval = self._budget.scan_interval
+        elif not breaker.closed:
+            interval = breaker.retry_in() \
+                or self._budget.interval(entity.unique_id)
+        elif changed is None:
+            interval = self._budget.interval(entity.unique_id)
+        else:
+            interval = self._budget.adapt(entity.unique_id, changed)
+        self._schedule_poll(entity, interval)
+        return device_data
+
+    async def _async_probe(self, entity, breaker):
+        """Probe a device with a half open breaker with one cheap request,
+        its first attribute or the gateway status."""
+        self.probes += 1
+        self.requests += 1
+        attributes = self._supported_attributes(entity)
+        try:
+            if attributes is None:
+                data = await self._client.get_device_status(entity.unique_id)
+            else:
+                data = await self._client.get_device_attributes(
+                    entity.unique_id, attributes[:1])
+            code = error_code(data)
+        except Exception:
+            code = REQUEST_ERROR
+        _LOGGER.debug("Probe of %s: %s", entity.name, code or "ok")
+        await self._async_record(entity, breaker, code)
+
+    async def _async_record(self, entity, breaker, code):
+        """Record the result of a request in the breaker of a device and
+        report when the breaker opened or closed."""
+        reason = breaker.reason
+        if not breaker.record(code):
+            return
+        if breaker.closed:
+            _LOGGER.warning("Polls of %s restarted", entity.name)
+            if reason in TRIP_AT_ONCE_ERRORS:
+                await entity.async_notify_ha("Warning: Neviweb Device " +
+                    "update restarted for " + entity.name)
+        else:
+            self._budget.release(entity.unique_id)
+            _LOGGER.warning("Polls of %s halted for %s sec after %s " +
+                "consecutive failures, last error: %s", entity.name,
+                round(breaker.open_time()), breaker.failures, code)
+
+    @callback
+    def _update_gateway(self, gateway, device_status):
+        """Suspend polls of the devices of a gateway going offline, resume
+        them when it is back online."""
+        if not isinstance(device_status, dict) \
+            or ATTR_STATUS not in device_status:
+            # Status not read, Neviweb itself did not answer
+            return
+        gateway_id = gateway.unique_id
+        self._gateway_checked[gateway_id] = time.monotonic()
+        offline = device_status[ATTR_STATUS] == GATEWAY_OFFLINE
+        if offline == (gateway_id in self._offline_gateways):
+            return
+        devices = [entity for entity in self.async_contexts()
+            if self._gateway_id(entity.unique_id) == gateway_id]
+        if offline:
+            self._offline_gateways.add(gateway_id)
+            _LOGGER.warning("Gateway %s is offline, polls of its %s devices " +
+                "suspended", gateway.name, len(devices))
+            for entity in devices:
+                self._suspend(entity)
+            return
+        self._offline_gateways.discard(gateway_id)
+        _LOGGER.warning("Gateway %s is back online, polls of its %s devices " +
+            "resumed", gateway.name, len(devices))
+        for entity in devices:
+            self._resume(entity)
+
+    @callback
+    def _suspend(self, entity):
+        """Stop polls of a device of an offline gateway and show it
+        unavailable."""
+        if entity.unique_id in self._suspended:
+            return
+        self._suspended.add(entity.unique_id)
+        self.suspensions += 1
+        self._budget.release(entity.unique_id)
+        unsub = self._unsub_poll.pop(entity.unique_id, None)
+        if unsub is not None:
+            unsub()
+        # First poll after the gateway is back must write the state
+        self._written.pop(entity.unique_id, None)
+        if entity.hass is not None:
+            self.async_write_device_state(entity)
+
+    @callback
+    def _resume(self, entity):
+        """Poll again a device of a gateway back online, at its offset
+        within GATEWAY_RESUME_SPREAD. Failures recorded while the gateway
+        was going offline no longer halt the device."""
+        if entity.unique_id not in self._suspended:
+            return
+        self._suspended.discard(entity.unique_id)
+        breaker = self.breaker(entity.unique_id)
+        if not breaker.closed and breaker.reason != REASON_DEACTIVATED:
+            breaker.set_active(True)
+        delay = GATEWAY_RESUME_SPREAD * self.poll_offset(entity.unique_id)
+        self._unsub_poll[entity.unique_id] = async_call_later(self.hass,
+            delay, partial(self._async_scheduled_poll, entity))
+
+    @callback
+    def _check_gateway(self, entity):
+        """Read at once the status of the gateway of a device whose poll
+        failed, unless read less than GATEWAY_CHECK_INTERVAL ago."""
+        gateway_id = self._gateway_id(entity.unique_id)
+        gateway = self._get_entity(gateway_id)
+        if gateway is None or gateway_id in self._offline_gateways:
+            return
+        now = time.monotonic()
+        if now - self._gateway_checked.get(gateway_id, 0) < \
+            GATEWAY_CHECK_INTERVAL:
+            return
+        self._gateway_checked[gateway_id] = now
+        unsub = self._unsub_poll.pop(gateway_id, None)
+        if unsub is not None:
+            unsub()
+        self.hass.async_create_task(self._async_scheduled_poll(gateway, None))
+
+    def _plan_requests(self, entity):
+        """Plan the requests of a device poll. Return the attributes due,
+        once each, for the attribute request, or None for a gateway read on
+        its /status endpoint, the other endpoints to read and the tiers
+        refreshed."""
+        attributes = self._supported_attributes(entity)
+        if attributes is None:
+            return None, [], ()
+        attributes, tiers = self._due_attributes(entity, attributes)
+        return attributes, entity.update_endpoints(), tiers
+
+    def _supported_attributes(self, entity):
+        """Return every attribute of a device once, without those not
+        supported by its model and firmware, or None for a gateway."""
+        attributes = entity.update_attributes()
+        if attributes is None:
+            return None
+        return self._capabilities.supported(entity.device_signature,
+            list(dict.fromkeys(attributes)))
+
+    async def _async_fetch(self, device_id, attributes, endpoints):
+        """Send the planned requests of a device at the same time. Return
+        the attributes received with the data of each endpoint, or the
+        error of the attribute request. An endpoint error only leaves its
+        last data unchanged."""
+        if attributes is None:
+            requests = [self._client.get_device_status(device_id)]
+        else:
+            requests = [self._client.get_device_attributes(device_id,
+                attributes)]
+        requests += [self._endpoints[endpoint](device_id)
+            for endpoint in endpoints]
+        self.requests += len(requests)
+        received, *results = await asyncio.gather(*requests)
+        if not isinstance(received, dict) or "error" in received \
+            or "errorCode" in received:
+            return received
+        for endpoint, data in zip(endpoints, results):
+            if isinstance(data, dict) and "error" not in data \
+                and "errorCode" not in data:
+                received[endpoint] = data
+        return received
+
+    def _state_changed(self, entity, received):
+        """Return True if hot attributes received differ from last data of
+        the device, None if there is nothing to compare. Warm and cold
+        attributes are settings and do not make the device polled more
+        often."""
+        last = self._device_data.get(entity.unique_id)
+        if last is None or not isinstance(received, dict) \
+            or "error" in received or "errorCode" in received:
+            return None
+        warm, cold = entity.attribute_tiers()
+        return any(key in last and last[key] != value
+            for key, value in received.items()
+            if key not in warm and key not in cold)
+
+    def _due_attributes(self, entity, attributes):
+        """Return the attributes to request for a device and the warm and
+        cold tiers refreshed by the request."""
+        last = self._device_data.get(entity.unique_id)
+        if last is None:
+            # Nothing received yet, read every attribute once
+            self.attributes_requested += len(attributes)
+            return attributes, (TIER_WARM, TIER_COLD)
+        warm, cold = entity.attribute_tiers()
+        now = time.monotonic()
+        refreshed = self._tier_refreshed.get(entity.unique_id, {})
+        due = [tier for tier, interval in self._tier_intervals.items()
+            if tier not in refreshed or now - refreshed[tier] >= interval]
+        requested = []
+        for attribute in attributes:
+            if attribute in cold:
+                tier = TIER_COLD
+            elif attribute in warm:
+                tier = TIER_WARM
+            else:
+                tier = TIER_HOT
+            if tier == TIER_HOT or tier in due or attribute not in last:
+                requested.append(attribute)
+        self.attributes_requested += len(requested)
+        self.attributes_skipped += len(attributes) - len(requested)
+        return requested, due
+
+    def _merge_device_data(self, device_id, received, tiers):
+        """Merge attributes received with last data of the device. Errors
+        are returned unchanged and do not refresh the tiers."""
+        if not isinstance(received, dict) or "error" in received \
+            or "errorCode" in received:
+            return received
+        device_data = dict(self._device_data.get(device_id, {}))
+        device_data.update(received)
+        self._device_data[device_id] = device_data
+        now = time.monotonic()
+        refreshed = self._tier_refreshed.setdefault(device_id, {})
+        for tier in tiers:
+            refreshed[tier] = now
+        return device_data
+
+    async def async_refresh_device(self, entity):
+        """Refresh only one device, at startup or on request."""
+        await self._async_update_device(entity)
+
+    def _get_entity(self, device_id):
+        """Return the subscribed entity of a device."""
+        for entity in self.async_contexts():
+            if entity.unique_id == device_id:
+                return entity
+        return None
+
+    @callback
+    def async_verify(self, device_id, data):
+        """Read back attributes written to a device after VERIFY_DELAY.
+        Writes done before the read are checked by the same request."""
+        # State shown changed with the command, next poll must write it
+        self._written.pop(device_id, None)
+        pending = self._pending_verify.get(device_id)
+        if pending is None:
+            pending = self._pending_verify[device_id] = {}
+            async_call_later(self.hass, VERIFY_DELAY,
+                partial(self._async_verify_device, device_id))
+        pending.update(data)
+
+    async def _async_verify_device(self, device_id, now):
+        """Fetch only the written attributes, merge them with last data of
+        the device, then confirm or roll back the state shown."""
+        written = self._pending_verify.pop(device_id)
+        entity = self._get_entity(device_id)
+        if entity is None or not entity.activ \
+            or device_id in self._suspended:
+            return
+        if device_id not in self._device_data:
+            # Nothing to merge the attributes with, read the whole device
+            await self.async_refresh_device(entity)
+            self.async_write_device_state(entity)
+            return
+        start = time.time()
+        async with self._semaphore:
+            self.requests += 1
+            try:
+                received = await self._client.get_device_attributes(device_id,
+                    list(written))
+            except Exception:
+                _LOGGER.exception("Verification failed for %s", entity.name)
+                return
+        if "error" in received or "errorCode" in received:
+            _LOGGER.debug("Verification of %s skipped: %s", entity.name,
+                received)
+            return
+        self.verify_count += 1
+        differ = {key: received.get(key) for key, value in written.items()
+            if key in received and received[key] != value}
+        if differ:
+            self.verify_rollback += 1
+            _LOGGER.debug("%s did not apply %s, device values: %s",
+                entity.name, written, differ)
+        device_data = dict(self._device_data[device_id])
+        device_data.update(received)
+        self._device_data[device_id] = device_data
+        try:
+            await entity.async_update_from_data(device_data, start, True)
+        except Exception:
+            _LOGGER.exception("Verification failed for %s", entity.name)
+            return
+        self.async_write_device_state(entity)
@@ -0,0 +1,114 @@
+"""Diagnostics of Neviweb130 devices and recorder footprint of their states."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import callback
+from homeassistant.helpers.entity import entity_sources
+from homeassistant.helpers.json import json_bytes
+
+from .const import DOMAIN, DIAGNOSTIC_ATTRIBUTES, RECORDER_MODE_REDUCED
+from .parsers import last_parse
+
+_LOGGER = logging.getLogger(__name__)
+
+# Estimated size of a row of the recorder states table, without attributes.
+STATE_ROW_BYTES = 150
+
+
+def device_attributes(data, mode):
+    """Return the state attributes of a device entity, without diagnostic
+    attributes in reduced recorder mode."""
+    if mode != RECORDER_MODE_REDUCED:
+        return data
+    return {key: value for key, value in data.items()
+        if key not in DIAGNOSTIC_ATTRIBUTES}
+
+
+def device_diagnostics(hass, entity):
+    """Return the diagnostics of a device entity: values read from Neviweb,
+    its state with every attribute, what the coordinator knows about the
+    device and the time its last parse took."""
+    state = hass.states.get(entity.entity_id)
+    poll = entity.coordinator.device_diagnostics(entity.unique_id)
+    return {
+        "name": entity.name,
+        "unique_id": entity.unique_id,
+        "activ": entity.activ,
+        "values": entity.device_state.as_dict(),
+        "state": state.state if state is not None else None,
+        "attributes": dict(state.attributes) if state is not None else None,
+        "poll": poll,
+        "parse": last_parse(entity.name),
+    }
+
+
+class Neviweb130RecorderMeter:
+    """Estimate bytes written to the recorder by the states of entities of
+    the integration. Bytes are counted twice, as if every attribute was
+    recorded (full) and without unrecorded attributes (recorded). Like the
+    recorder, an attributes row is only counted when the attributes differ
+    from the last ones of the entity, a states row for every state
+    written."""
+
+    def __init__(self, hass):
+        """Initialize the meter."""
+        self._hass = hass
+        self._start = time.monotonic()
+        # Last full and recorded attributes, by entity id
+        self._last = {}
+        self._unsub = None
+        self.states = 0
+        self.full_bytes = 0
+        self.recorded_bytes = 0
+
+    @callback
+    def async_start(self):
+        """Start counting states written."""
+        self._unsub = self._hass.bus.async_listen(EVENT_STATE_CHANGED,
+            self._async_state_changed)
+
+    @callback
+    def async_stop(self):
+        """Stop counting states written."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_state_changed(self, event):
+        """Count the bytes of a state of an entity of the integration."""
+        state = event.data.get("new_state")
+        if state is None:
+            return
+        info = entity_sources(self._hass).get(state.entity_id)
+        if info is None or info["domain"] != DOMAIN:
+            return
+        unrecorded = frozenset()
+        if state.state_info is not None:
+            unrecorded = state.state_info["unrecorded_attributes"]
+        full = json_bytes(state.attributes)
+        recorded = json_bytes({key: value for key, value in
+            state.attributes.items() if key not in unrecorded})
+        last_full, last_recorded = self._last.get(state.entity_id,
+            (None, None))
+        row = STATE_ROW_BYTES + len(state.state)
+        self.states += 1
+        self.full_bytes += row + (len(full) if full != last_full else 0)
+        self.recorded_bytes += row + (len(recorded)
+            if recorded != last_recorded else 0)
+        self._last[state.entity_id] = (full, recorded)
+
+    def get_stats(self, devices):
+        """Return states written and bytes per device and per day, with
+        every attribute and with recorded attributes only."""
+        days = max(time.monotonic() - self._start, 1) / 86400
+        devices = max(devices, 1)
+        return {"states": self.states,
+            "full_bytes_per_device_day": round(self.full_bytes / devices
+                / days),
+            "recorded_bytes_per_device_day": round(self.recorded_bytes
+                / devices / days)}
@@ -0,0 +1,210 @@
+"""Import Neviweb energy history into Home Assistant long-term statistics."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.const import UnitOfEnergy, UnitOfVolume
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN, STORAGE_VERSION, STORAGE_KEY_STATISTICS
+from .stats import HOURLY, DAILY, MONTHLY
+
+_LOGGER = logging.getLogger(__name__)
+
+# Delay before saving checkpoints, imports of all devices are saved at once.
+CHECKPOINT_SAVE_DELAY = 30
+
+# Periods of history making a complete import.
+PERIODS = (HOURLY, DAILY, MONTHLY)
+
+# Divisor of history values by unit of the device statistics, Wh for energy
+# and same scale as the water sensor for flow.
+UNIT_DIVISOR = {
+    UnitOfEnergy.KILO_WATT_HOUR: 1000,
+    UnitOfVolume.CUBIC_METERS: 1000000,
+}
+
+
+def statistic_id(device_id):
+    """Return the external statistic id of a device energy."""
+    return "{}:energy_{}".format(DOMAIN, device_id)
+
+
+def _bucket(period, item, divisor):
+    """Return start and end of the period of a history item and its value
+    divided by divisor, None if the item has no usable date."""
+    try:
+        date = dt_util.parse_datetime(item["date"])
+        energy = item["period"] / divisor
+    except (KeyError, TypeError, ValueError):
+        return None
+    if date is None:
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    date = dt_util.as_local(date)
+    if period == HOURLY:
+        start = date.replace(minute=0, second=0, microsecond=0)
+        return start, start + timedelta(hours=1), energy
+    if period == DAILY:
+        day = date.date()
+        return (dt_util.start_of_local_day(day),
+            dt_util.start_of_local_day(day + timedelta(days=1)), energy)
+    month = date.date().replace(day=1)
+    next_month = (month + timedelta(days=32)).replace(day=1)
+    return (dt_util.start_of_local_day(month),
+        dt_util.start_of_local_day(next_month), energy)
+
+
+def _tally(tallies, start, energy):
+    """Add energy of a statistic starting at start to the energy imported
+    in its local day and month, kept in tallies as [period start, energy]
+    and restarted when a new day or month begins."""
+    day = start.date()
+    for key, begin in (("day", dt_util.start_of_local_day(day)),
+            ("month", dt_util.start_of_local_day(day.replace(day=1)))):
+        begin = begin.isoformat()
+        if key not in tallies or tallies[key][0] != begin:
+            tallies[key] = [begin, 0.0]
+        tallies[key][1] = round(tallies[key][1] + energy, 6)
+
+
+class Neviweb130EnergyImporter:
+    """Write energy history of devices as external statistics, used by the
+    Energy dashboard. A checkpoint per device keeps the end of the last
+    period imported and the running sum, so each run only adds new periods.
+
+    Periods are taken in time order, hourly first when several start at
+    the same time, and a period is only added if it starts after the
+    checkpoint. Monthly and daily history fill the time not covered by
+    hourly history, like on first run or after HA was stopped for a day.
+    When the checkpoint falls inside a day or month not covered by hourly
+    history, the rest of that day or month is added at the checkpoint, as
+    its total less the energy already imported in it, which the checkpoint
+    also keeps.
+
+    The checkpoint also keeps the periods imported. A first import only
+    holds the periods received, when a fetch failed. Histories received
+    are kept until every period was imported: when a missing period is
+    received at a later fetch, statistics of the device are cleared and
+    imported again from all of them.
+    """
+
+    def __init__(self, hass):
+        """Initialize the importer."""
+        self._hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY_STATISTICS)
+        self._checkpoints = {}
+        # Last histories received, by device id, until every period is
+        # imported
+        self._histories = {}
+        self.imported = 0
+
+    async def async_load(self):
+        """Load checkpoints saved by previous runs."""
+        self._checkpoints = await self._store.async_load() or {}
+
+    async def async_import(self, entity, histories):
+        """Import complete periods of histories received for a device."""
+        if "recorder" not in self._hass.config.components:
+            return
+        device_id = str(entity.unique_id)
+        checkpoint = self._checkpoints.get(device_id)
+        # Checkpoints saved before periods were kept had every period
+        imported = set() if checkpoint is None else \
+            set(checkpoint.get("periods", PERIODS))
+        if imported != set(PERIODS):
+            cached = self._histories.setdefault(device_id, {})
+            cached.update(histories)
+            histories = dict(cached)
+        cursor = None
+        total = 0.0
+        tallies = {}
+        # A period missing from the first import was received, import the
+        # whole history again
+        rebuild = checkpoint is not None and \
+            not imported.issuperset(histories)
+        if checkpoint is not None and not rebuild:
+            cursor = dt_util.parse_datetime(checkpoint["end"])
+            total = checkpoint["sum"]
+            tallies = {key: list(value) for key, value in
+                checkpoint.get("tallies", {}).items()}
+        periods = set(histories) | (set() if rebuild else imported)
+        unit = entity.energy_unit
+        buckets = []
+        for span, period in enumerate(PERIODS):
+            for item in histories.get(period) or []:
+                bucket = _bucket(period, item, UNIT_DIVISOR[unit])
+                if bucket is not None:
+                    buckets.append((bucket[0], span, bucket[1], bucket[2]))
+        now = dt_util.now()
+        hours = {start for start, span, end, _ in buckets
+            if span == 0 and end <= now}
+        statistics = []
+        for start, span, end, energy in sorted(buckets):
+            if end > now:
+                continue
+            if cursor is not None and start < cursor:
+                if end <= cursor or cursor in hours:
+                    continue
+                # Checkpoint inside this day or month, add the rest of it
+                tally = tallies.get("day" if PERIODS[span] == DAILY
+                    else "month")
+                if tally is None or tally[0] != start.isoformat():
+                    _LOGGER.debug("Energy of %s imported since %s unknown, "
+                        "%s history skipped", entity.name, start,
+                        PERIODS[span])
+                    continue
+                start = cursor
+                energy = max(energy - tally[1], 0)
+            total += energy
+            statistics.append(StatisticData(start=start, sum=total))
+            _tally(tallies, start, energy)
+            cursor = end
+        if not statistics:
+            return
+        metadata = StatisticMetaData(has_mean=False, has_sum=True,
+            name="{} {}".format(entity.name, "water" if
+                unit == UnitOfVolume.CUBIC_METERS else "energy"),
+            source=DOMAIN, statistic_id=statistic_id(device_id),
+            unit_of_measurement=unit)
+        if rebuild:
+            get_instance(self._hass).async_clear_statistics(
+                [statistic_id(device_id)])
+        async_add_external_statistics(self._hass, metadata, statistics)
+        self.imported += len(statistics)
+        self._checkpoints[device_id] = {"end": cursor.isoformat(),
+            "sum": round(total, 3), "tallies": tallies,
+            "periods": [period for period in PERIODS if period in periods]}
+        if periods == set(PERIODS):
+            self._histories.pop(device_id, None)
+        self._store.async_delay_save(lambda: self._checkpoints,
+            CHECKPOINT_SAVE_DELAY)
+        _LOGGER.debug("Imported %s energy periods of %s up to %s, from %s "
+            "history", len(statistics), entity.name, cursor,
+            "/".join(self._checkpoints[device_id]["periods"]))
+
+    @callback
+    def async_reset(self, entity):
+        """Clear imported statistics and checkpoint of a device, next import
+        backfills the whole history again."""
+        device_id = str(entity.unique_id)
+        self._checkpoints.pop(device_id, None)
+        self._histories.pop(device_id, None)
+        self._store.async_delay_save(lambda: self._checkpoints,
+            CHECKPOINT_SAVE_DELAY)
+        if "recorder" in self._hass.config.components:
+            get_instance(self._hass).async_clear_statistics(
+                [statistic_id(device_id)])
@@ -0,0 +1,139 @@
+"""Thread pool running blocking Neviweb requests, apart from the executor
+Home Assistant shares with every integration."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import logging
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+THREAD_NAME_PREFIX = "neviweb130"
+
+
+class Neviweb130Executor:
+    """Bounded pool of threads for the blocking calls of the requests
+    client: login, inventory, and commands of the custom services. A slow
+    Neviweb then only holds these threads, and jobs queued while all of
+    them are busy are counted with the time they waited.
+
+    parallel_updates limits, by platform, the commands running at the same
+    time, so one platform can not take every thread.
+    """
+
+    def __init__(self, hass, max_workers, parallel_updates):
+        """Initialize the pool of max_workers threads."""
+        self._hass = hass
+        self.max_workers = max_workers
+        # Commands allowed at the same time, by platform, 0 for no limit
+        self._semaphores = {platform: asyncio.Semaphore(limit)
+            for platform, limit in parallel_updates.items() if limit}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+            thread_name_prefix=THREAD_NAME_PREFIX)
+        self._lock = threading.Lock()
+        # Name of the function of jobs submitted and not started, by job
+        # number, and jobs started and not done
+        self._job_numbers = itertools.count()
+        self._waiting = {}
+        self._running = 0
+        self.jobs = 0
+        self.peak_queued = 0
+        self.waited = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    def __run(self, number, submitted, func, args):
+        """Run a job in a pool thread, recording how long it waited."""
+        wait = time.monotonic() - submitted
+        with self._lock:
+            del self._waiting[number]
+            self._running += 1
+            self.wait_time += wait
+            self.max_wait = max(self.max_wait, wait)
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def __queue(self, func):
+        """Count a job of func submitted to the pool, return its number."""
+        with self._lock:
+            number = next(self._job_numbers)
+            self._waiting[number] = getattr(func, "__qualname__", repr(func))
+            self.jobs += 1
+            if len(self._waiting) + self._running > self.max_workers:
+                # No thread free, the job waits in the queue
+                self.waited += 1
+            self.peak_queued = max(self.peak_queued, len(self._waiting))
+            return number
+
+    async def async_run(self, func, *args):
+        """Run func with args in the pool and return its result."""
+        return await self._hass.loop.run_in_executor(self._executor,
+            self.__run, self.__queue(func), time.monotonic(), func, args)
+
+    def map(self, func, items):
+        """Run func on each of items in the pool and return the results in
+        order, from a job already running in the pool. An item not started
+        when its result is needed runs in the calling thread, so the job
+        never waits for the thread it holds."""
+        items = list(items)
+        jobs = []
+        for item in items:
+            number = self.__queue(func)
+            jobs.append((number, self._executor.submit(self.__run, number,
+                time.monotonic(), func, (item,))))
+        results = []
+        for (number, future), item in zip(jobs, items):
+            if future.cancel():
+                with self._lock:
+                    del self._waiting[number]
+                results.append(func(item))
+            else:
+                results.append(future.result())
+        return results
+
+    def job(self, func):
+        """Return a coroutine function running func in the pool, to
+        register a blocking service handler or command of an entity. It
+        waits for the limit of the platform module func is defined in."""
+        semaphore = self._semaphores.get(func.__module__.rsplit(".", 1)[-1])
+
+        async def async_job(*args):
+            if semaphore is None:
+                return await self.async_run(func, *args)
+            async with semaphore:
+                return await self.async_run(func, *args)
+        return async_job
+
+    def shutdown(self):
+        """Stop the threads once their current jobs are done. Jobs not
+        started are cancelled and logged, commands of services among them
+        are not sent."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            cancelled = list(self._waiting.values())
+            self._waiting.clear()
+        if cancelled:
+            _LOGGER.warning("%s Neviweb jobs not started at shutdown were "
+                "cancelled: %s", len(cancelled), ", ".join(cancelled))
+
+    def get_stats(self):
+        """Return pool size, jobs run, jobs queued and running now, highest
+        queue depth, jobs which waited for a free thread, and mean and
+        highest wait in seconds since start."""
+        with self._lock:
+            return {"workers": self.max_workers,
+                "jobs": self.jobs,
+                "queued": len(self._waiting),
+                "running": self._running,
+                "peak_queued": self.peak_queued,
+                "waited": self.waited,
+                "mean_wait": round(self.wait_time / self.jobs, 3)
+                    if self.jobs else 0,
+                "max_wait": round(self.max_wait, 3)}
@@ -18,7 +18,7 @@ import voluptuous as vol
 import time
 
 import custom_components.neviweb130 as neviweb130
-from . import (SCAN_INTERVAL, STAT_INTERVAL, VERSION)
+from . import (SCAN_INTERVAL, VERSION)
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_BRIGHTNESS_PCT,
@@ -28,6 +28,7 @@ from homeassistant.components.light import (
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    UnitOfEnergy,
 )
 
 from homeassistant.helpers import (
@@ -45,8 +46,13 @@ from homeassistant.components.persistent_notification import DOMAIN as PN_DOMAIN
 
 from datetime import timedelta
 from homeassistant.helpers.event import track_time_interval
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
     DOMAIN,
+    UNRECORDED_ATTRIBUTES,
+    SIGNAL_DEVICES_DISCOVERED,
     ATTR_ACTIVE,
     ATTR_BLUE,
     ATTR_ERROR_CODE_SET1,
@@ -79,6 +85,8 @@ from .const import (
     SERVICE_SET_KEY_DOUBLE_UP,
 )
 
+from .diagnostics import device_attributes
+from .parsers import KEEP, Field, compile_parser, entry, item, parse
 from .schema import (
     SET_LIGHT_KEYPAD_LOCK_SCHEMA,
     SET_LIGHT_TIMER_SCHEMA,
@@ -88,12 +96,19 @@ from .schema import (
     SET_ACTIVATION_SCHEMA,
     SET_KEY_DOUBLE_UP_SCHEMA,
 )
+from .state import (
+    Neviweb130LightState,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity updates and commands are not limited by Home Assistant. Device
+# polls are limited by the coordinator, blocking commands by the
+# Neviweb130Executor.
+PARALLEL_UPDATES = 0
+
 DEFAULT_NAME = 'neviweb130 light'
 DEFAULT_NAME_2 = 'neviweb130 light 2'
-SNOOZE_TIME = 1200
 
 UPDATE_ATTRIBUTES = [
     ATTR_INTENSITY,
@@ -108,6 +123,22 @@ UPDATE_ATTRIBUTES = [
     ATTR_RSSI,
 ]
 
+WARM_ATTRIBUTES = [
+    ATTR_KEY_DOUBLE_UP,
+    ATTR_KEYPAD,
+    ATTR_LED_OFF_INTENSITY,
+    ATTR_LED_ON_INTENSITY,
+    ATTR_RSSI,
+]
+
+COLD_ATTRIBUTES = [
+    ATTR_INTENSITY_MIN,
+    ATTR_LED_OFF_COLOR,
+    ATTR_LED_ON_COLOR,
+    ATTR_LIGHT_WATTAGE,
+    ATTR_PHASE_CONTROL,
+]
+
 DEVICE_MODEL_DIMMER = [2131]
 DEVICE_MODEL_NEW_DIMMER = [2132]
 DEVICE_MODEL_LIGHT = [2121]
@@ -123,36 +154,51 @@ async def async_setup_platform(
     """Set up the neviweb light."""
     data = hass.data[DOMAIN]
     
-    entities = []
-    for device_info in data.neviweb130_client.gateway_data:
-        if "signature" in device_info and \
-            "model" in device_info["signature"] and \
-            device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
-            device_name = '{} {}'.format(DEFAULT_NAME, device_info["name"])
-            device_sku = device_info["sku"]
-            device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
-            if device_info["signature"]["model"] in DEVICE_MODEL_LIGHT:
-                entities.append(Neviweb130Light(data, device_info, device_name, device_sku, device_firmware))
-            elif device_info["signature"]["model"] in DEVICE_MODEL_DIMMER:
-                entities.append(Neviweb130Dimmer(data, device_info, device_name, device_sku, device_firmware))
-            elif device_info["signature"]["model"] in DEVICE_MODEL_NEW_DIMMER:
-                entities.append(Neviweb130NewDimmer(data, device_info, device_name, device_sku, device_firmware))
-    for device_info in data.neviweb130_client.gateway_data2:
-        if "signature" in device_info and \
-            "model" in device_info["signature"] and \
-            device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
-            device_name = '{} {}'.format(DEFAULT_NAME, device_info["name"])
-            device_sku = device_info["sku"]
-            device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
-            if device_info["signature"]["model"] in DEVICE_MODEL_LIGHT:
-                entities.append(Neviweb130Light(data, device_info, device_name, device_sku, device_firmware))
-            elif device_info["signature"]["model"] in DEVICE_MODEL_DIMMER:
-                entities.append(Neviweb130Dimmer(data, device_info, device_name, device_sku, device_firmware))
-            elif device_info["signature"]["model"] in DEVICE_MODEL_NEW_DIMMER:
-                entities.append(Neviweb130NewDimmer(data, device_info, device_name, device_sku, device_firmware))
-
+    def build_entities(devices, devices2):
+        """Create entities for devices of both gateways."""
+        new_entities = []
+        for device_info in devices:
+            if "signature" in device_info and \
+                "model" in device_info["signature"] and \
+                device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
+                device_name = '{} {}'.format(DEFAULT_NAME, device_info["name"])
+                device_sku = device_info["sku"]
+                device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
+                if device_info["signature"]["model"] in DEVICE_MODEL_LIGHT:
+                    new_entities.append(Neviweb130Light(data, device_info, device_name, device_sku, device_firmware))
+                elif device_info["signature"]["model"] in DEVICE_MODEL_DIMMER:
+                    new_entities.append(Neviweb130Dimmer(data, device_info, device_name, device_sku, device_firmware))
+                elif device_info["signature"]["model"] in DEVICE_MODEL_NEW_DIMMER:
+                    new_entities.append(Neviweb130NewDimmer(data, device_info, device_name, device_sku, device_firmware))
+        for device_info in devices2:
+            if "signature" in device_info and \
+                "model" in device_info["signature"] and \
+                device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
+                device_name = '{} {}'.format(DEFAULT_NAME, device_info["name"])
+                device_sku = device_info["sku"]
+                device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
+                if device_info["signature"]["model"] in DEVICE_MODEL_LIGHT:
+                    new_entities.append(Neviweb130Light(data, device_info, device_name, device_sku, device_firmware))
+                elif device_info["signature"]["model"] in DEVICE_MODEL_DIMMER:
+                    new_entities.append(Neviweb130Dimmer(data, device_info, device_name, device_sku, device_firmware))
+                elif device_info["signature"]["model"] in DEVICE_MODEL_NEW_DIMMER:
+                    new_entities.append(Neviweb130NewDimmer(data, device_info, device_name, device_sku, device_firmware))
+        return new_entities
+
+    entities = build_entities(data.neviweb130_client.gateway_data,
+        data.neviweb130_client.gateway_data2)
     async_add_entities(entities, True)
 
+    @callback
+    def async_add_discovered_entities(devices, devices2):
+        """Add devices whose signature was fetched after startup."""
+        new_entities = build_entities(devices, devices2)
+        entities.extend(new_entities)
+        async_add_entities(new_entities, True)
+
+    async_dispatcher_connect(hass, SIGNAL_DEVICES_DISCOVERED,
+        async_add_discovered_entities)
+
     def set_light_keypad_lock_service(service):
         """ lock/unlock keypad device"""
         entity_id = service.data[ATTR_ENTITY_ID]
@@ -161,7 +207,7 @@ async def async_setup_platform(
             if light.entity_id == entity_id:
                 value = {"id": light.unique_id, "lock": service.data[ATTR_KEYPAD]}
                 light.set_keypad_lock(value)
-                light.schedule_update_ha_state(True)
+                light.schedule_update_ha_state()
                 break
 
     def set_light_timer_service(service):
@@ -172,7 +218,7 @@ async def async_setup_platform(
             if light.entity_id == entity_id:
                 value = {"id": light.unique_id, "time": service.data[ATTR_TIMER]}
                 light.set_timer(value)
-                light.schedule_update_ha_state(True)
+                light.schedule_update_ha_state()
                 break
 
     def set_led_indicator_service(service):
@@ -183,7 +229,7 @@ async def async_setup_platform(
             if light.entity_id == entity_id:
                 value = {"id": light.unique_id, "state": service.data[ATTR_STATE], "intensity": service.data[ATTR_INTENSITY], "red": service.data[ATTR_RED], "green": service.data[ATTR_GREEN], "blue": service.data[ATTR_BLUE]}
                 light.set_led_indicator(value)
-                light.schedule_update_ha_state(True)
+                light.schedule_update_ha_state()
                 break
 
     def set_wattage_service(service):
@@ -194,7 +240,7 @@ async def async_setup_platform(
             if light.entity_id == entity_id:
                 value = {"id": light.unique_id, "watt": service.data[ATTR_LIGHT_WATTAGE]}
                 light.set_wattage(value)
-                light.schedule_update_ha_state(True)
+                light.schedule_update_ha_state()
                 break
 
     def set_phase_control_service(service):
@@ -205,7 +251,7 @@ async def async_setup_platform(
             if light.entity_id == entity_id:
                 value = {"id": light.unique_id, "phase": service.data[ATTR_PHASE_CONTROL]}
                 light.set_phase_control(value)
-                light.schedule_update_ha_state(True)
+                light.schedule_update_ha_state()
                 break
 
     def set_activation_service(service):
@@ -216,7 +262,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "active": service.data[ATTR_ACTIVE]}
                 switch.set_activation(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_key_double_up_service(service):
@@ -227,55 +273,55 @@ async def async_setup_platform(
             if light.entity_id == entity_id:
                 value = {"id": light.unique_id, "double": service.data[ATTR_KEY_DOUBLE_UP]}
                 light.set_key_double_up(value)
-                light.schedule_update_ha_state(True)
+                light.schedule_update_ha_state()
                 break
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_LIGHT_KEYPAD_LOCK,
-        set_light_keypad_lock_service,
+        data.executor.job(set_light_keypad_lock_service),
         schema=SET_LIGHT_KEYPAD_LOCK_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_LIGHT_TIMER,
-        set_light_timer_service,
+        data.executor.job(set_light_timer_service),
         schema=SET_LIGHT_TIMER_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_LED_INDICATOR,
-        set_led_indicator_service,
+        data.executor.job(set_led_indicator_service),
         schema=SET_LED_INDICATOR_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_WATTAGE,
-        set_wattage_service,
+        data.executor.job(set_wattage_service),
         schema=SET_WATTAGE_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_PHASE_CONTROL,
-        set_phase_control_service,
+        data.executor.job(set_phase_control_service),
         schema=SET_PHASE_CONTROL_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_ACTIVATION,
-        set_activation_service,
+        data.executor.job(set_activation_service),
         schema=SET_ACTIVATION_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_KEY_DOUBLE_UP,
-        set_key_double_up_service,
+        data.executor.job(set_key_double_up_service),
         schema=SET_KEY_DOUBLE_UP_SCHEMA,
     )
 
@@ -303,34 +349,67 @@ def lock_to_ha(lock):
         case "partialLock":
             return "Tamper protection"
 
-class Neviweb130Light(LightEntity):
+def led_to_ha(intensity, color):
+    """Convert led intensity and color to intensity,red,green,blue."""
+    return "{},{},{},{}".format(intensity, color["red"], color["green"],
+        color["blue"])
+
+# Parsers of device data, by light model
+
+LED_FIELDS = (
+    Field("led_on", (ATTR_LED_ON_INTENSITY, ATTR_LED_ON_COLOR), led_to_ha),
+    Field("led_off", (ATTR_LED_OFF_INTENSITY, ATTR_LED_OFF_COLOR), led_to_ha),
+)
+
+LIGHT_FIELDS = LED_FIELDS + (
+    Field("onoff", ATTR_ONOFF),
+    Field("wattage", ATTR_LIGHT_WATTAGE, item("value")),
+    Field("wattage_status", ATTR_LIGHT_WATTAGE, item("status")),
+    Field("temp_status", ATTR_ERROR_CODE_SET1, entry("temperature"), KEEP),
+    Field("keypad", ATTR_KEYPAD),
+    Field("timer", ATTR_TIMER),
+    Field("rssi", ATTR_RSSI),
+)
+
+LIGHT_PARSER = compile_parser("light", Neviweb130LightState, LIGHT_FIELDS)
+
+DIMMER_PARSER = compile_parser("dimmer", Neviweb130LightState,
+    LIGHT_FIELDS + (
+    Field("brightness_pct", ATTR_INTENSITY, round, 0),
+    Field("intensity_min", ATTR_INTENSITY_MIN),
+))
+
+NEW_DIMMER_PARSER = compile_parser("new_dimmer", Neviweb130LightState,
+    LED_FIELDS + (
+    Field("brightness_pct", ATTR_INTENSITY, round, 0),
+    Field("intensity_min", ATTR_INTENSITY_MIN),
+    Field("phase_control", ATTR_PHASE_CONTROL),
+    Field("double_up", ATTR_KEY_DOUBLE_UP),
+    Field("onoff", ATTR_ONOFF),
+    Field("keypad", ATTR_KEYPAD),
+    Field("wattage", ATTR_WATTAGE_INSTANT),
+    Field("timer", ATTR_TIMER),
+    Field("temp_status", ATTR_ERROR_CODE_SET1, entry("temperature"), KEEP),
+    Field("rssi", ATTR_RSSI),
+))
+
+class Neviweb130Light(CoordinatorEntity, LightEntity):
     """Implementation of a neviweb light, SW2500ZB, SW2500ZB-G2."""
 
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
+
     def __init__(self, data, device_info, name, sku, firmware):
         """Initialize."""
         self._name = name
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
-        self._hour_energy_kwh_count = None
-        self._today_energy_kwh_count = None
-        self._month_energy_kwh_count = None
-        self._hour_kwh = None
-        self._today_kwh = None
-        self._month_kwh = None
-        self._brightness_pct = 0
-        self._keypad = "Unlocked"
-        self._timer = 0
-        self._led_on = "0,0,0,0"
-        self._led_off = "0,0,0,0"
-        self._wattage = 0
-        self._wattage_status = None
-        self._temp_status = None
-        self._rssi = None
-        self._onoff = None
+        self._state = Neviweb130LightState()
         self._is_light = device_info["signature"]["model"] in \
             DEVICE_MODEL_LIGHT
         self._is_dimmable = device_info["signature"]["model"] in \
@@ -338,44 +417,35 @@ class Neviweb130Light(LightEntity):
             DEVICE_MODEL_NEW_DIMMER
         self._is_new_dimmable = device_info["signature"]["model"] in \
             DEVICE_MODEL_NEW_DIMMER
-        self._energy_stat_time = time.time() - 1500
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
+    def attribute_tiers(self):
+        """Return attributes refreshed on the warm and cold tiers."""
+        return WARM_ATTRIBUTES, COLD_ATTRIBUTES
+
+    def update_endpoints(self):
+        """Return endpoints read by the coordinator besides attributes."""
+        return []
+
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        WATT_ATTRIBUTE = [ATTR_LIGHT_WATTAGE, ATTR_ERROR_CODE_SET1]
+        return UPDATE_ATTRIBUTES + WATT_ATTRIBUTE
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from neviweb and update the state."""
-            WATT_ATTRIBUTE = [ATTR_LIGHT_WATTAGE, ATTR_ERROR_CODE_SET1]
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + WATT_ATTRIBUTE)
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s",
                 self._name, elapsed, device_data)
             if "error" not in device_data:
                 if "errorCode" not in device_data:
-                    self._onoff = device_data[ATTR_ONOFF]
-                    self._wattage = device_data[ATTR_LIGHT_WATTAGE]["value"]
-                    self._wattage_status = device_data[ATTR_LIGHT_WATTAGE]["status"]
-                    if ATTR_ERROR_CODE_SET1 in device_data and len(device_data[ATTR_ERROR_CODE_SET1]) > 0:
-                        self._temp_status = device_data[ATTR_ERROR_CODE_SET1]["temperature"]
-                    self._keypad = device_data[ATTR_KEYPAD]
-                    self._timer = device_data[ATTR_TIMER]
-                    self._rssi = device_data[ATTR_RSSI]
-                    self._led_on = str(device_data[ATTR_LED_ON_INTENSITY])+","+str(device_data[ATTR_LED_ON_COLOR]["red"])+","+str(device_data[ATTR_LED_ON_COLOR]["green"])+","+str(device_data[ATTR_LED_ON_COLOR]["blue"])
-                    self._led_off = str(device_data[ATTR_LED_OFF_INTENSITY])+","+str(device_data[ATTR_LED_OFF_COLOR]["red"])+","+str(device_data[ATTR_LED_OFF_COLOR]["green"])+","+str(device_data[ATTR_LED_OFF_COLOR]["blue"])
+                    parse(LIGHT_PARSER, self._state, device_data, self._name)
                 else:
                     _LOGGER.warning("Error in updating device %s: (%s)", self._name, device_data)
             else:
-                self.log_error(device_data["error"]["code"])
-            self.do_stat(start)
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
 
     @property
     def supported_color_modes(self):
@@ -391,6 +461,57 @@ class Neviweb130Light(LightEntity):
             return ColorMode.BRIGHTNESS
         return ColorMode.ONOFF
 
+    @property
+    def activ(self):
+        """Return False when Neviweb polling is halted for this device."""
+        return self.coordinator.breaker(self.unique_id).closed
+
+    @property
+    def available(self):
+        """Return False while the gateway of the device is offline."""
+        return super().available and \
+            self.coordinator.device_available(self.unique_id)
+
+    @property
+    def device_signature(self):
+        """Return model and firmware of the device."""
+        return self._device_model, self._firmware
+
+    @property
+    def device_state(self):
+        """Return the values last read from Neviweb for this device."""
+        return self._state
+
+    @property
+    def energy_stats(self):
+        """Return True if energy statistics are fetched for this device."""
+        return True
+
+    @property
+    def energy_unit(self):
+        """Return the unit of energy statistics of this device."""
+        return UnitOfEnergy.KILO_WATT_HOUR
+
+    @property
+    def energy_counters(self):
+        """Return energy counters and last period usage in kWh, shown by the
+        energy sensor of this device."""
+        return {'hourly_kwh_count': self._state.hour_energy_kwh_count,
+            'daily_kwh_count': self._state.today_energy_kwh_count,
+            'monthly_kwh_count': self._state.month_energy_kwh_count,
+            'hourly_kwh': self._state.hour_kwh,
+            'daily_kwh': self._state.today_kwh,
+            'monthly_kwh': self._state.month_kwh}
+
+    @property
+    def power_sensor(self):
+        """Return True if the power drawn by this device is known."""
+        return False
+
+    async def async_update(self):
+        """Refresh this device only, at startup or after a command."""
+        await self.coordinator.async_refresh_device(self)
+
     @property
     def unique_id(self):
         """Return unique ID based on Neviweb device ID."""
@@ -410,38 +531,33 @@ class Neviweb130Light(LightEntity):
     def extra_state_attributes(self):
         """Return the state attributes."""
         data = {}
-        data.update({'wattage': self._wattage,
-                    'wattage_status': self._wattage_status,
-                    'Temperature_status': self._temp_status,
-                    'onOff': self._onoff,
-                    'keypad': lock_to_ha(self._keypad),
-                    'timer': self._timer,
-                    'led_on': self._led_on,
-                    'led_off': self._led_off,
-                    'hourly_kwh_count': self._hour_energy_kwh_count,
-                    'daily_kwh_count': self._today_energy_kwh_count,
-                    'monthly_kwh_count': self._month_energy_kwh_count,
-                    'hourly_kwh': self._hour_kwh,
-                    'daily_kwh': self._today_kwh,
-                    'monthly_kwh': self._month_kwh,
+        data.update({'wattage': self._state.wattage,
+                    'wattage_status': self._state.wattage_status,
+                    'Temperature_status': self._state.temp_status,
+                    'onOff': self._state.onoff,
+                    'keypad': lock_to_ha(self._state.keypad),
+                    'timer': self._state.timer,
+                    'led_on': self._state.led_on,
+                    'led_off': self._state.led_off,
                     'sku': self._sku,
                     'device_model': str(self._device_model),
                     'device_model_cfg': self._device_model_cfg,
-                    'rssi': self._rssi,
+                    'rssi': self._state.rssi,
                     'firmware': self._firmware,
-                    'Activation': self._activ,
+                    'Activation': self.activ,
+                    'poll_interval': self.coordinator.poll_interval(self._id),
                     'id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
 
     @property
     def brightness(self):
         """Return intensity of light"""
-        return brightness_from_percentage(self._brightness_pct)
+        return brightness_from_percentage(self._state.brightness_pct)
 
     @property
     def is_on(self): ## need to change this for neviweb130
         """Return true if device is on."""
-        return self._onoff != MODE_OFF
+        return self._state.onoff != MODE_OFF
 
     # For the turn_on and turn_off functions, we would normally check if the
     # the requested state is different from the actual state to issue the 
@@ -449,22 +565,30 @@ class Neviweb130Light(LightEntity):
     # chance that the current stored state doesn't match with real device 
     # state. So we force the set_brightness each time.
 
-    def turn_on(self, **kwargs):
-        """Turn the light on."""
-        if not self.is_on:
-            if self._brightness_pct == 0:
-                self._brightness_pct = 5
-            self._client.set_light_onoff(self._id, "on", self._brightness_pct)
+    async def async_turn_on(self, **kwargs):
+        """Turn the light on. The new state is shown at once, the write is
+        then verified by a read of the device."""
+        turn_on = not self.is_on
+        if turn_on and self._state.brightness_pct == 0:
+            self._state.brightness_pct = 5
+        brightness_pct = None
         if ATTR_BRIGHTNESS in kwargs and self.brightness != kwargs[ATTR_BRIGHTNESS]:
             brightness_pct = brightness_to_percentage(round(kwargs.get(ATTR_BRIGHTNESS)))
-            self._client.set_brightness(self._id, brightness_pct)
-            self._brightness_pct = brightness_pct
-        self._onoff = "on"
-
-    def turn_off(self, **kwargs):
+        on_pct = self._state.brightness_pct
+        if brightness_pct is not None:
+            self._state.brightness_pct = brightness_pct
+        self._state.onoff = "on"
+        self.async_write_ha_state()
+        if turn_on:
+            await self._async_client.set_light_onoff(self._id, "on", on_pct)
+        if brightness_pct is not None:
+            await self._async_client.set_brightness(self._id, brightness_pct)
+
+    async def async_turn_off(self, **kwargs):
         """Turn the light off."""
-        self._client.set_light_onoff(self._id, "off", self._brightness_pct)
-        self._onoff = MODE_OFF
+        self._state.onoff = MODE_OFF
+        self.async_write_ha_state()
+        await self._async_client.set_light_onoff(self._id, "off", self._state.brightness_pct)
 
     def set_phase_control(self, value):
         """Change phase control parameter, reverse or forward """
@@ -472,7 +596,7 @@ class Neviweb130Light(LightEntity):
         entity = value["id"]
         self._client.set_phase(
             entity, phase)
-        self._phase_control = phase
+        self._state.phase_control = phase
 
     def set_keypad_lock(self, value):
         """Lock, unlock or partially lock device's keypad, lock = locked, unlock = unlocked, partiallyLocked = partial lock"""
@@ -480,7 +604,7 @@ class Neviweb130Light(LightEntity):
         entity = value["id"]
         self._client.set_keypad_lock(
             entity, lock, False)
-        self._keypad = lock
+        self._state.keypad = lock
 
     def set_timer(self, value):
         """Set device timer, 0 = off, 1 to 255 = timer length"""
@@ -488,7 +612,7 @@ class Neviweb130Light(LightEntity):
         entity = value["id"]
         self._client.set_timer(
             entity, time)
-        self._timer = time
+        self._state.timer = time
 
     def set_led_indicator(self, value):
         """Set led indicator color and intensity, base on RGB red, green, blue color (0-255) and intensity from 0 to 100"""
@@ -501,9 +625,9 @@ class Neviweb130Light(LightEntity):
         self._client.set_led_indicator(
             entity, state, intensity, red, green, blue)
         if state == 0:
-            self._led_off = str(value["intensity"])+","+str(value["red"])+","+str(value["green"])+","+str(value["blue"])
+            self._state.led_off = str(value["intensity"])+","+str(value["red"])+","+str(value["green"])+","+str(value["blue"])
         else:
-            self._led_on = str(value["intensity"])+","+str(value["red"])+","+str(value["green"])+","+str(value["blue"])
+            self._state.led_on = str(value["intensity"])+","+str(value["red"])+","+str(value["green"])+","+str(value["blue"])
 
     def set_wattage(self, value):
         """Set light device watt load """
@@ -511,12 +635,12 @@ class Neviweb130Light(LightEntity):
         entity = value["id"]
         self._client.set_wattage(
             entity, watt)
-        self._wattage = watt
+        self._state.wattage = watt
 
     def set_activation(self, value):
         """ Activate or deactivate neviweb polling for a missing device """
         action = value["active"]
-        self._activ = action
+        self.coordinator.breaker(self.unique_id).set_active(action)
 
     def set_key_double_up(self, value):
         """Change key double up action """
@@ -524,47 +648,40 @@ class Neviweb130Light(LightEntity):
         entity = value["id"]
         self._client.set_double_up(
             entity, double)
-        self._double_up = double
-
-    def do_stat(self, start):
-        """ Get device energy statistic """
-        if start - self._energy_stat_time > STAT_INTERVAL and self._energy_stat_time != 0:
-            device_hourly_stats = self._client.get_device_hourly_stats(self._id)
-#            _LOGGER.warning("%s device_hourly_stats = %s", self._name, device_hourly_stats)
-            if device_hourly_stats is not None and len(device_hourly_stats) > 1:
-                self._hour_energy_kwh_count = device_hourly_stats[1]["counter"] / 1000
-                self._hour_kwh = device_hourly_stats[1]["period"] / 1000
+        self._state.double_up = double
+
+    def update_energy_stats(self, hourly, daily, monthly):
+        """ Update device energy statistic, None for a period not fetched """
+        if hourly is not None:
+            if len(hourly) > 1:
+                self._state.hour_energy_kwh_count = hourly[1]["counter"] / 1000
+                self._state.hour_kwh = hourly[1]["period"] / 1000
             else:
                 _LOGGER.warning("Got None for device_hourly_stats")
-            device_daily_stats = self._client.get_device_daily_stats(self._id)
-#            _LOGGER.warning("%s device_daily_stats = %s", self._name, device_daily_stats)
-            if device_daily_stats is not None and len(device_daily_stats) > 1:
-                self._today_energy_kwh_count = device_daily_stats[0]["counter"] / 1000
-                self._today_kwh = device_daily_stats[0]["period"] / 1000
+        if daily is not None:
+            if len(daily) > 1:
+                self._state.today_energy_kwh_count = daily[0]["counter"] / 1000
+                self._state.today_kwh = daily[0]["period"] / 1000
             else:
                 _LOGGER.warning("Got None for device_daily_stats")
-            device_monthly_stats = self._client.get_device_monthly_stats(self._id)
-#            _LOGGER.warning("%s device_monthly_stats = %s", self._name, device_monthly_stats)
-            if device_monthly_stats is not None and len(device_monthly_stats) > 1:
-                self._month_energy_kwh_count = device_monthly_stats[0]["counter"] / 1000
-                self._month_kwh = device_monthly_stats[0]["period"] / 1000
+        if monthly is not None:
+            if len(monthly) > 1:
+                self._state.month_energy_kwh_count = monthly[0]["counter"] / 1000
+                self._state.month_kwh = monthly[0]["period"] / 1000
             else:
                 _LOGGER.warning("Got None for device_monthly_stats")
-            self._energy_stat_time = time.time()
-        if self._energy_stat_time == 0:
-            self._energy_stat_time = start
 
-    def log_error(self, error_data):
+    async def async_log_error(self, error_data):
         """ Send error message to LOG """
         if error_data == "USRSESSEXP":
             _LOGGER.warning("Session expired... reconnecting...")
-            self._client.reconnect()
+            await self._async_client.reconnect()
         elif error_data == "ACCSESSEXC":
             _LOGGER.warning("Maximun session number reached...Close other connections and try again.")
-            self.notify_ha(
+            await self.async_notify_ha(
                 f"Warning: Maximun Neviweb session number reached...Close other connections and try again."
             )
-            self._client.reconnect()
+            await self._async_client.reconnect()
         elif error_data == "DVCATTRNSPTD":
                 _LOGGER.warning("Device attribute not supported for %s: %s...(SKU: %s)", self._name, device_data, self._sku)
         elif error_data == "DVCACTNSPTD":
@@ -577,19 +694,17 @@ class Neviweb130Light(LightEntity):
             _LOGGER.warning("Device busy can't reach (neviweb update ?), retry later %s: %s...(SKU: %s)", self._name, device_data, self._sku)
         elif error_data == "DVCUNVLB":
             _LOGGER.warning("Device %s is disconected from Neviweb: %s...(SKU: %s)", self._name, device_data, self._sku)
-            _LOGGER.warning("This device %s is de-activated and won't be updated for 20 minutes.",self._name)
-            _LOGGER.warning("You can re-activate device %s with service.neviweb130_set_activation or wait 20 minutes for update to restart or just restart HA.",self._name)
-            self._activ = False
-            self._snooze = time.time()
-            self.notify_ha(
-                f"Warning: Received message from Neviweb, device disconnected... Check you log... Neviweb update will be halted for 20 minutes for " + self._name + ", Sku: " + self._sku
+            _LOGGER.warning("This device %s is de-activated and will be probed with a growing delay until it answers again.",self._name)
+            _LOGGER.warning("You can re-activate device %s with service.neviweb130_set_activation or wait for update to restart or just restart HA.",self._name)
+            await self.async_notify_ha(
+                f"Warning: Received message from Neviweb, device disconnected... Check you log... Neviweb update will be halted until the device answers again for " + self._name + ", Sku: " + self._sku
             )
         else:
             _LOGGER.warning("Unknown error for %s: %s...(SKU: %s) Report to maintainer.", self._name, device_data, self._sku)
 
-    def notify_ha(self, msg: str, title: str = "Neviweb130 integration "+VERSION):
+    async def async_notify_ha(self, msg: str, title: str = "Neviweb130 integration "+VERSION):
         """Notify user via HA web frontend."""
-        self.hass.services.call(
+        await self.hass.services.async_call(
             PN_DOMAIN,
             "create",
             service_data={
@@ -609,99 +724,59 @@ class Neviweb130Dimmer(Neviweb130Light):
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
-        self._hour_energy_kwh_count = None
-        self._today_energy_kwh_count = None
-        self._month_energy_kwh_count = None
-        self._hour_kwh = None
-        self._today_kwh = None
-        self._month_kwh = None
-        self._brightness_pct = 0
-        self._keypad = "Unlocked"
-        self._timer = 0
-        self._led_on = "0,0,0,0"
-        self._led_off = "0,0,0,0"
-        self._intensity_min = 600
-        self._wattage = 0
-        self._wattage_status = None
-        self._temp_status = None
-        self._rssi = None
+        self._state = Neviweb130LightState()
         self._is_dimmable = device_info["signature"]["model"] in \
             DEVICE_MODEL_DIMMER
-        self._onoff = None
-        self._energy_stat_time = time.time() - 1500
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        WATT_ATTRIBUTE = [ATTR_LIGHT_WATTAGE, ATTR_ERROR_CODE_SET1]
+        return UPDATE_ATTRIBUTES + WATT_ATTRIBUTE
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from neviweb and update the state."""
-            WATT_ATTRIBUTE = [ATTR_LIGHT_WATTAGE, ATTR_ERROR_CODE_SET1]
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + WATT_ATTRIBUTE)
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
             if "error" not in device_data:
                 if "errorCode" not in device_data:
-                    if ATTR_INTENSITY in device_data:
-                        self._brightness_pct = round(device_data[ATTR_INTENSITY]) if \
-                            device_data[ATTR_INTENSITY] is not None else 0
-                    self._intensity_min = device_data[ATTR_INTENSITY_MIN]
-                    self._onoff = device_data[ATTR_ONOFF]
-                    self._wattage = device_data[ATTR_LIGHT_WATTAGE]["value"]
-                    self._wattage_status = device_data[ATTR_LIGHT_WATTAGE]["status"]
-                    if ATTR_ERROR_CODE_SET1 in device_data and len(device_data[ATTR_ERROR_CODE_SET1]) > 0:
-                        self._temp_status = device_data[ATTR_ERROR_CODE_SET1]["temperature"]
-                    self._keypad = device_data[ATTR_KEYPAD]
-                    self._timer = device_data[ATTR_TIMER]
-                    self._rssi = device_data[ATTR_RSSI]
-                    self._led_on = str(device_data[ATTR_LED_ON_INTENSITY])+","+str(device_data[ATTR_LED_ON_COLOR]["red"])+","+str(device_data[ATTR_LED_ON_COLOR]["green"])+","+str(device_data[ATTR_LED_ON_COLOR]["blue"])
-                    self._led_off = str(device_data[ATTR_LED_OFF_INTENSITY])+","+str(device_data[ATTR_LED_OFF_COLOR]["red"])+","+str(device_data[ATTR_LED_OFF_COLOR]["green"])+","+str(device_data[ATTR_LED_OFF_COLOR]["blue"])
+                    parse(DIMMER_PARSER, self._state, device_data, self._name)
                 else:
                     _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
             else:
-                self.log_error(device_data["error"]["code"])
-            self.do_stat(start)
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
         data = {}
-        data.update({ATTR_BRIGHTNESS_PCT: self._brightness_pct,
-               'minimum_intensity': self._intensity_min,
-               'Temperature_status': self._temp_status,
-               'wattage': self._wattage,
-               'wattage_status': self._wattage_status,
-               'Temperature_status': self._temp_status,
-               'onOff': self._onoff,
-               'keypad': lock_to_ha(self._keypad),
-               'timer': self._timer,
-               'led_on': self._led_on,
-               'led_off': self._led_off,
-               'hourly_kwh_count': self._hour_energy_kwh_count,
-               'daily_kwh_count': self._today_energy_kwh_count,
-               'monthly_kwh_count': self._month_energy_kwh_count,
-               'hourly_kwh': self._hour_kwh,
-               'daily_kwh': self._today_kwh,
-               'monthly_kwh': self._month_kwh,
+        data.update({ATTR_BRIGHTNESS_PCT: self._state.brightness_pct,
+               'minimum_intensity': self._state.intensity_min,
+               'Temperature_status': self._state.temp_status,
+               'wattage': self._state.wattage,
+               'wattage_status': self._state.wattage_status,
+               'Temperature_status': self._state.temp_status,
+               'onOff': self._state.onoff,
+               'keypad': lock_to_ha(self._state.keypad),
+               'timer': self._state.timer,
+               'led_on': self._state.led_on,
+               'led_off': self._state.led_off,
                'sku': self._sku,
                'device_model': str(self._device_model),
                'device_model_cfg': self._device_model_cfg,
                'firmware': self._firmware,
-               'rssi': self._rssi,
-               'Activation': self._activ,
+               'rssi': self._state.rssi,
+               'Activation': self.activ,
+               'poll_interval': self.coordinator.poll_interval(self._id),
                'id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
 
 class Neviweb130NewDimmer(Neviweb130Light):
     """Implementation of a neviweb new dimmer DM2550ZB, DM2550ZB-G2."""
@@ -712,100 +787,68 @@ class Neviweb130NewDimmer(Neviweb130Light):
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
-        self._hour_energy_kwh_count = None
-        self._today_energy_kwh_count = None
-        self._month_energy_kwh_count = None
-        self._hour_kwh = None
-        self._today_kwh = None
-        self._month_kwh = None
-        self._brightness_pct = 0
-        self._keypad = "Unlocked"
-        self._timer = 0
-        self._led_on = "0,0,0,0"
-        self._led_off = "0,0,0,0"
-        self._phase_control = None
-        self._intensity_min = 600
-        self._wattage = 0
-        self._double_up = None
-        self._temp_status = None
-        self._rssi = None
+        self._state = Neviweb130LightState()
         self._is_dimmable = device_info["signature"]["model"] in \
             DEVICE_MODEL_NEW_DIMMER
         self._is_new_dimmable = device_info["signature"]["model"] in \
             DEVICE_MODEL_NEW_DIMMER
-        self._onoff = None
-        self._energy_stat_time = time.time() - 1500
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        WATT_ATTRIBUTE = [ATTR_PHASE_CONTROL, ATTR_KEY_DOUBLE_UP, ATTR_WATTAGE_INSTANT, ATTR_ERROR_CODE_SET1]
+        return UPDATE_ATTRIBUTES + WATT_ATTRIBUTE
+
+    @property
+    def power_sensor(self):
+        """Return True if the power drawn by this device is known."""
+        return True
+
+    @property
+    def current_power(self):
+        """Return the power drawn in W."""
+        return self._state.wattage
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from neviweb and update the state."""
-            WATT_ATTRIBUTE = [ATTR_PHASE_CONTROL, ATTR_KEY_DOUBLE_UP, ATTR_WATTAGE_INSTANT, ATTR_ERROR_CODE_SET1]
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + WATT_ATTRIBUTE)
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
             if "error" not in device_data:
                 if "errorCode" not in device_data:
-                    if ATTR_INTENSITY in device_data:
-                        self._brightness_pct = round(device_data[ATTR_INTENSITY]) if \
-                            device_data[ATTR_INTENSITY] is not None else 0
-                    self._intensity_min = device_data[ATTR_INTENSITY_MIN]
-                    self._phase_control = device_data[ATTR_PHASE_CONTROL]
-                    self._double_up = device_data[ATTR_KEY_DOUBLE_UP]
-                    self._onoff = device_data[ATTR_ONOFF]
-                    self._keypad = device_data[ATTR_KEYPAD]
-                    self._wattage = device_data[ATTR_WATTAGE_INSTANT]
-                    self._timer = device_data[ATTR_TIMER]
-                    if ATTR_ERROR_CODE_SET1 in device_data and len(device_data[ATTR_ERROR_CODE_SET1]) > 0:
-                        self._temp_status = device_data[ATTR_ERROR_CODE_SET1]["temperature"]
-                    self._rssi = device_data[ATTR_RSSI]
-                    self._led_on = str(device_data[ATTR_LED_ON_INTENSITY])+","+str(device_data[ATTR_LED_ON_COLOR]["red"])+","+str(device_data[ATTR_LED_ON_COLOR]["green"])+","+str(device_data[ATTR_LED_ON_COLOR]["blue"])
-                    self._led_off = str(device_data[ATTR_LED_OFF_INTENSITY])+","+str(device_data[ATTR_LED_OFF_COLOR]["red"])+","+str(device_data[ATTR_LED_OFF_COLOR]["green"])+","+str(device_data[ATTR_LED_OFF_COLOR]["blue"])
+                    parse(NEW_DIMMER_PARSER, self._state, device_data, self._name)
                 else:
                     _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
             else:
-                self.log_error(device_data["error"]["code"])
-            self.do_stat(start)
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
         data = {}
-        data.update({ATTR_BRIGHTNESS_PCT: self._brightness_pct,
-               'minimum_intensity': self._intensity_min,
-               'Temperature_status': self._temp_status,
-               'phase_control': self._phase_control,
-               'Double_up_Action': self._double_up,
-               'wattage': self._wattage,
-               'onOff': self._onoff,
-               'keypad': lock_to_ha(self._keypad),
-               'timer': self._timer,
-               'led_on': self._led_on,
-               'led_off': self._led_off,
-               'hourly_kwh_count': self._hour_energy_kwh_count,
-               'daily_kwh_count': self._today_energy_kwh_count,
-               'monthly_kwh_count': self._month_energy_kwh_count,
-               'hourly_kwh': self._hour_kwh,
-               'daily_kwh': self._today_kwh,
-               'monthly_kwh': self._month_kwh,
+        data.update({ATTR_BRIGHTNESS_PCT: self._state.brightness_pct,
+               'minimum_intensity': self._state.intensity_min,
+               'Temperature_status': self._state.temp_status,
+               'phase_control': self._state.phase_control,
+               'Double_up_Action': self._state.double_up,
+               'wattage': self._state.wattage,
+               'onOff': self._state.onoff,
+               'keypad': lock_to_ha(self._state.keypad),
+               'timer': self._state.timer,
+               'led_on': self._state.led_on,
+               'led_off': self._state.led_off,
                'sku': self._sku,
                'device_model': str(self._device_model),
                'device_model_cfg': self._device_model_cfg,
                'firmware': self._firmware,
-               'rssi': self._rssi,
-               'Activation': self._activ,
+               'rssi': self._state.rssi,
+               'Activation': self.activ,
+               'poll_interval': self.coordinator.poll_interval(self._id),
                'id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
@@ -0,0 +1,119 @@
+"""Token bucket rate limiter for requests sent to Neviweb."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+
+_LOGGER = logging.getLogger(__name__)
+
+READ = "read"
+WRITE = "write"
+STAT = "stat"
+
+
+class TokenBucket:
+    """Allow rate requests per second on average with bursts of burst
+    requests. A rate of 0 disables the limit."""
+
+    def __init__(self, rate, burst):
+        """Initialize a full bucket."""
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.delayed = 0
+        self.delay = 0.0
+
+    def reserve(self):
+        """Take one token and return the number of seconds to wait before
+        sending the request. Tokens can go below zero so waiting callers
+        are served in order."""
+        with self._lock:
+            self.requests += 1
+            if not self._rate:
+                return 0
+            now = time.monotonic()
+            self._tokens = min(self._burst,
+                self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            wait = -self._tokens / self._rate
+            self.delayed += 1
+            self.delay += wait
+            return wait
+
+
+class Neviweb130RateLimiter:
+    """Client wide limiter with separate budgets for device reads, device
+    writes and energy statistics. Login is never delayed."""
+
+    def __init__(self, read_rate, read_burst, write_rate, write_burst,
+            stat_rate, stat_burst):
+        """Initialize one bucket per request kind."""
+        self._buckets = {
+            READ: TokenBucket(read_rate, read_burst),
+            WRITE: TokenBucket(write_rate, write_burst),
+            STAT: TokenBucket(stat_rate, stat_burst),
+        }
+
+    @staticmethod
+    def request_kind(method, url):
+        """Return the bucket used for a request, None for login."""
+        if url.endswith("/api/login"):
+            return None
+        if "/energy/" in url:
+            return STAT
+        if method.upper() in ("PUT", "POST"):
+            return WRITE
+        return READ
+
+    def reserve(self, method, url):
+        """Return the number of seconds to wait before sending a request."""
+        kind = self.request_kind(method, url)
+        if kind is None:
+            return 0
+        wait = self._buckets[kind].reserve()
+        if wait:
+            _LOGGER.debug("Rate limit, %s request delayed %s sec: %s", kind,
+                round(wait, 3), url)
+        return wait
+
+    def wait(self, method, url):
+        """Block until a request can be sent, used from executor threads.
+        Return the time waited."""
+        wait = self.reserve(method, url)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def get_stats(self):
+        """Return requests, delayed requests and cumulated delay by kind."""
+        return {kind: {"requests": bucket.requests,
+            "delayed": bucket.delayed,
+            "delay": round(bucket.delay, 3)}
+            for kind, bucket in self._buckets.items()}
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """Requests transport adapter waiting for the rate limiter before
+    sending each request."""
+
+    def __init__(self, limiter, **kwargs):
+        """Initialize the adapter."""
+        self._limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        """Wait for the limiter, then send the request. The time waited is
+        kept on the request to be removed from the response time."""
+        request.rate_limit_wait = self._limiter.wait(request.method,
+            request.url)
+        return super().send(request, **kwargs)
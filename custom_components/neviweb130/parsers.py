@@ -0,0 +1,150 @@
+"""Declarative parsers of device data received from Neviweb.
+
+Each device model gets a table of Field entries: the state slot to set, the
+Neviweb attribute read, an optional extractor and a default. Tables are
+compiled once, at import, into a parser setting the slots of a device state
+in one pass. An attribute missing from the data or with an unexpected shape
+only leaves its slot unchanged, instead of aborting the whole update.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+import logging
+from operator import itemgetter
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Errors of an extractor meaning the attribute is not shaped as expected.
+PARSE_ERRORS = (KeyError, IndexError, TypeError, ValueError, AttributeError)
+
+# Default leaving the slot unchanged when no value is received.
+KEEP = object()
+
+# Compiled parsers by name, with their state class.
+PARSERS = {}
+
+# Parser last used for each device and time its last parse took in
+# microseconds, by device name.
+_DEVICE_PARSES = {}
+
+Field = namedtuple("Field", "name attribute extract default",
+    defaults=(None, None))
+Field.__doc__ = """Entry of a parser table. name is the state slot set from
+attribute, a Neviweb attribute or a tuple of them. extract is called with
+the value of each attribute, not called when a single attribute is None.
+default is stored when the value is None, KEEP leaves the slot unchanged."""
+
+
+def item(key):
+    """Return an extractor of key of a dict attribute, like value or
+    status."""
+    return itemgetter(key)
+
+
+def entry(key):
+    """Return an extractor of key of a dict attribute giving None when the
+    key is absent, for error code sets that are often empty."""
+    def extract(value):
+        return value.get(key)
+    return extract
+
+
+def if_on(key):
+    """Return an extractor of key of a dict attribute, None unless its
+    status is on."""
+    def extract(value):
+        return value[key] if value["status"] == "on" else None
+    return extract
+
+
+def chain(*extractors):
+    """Return an extractor applying extractors in order, stopping at the
+    first None."""
+    def extract(value):
+        for extractor in extractors:
+            if value is None:
+                return None
+            value = extractor(value)
+        return value
+    return extract
+
+
+def _step(name, attribute, extract, default):
+    """Return a function setting one slot of a state from device data."""
+    if isinstance(attribute, tuple):
+        def read(data):
+            return extract(*[data[key] for key in attribute])
+    elif extract is None:
+        read = itemgetter(attribute)
+    else:
+        get = itemgetter(attribute)
+
+        def read(data):
+            value = get(data)
+            return None if value is None else extract(value)
+
+    if default is KEEP:
+        def step(state, data):
+            value = read(data)
+            if value is not None:
+                setattr(state, name, value)
+    elif default is None:
+        def step(state, data):
+            setattr(state, name, read(data))
+    else:
+        def step(state, data):
+            value = read(data)
+            setattr(state, name, default if value is None else value)
+    return step
+
+
+def compile_parser(name, state_class, fields):
+    """Compile a table of fields into a parser of states of state_class,
+    registered under name. The parser sets the slots of a state from device
+    data and returns the attributes missing or not parsed."""
+    slots = set(state_class().as_dict())
+    unknown = [field.name for field in fields if field.name not in slots]
+    if unknown:
+        raise ValueError("Unknown slots of {} in parser {}: {}".format(
+            state_class.__name__, name, unknown))
+    steps = tuple((field.attribute, _step(*field)) for field in fields)
+
+    def parse(state, data):
+        failed = []
+        for attribute, step in steps:
+            try:
+                step(state, data)
+            except PARSE_ERRORS:
+                failed.append(attribute)
+        return failed
+
+    PARSERS[name] = (state_class, parse)
+    return parse
+
+
+def parse(parser, state, data, name):
+    """Parse device data of the device called name into its state, logging
+    attributes missing or not parsed."""
+    start = time.perf_counter()
+    failed = parser(state, data)
+    _DEVICE_PARSES[name] = (parser, (time.perf_counter() - start) * 1e6)
+    if failed:
+        _LOGGER.debug("Attributes missing or not parsed for %s: %s", name,
+            failed)
+
+
+def parser_name(parser):
+    """Return the name a compiled parser is registered under."""
+    return next(key for key, value in PARSERS.items() if value[1] is parser)
+
+
+def last_parse(name):
+    """Return the parser last used for the device called name and the time
+    in microseconds its last parse took. Return None if the device was not
+    parsed yet."""
+    if name not in _DEVICE_PARSES:
+        return None
+    parser, elapsed = _DEVICE_PARSES[name]
+    return {"parser": parser_name(parser), "last_parse_us": round(elapsed, 1)}
@@ -0,0 +1,77 @@
+"""Retry policy for requests sent to Neviweb."""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Errors worth sending the same request again, the device or Neviweb may
+# answer later. Other errors, like DVCATTRNSPTD or SVCUNAUTH, will not change.
+# ReadTimeout is the error code used when Neviweb did not answer in time.
+RETRYABLE_ERRORS = {"DVCBUSY", "DVCCOMMTO", "SVCERR", "ReadTimeout"}
+
+
+def error_code(data):
+    """Return the error code of a Neviweb response, None if no error."""
+    if not isinstance(data, dict):
+        return None
+    if isinstance(data.get("error"), dict):
+        return data["error"].get("code")
+    return data.get("errorCode")
+
+
+class Neviweb130RetryPolicy:
+    """Exponential backoff with full jitter for retryable errors, limited
+    to max_retries per request and to budget retries per cycle for the
+    whole client. Device attribute writes set absolute values, so they can
+    be sent again like reads."""
+
+    def __init__(self, max_retries, base_delay, max_delay, budget, cycle):
+        """Initialize the policy, cycle is the budget period in seconds."""
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._budget = budget
+        self._cycle = cycle
+        self._lock = threading.Lock()
+        self._cycle_start = time.monotonic()
+        self._budget_left = budget
+        self.retries = 0
+        self.retries_by_code = {}
+        self.given_up = 0
+        self.budget_exhausted = 0
+
+    def next_delay(self, attempt, code):
+        """Return seconds to wait before retry number attempt + 1 of a
+        request which failed with code, or None to give up."""
+        if code not in RETRYABLE_ERRORS:
+            return None
+        with self._lock:
+            if attempt >= self._max_retries:
+                self.given_up += 1
+                return None
+            now = time.monotonic()
+            if now - self._cycle_start >= self._cycle:
+                self._cycle_start = now
+                self._budget_left = self._budget
+            if self._budget_left <= 0:
+                self.budget_exhausted += 1
+                return None
+            self._budget_left -= 1
+            self.retries += 1
+            self.retries_by_code[code] = self.retries_by_code.get(code, 0) + 1
+        return random.uniform(0, min(self._max_delay,
+            self._base_delay * 2 ** attempt))
+
+    def get_stats(self):
+        """Return retries sent, by error code, requests given up after
+        max_retries and retries refused by the budget."""
+        with self._lock:
+            return {"retries": self.retries,
+                "retries_by_code": dict(self.retries_by_code),
+                "given_up": self.given_up,
+                "budget_exhausted": self.budget_exhausted}
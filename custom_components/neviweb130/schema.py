@@ -20,6 +20,30 @@ from .const import (
     CONF_NETWORK2,
     CONF_HOMEKIT_MODE,
     CONF_STAT_INTERVAL,
+    CONF_POOL_SIZE,
+    CONF_READ_RATE,
+    CONF_READ_BURST,
+    CONF_WRITE_RATE,
+    CONF_WRITE_BURST,
+    CONF_STAT_RATE,
+    CONF_STAT_BURST,
+    CONF_RETRY_ATTEMPTS,
+    CONF_RETRY_DELAY,
+    CONF_RETRY_BUDGET,
+    CONF_WARM_INTERVAL,
+    CONF_COLD_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_POLL_BUDGET,
+    CONF_RECORDER_MODE,
+    CONF_BREAKER_ERRORS,
+    CONF_BREAKER_THRESHOLD,
+    CONF_BREAKER_OPEN_TIME,
+    CONF_EXECUTOR_SIZE,
+    CONF_PARALLEL_UPDATES,
+    PLATFORMS,
+    RECORDER_MODE_FULL,
+    RECORDER_MODE_REDUCED,
     ATTR_ACTIVE,
     ATTR_BACKLIGHT,
     ATTR_BATT_ALERT,
@@ -84,6 +108,30 @@ from .const import (
 SCAN_INTERVAL = timedelta(seconds=540)
 HOMEKIT_MODE = False
 STAT_INTERVAL = 1800
+POOL_SIZE = 10
+READ_RATE = 5
+READ_BURST = 20
+WRITE_RATE = 2
+WRITE_BURST = 5
+STAT_RATE = 1
+STAT_BURST = 5
+RETRY_ATTEMPTS = 3
+RETRY_DELAY = 1
+RETRY_MAX_DELAY = 30
+RETRY_BUDGET = 30
+WARM_INTERVAL = timedelta(hours=1)
+COLD_INTERVAL = timedelta(hours=24)
+MIN_SCAN_INTERVAL = timedelta(seconds=300)
+MAX_SCAN_INTERVAL = timedelta(seconds=1800)
+POLL_BUDGET = 0
+RECORDER_MODE = RECORDER_MODE_FULL
+BREAKER_ERRORS = ["DVCUNVLB", "DVCCOMMTO", "DVCBUSY", "SVCERR", "ReadTimeout",
+    "RequestError"]
+BREAKER_THRESHOLD = 3
+BREAKER_OPEN_TIME = timedelta(seconds=300)
+BREAKER_MAX_OPEN_TIME = timedelta(hours=2)
+EXECUTOR_SIZE = 4
+PARALLEL_UPDATES = {}
 PERIOD_VALUE = {"15 sec", "5 min", "10 min", "15 min", "20 min", "25 min", "30 min"}
 TANK_VALUE = {"40 gal", "50 gal", "60 gal", "80 gal"}
 CONTROLLED_VALUE = {"Hot water heater", "Pool pump", "Eletric vehicle charger", "Other"}
@@ -108,6 +156,51 @@ CONFIG_SCHEMA = vol.Schema({
             cv.boolean,
         vol.Optional(CONF_STAT_INTERVAL, default=STAT_INTERVAL):
             vol.All(vol.Coerce(int), vol.Range(min=300, max=1800)),
+        vol.Optional(CONF_POOL_SIZE, default=POOL_SIZE):
+            vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+        vol.Optional(CONF_READ_RATE, default=READ_RATE):
+            vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        vol.Optional(CONF_READ_BURST, default=READ_BURST):
+            vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+        vol.Optional(CONF_WRITE_RATE, default=WRITE_RATE):
+            vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        vol.Optional(CONF_WRITE_BURST, default=WRITE_BURST):
+            vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+        vol.Optional(CONF_STAT_RATE, default=STAT_RATE):
+            vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        vol.Optional(CONF_STAT_BURST, default=STAT_BURST):
+            vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+        vol.Optional(CONF_RETRY_ATTEMPTS, default=RETRY_ATTEMPTS):
+            vol.All(vol.Coerce(int), vol.Range(min=0, max=10)),
+        vol.Optional(CONF_RETRY_DELAY, default=RETRY_DELAY):
+            vol.All(vol.Coerce(float), vol.Range(min=0.1, max=RETRY_MAX_DELAY)),
+        vol.Optional(CONF_RETRY_BUDGET, default=RETRY_BUDGET):
+            vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+        vol.Optional(CONF_WARM_INTERVAL, default=WARM_INTERVAL):
+            cv.time_period,
+        vol.Optional(CONF_COLD_INTERVAL, default=COLD_INTERVAL):
+            cv.time_period,
+        vol.Optional(CONF_MIN_SCAN_INTERVAL, default=MIN_SCAN_INTERVAL):
+            cv.time_period,
+        vol.Optional(CONF_MAX_SCAN_INTERVAL, default=MAX_SCAN_INTERVAL):
+            cv.time_period,
+        vol.Optional(CONF_POLL_BUDGET, default=POLL_BUDGET):
+            vol.All(vol.Coerce(int), vol.Range(min=0, max=100000)),
+        vol.Optional(CONF_RECORDER_MODE, default=RECORDER_MODE):
+            vol.In([RECORDER_MODE_FULL, RECORDER_MODE_REDUCED]),
+        vol.Optional(CONF_BREAKER_ERRORS, default=BREAKER_ERRORS):
+            vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_BREAKER_THRESHOLD, default=BREAKER_THRESHOLD):
+            vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+        vol.Optional(CONF_BREAKER_OPEN_TIME, default=BREAKER_OPEN_TIME):
+            vol.All(cv.time_period, vol.Range(min=timedelta(seconds=30),
+                max=BREAKER_MAX_OPEN_TIME)),
+        vol.Optional(CONF_EXECUTOR_SIZE, default=EXECUTOR_SIZE):
+            vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+        vol.Optional(CONF_PARALLEL_UPDATES, default=PARALLEL_UPDATES):
+            vol.Schema({vol.Optional(platform):
+                vol.All(vol.Coerce(int), vol.Range(min=0, max=100))
+                for platform in PLATFORMS}),
     })
 },
     extra=vol.ALLOW_EXTRA,
@@ -583,3 +676,15 @@ SET_BATTERY_ALERT_SCHEMA = vol.Schema(
         vol.Required(ATTR_BATT_ALERT): vol.In([True, False]),
     }
 )
+
+RESYNC_ENERGY_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+    }
+)
+
+GET_DIAGNOSTICS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+    }
+)
@@ -31,7 +31,9 @@ from homeassistant.const import (
     ATTR_VOLTAGE,
     PERCENTAGE,
     STATE_OK,
+    UnitOfPower,
     UnitOfTemperature,
+    UnitOfVolume,
 )
 
 from homeassistant.helpers import (
@@ -45,7 +47,11 @@ from homeassistant.helpers import (
 )
 
 from homeassistant.helpers.typing import HomeAssistantType
-from homeassistant.components.sensor import SensorStateClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.persistent_notification import DOMAIN as PN_DOMAIN
 
@@ -53,8 +59,15 @@ from datetime import timedelta
 from homeassistant.helpers.event import track_time_interval
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.icon import icon_for_battery_level
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
     DOMAIN,
+    UNRECORDED_ATTRIBUTES,
+    SIGNAL_DEVICES_DISCOVERED,
+    SIGNAL_DEVICE_SUBSCRIBED,
+    SIGNAL_DEVICE_UPDATED,
     ATTR_ACTIVE,
     ATTR_ANGLE,
     ATTR_BATT_ALERT,
@@ -93,6 +106,8 @@ from .const import (
     SERVICE_SET_ACTIVATION,
 )
 
+from .diagnostics import device_attributes
+from .parsers import KEEP, Field, compile_parser, entry, item, parse
 from .schema import (
     TANK_HEIGHT,
     SET_SENSOR_ALERT_SCHEMA,
@@ -105,15 +120,26 @@ from .schema import (
     SET_BATTERY_ALERT_SCHEMA,
     SET_ACTIVATION_SCHEMA,
 )
+from .state import (
+    Neviweb130LeakSensorState,
+    Neviweb130TankMonitorState,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity updates and commands are not limited by Home Assistant. Device
+# polls are limited by the coordinator, blocking commands by the
+# Neviweb130Executor.
+PARALLEL_UPDATES = 0
+
 DEFAULT_NAME = 'neviweb130 sensor'
 DEFAULT_NAME_2 = 'neviweb130 sensor 2'
-SNOOZE_TIME = 1200
 
 UPDATE_ATTRIBUTES = [ATTR_BATTERY_VOLTAGE, ATTR_BATTERY_STATUS]
 
+WARM_ATTRIBUTES = [ATTR_BATTERY_VOLTAGE, ATTR_BATT_PERCENT_NORMAL, ATTR_RSSI, ATTR_LEAK_ALERT, ATTR_BATT_ALERT, ATTR_TEMP_ALERT, ATTR_FUEL_ALERT, ATTR_FUEL_PERCENT_ALERT, ATTR_CONF_CLOSURE]
+COLD_ATTRIBUTES = [ATTR_BATTERY_TYPE, ATTR_TANK_TYPE, ATTR_GAUGE_TYPE, ATTR_TANK_HEIGHT]
+
 IMPLEMENTED_GATEWAY = [130]
 IMPLEMENTED_TANK_MONITOR = [5055, 5056]
 IMPLEMENTED_SENSOR_MODEL = [5051, 5053]
@@ -137,46 +163,84 @@ async def async_setup_platform(
     """Set up the Neviweb sensor."""
     data = hass.data[DOMAIN]
 
-    entities = []
-    for device_info in data.neviweb130_client.gateway_data:
-        if "signature" in device_info and \
-            "model" in device_info["signature"] and \
-            device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
-            device_name = '{} {}'.format(DEFAULT_NAME, device_info["name"])
-            device_sku = device_info["sku"]
-            device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
-            if device_info["signature"]["model"] in IMPLEMENTED_SENSOR_MODEL \
-              or device_info["signature"]["model"] in IMPLEMENTED_CONNECTED_SENSOR \
-              or device_info["signature"]["model"] in IMPLEMENTED_NEW_SENSOR_MODEL:
-                device_type = "leak"
-                entities.append(Neviweb130Sensor(data, device_info, device_name, device_type, device_sku, device_firmware))
-            elif  device_info["signature"]["model"] in IMPLEMENTED_TANK_MONITOR:
-                device_type = "level"
-                entities.append(Neviweb130TankSensor(data, device_info, device_name, device_type, device_sku, device_firmware))
-            else:
-                device_type = "gateway"
-                entities.append(Neviweb130GatewaySensor(data, device_info, device_name, device_type, device_sku, device_firmware))
-    for device_info in data.neviweb130_client.gateway_data2:
-        if "signature" in device_info and \
-            "model" in device_info["signature"] and \
-            device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
-            device_name = '{} {}'.format(DEFAULT_NAME_2, device_info["name"])
-            device_sku = device_info["sku"]
-            device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
-            if device_info["signature"]["model"] in IMPLEMENTED_SENSOR_MODEL \
-              or device_info["signature"]["model"] in IMPLEMENTED_CONNECTED_SENSOR \
-              or device_info["signature"]["model"] in IMPLEMENTED_NEW_SENSOR_MODEL:
-                device_type = "leak"
-                entities.append(Neviweb130Sensor(data, device_info, device_name, device_type, device_sku, device_firmware))
-            elif  device_info["signature"]["model"] in IMPLEMENTED_TANK_MONITOR:
-                device_type = "level"
-                entities.append(Neviweb130TankSensor(data, device_info, device_name, device_type, device_sku, device_firmware))
-            else:
-                device_type = "gateway"
-                entities.append(Neviweb130GatewaySensor(data, device_info, device_name, device_type, device_sku, device_firmware))
-
+    def build_entities(devices, devices2):
+        """Create entities for devices of both gateways."""
+        new_entities = []
+        for device_info in devices:
+            if "signature" in device_info and \
+                "model" in device_info["signature"] and \
+                device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
+                device_name = '{} {}'.format(DEFAULT_NAME, device_info["name"])
+                device_sku = device_info["sku"]
+                device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
+                if device_info["signature"]["model"] in IMPLEMENTED_SENSOR_MODEL \
+                  or device_info["signature"]["model"] in IMPLEMENTED_CONNECTED_SENSOR \
+                  or device_info["signature"]["model"] in IMPLEMENTED_NEW_SENSOR_MODEL:
+                    device_type = "leak"
+                    new_entities.append(Neviweb130Sensor(data, device_info, device_name, device_type, device_sku, device_firmware))
+                elif  device_info["signature"]["model"] in IMPLEMENTED_TANK_MONITOR:
+                    device_type = "level"
+                    new_entities.append(Neviweb130TankSensor(data, device_info, device_name, device_type, device_sku, device_firmware))
+                else:
+                    device_type = "gateway"
+                    new_entities.append(Neviweb130GatewaySensor(data, device_info, device_name, device_type, device_sku, device_firmware))
+        for device_info in devices2:
+            if "signature" in device_info and \
+                "model" in device_info["signature"] and \
+                device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
+                device_name = '{} {}'.format(DEFAULT_NAME_2, device_info["name"])
+                device_sku = device_info["sku"]
+                device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
+                if device_info["signature"]["model"] in IMPLEMENTED_SENSOR_MODEL \
+                  or device_info["signature"]["model"] in IMPLEMENTED_CONNECTED_SENSOR \
+                  or device_info["signature"]["model"] in IMPLEMENTED_NEW_SENSOR_MODEL:
+                    device_type = "leak"
+                    new_entities.append(Neviweb130Sensor(data, device_info, device_name, device_type, device_sku, device_firmware))
+                elif  device_info["signature"]["model"] in IMPLEMENTED_TANK_MONITOR:
+                    device_type = "level"
+                    new_entities.append(Neviweb130TankSensor(data, device_info, device_name, device_type, device_sku, device_firmware))
+                else:
+                    device_type = "gateway"
+                    new_entities.append(Neviweb130GatewaySensor(data, device_info, device_name, device_type, device_sku, device_firmware))
+        return new_entities
+
+    entities = build_entities(data.neviweb130_client.gateway_data,
+        data.neviweb130_client.gateway_data2)
     async_add_entities(entities, True)
 
+    @callback
+    def async_add_discovered_entities(devices, devices2):
+        """Add devices whose signature was fetched after startup."""
+        new_entities = build_entities(devices, devices2)
+        entities.extend(new_entities)
+        async_add_entities(new_entities, True)
+
+    async_dispatcher_connect(hass, SIGNAL_DEVICES_DISCOVERED,
+        async_add_discovered_entities)
+
+    # Devices of every platform with energy or power sensors added
+    sensor_devices = set()
+
+    @callback
+    def async_add_device_sensors(device):
+        """Add energy and power sensors of a device entity."""
+        if device.unique_id in sensor_devices:
+            return
+        new_sensors = []
+        if device.energy_stats:
+            new_sensors.append(Neviweb130EnergySensor(device))
+        if device.power_sensor:
+            new_sensors.append(Neviweb130PowerSensor(device))
+        if new_sensors:
+            sensor_devices.add(device.unique_id)
+            async_add_entities(new_sensors)
+
+    for coordinator in (data.coordinator, data.coordinator2):
+        for device in coordinator.async_contexts():
+            async_add_device_sensors(device)
+    async_dispatcher_connect(hass, SIGNAL_DEVICE_SUBSCRIBED,
+        async_add_device_sensors)
+
     def set_sensor_alert_service(service):
         """ Set different alert and action for water leak sensor """
         entity_id = service.data[ATTR_ENTITY_ID]
@@ -185,7 +249,7 @@ async def async_setup_platform(
             if sensor.entity_id == entity_id:
                 value = {"id": sensor.unique_id, "leak": service.data[ATTR_LEAK_ALERT], "temp": service.data[ATTR_TEMP_ALERT], "batt": service.data[ATTR_BATT_ALERT], "close": service.data[ATTR_CONF_CLOSURE]}
                 sensor.set_sensor_alert(value)
-                sensor.schedule_update_ha_state(True)
+                sensor.schedule_update_ha_state()
                 break
 
     def set_battery_type_service(service):
@@ -196,7 +260,7 @@ async def async_setup_platform(
             if sensor.entity_id == entity_id:
                 value = {"id": sensor.unique_id, "type": service.data[ATTR_BATTERY_TYPE]}
                 sensor.set_battery_type(value)
-                sensor.schedule_update_ha_state(True)
+                sensor.schedule_update_ha_state()
                 break
 
     def set_tank_type_service(service):
@@ -207,7 +271,7 @@ async def async_setup_platform(
             if sensor.entity_id == entity_id:
                 value = {"id": sensor.unique_id, "type": service.data[ATTR_TANK_TYPE]}
                 sensor.set_tank_type(value)
-                sensor.schedule_update_ha_state(True)
+                sensor.schedule_update_ha_state()
                 break
 
     def set_gauge_type_service(service):
@@ -218,7 +282,7 @@ async def async_setup_platform(
             if sensor.entity_id == entity_id:
                 value = {"id": sensor.unique_id, "gauge": service.data[ATTR_GAUGE_TYPE]}
                 sensor.set_gauge_type(value)
-                sensor.schedule_update_ha_state(True)
+                sensor.schedule_update_ha_state()
                 break
 
     def set_low_fuel_alert_service(service):
@@ -229,7 +293,7 @@ async def async_setup_platform(
             if sensor.entity_id == entity_id:
                 value = {"id": sensor.unique_id, "low": service.data[ATTR_FUEL_PERCENT_ALERT]}
                 sensor.set_low_fuel_alert(value)
-                sensor.schedule_update_ha_state(True)
+                sensor.schedule_update_ha_state()
                 break
 
     def set_tank_height_service(service):
@@ -240,7 +304,7 @@ async def async_setup_platform(
             if sensor.entity_id == entity_id:
                 value = {"id": sensor.unique_id, "height": service.data[ATTR_TANK_HEIGHT]}
                 sensor.set_tank_height(value)
-                sensor.schedule_update_ha_state(True)
+                sensor.schedule_update_ha_state()
                 break
 
     def set_fuel_alert_service(service):
@@ -251,7 +315,7 @@ async def async_setup_platform(
             if sensor.entity_id == entity_id:
                 value = {"id": sensor.unique_id, "fuel": service.data[ATTR_FUEL_ALERT]}
                 sensor.set_fuel_alert(value)
-                sensor.schedule_update_ha_state(True)
+                sensor.schedule_update_ha_state()
                 break
 
     def set_battery_alert_service(service):
@@ -262,7 +326,7 @@ async def async_setup_platform(
             if sensor.entity_id == entity_id:
                 value = {"id": sensor.unique_id, "batt": service.data[ATTR_BATT_ALERT]}
                 sensor.set_battery_alert(value)
-                sensor.schedule_update_ha_state(True)
+                sensor.schedule_update_ha_state()
                 break
 
     def set_activation_service(service):
@@ -273,69 +337,69 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "active": service.data[ATTR_ACTIVE]}
                 switch.set_activation(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_SENSOR_ALERT,
-        set_sensor_alert_service,
+        data.executor.job(set_sensor_alert_service),
         schema=SET_SENSOR_ALERT_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_BATTERY_TYPE,
-        set_battery_type_service,
+        data.executor.job(set_battery_type_service),
         schema=SET_BATTERY_TYPE_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_TANK_TYPE,
-        set_tank_type_service,
+        data.executor.job(set_tank_type_service),
         schema=SET_TANK_TYPE_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_GAUGE_TYPE,
-        set_gauge_type_service,
+        data.executor.job(set_gauge_type_service),
         schema=SET_GAUGE_TYPE_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_LOW_FUEL_ALERT,
-        set_low_fuel_alert_service,
+        data.executor.job(set_low_fuel_alert_service),
         schema=SET_LOW_FUEL_ALERT_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_TANK_HEIGHT,
-        set_tank_height_service,
+        data.executor.job(set_tank_height_service),
         schema=SET_TANK_HEIGHT_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_FUEL_ALERT,
-        set_fuel_alert_service,
+        data.executor.job(set_fuel_alert_service),
         schema=SET_FUEL_ALERT_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_BATTERY_ALERT,
-        set_battery_alert_service,
+        data.executor.job(set_battery_alert_service),
         schema=SET_BATTERY_ALERT_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_ACTIVATION,
-        set_activation_service,
+        data.executor.job(set_activation_service),
         schema=SET_ACTIVATION_SCHEMA,
     )
 
@@ -371,43 +435,77 @@ def convert_to_percent(angle, low, high):
     pct = y * value_range + lower_limit
     return round(pct)
 
-class Neviweb130Sensor(Entity):
+def leak_to_ha(status):
+    """Convert leak status to water or ok."""
+    return STATE_WATER_LEAK if status == STATE_WATER_LEAK else "ok"
+
+# Parsers of device data, by sensor model
+
+SENSOR_FIELDS = (
+    Field("battery_voltage", ATTR_BATTERY_VOLTAGE),
+    Field("rssi", ATTR_RSSI),
+)
+
+LEAK_FIELDS = SENSOR_FIELDS + (
+    Field("leak_status", ATTR_WATER_LEAK_STATUS, leak_to_ha, "ok"),
+    Field("cur_temp", ATTR_ROOM_TEMPERATURE),
+    Field("leak_alert", ATTR_LEAK_ALERT),
+    Field("temp_status", ATTR_ROOM_TEMP_ALARM),
+    Field("temp_alert", ATTR_TEMP_ALERT),
+    Field("battery_alert", ATTR_BATT_ALERT),
+    Field("battery_status", ATTR_BATTERY_STATUS),
+    Field("battery_type", ATTR_BATTERY_TYPE, None, KEEP),
+    Field("batt_percent_normal", ATTR_BATT_PERCENT_NORMAL),
+    Field("batt_status_normal", ATTR_BATT_STATUS_NORMAL),
+)
+
+SENSOR_PARSER = compile_parser("sensor", Neviweb130LeakSensorState,
+    SENSOR_FIELDS)
+
+LEAK_PARSER = compile_parser("leak", Neviweb130LeakSensorState, LEAK_FIELDS)
+
+CONNECTED_PARSER = compile_parser("connected", Neviweb130LeakSensorState,
+    LEAK_FIELDS + (
+    Field("closure_action", ATTR_CONF_CLOSURE),
+))
+
+NEW_LEAK_PARSER = compile_parser("new_leak", Neviweb130LeakSensorState,
+    LEAK_FIELDS + (
+    Field("data", ATTR_ERROR_CODE_SET1, entry("data"), KEEP),
+))
+
+TANK_PARSER = compile_parser("tank", Neviweb130TankMonitorState,
+    SENSOR_FIELDS + (
+    Field("angle", ATTR_ANGLE, item("value")),
+    Field("sampling", ATTR_ANGLE, item(ATTR_SAMPLING)),
+    Field("tank_percent", ATTR_TANK_PERCENT),
+    Field("tank_type", ATTR_TANK_TYPE),
+    Field("tank_height", ATTR_TANK_HEIGHT),
+    Field("gauge_type", ATTR_GAUGE_TYPE),
+    Field("fuel_alert", ATTR_FUEL_ALERT),
+    Field("fuel_percent_alert", ATTR_FUEL_PERCENT_ALERT),
+    Field("battery_alert", ATTR_BATT_ALERT),
+    Field("temperature", ATTR_ERROR_CODE_SET1, entry("temperature"), KEEP),
+))
+
+class Neviweb130Sensor(CoordinatorEntity, Entity):
     """Implementation of a Neviweb sensor."""
 
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
+
     def __init__(self, data, device_info, name, device_type, sku, firmware):
         """Initialize."""
         self._name = name
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
         self._device_type = device_type
-        self._cur_temp = None
-        self._leak_status = None
-        self._battery_voltage = None
-        self._battery_status = None
-        self._temp_status = None
-        self._battery_type = "alkaline"
-        self._leak_status = None
-        self._leak_alert = None
-        self._temp_alert = None
-        self._battery_alert = None
-        self._fuel_alert = None
-        self._fuel_percent_alert = None
-        self._closure_action = None
-        self._rssi = None
-        self._angle = None
-        self._sampling = None
-        self._tank_type = None
-        self._tank_height = None
-        self._tank_percent = None
-        self._gauge_type = None
-        self._temperature = None
-        self._data = None
-        self._batt_percent_normal = None
-        self._batt_status_normal = None
+        self._state = Neviweb130LeakSensorState()
         self._is_leak = device_info["signature"]["model"] in \
             IMPLEMENTED_SENSOR_MODEL or device_info["signature"]["model"] in IMPLEMENTED_CONNECTED_SENSOR \
             or device_info["signature"]["model"] in IMPLEMENTED_NEW_SENSOR_MODEL
@@ -419,68 +517,89 @@ class Neviweb130Sensor(Entity):
             IMPLEMENTED_TANK_MONITOR
         self._is_gateway = device_info["signature"]["model"] in \
             IMPLEMENTED_GATEWAY
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
-            if self._is_leak:
-                LEAK_ATTRIBUTE = [ATTR_WATER_LEAK_STATUS, ATTR_ROOM_TEMPERATURE, ATTR_ROOM_TEMP_ALARM, ATTR_LEAK_ALERT, ATTR_BATTERY_TYPE, ATTR_BATT_ALERT, ATTR_TEMP_ALERT, ATTR_RSSI, ATTR_BATT_PERCENT_NORMAL, ATTR_BATT_STATUS_NORMAL]
-            else:
-                LEAK_ATTRIBUTE = []
-            if self._is_new_leak:
-                NEW_LEAK_ATTRIBUTE = [ATTR_ERROR_CODE_SET1]
-            else:
-                NEW_LEAK_ATTRIBUTE = []
-            if self._is_connected:
-                CONNECTED_ATTRIBUTE = [ATTR_CONF_CLOSURE]
-            else:
-                CONNECTED_ATTRIBUTE = []
+    def attribute_tiers(self):
+        """Return attributes refreshed on the warm and cold tiers."""
+        return WARM_ATTRIBUTES, COLD_ATTRIBUTES
 
+    def update_endpoints(self):
+        """Return endpoints read by the coordinator besides attributes."""
+        return []
+
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        if self._is_leak:
+            LEAK_ATTRIBUTE = [ATTR_WATER_LEAK_STATUS, ATTR_ROOM_TEMPERATURE, ATTR_ROOM_TEMP_ALARM, ATTR_LEAK_ALERT, ATTR_BATTERY_TYPE, ATTR_BATT_ALERT, ATTR_TEMP_ALERT, ATTR_RSSI, ATTR_BATT_PERCENT_NORMAL, ATTR_BATT_STATUS_NORMAL]
+        else:
+            LEAK_ATTRIBUTE = []
+        if self._is_new_leak:
+            NEW_LEAK_ATTRIBUTE = [ATTR_ERROR_CODE_SET1]
+        else:
+            NEW_LEAK_ATTRIBUTE = []
+        if self._is_connected:
+            CONNECTED_ATTRIBUTE = [ATTR_CONF_CLOSURE]
+        else:
+            CONNECTED_ATTRIBUTE = []
+        return UPDATE_ATTRIBUTES + LEAK_ATTRIBUTE + CONNECTED_ATTRIBUTE + NEW_LEAK_ATTRIBUTE
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from Neviweb and update the state."""
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id,
-                UPDATE_ATTRIBUTES + LEAK_ATTRIBUTE + CONNECTED_ATTRIBUTE + NEW_LEAK_ATTRIBUTE)
 #            device_daily_stats = self._client.get_device_daily_stats(self._id)
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
             if "error" not in device_data or device_data is not None:
                 if "errorCode" not in device_data:
-                    if self._is_leak or self._is_connected or self._is_new_leak:
-                        self._leak_status = STATE_WATER_LEAK if \
-                            device_data[ATTR_WATER_LEAK_STATUS] == STATE_WATER_LEAK else "ok"
-                        self._cur_temp = device_data[ATTR_ROOM_TEMPERATURE]
-                        self._leak_alert = device_data[ATTR_LEAK_ALERT]
-                        self._temp_status = device_data[ATTR_ROOM_TEMP_ALARM]
-                        self._temp_alert = device_data[ATTR_TEMP_ALERT]
-                        self._battery_alert = device_data[ATTR_BATT_ALERT]
-                        if ATTR_BATTERY_STATUS in device_data:
-                            self._battery_status = device_data[ATTR_BATTERY_STATUS]
-                            self._battery_type = device_data[ATTR_BATTERY_TYPE]
-                        if ATTR_BATT_PERCENT_NORMAL in device_data:
-                            self._batt_percent_normal = device_data[ATTR_BATT_PERCENT_NORMAL]
-                            self._batt_status_normal = device_data[ATTR_BATT_STATUS_NORMAL]
-                        if self._is_connected:
-                            self._closure_action = device_data[ATTR_CONF_CLOSURE]
-                        if self._is_new_leak:
-                            if ATTR_ERROR_CODE_SET1 in device_data and len(device_data[ATTR_ERROR_CODE_SET1]) > 0:
-                                self._data = device_data[ATTR_ERROR_CODE_SET1]["data"]
-                    self._battery_voltage = device_data[ATTR_BATTERY_VOLTAGE]
-                    if ATTR_RSSI in device_data:
-                            self._rssi = device_data[ATTR_RSSI]
+                    if self._is_connected:
+                        parse(CONNECTED_PARSER, self._state, device_data, self._name)
+                    elif self._is_new_leak:
+                        parse(NEW_LEAK_PARSER, self._state, device_data, self._name)
+                    elif self._is_leak:
+                        parse(LEAK_PARSER, self._state, device_data, self._name)
+                    else:
+                        parse(SENSOR_PARSER, self._state, device_data, self._name)
                     return
                 _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
                 return
             else:
-                self.log_error(device_data["error"]["code"])
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
+
+    @property
+    def activ(self):
+        """Return False when Neviweb polling is halted for this device."""
+        return self.coordinator.breaker(self.unique_id).closed
+
+    @property
+    def available(self):
+        """Return False while the gateway of the device is offline."""
+        return super().available and \
+            self.coordinator.device_available(self.unique_id)
+
+    @property
+    def device_signature(self):
+        """Return model and firmware of the device."""
+        return self._device_model, self._firmware
+
+    @property
+    def device_state(self):
+        """Return the values last read from Neviweb for this device."""
+        return self._state
+
+    @property
+    def energy_stats(self):
+        """Return True if energy statistics are fetched for this device."""
+        return False
+
+    @property
+    def power_sensor(self):
+        """Return True if the power drawn by this device is known."""
+        return False
+
+    async def async_update(self):
+        """Refresh this device only, at startup or after a command."""
+        await self.coordinator.async_refresh_device(self)
 
     @property
     def unique_id(self):
@@ -520,57 +639,58 @@ class Neviweb130Sensor(Entity):
     @property
     def current_temperature(self):
         """Return the current sensor temperature."""
-        return self._cur_temp
+        return self._state.cur_temp
 
     @property  
     def leak_status(self):
         """Return current sensor leak status: 'water' or 'ok' """
-        return self._leak_status != None
+        return self._state.leak_status != None
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
         data = {}
-        data.update({'Leak_status': self._leak_status,
-                'Temperature': self._cur_temp,
-                'Temp_alarm': self._temp_status,
-                'Temperature_alert': self._temp_alert,
-                'leak_alert': self._leak_alert,
-                'Battery_level': voltage_to_percentage(self._battery_voltage, self._battery_type),
-                'Battery_voltage': self._battery_voltage,
-                'Battery_status': self._battery_status,
-                'Battery_percent_normalized': self._batt_percent_normal,
-                'Battery_status_normalized': self._batt_status_normal,
-                'Battery_alert': self._battery_alert,
-                'Battery_type': self._battery_type,
-                'Rssi': self._rssi})
+        data.update({'Leak_status': self._state.leak_status,
+                'Temperature': self._state.cur_temp,
+                'Temp_alarm': self._state.temp_status,
+                'Temperature_alert': self._state.temp_alert,
+                'leak_alert': self._state.leak_alert,
+                'Battery_level': voltage_to_percentage(self._state.battery_voltage, self._state.battery_type),
+                'Battery_voltage': self._state.battery_voltage,
+                'Battery_status': self._state.battery_status,
+                'Battery_percent_normalized': self._state.batt_percent_normal,
+                'Battery_status_normalized': self._state.batt_status_normal,
+                'Battery_alert': self._state.battery_alert,
+                'Battery_type': self._state.battery_type,
+                'Rssi': self._state.rssi})
         if self._is_connected:
-            data.update({'Closure_action': self._closure_action})
+            data.update({'Closure_action': self._state.closure_action})
         if self._is_new_leak:
-            data.update({'Data': self._data})
+            data.update({'Data': self._state.data})
         data.update({'sku': self._sku,
                     'device_model': str(self._device_model),
                     'device_model_cfg': self._device_model_cfg,
                     'firmware': self._firmware,
-                    'Activation': "Activ" if self._activ else "Inactive",
+                    'Activation': "Activ" if self.activ else "Inactive",
                     'device_type': self._device_type,
+                    'poll_interval': self.coordinator.poll_interval(self._id),
                     'Id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
 
     @property
     def battery_voltage(self):
         """Return the current battery voltage of the sensor in %."""
-        return voltage_to_percentage(self._battery_voltage, self._battery_type)
+        return voltage_to_percentage(self._state.battery_voltage, self._state.battery_type)
 
     @property
     def battery_status(self):
         """Return the current battery status."""
-        return self._battery_status
+        return self._state.battery_status
 
     @property
     def state(self):
         """Return the state of the sensor."""
-        return self._leak_status
+        return self._state.leak_status
 
     def set_sensor_alert(self, value):
         """ Set water leak sensor alert and action """
@@ -581,10 +701,10 @@ class Neviweb130Sensor(Entity):
         entity = value["id"]
         self._client.set_sensor_alert(
             entity, leak, batt, temp, close)
-        self._leak_alert = True if leak == 1 else False
-        self._temp_alert = True if temp == 1 else False
-        self._battery_alert = True if batt == 1 else False
-        self._closure_action = close
+        self._state.leak_alert = True if leak == 1 else False
+        self._state.temp_alert = True if temp == 1 else False
+        self._state.battery_alert = True if batt == 1 else False
+        self._state.closure_action = close
 
     def set_battery_type(self, value):
         """ Set battery type, alkaline or lithium for water leak sensor. """
@@ -592,16 +712,16 @@ class Neviweb130Sensor(Entity):
         entity = value["id"]
         self._client.set_battery_type(
             entity, batt)
-        self._battery_type = batt
+        self._state.battery_type = batt
 
     def set_activation(self, value):
         """ Activate or deactivate neviweb polling for a missing device """
         action = value["active"]
-        self._activ = action
+        self.coordinator.breaker(self.unique_id).set_active(action)
 
-    def notify_ha(self, msg: str, title: str = "Neviweb130 integration "+VERSION):
+    async def async_notify_ha(self, msg: str, title: str = "Neviweb130 integration "+VERSION):
         """Notify user via HA web frontend."""
-        self.hass.services.call(
+        await self.hass.services.async_call(
             PN_DOMAIN,
             "create",
             service_data={
@@ -612,17 +732,17 @@ class Neviweb130Sensor(Entity):
         )
         return True
 
-    def log_error(self, error_data):
+    async def async_log_error(self, error_data):
         """ Send error message to LOG """
         if error_data == "USRSESSEXP":
             _LOGGER.warning("Session expired... reconnecting...")
-            self._client.reconnect()
+            await self._async_client.reconnect()
         elif error_data == "ACCSESSEXC":
             _LOGGER.warning("Maximun session number reached...Close other connections and try again.")
-            self.notify_ha(
+            await self.async_notify_ha(
                 f"Warning: Maximun Neviweb session number reached...Close other connections and try again."
             )
-            self._client.reconnect()
+            await self._async_client.reconnect()
         elif error_data == "DVCATTRNSPTD":
                 _LOGGER.warning("Device attribute not supported for %s: %s...(SKU: %s)", self._name, device_data, self._sku)
         elif error_data == "DVCACTNSPTD":
@@ -635,12 +755,10 @@ class Neviweb130Sensor(Entity):
             _LOGGER.warning("Device busy can't reach (neviweb update ?), retry later %s: %s...(SKU: %s)", self._name, device_data, self._sku)
         elif error_data == "DVCUNVLB":
             _LOGGER.warning("Device %s is disconected from Neviweb: %s...(SKU: %s)", self._name, device_data, self._sku)
-            _LOGGER.warning("This device %s is de-activated and won't be updated for 20 minutes.",self._name)
-            _LOGGER.warning("You can re-activate device %s with service.neviweb130_set_activation or wait 20 minutes for update to restart or just restart HA.",self._name)
-            self._activ = False
-            self._snooze = time.time()
-            self.notify_ha(
-                f"Warning: Received message from Neviweb, device disconnected... Check you log... Neviweb update will be halted for 20 minutes for " + self._name + ", Sku: " + self._sku
+            _LOGGER.warning("This device %s is de-activated and will be probed with a growing delay until it answers again.",self._name)
+            _LOGGER.warning("You can re-activate device %s with service.neviweb130_set_activation or wait for update to restart or just restart HA.",self._name)
+            await self.async_notify_ha(
+                f"Warning: Received message from Neviweb, device disconnected... Check you log... Neviweb update will be halted until the device answers again for " + self._name + ", Sku: " + self._sku
             )
         else:
             _LOGGER.warning("Unknown error for %s: %s...(SKU: %s) Report to maintainer.", self._name, device_data, self._sku)
@@ -654,69 +772,41 @@ class Neviweb130TankSensor(Neviweb130Sensor):
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
         self._device_type = device_type
-        self._activ = True
-        self._snooze = 0
-        self._angle = None
-        self._sampling = None
-        self._tank_percent = None
-        self._tank_type = None
-        self._tank_height = None
-        self._gauge_type = None
-        self._fuel_alert = None
-        self._fuel_percent_alert = None
-        self._battery_alert = None
-        self._battery_voltage = None
-        self._temperature = None
-        self._rssi = None
+        self._state = Neviweb130TankMonitorState()
         self._is_monitor = device_info["signature"]["model"] in \
             IMPLEMENTED_TANK_MONITOR
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
         
-    def update(self):
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        MONITOR_ATTRIBUTE = [ATTR_ANGLE, ATTR_TANK_PERCENT, ATTR_TANK_TYPE, ATTR_GAUGE_TYPE, ATTR_TANK_HEIGHT, ATTR_FUEL_ALERT, ATTR_BATT_ALERT, ATTR_FUEL_PERCENT_ALERT, ATTR_ERROR_CODE_SET1, ATTR_RSSI]
+        return UPDATE_ATTRIBUTES + MONITOR_ATTRIBUTE
+
+    async def async_update_from_data(self, device_data, start, verify=False):
         """ update device """
-        if self._activ:
-            MONITOR_ATTRIBUTE = [ATTR_ANGLE, ATTR_TANK_PERCENT, ATTR_TANK_TYPE, ATTR_GAUGE_TYPE, ATTR_TANK_HEIGHT, ATTR_FUEL_ALERT, ATTR_BATT_ALERT, ATTR_FUEL_PERCENT_ALERT, ATTR_ERROR_CODE_SET1, ATTR_RSSI]
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + MONITOR_ATTRIBUTE)
+        if self.activ:
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
             if "error" not in device_data or device_data is not None:
                 if "errorCode" not in device_data:
-                    self._angle = device_data[ATTR_ANGLE]["value"]
-                    self._sampling = device_data[ATTR_ANGLE][ATTR_SAMPLING]
-                    self._tank_percent = device_data[ATTR_TANK_PERCENT]
-                    self._tank_type = device_data[ATTR_TANK_TYPE]
-                    self._tank_height = device_data[ATTR_TANK_HEIGHT]
-                    self._gauge_type = device_data[ATTR_GAUGE_TYPE]
-                    self._fuel_alert = device_data[ATTR_FUEL_ALERT]
-                    self._fuel_percent_alert = device_data[ATTR_FUEL_PERCENT_ALERT]
-                    self._battery_alert = device_data[ATTR_BATT_ALERT]
-                    if ATTR_ERROR_CODE_SET1 in device_data and len(device_data[ATTR_ERROR_CODE_SET1]) > 0:
-                        self._temperature = device_data[ATTR_ERROR_CODE_SET1]["temperature"]
-                    self._battery_voltage = device_data[ATTR_BATTERY_VOLTAGE]
-                    if ATTR_RSSI in device_data:
-                        self._rssi = device_data[ATTR_RSSI]
+                    parse(TANK_PARSER, self._state, device_data, self._name)
                     return
                 _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
                 return
             else:
-                self.log_error(device_data["error"]["code"])
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
 
     @property  
     def level_status(self):
         """Return current sensor fuel level status """
-        if self._fuel_alert:
+        if self._state.fuel_alert:
             return  "OK"
         else:
             return "Low"
@@ -725,33 +815,34 @@ class Neviweb130TankSensor(Neviweb130Sensor):
     def extra_state_attributes(self):
         """Return the state attributes."""
         data = {}
-        data.update({'Gauge_angle': self._angle,
-                'Last_sampling_time': convert(self._sampling),
-                'Battery_level': voltage_to_percentage(self._battery_voltage, "lithium"),
-                'Battery_voltage': self._battery_voltage,
-                'Battery_alert': self._battery_alert,
-                'Tank_type': self._tank_type,
-                'Tank_height': self._tank_height,
-                'Tank_percent': self._tank_percent,
-                'Gauge_type': self._gauge_type,
-                'Fuel_alert': "OK" if self._fuel_alert else "Low",
-                'Fuel_percent_alert': "Off" if self._fuel_percent_alert == 0 else self._fuel_percent_alert,
-                'Temperature': self._temperature,
-                'Rssi': self._rssi,
+        data.update({'Gauge_angle': self._state.angle,
+                'Last_sampling_time': convert(self._state.sampling),
+                'Battery_level': voltage_to_percentage(self._state.battery_voltage, "lithium"),
+                'Battery_voltage': self._state.battery_voltage,
+                'Battery_alert': self._state.battery_alert,
+                'Tank_type': self._state.tank_type,
+                'Tank_height': self._state.tank_height,
+                'Tank_percent': self._state.tank_percent,
+                'Gauge_type': self._state.gauge_type,
+                'Fuel_alert': "OK" if self._state.fuel_alert else "Low",
+                'Fuel_percent_alert': "Off" if self._state.fuel_percent_alert == 0 else self._state.fuel_percent_alert,
+                'Temperature': self._state.temperature,
+                'Rssi': self._state.rssi,
                 'sku': self._sku,
                 'device_model': str(self._device_model),
                 'device_model_cfg': self._device_model_cfg,
                 'firmware': self._firmware,
-                'Activation': "Activ" if self._activ else "Inactive",
+                'Activation': "Activ" if self.activ else "Inactive",
                 'device_type': self._device_type,
+                'poll_interval': self.coordinator.poll_interval(self._id),
                 'Id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
 
     @property
     def state(self):
         """Return the state of the tank sensor."""
-        return self._tank_percent
-#        return convert_to_percent(self._angle, 10, 80)
+        return self._state.tank_percent
+#        return convert_to_percent(self._state.angle, 10, 80)
 
     def set_tank_type(self, value):
         """ Set tank type for LM4110-ZB sensor. """
@@ -759,7 +850,7 @@ class Neviweb130TankSensor(Neviweb130Sensor):
         entity = value["id"]
         self._client.set_tank_type(
             entity, tank)
-        self._tank_type = tank
+        self._state.tank_type = tank
 
     def set_gauge_type(self, value):
         """ Set gauge type for LM4110-ZB sensor. """
@@ -767,7 +858,7 @@ class Neviweb130TankSensor(Neviweb130Sensor):
         entity = value["id"]
         self._client.set_gauge_type(
             entity, gauge)
-        self._gauge_type = gauge
+        self._state.gauge_type = gauge
 
     def set_low_fuel_alert(self, value):
         """ Set low fuel alert limit LM4110-ZB sensor. """
@@ -775,7 +866,7 @@ class Neviweb130TankSensor(Neviweb130Sensor):
         entity = value["id"]
         self._client.set_low_fuel_alert(
             entity, alert)
-        self._fuel_percent_alert = alert
+        self._state.fuel_percent_alert = alert
 
     def set_tank_height(self, value):
         """ Set low fuel alert LM4110-ZB sensor. """
@@ -783,7 +874,7 @@ class Neviweb130TankSensor(Neviweb130Sensor):
         entity = value["id"]
         self._client.set_tank_height(
             entity, height)
-        self._tank_height = height
+        self._state.tank_height = height
 
     def set_fuel_alert(self, value):
         """ Set low fuel alert LM4110-ZB sensor. """
@@ -791,7 +882,7 @@ class Neviweb130TankSensor(Neviweb130Sensor):
         entity = value["id"]
         self._client.set_fuel_alert(
             entity, fuel)
-        self._fuel_alert = fuel
+        self._state.fuel_alert = fuel
 
     def set_battery_alert(self, value):
         """ Set low battery alert LM4110-ZB sensor. """
@@ -799,7 +890,7 @@ class Neviweb130TankSensor(Neviweb130Sensor):
         entity = value["id"]
         self._client.set_battery_alert(
             entity, batt)
-        self._battery_alert = batt
+        self._state.battery_alert = batt
 
 
 class Neviweb130GatewaySensor(Neviweb130Sensor):
@@ -811,48 +902,155 @@ class Neviweb130GatewaySensor(Neviweb130Sensor):
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
         self._device_type = device_type
-        self._activ = True
-        self._snooze = 0
-        self._gateway_status = None
+        self._state = Neviweb130LeakSensorState()
         self._is_gateway = device_info["signature"]["model"] in \
             IMPLEMENTED_GATEWAY
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
         
-    def update(self):
+    def update_attributes(self):
+        """Gateway is polled on /status instead of device attributes."""
+        return None
+
+    async def async_update_from_data(self, device_status, start, verify=False):
         """ update device """
-        if self._activ:
-            start = time.time()
-            device_status = self._client.get_device_status(self._id)
+        if self.activ:
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_status)
-            self._gateway_status = device_status[ATTR_STATUS]
+            self._state.gateway_status = device_status[ATTR_STATUS]
             return
 
     @property  
     def gateway_status(self):
         """Return current gateway status: 'online' or 'offline' """
-        return self._gateway_status != None
+        return self._state.gateway_status != None
 
     @property
     def state(self):
         """Return the state of the gateway."""
-        return self._gateway_status
+        return self._state.gateway_status
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
         data = {}
-        data.update({'Gateway_status': self._gateway_status,
+        data.update({'Gateway_status': self._state.gateway_status,
                 'sku': self._sku,
                 'device_model': str(self._device_model),
                 'device_model_cfg': self._device_model_cfg,
                 'firmware': self._firmware,
-                'Activation': "Activ" if self._activ else "Inactive",
+                'Activation': "Activ" if self.activ else "Inactive",
                 'device_type': self._device_type,
+                'poll_interval': self.coordinator.poll_interval(self._id),
                 'Id': str(self._id)})
+        return device_attributes(data, neviweb130.RECORDER_MODE)
+
+
+class Neviweb130DeviceSensor(SensorEntity):
+    """Sensor showing a value of a device entity of another platform,
+    written each time the state of the device is written."""
+
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
+
+    def __init__(self, device, suffix):
+        """Initialize."""
+        self._device = device
+        self._suffix = suffix
+
+    async def async_added_to_hass(self):
+        """Follow the updates of the device."""
+        self.async_on_remove(async_dispatcher_connect(self.hass,
+            SIGNAL_DEVICE_UPDATED.format(self._device.unique_id),
+            self.async_write_ha_state))
+
+    @property
+    def should_poll(self):
+        """Return False, the state is written by the device updates."""
+        return False
+
+    @property
+    def unique_id(self):
+        """Return unique ID based on Neviweb device ID."""
+        return "{}_{}".format(self._device.unique_id, self._suffix)
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return "{} {}".format(self._device.name, self._suffix)
+
+    @property
+    def available(self):
+        """Return True if the device is available and polled."""
+        return self._device.available and self._device.activ
+
+
+class Neviweb130EnergySensor(Neviweb130DeviceSensor):
+    """Energy or water counter of a device, from its hourly statistics."""
+
+    def __init__(self, device):
+        """Initialize."""
+        super().__init__(device, "water" if
+            device.energy_unit == UnitOfVolume.CUBIC_METERS else "energy")
+
+    @property
+    def device_class(self):
+        """Return the device class of this entity."""
+        if self._device.energy_unit == UnitOfVolume.CUBIC_METERS:
+            return SensorDeviceClass.WATER
+        return SensorDeviceClass.ENERGY
+
+    @property
+    def state_class(self):
+        """Return the state class of this entity."""
+        return SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_unit_of_measurement(self):
+        """Return the unit of measurement of this entity."""
+        return self._device.energy_unit
+
+    @property
+    def native_value(self):
+        """Return the hourly counter of the device."""
+        return next(iter(self._device.energy_counters.values()))
+
+    @property
+    def extra_state_attributes(self):
+        """Return the counters and last period usage of the device."""
+        data = dict(self._device.energy_counters)
+        data.update({'Id': str(self._device.unique_id)})
         return data
+
+
+class Neviweb130PowerSensor(Neviweb130DeviceSensor):
+    """Power drawn by a device."""
+
+    def __init__(self, device):
+        """Initialize."""
+        super().__init__(device, "power")
+
+    @property
+    def device_class(self):
+        """Return the device class of this entity."""
+        return SensorDeviceClass.POWER
+
+    @property
+    def state_class(self):
+        """Return the state class of this entity."""
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def native_unit_of_measurement(self):
+        """Return the unit of measurement of this entity."""
+        return UnitOfPower.WATT
+
+    @property
+    def native_value(self):
+        """Return the power drawn by the device."""
+        return self._device.current_power
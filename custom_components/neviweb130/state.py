@@ -0,0 +1,289 @@
+"""Slot based state of Neviweb devices, one class per device family.
+
+Entities keep the values read from Neviweb in one of these containers instead
+of attributes of the entity itself. Slots avoid a dict per device and name
+every value a family can hold, shared by every entity of the family.
+"""
+
+from __future__ import annotations
+
+from homeassistant.const import UnitOfTemperature
+
+
+class Neviweb130DeviceState:
+    """State of a Neviweb device. Subclasses list their values in __slots__
+    and the ones not starting as None in _defaults, merged with those of
+    parent classes."""
+
+    __slots__ = ("rssi",)
+
+    _fields = __slots__
+    _defaults = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Collect slots and defaults of the subclass and its parents."""
+        super().__init_subclass__(**kwargs)
+        parent = cls.__mro__[1]
+        cls._fields = parent._fields + cls.__dict__.get("__slots__", ())
+        cls._defaults = {**parent._defaults,
+            **cls.__dict__.get("_defaults", {})}
+
+    def __init__(self):
+        """Set every slot to its default."""
+        for name in self._fields:
+            setattr(self, name, self._defaults.get(name))
+
+    def as_dict(self):
+        """Return the values of every slot, by name."""
+        return {name: getattr(self, name) for name in self._fields}
+
+
+class Neviweb130EnergyState(Neviweb130DeviceState):
+    """State of a device reporting energy statistics."""
+
+    __slots__ = (
+        "hour_energy_kwh_count", "today_energy_kwh_count",
+        "month_energy_kwh_count", "hour_kwh", "today_kwh", "month_kwh",
+    )
+
+
+class Neviweb130ThermostatState(Neviweb130EnergyState):
+    """State of a thermostat, slots read or set by every thermostat entity."""
+
+    __slots__ = (
+        "drstatus_active", "drstatus_optout", "drstatus_setpoint",
+        "drstatus_abs", "drstatus_rel", "drsetpoint_status",
+        "drsetpoint_value", "cur_temp", "cur_temp_before",
+        "target_temp", "operation_mode", "occupancy", "wattage",
+        "min_temp", "max_temp", "temperature_format", "time_format",
+        "temp_display_value", "display2", "heat_level", "keypad",
+        "backlight", "cycle_length", "code_reference_sensor",
+        "code_compensation_sensor", "code_air_sensor",
+        "code_wire_sensor", "code_current_overload",
+        "code_thermal_overload", "code_load_error", "code_end_of_life",
+        "aux_heat", "cycle_length_output2_status", "aux_cycle_length",
+        "floor_mode", "cool_max", "cool_min", "floor_air_limit",
+        "early_start", "cycle_length_output2_value", "load2_status",
+        "load2", "pump_protec_status", "pump_protec_duration",
+        "pump_protec_period", "floor_sensor_type", "floor_min",
+        "floor_min_status", "floor_max", "floor_max_status",
+        "temp_status", "stm_mcu", "thermal_overload",
+        "current_overload", "j2connector", "j3connector", "line_error",
+        "code_floor_sensor", "code_gfcibase", "base", "air_top",
+        "air_bottom", "inductive_mode",
+    )
+
+    _defaults = {
+        "drstatus_active": "off",
+        "drstatus_optout": "off",
+        "drstatus_setpoint": "off",
+        "drstatus_abs": "off",
+        "drstatus_rel": "off",
+        "drsetpoint_status": "off",
+        "drsetpoint_value": 0,
+        "wattage": 0,
+        "min_temp": 0,
+        "max_temp": 0,
+        "temperature_format": UnitOfTemperature.CELSIUS,
+        "time_format": "24h",
+        "heat_level": 0,
+        "cycle_length": 0,
+        "aux_heat": "off",
+        "cycle_length_output2_status": "off",
+        "aux_cycle_length": 0,
+        "early_start": "off",
+        "cycle_length_output2_value": 0,
+        "load2": 0,
+        "floor_min_status": "off",
+        "floor_max_status": "off",
+    }
+
+
+class Neviweb130HeatState(Neviweb130ThermostatState):
+    """State of TH1123ZB, TH1124ZB, their G2 and TH1500ZB heating thermostats."""
+
+    __slots__ = (
+        "cold_load_pickup", "heat_lockout_temp",
+    )
+
+
+class Neviweb130FloorState(Neviweb130ThermostatState):
+    """State of TH1300ZB, TH1300WF, TH1325WF, TH1310WF, SRM40 and FLP55 floor
+    thermostats."""
+
+    __slots__ = (
+        "temp_display_status", "gfci_status", "floor_air_limit_status",
+        "gfci_alert", "load1", "heat_source_type", "target_temp_away",
+    )
+
+    _defaults = {
+        "load1": 0,
+    }
+
+
+class Neviweb130LowVoltageState(Neviweb130ThermostatState):
+    """State of TH1400ZB and TH1400WF low voltage thermostats."""
+
+    __slots__ = (
+        "temp_display_status", "floor_air_limit_status",
+        "pump_protec_period_status", "load1", "heat_source_type",
+        "target_temp_away", "pump_duration", "pump_duration_value",
+    )
+
+    _defaults = {
+        "load1": 0,
+    }
+
+
+class Neviweb130WifiState(Neviweb130ThermostatState):
+    """State of TH1123WF, TH1124WF and TH1500WF thermostats."""
+
+    __slots__ = (
+        "temp_display_status", "load1", "heat_source_type",
+        "target_temp_away",
+    )
+
+    _defaults = {
+        "load1": 0,
+    }
+
+
+class Neviweb130HcState(Neviweb130ThermostatState):
+    """State of TH1134ZB-HC heating/cooling thermostat."""
+
+    __slots__ = (
+        "temp_display_status", "target_cool", "HC_device", "language",
+        "model", "fan_speed", "fan_swing_vert", "fan_swing_horiz",
+        "fan_cap", "fan_swing_cap", "fan_swing_cap_vert",
+        "fan_swing_cap_horiz", "balance_pt", "heat_lock_temp",
+        "cool_lock_temp", "avail_mode",
+    )
+
+    _defaults = {
+        "fan_speed": 0,
+    }
+
+
+class Neviweb130LightState(Neviweb130EnergyState):
+    """State of SW2500ZB lights and DM2500ZB, DM2550ZB dimmers."""
+
+    __slots__ = (
+        "wattage", "keypad", "temp_status", "brightness_pct", "timer",
+        "led_on", "led_off", "wattage_status", "onoff",
+        "phase_control", "double_up", "intensity_min",
+    )
+
+    _defaults = {
+        "wattage": 0,
+        "keypad": "Unlocked",
+        "brightness_pct": 0,
+        "timer": 0,
+        "led_on": "0,0,0,0",
+        "led_off": "0,0,0,0",
+        "intensity_min": 600,
+    }
+
+
+class Neviweb130LoadControllerState(Neviweb130EnergyState):
+    """State of RM3250ZB, RM3500ZB, RM3500WF load controllers and MC3100ZB
+    multi controller."""
+
+    __slots__ = (
+        "drstatus_active", "drstatus_optout", "cur_temp", "wattage",
+        "keypad", "temp_status", "stm_mcu", "thermal_overload",
+        "current_overload", "j2connector", "j3connector", "line_error",
+        "timer", "onoff", "current_power_w", "room_temp",
+        "battery_voltage", "onoff2", "timer2", "drstatus_onoff",
+        "tank_size", "controlled_device", "water_temp_min",
+        "cold_load_remaining_time", "input_1_on_delay",
+        "input_1_off_delay", "input_2_on_delay", "input_2_off_delay",
+        "input_name_1", "input_name_2", "output_name_1",
+        "output_name_2", "relayK1", "relayK2",
+        "drstatus_optout_reason", "water_temp", "water_temp_time",
+        "temperature", "water_leak_status", "cold_load_status",
+        "consumption", "consumption_time", "watt_time_on",
+        "cold_load_temp", "water_leak_disconected_status",
+        "water_tank_on", "leg_status", "mode", "away_action",
+        "battery_status", "batt_percent_normal", "batt_status_normal",
+        "batt_info", "humidity", "ext_temp", "input_status",
+        "input2_status",
+    )
+
+    _defaults = {
+        "drstatus_active": "off",
+        "drstatus_optout": "off",
+        "wattage": 0,
+        "timer": 0,
+        "current_power_w": 0,
+        "battery_voltage": 0,
+        "timer2": 0,
+        "drstatus_onoff": "off",
+        "cold_load_remaining_time": 0,
+        "input_1_on_delay": 0,
+        "input_1_off_delay": 0,
+        "input_2_on_delay": 0,
+        "input_2_off_delay": 0,
+        "input_name_1": "Not set",
+        "input_name_2": "Not set",
+        "output_name_1": "Not set",
+        "output_name_2": "Not set",
+        "drstatus_optout_reason": "off",
+    }
+
+
+class Neviweb130ValveState(Neviweb130EnergyState):
+    """State of wifi and mesh valves and their flow meter."""
+
+    __slots__ = (
+        "onoff", "battery_voltage", "water_leak_status", "away_action",
+        "battery_status", "batt_percent_normal", "batt_status_normal",
+        "reports_position", "valve_status", "battery_alert",
+        "power_supply", "temp_alert", "flowmeter_model",
+        "flowmeter_alert_delay", "flowmeter_opt_alarm",
+        "flowmeter_opt_action", "flowmeter_threshold",
+        "flowmeter_alarm_lenght", "valve_closure",
+        "flowmeter_multiplier", "flowmeter_offset",
+        "flowmeter_divisor", "stm8Error_motorJam", "motor_target",
+        "valve_info_status", "valve_info_cause", "valve_info_id",
+        "occupancy_delay", "flow_alarm_1", "flow_alarm_2",
+        "temp_action_low", "batt_action_low", "flowmeter_timer",
+        "flowmeter_enabled", "stm8Error_motorPosition",
+        "stm8Error_motorLimit", "error_code",
+    )
+
+    _defaults = {
+        "battery_voltage": 0,
+        "reports_position": False,
+        "battery_alert": 0,
+        "flowmeter_alert_delay": 0,
+        "flowmeter_threshold": 1,
+        "flowmeter_alarm_lenght": 0,
+        "flowmeter_multiplier": 0,
+        "flowmeter_offset": 0,
+        "flowmeter_divisor": 1,
+        "flowmeter_timer": 0,
+    }
+
+
+class Neviweb130LeakSensorState(Neviweb130DeviceState):
+    """State of leak, temperature and connected sensors and of gateways."""
+
+    __slots__ = (
+        "cur_temp", "temp_status", "battery_voltage", "temperature",
+        "battery_status", "batt_percent_normal", "batt_status_normal",
+        "battery_alert", "temp_alert", "leak_status", "battery_type",
+        "leak_alert", "closure_action", "gateway_status", "data",
+    )
+
+    _defaults = {
+        "battery_type": "alkaline",
+    }
+
+
+class Neviweb130TankMonitorState(Neviweb130LeakSensorState):
+    """State of LM4110ZB tank level monitor."""
+
+    __slots__ = (
+        "fuel_alert", "fuel_percent_alert", "angle", "sampling",
+        "tank_type", "tank_height", "tank_percent", "gauge_type",
+    )
@@ -0,0 +1,206 @@
+"""Energy statistics scheduler, fetch Neviweb energy history of devices off
+the device update path."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from functools import partial
+import logging
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_time_change,
+)
+import homeassistant.util.dt as dt_util
+
+from .const import SIGNAL_DEVICE_SUBSCRIBED, SIGNAL_DEVICE_UNSUBSCRIBED
+from .coordinator import Neviweb130Coordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+HOURLY = "hourly"
+DAILY = "daily"
+MONTHLY = "monthly"
+
+# First fetch after startup, to let device states be read first.
+STAT_STARTUP_DELAY = 300
+# Delay after the hour rolls over, to let Neviweb close the last period.
+STAT_ROLLOVER_DELAY = 60
+# Daily history is fetched after midnight and once more after this hour, to
+# catch data received late by Neviweb.
+STAT_DAILY_CATCHUP_HOUR = 12
+
+
+class Neviweb130StatsScheduler:
+    """Fetch energy history of devices with its own cadence per period:
+    hourly history after each hour rolls over, daily history once a day
+    plus a catch-up, monthly history once a day. Fetches of the devices
+    are spread over window seconds, with the same offset per device as
+    device polls.
+
+    Entities are taken from the coordinators, then followed as they
+    subscribe to them and unsubscribe. They must provide:
+    - energy_stats, True if the device reports energy statistics.
+    - update_energy_stats(hourly, daily, monthly), to parse received
+      histories, None for a period not fetched.
+    - energy_unit and energy_counters, the unit of the statistics and the
+      counters shown by the energy sensor of the device.
+    Energy and power sensors of the device are written with the device.
+    """
+
+    def __init__(self, hass, client, coordinators, window):
+        """Initialize the scheduler, window is in seconds."""
+        self._hass = hass
+        self._getters = {
+            HOURLY: client.get_device_hourly_stats,
+            DAILY: client.get_device_daily_stats,
+            MONTHLY: client.get_device_monthly_stats,
+        }
+        self._coordinators = coordinators
+        self._window = window
+        # Subscribed entities reporting energy statistics, by device id
+        self._entities = {}
+        # Last successful fetch of each period, by device id
+        self._fetched = {}
+        # Cancel callback of the next fetch, by device id
+        self._pending = {}
+        self._unsub = []
+        self.fetches = {HOURLY: 0, DAILY: 0, MONTHLY: 0}
+        self.failures = 0
+        # Awaited with entity and histories received, by period
+        self.history_listener = None
+
+    @callback
+    def async_start(self):
+        """Follow entities subscribing, schedule first fetch of every
+        device and fetches after each hour rolls over."""
+        for coordinator in self._coordinators:
+            for entity in coordinator.async_contexts():
+                self._async_subscribed(entity)
+        self._unsub = [
+            async_dispatcher_connect(self._hass, SIGNAL_DEVICE_SUBSCRIBED,
+                self._async_subscribed),
+            async_dispatcher_connect(self._hass, SIGNAL_DEVICE_UNSUBSCRIBED,
+                self._async_unsubscribed),
+            async_track_time_change(self._hass, self._async_hour_rollover,
+                minute=0, second=0),
+        ]
+        self._pending[None] = async_call_later(self._hass,
+            STAT_STARTUP_DELAY, self._async_first_fetch)
+
+    @callback
+    def _async_subscribed(self, entity):
+        """Add an entity subscribing if it reports energy statistics."""
+        if entity.energy_stats:
+            self._entities[entity.unique_id] = entity
+
+    @callback
+    def _async_unsubscribed(self, entity):
+        """Forget an entity unsubscribing and cancel its next fetch."""
+        if self._entities.get(entity.unique_id) is not entity:
+            return
+        del self._entities[entity.unique_id]
+        unsub = self._pending.pop(entity.unique_id, None)
+        if unsub is not None:
+            unsub()
+
+    @callback
+    def _async_first_fetch(self, now):
+        """Schedule first fetch of every device added at startup."""
+        self._pending.pop(None, None)
+        self._schedule_all(0)
+
+    @callback
+    def async_stop(self):
+        """Cancel scheduled fetches."""
+        for unsub in self._unsub:
+            unsub()
+        self._unsub = []
+        for unsub in self._pending.values():
+            unsub()
+        self._pending.clear()
+
+    def get_stats(self):
+        """Return history requests sent by period and failed requests."""
+        return {"fetches": dict(self.fetches), "failures": self.failures}
+
+    @callback
+    def async_refetch(self, entity):
+        """Fetch every period of a device again, within the window."""
+        self._fetched.pop(entity.unique_id, None)
+        unsub = self._pending.pop(entity.unique_id, None)
+        if unsub is not None:
+            unsub()
+        self._schedule(entity, 0)
+
+    @callback
+    def _async_hour_rollover(self, now):
+        """Schedule fetch of every device after the hour rolls over."""
+        self._schedule_all(STAT_ROLLOVER_DELAY)
+
+    @callback
+    def _schedule_all(self, delay):
+        """Schedule a fetch of every device, spread over the window."""
+        for entity in self._entities.values():
+            self._schedule(entity, delay)
+
+    @callback
+    def _schedule(self, entity, delay):
+        """Schedule a fetch of a device after delay and its offset within
+        the window, unless one is pending."""
+        if entity.unique_id in self._pending:
+            return
+        offset = delay + self._window * \
+            Neviweb130Coordinator.poll_offset(entity.unique_id)
+        self._pending[entity.unique_id] = async_call_later(self._hass,
+            offset, partial(self._async_fetch, entity))
+
+    def _due(self, device_id, now):
+        """Return the periods to fetch for a device."""
+        fetched = self._fetched.get(device_id, {})
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        today = dt_util.start_of_local_day(now)
+        catchup = today + timedelta(hours=STAT_DAILY_CATCHUP_HOUR)
+        due = []
+        if fetched.get(HOURLY) is None or fetched[HOURLY] < hour:
+            due.append(HOURLY)
+        if fetched.get(DAILY) is None or fetched[DAILY] < today or \
+            (now >= catchup and fetched[DAILY] < catchup):
+            due.append(DAILY)
+        if fetched.get(MONTHLY) is None or fetched[MONTHLY] < today:
+            due.append(MONTHLY)
+        return due
+
+    async def _async_fetch(self, entity, now):
+        """Fetch the periods due for a device and push them to its entity."""
+        self._pending.pop(entity.unique_id, None)
+        if not entity.activ or \
+            self._entities.get(entity.unique_id) is not entity:
+            return
+        now = dt_util.now()
+        fetched = self._fetched.setdefault(entity.unique_id, {})
+        histories = {}
+        for period in self._due(entity.unique_id, now):
+            self.fetches[period] += 1
+            try:
+                history = await self._getters[period](entity.unique_id)
+            except Exception:
+                _LOGGER.exception("Cannot get %s energy stats of %s", period,
+                    entity.name)
+                history = None
+            if history is None:
+                self.failures += 1
+                continue
+            histories[period] = history
+            fetched[period] = now
+        if not histories:
+            return
+        _LOGGER.debug("Energy stats of %s updated: %s", entity.name,
+            list(histories))
+        entity.update_energy_stats(histories.get(HOURLY),
+            histories.get(DAILY), histories.get(MONTHLY))
+        entity.coordinator.async_write_device_state(entity)
+        if self.history_listener is not None:
+            await self.history_listener(entity, histories)
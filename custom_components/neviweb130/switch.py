@@ -31,7 +31,7 @@ import voluptuous as vol
 import time
 
 import custom_components.neviweb130 as neviweb130
-from . import (SCAN_INTERVAL, STAT_INTERVAL, VERSION)
+from . import (SCAN_INTERVAL, VERSION)
 from homeassistant.components.switch import (
     SwitchDeviceClass,
     SwitchEntity,
@@ -61,8 +61,13 @@ from homeassistant.components.persistent_notification import DOMAIN as PN_DOMAIN
 from datetime import timedelta
 from homeassistant.helpers.event import track_time_interval
 from homeassistant.helpers.icon import icon_for_battery_level
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
     DOMAIN,
+    UNRECORDED_ATTRIBUTES,
+    SIGNAL_DEVICES_DISCOVERED,
     ATTR_ACTIVE,
     ATTR_ALERT,
     ATTR_AWAY_ACTION,
@@ -147,6 +152,8 @@ from .const import (
     SERVICE_SET_ON_OFF_INPUT_DELAY,
 )
 
+from .diagnostics import device_attributes
+from .parsers import KEEP, Field, compile_parser, entry, item, parse
 from .schema import (
     CONTROLLED_VALUE,
     DELAY,
@@ -167,15 +174,26 @@ from .schema import (
     SET_REMAINING_TIME_SCHEMA,
     SET_ON_OFF_INPUT_DELAY_SCHEMA,
 )
+from .state import (
+    Neviweb130LoadControllerState,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity updates and commands are not limited by Home Assistant. Device
+# polls are limited by the coordinator, blocking commands by the
+# Neviweb130Executor.
+PARALLEL_UPDATES = 0
+
 DEFAULT_NAME = 'neviweb130 switch'
 DEFAULT_NAME_2 = 'neviweb130 switch 2'
-SNOOZE_TIME = 1200
 
 UPDATE_ATTRIBUTES = [ATTR_ONOFF]
 
+WARM_ATTRIBUTES = [ATTR_KEYPAD, ATTR_RSSI, ATTR_WIFI, ATTR_BATTERY_VOLTAGE, ATTR_BATT_INFO, ATTR_WATER_TEMP_MIN, ATTR_MIN_WATER_TEMP, ATTR_WATT_TIME_ON, ATTR_DR_WATER_TEMP_TIME,
+    ATTR_WATER_TANK_ON, ATTR_WATER_TEMP_TIME, ATTR_COLD_LOAD_PICKUP_TEMP, ATTR_AWAY_ACTION, ATTR_INPUT_1_ON_DELAY, ATTR_INPUT_2_ON_DELAY, ATTR_INPUT_1_OFF_DELAY, ATTR_INPUT_2_OFF_DELAY]
+COLD_ATTRIBUTES = [ATTR_WATTAGE, ATTR_WIFI_WATTAGE, ATTR_TANK_SIZE, ATTR_CONTROLLED_DEVICE, ATTR_NAME_1, ATTR_NAME_2, ATTR_OUTPUT_NAME_1, ATTR_OUTPUT_NAME_2]
+
 HA_TO_NEVIWEB_SIZE = {
     "40 gal": 40,
     "50 gal": 50,
@@ -240,54 +258,69 @@ async def async_setup_platform(
     """Set up the Neviweb130 switch."""
     data = hass.data[DOMAIN]
 
-    entities = []
-    for device_info in data.neviweb130_client.gateway_data:
-        if "signature" in device_info and \
-            "model" in device_info["signature"] and \
-            device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
-            device_name = '{} {}'.format(DEFAULT_NAME, device_info["name"])
-            device_sku = device_info["sku"]
-            device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
-            if device_info["signature"]["model"] in IMPLEMENTED_WALL_DEVICES:
-                device_type = "outlet"
-                entities.append(Neviweb130Switch(data, device_info, device_name, device_sku, device_firmware, device_type))
-            elif device_info["signature"]["model"] in IMPLEMENTED_LOAD_DEVICES:
-                device_type = "power"
-                entities.append(Neviweb130PowerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
-            elif device_info["signature"]["model"] in IMPLEMENTED_WATER_HEATER_LOAD_MODEL:
-                device_type = "power"
-                entities.append(Neviweb130TankPowerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
-            elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL:
-                device_type = "power"
-                entities.append(Neviweb130WifiTankPowerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
-            else:
-                device_type = "control"
-                entities.append(Neviweb130ControlerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
-    for device_info in data.neviweb130_client.gateway_data2:
-        if "signature" in device_info and \
-            "model" in device_info["signature"] and \
-            device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
-            device_name = '{} {}'.format(DEFAULT_NAME_2, device_info["name"])
-            device_sku = device_info["sku"]
-            device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
-            if device_info["signature"]["model"] in IMPLEMENTED_WALL_DEVICES:
-                device_type = "outlet"
-                entities.append(Neviweb130Switch(data, device_info, device_name, device_sku, device_firmware, device_type))
-            elif device_info["signature"]["model"] in IMPLEMENTED_LOAD_DEVICES:
-                device_type = "power"
-                entities.append(Neviweb130PowerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
-            elif device_info["signature"]["model"] in IMPLEMENTED_WATER_HEATER_LOAD_MODEL:
-                device_type = "power"
-                entities.append(Neviweb130TankPowerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
-            elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL:
-                device_type = "power"
-                entities.append(Neviweb130WifiTankPowerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
-            else:
-                device_type = "control"
-                entities.append(Neviweb130ControlerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
+    def build_entities(devices, devices2):
+        """Create entities for devices of both gateways."""
+        new_entities = []
+        for device_info in devices:
+            if "signature" in device_info and \
+                "model" in device_info["signature"] and \
+                device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
+                device_name = '{} {}'.format(DEFAULT_NAME, device_info["name"])
+                device_sku = device_info["sku"]
+                device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
+                if device_info["signature"]["model"] in IMPLEMENTED_WALL_DEVICES:
+                    device_type = "outlet"
+                    new_entities.append(Neviweb130Switch(data, device_info, device_name, device_sku, device_firmware, device_type))
+                elif device_info["signature"]["model"] in IMPLEMENTED_LOAD_DEVICES:
+                    device_type = "power"
+                    new_entities.append(Neviweb130PowerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
+                elif device_info["signature"]["model"] in IMPLEMENTED_WATER_HEATER_LOAD_MODEL:
+                    device_type = "power"
+                    new_entities.append(Neviweb130TankPowerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
+                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL:
+                    device_type = "power"
+                    new_entities.append(Neviweb130WifiTankPowerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
+                else:
+                    device_type = "control"
+                    new_entities.append(Neviweb130ControlerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
+        for device_info in devices2:
+            if "signature" in device_info and \
+                "model" in device_info["signature"] and \
+                device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
+                device_name = '{} {}'.format(DEFAULT_NAME_2, device_info["name"])
+                device_sku = device_info["sku"]
+                device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
+                if device_info["signature"]["model"] in IMPLEMENTED_WALL_DEVICES:
+                    device_type = "outlet"
+                    new_entities.append(Neviweb130Switch(data, device_info, device_name, device_sku, device_firmware, device_type))
+                elif device_info["signature"]["model"] in IMPLEMENTED_LOAD_DEVICES:
+                    device_type = "power"
+                    new_entities.append(Neviweb130PowerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
+                elif device_info["signature"]["model"] in IMPLEMENTED_WATER_HEATER_LOAD_MODEL:
+                    device_type = "power"
+                    new_entities.append(Neviweb130TankPowerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
+                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL:
+                    device_type = "power"
+                    new_entities.append(Neviweb130WifiTankPowerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
+                else:
+                    device_type = "control"
+                    new_entities.append(Neviweb130ControlerSwitch(data, device_info, device_name, device_sku, device_firmware, device_type))
+        return new_entities
 
+    entities = build_entities(data.neviweb130_client.gateway_data,
+        data.neviweb130_client.gateway_data2)
     async_add_entities(entities, True)
 
+    @callback
+    def async_add_discovered_entities(devices, devices2):
+        """Add devices whose signature was fetched after startup."""
+        new_entities = build_entities(devices, devices2)
+        entities.extend(new_entities)
+        async_add_entities(new_entities, True)
+
+    async_dispatcher_connect(hass, SIGNAL_DEVICES_DISCOVERED,
+        async_add_discovered_entities)
+
     def set_switch_keypad_lock_service(service):
         """ lock/unlock keypad device"""
         entity_id = service.data[ATTR_ENTITY_ID]
@@ -296,7 +329,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "lock": service.data[ATTR_KEYPAD]}
                 switch.set_keypad_lock(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_switch_timer_service(service):
@@ -307,7 +340,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "time": service.data[ATTR_TIMER]}
                 switch.set_timer(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_switch_timer2_service(service):
@@ -318,7 +351,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "time": service.data[ATTR_TIMER2]}
                 switch.set_timer2(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_load_dr_options_service(service):
@@ -329,7 +362,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "dractive": service.data[ATTR_DRACTIVE], "droptout": service.data[ATTR_OPTOUT], "onoff": service.data[ATTR_ONOFF]}
                 switch.set_load_dr_options(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_control_onoff_service(service):
@@ -340,7 +373,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "onoff_num": service.data[ATTR_ONOFF_NUM], "status": service.data[ATTR_STATUS]}
                 switch.set_control_onoff(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_tank_size_service(service):
@@ -351,7 +384,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "val": service.data[ATTR_VALUE][0]}
                 switch.set_tank_size(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_controlled_device_service(service):
@@ -362,7 +395,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "val": service.data[ATTR_VALUE][0]}
                 switch.set_controlled_device(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_low_temp_protection_service(service):
@@ -373,7 +406,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "val": service.data[ATTR_WATER_TEMP_MIN]}
                 switch.set_low_temp_protection(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_input_output_names_service(service):
@@ -384,7 +417,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "input1": service.data[ATTR_NAME_1], "input2": service.data[ATTR_NAME_2], "output1": service.data[ATTR_OUTPUT_NAME_1], "output2": service.data[ATTR_OUTPUT_NAME_2]}
                 switch.set_input_output_names(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_activation_service(service):
@@ -395,7 +428,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "active": service.data[ATTR_ACTIVE]}
                 switch.set_activation(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_remaining_time_service(service):
@@ -406,7 +439,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "time": service.data[ATTR_COLD_LOAD_PICKUP_REMAIN_TIME]}
                 switch.set_remaining_time(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_on_off_input_delay_service(service):
@@ -417,90 +450,90 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "inputnumber": service.data[ATTR_INPUT_NUMBER], "onoff": service.data[ATTR_ONOFF], "delay": service.data[ATTR_DELAY][0]}
                 switch.set_on_off_input_delay(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_SWITCH_KEYPAD_LOCK,
-        set_switch_keypad_lock_service,
+        data.executor.job(set_switch_keypad_lock_service),
         schema=SET_SWITCH_KEYPAD_LOCK_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_SWITCH_TIMER,
-        set_switch_timer_service,
+        data.executor.job(set_switch_timer_service),
         schema=SET_SWITCH_TIMER_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_SWITCH_TIMER_2,
-        set_switch_timer2_service,
+        data.executor.job(set_switch_timer2_service),
         schema=SET_SWITCH_TIMER_2_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_LOAD_DR_OPTIONS,
-        set_load_dr_options_service,
+        data.executor.job(set_load_dr_options_service),
         schema=SET_LOAD_DR_OPTIONS_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_CONTROL_ONOFF,
-        set_control_onoff_service,
+        data.executor.job(set_control_onoff_service),
         schema=SET_CONTROL_ONOFF_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_TANK_SIZE,
-        set_tank_size_service,
+        data.executor.job(set_tank_size_service),
         schema=SET_TANK_SIZE_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_CONTROLLED_DEVICE,
-        set_controlled_device_service,
+        data.executor.job(set_controlled_device_service),
         schema=SET_CONTROLLED_DEVICE_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_LOW_TEMP_PROTECTION,
-        set_low_temp_protection_service,
+        data.executor.job(set_low_temp_protection_service),
         schema=SET_LOW_TEMP_PROTECTION_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_INPUT_OUTPUT_NAMES,
-        set_input_output_names_service,
+        data.executor.job(set_input_output_names_service),
         schema=SET_INPUT_OUTPUT_NAMES_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_ACTIVATION,
-        set_activation_service,
+        data.executor.job(set_activation_service),
         schema=SET_ACTIVATION_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_REMAINING_TIME,
-        set_remaining_time_service,
+        data.executor.job(set_remaining_time_service),
         schema=SET_REMAINING_TIME_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_ON_OFF_INPUT_DELAY,
-        set_on_off_input_delay_service,
+        data.executor.job(set_on_off_input_delay_service),
         schema=SET_ON_OFF_INPUT_DELAY_SCHEMA,
     )
 
@@ -588,27 +621,136 @@ def lock_to_ha(lock):
         case "partialLock":
             return "Tamper protection"
 
-class Neviweb130Switch(SwitchEntity):
+# Parsers of device data, by load controller model
+
+DR_FIELDS = (
+    Field("drstatus_active", ATTR_DRSTATUS, item(ATTR_DRACTIVE)),
+    Field("drstatus_optout", ATTR_DRSTATUS, item(ATTR_OPTOUT)),
+    Field("drstatus_onoff", ATTR_DRSTATUS, item(ATTR_ONOFF)),
+)
+
+TANK_FIELDS = DR_FIELDS + (
+    Field("onoff", ATTR_ONOFF),
+    Field("drstatus_optout_reason", ATTR_DRSTATUS, item("optOutReason")),
+    Field("temp_status", ATTR_ERROR_CODE_SET1, entry("temperatureSensor"),
+        KEEP),
+    Field("stm_mcu", ATTR_ERROR_CODE_SET1, entry("stm_mcu"), KEEP),
+    Field("thermal_overload", ATTR_ERROR_CODE_SET1, entry("thermalOverload"),
+        KEEP),
+    Field("current_overload", ATTR_ERROR_CODE_SET1, entry("currentOverload"),
+        KEEP),
+    Field("j2connector", ATTR_ERROR_CODE_SET1, entry("j2Connector"), KEEP),
+    Field("j3connector", ATTR_ERROR_CODE_SET1, entry("j3Connector"), KEEP),
+    Field("line_error", ATTR_ERROR_CODE_SET1, entry("lineError"), KEEP),
+    Field("cold_load_status", ATTR_COLD_LOAD_PICKUP_STATUS),
+    Field("cold_load_remaining_time", ATTR_COLD_LOAD_PICKUP_REMAIN_TIME),
+    Field("tank_size", ATTR_TANK_SIZE),
+)
+
+CONTROLLER_FIELDS = (
+    Field("onoff", ATTR_ONOFF),
+    Field("onoff2", ATTR_ONOFF2),
+    Field("battery_status", ATTR_BATTERY_STATUS),
+    Field("battery_voltage", ATTR_BATTERY_VOLTAGE),
+    Field("input_status", ATTR_INPUT_STATUS),
+    Field("input2_status", ATTR_INPUT2_STATUS),
+    Field("humidity", ATTR_REL_HUMIDITY),
+    Field("room_temp", ATTR_ROOM_TEMPERATURE),
+    Field("ext_temp", ATTR_EXT_TEMP),
+    Field("timer", ATTR_TIMER),
+    Field("timer2", ATTR_TIMER2),
+    Field("batt_info", ATTR_BATT_INFO),
+    Field("input_1_on_delay", ATTR_INPUT_1_ON_DELAY),
+    Field("input_2_on_delay", ATTR_INPUT_2_ON_DELAY),
+    Field("input_1_off_delay", ATTR_INPUT_1_OFF_DELAY),
+    Field("input_2_off_delay", ATTR_INPUT_2_OFF_DELAY),
+    Field("batt_percent_normal", ATTR_BATT_PERCENT_NORMAL),
+    Field("batt_status_normal", ATTR_BATT_STATUS_NORMAL),
+    Field("rssi", ATTR_RSSI),
+)
+
+SWITCH_PARSER = compile_parser("switch", Neviweb130LoadControllerState, (
+    Field("current_power_w", ATTR_WATTAGE_INSTANT),
+    Field("onoff", ATTR_ONOFF),
+))
+
+POWER_SWITCH_PARSER = compile_parser("power_switch",
+    Neviweb130LoadControllerState, DR_FIELDS + (
+    Field("onoff", ATTR_ONOFF),
+    Field("current_power_w", ATTR_WATTAGE_INSTANT),
+    Field("wattage", ATTR_WATTAGE),
+    Field("keypad", ATTR_KEYPAD, lambda keypad: STATE_KEYPAD_STATUS
+        if keypad == STATE_KEYPAD_STATUS else "locked", "locked"),
+    Field("timer", ATTR_TIMER),
+    Field("relayK1", ATTR_ERROR_CODE_SET1, entry("relayK1"), KEEP),
+    Field("relayK2", ATTR_ERROR_CODE_SET1, entry("relayK2"), KEEP),
+    Field("rssi", ATTR_RSSI),
+    Field("controlled_device", ATTR_CONTROLLED_DEVICE),
+))
+
+TANK_SWITCH_PARSER = compile_parser("tank_switch",
+    Neviweb130LoadControllerState, TANK_FIELDS + (
+    Field("water_leak_status", ATTR_WATER_LEAK_STATUS),
+    Field("water_temp", ATTR_ROOM_TEMPERATURE),
+    Field("wattage", ATTR_WATTAGE),
+    Field("current_power_w", ATTR_WATTAGE_INSTANT),
+    Field("rssi", ATTR_RSSI),
+    Field("water_temp_min", ATTR_WATER_TEMP_MIN),
+    Field("watt_time_on", ATTR_WATT_TIME_ON),
+    Field("water_temp_time", ATTR_DR_WATER_TEMP_TIME),
+    Field("temperature", ATTR_DR_PROTEC_STATUS, item("temperature")),
+    Field("consumption", ATTR_DR_PROTEC_STATUS, item("consumption")),
+    Field("consumption_time", ATTR_DR_PROTEC_STATUS,
+        item("consumptionOverTime")),
+))
+
+WIFI_TANK_SWITCH_PARSER = compile_parser("wifi_tank_switch",
+    Neviweb130LoadControllerState, TANK_FIELDS + (
+    Field("water_leak_status", ATTR_WATER_LEAK_ALARM_STATUS),
+    Field("water_leak_disconected_status",
+        ATTR_WATER_LEAK_DISCONECTED_STATUS),
+    Field("water_temp", ATTR_WATER_TEMPERATURE),
+    Field("current_power_w", ATTR_WIFI_WATT_NOW),
+    Field("wattage", ATTR_WIFI_WATTAGE),
+    Field("cold_load_temp", ATTR_COLD_LOAD_PICKUP_TEMP),
+    Field("rssi", ATTR_WIFI),
+    Field("mode", ATTR_SYSTEM_MODE),
+    Field("away_action", ATTR_AWAY_ACTION),
+    Field("leg_status", ATTR_LEG_PROTEC_STATUS),
+    Field("water_temp_min", ATTR_MIN_WATER_TEMP),
+    Field("water_tank_on", ATTR_WATER_TANK_ON),
+    Field("water_temp_time", ATTR_WATER_TEMP_TIME),
+))
+
+CONTROLLER_PARSER = compile_parser("controller",
+    Neviweb130LoadControllerState, CONTROLLER_FIELDS)
+
+CONTROLLER_ZB_PARSER = compile_parser("controller_zigbee",
+    Neviweb130LoadControllerState, CONTROLLER_FIELDS + (
+    Field("input_name_1", ATTR_NAME_1),
+    Field("input_name_2", ATTR_NAME_2),
+    Field("output_name_1", ATTR_OUTPUT_NAME_1),
+    Field("output_name_2", ATTR_OUTPUT_NAME_2),
+))
+
+class Neviweb130Switch(CoordinatorEntity, SwitchEntity):
     """Implementation of a Neviweb switch."""
 
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
+
     def __init__(self, data, device_info, name, sku, firmware, device_type):
         """Initialize."""
         self._name = name
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
         self._device_type = device_type
-        self._hour_energy_kwh_count = None
-        self._today_energy_kwh_count = None
-        self._month_energy_kwh_count = None
-        self._hour_kwh = None
-        self._today_kwh = None
-        self._month_kwh = None
-        self._current_power_w = 0
-        self._onoff = None
+        self._state = Neviweb130LoadControllerState()
         self._is_wall = device_info["signature"]["model"] in \
             IMPLEMENTED_WALL_DEVICES
         self._is_load = device_info["signature"]["model"] in \
@@ -621,35 +763,90 @@ class Neviweb130Switch(SwitchEntity):
             IMPLEMENTED_ZB_DEVICE_CONTROL
         self._is_sedna_control = device_info["signature"]["model"] in \
             IMPLEMENTED_SED_DEVICE_CONTROL
-        self._energy_stat_time = time.time() - 1500
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
-            LOAD_ATTRIBUTES = [ATTR_WATTAGE_INSTANT]
+    def attribute_tiers(self):
+        """Return attributes refreshed on the warm and cold tiers."""
+        return WARM_ATTRIBUTES, COLD_ATTRIBUTES
+
+    def update_endpoints(self):
+        """Return endpoints read by the coordinator besides attributes."""
+        return []
+
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        LOAD_ATTRIBUTES = [ATTR_WATTAGE_INSTANT]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from Neviweb and update the state."""
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES)
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
             if "error" not in device_data:
                 if "errorCode" not in device_data:
-                    self._current_power_w = device_data[ATTR_WATTAGE_INSTANT]
-                    self._onoff = device_data[ATTR_ONOFF]
+                    parse(SWITCH_PARSER, self._state, device_data, self._name)
                 else:
                     _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
             else:
-                self.log_error(device_data["error"]["code"])
-            self.do_stat(start)
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
+
+    @property
+    def activ(self):
+        """Return False when Neviweb polling is halted for this device."""
+        return self.coordinator.breaker(self.unique_id).closed
+
+    @property
+    def available(self):
+        """Return False while the gateway of the device is offline."""
+        return super().available and \
+            self.coordinator.device_available(self.unique_id)
+
+    @property
+    def device_signature(self):
+        """Return model and firmware of the device."""
+        return self._device_model, self._firmware
+
+    @property
+    def device_state(self):
+        """Return the values last read from Neviweb for this device."""
+        return self._state
+
+    @property
+    def energy_stats(self):
+        """Return True if energy statistics are fetched for this device."""
+        return True
+
+    @property
+    def energy_unit(self):
+        """Return the unit of energy statistics of this device."""
+        return UnitOfEnergy.KILO_WATT_HOUR
+
+    @property
+    def energy_counters(self):
+        """Return energy counters and last period usage in kWh, shown by the
+        energy sensor of this device."""
+        return {'hourly_kwh_count': self._state.hour_energy_kwh_count,
+            'daily_kwh_count': self._state.today_energy_kwh_count,
+            'monthly_kwh_count': self._state.month_energy_kwh_count,
+            'hourly_kwh': self._state.hour_kwh,
+            'daily_kwh': self._state.today_kwh,
+            'monthly_kwh': self._state.month_kwh}
+
+    @property
+    def power_sensor(self):
+        """Return True if the power drawn by this device is known."""
+        return True
+
+    @property
+    def current_power(self):
+        """Return the power drawn in W."""
+        return self._state.current_power_w
+
+    async def async_update(self):
+        """Refresh this device only, at startup or after a command."""
+        await self.coordinator.async_refresh_device(self)
 
     @property
     def unique_id(self):
@@ -677,53 +874,50 @@ class Neviweb130Switch(SwitchEntity):
     @property  
     def is_on(self):
         """Return current operation i.e. ON, OFF """
-        return self._onoff != MODE_OFF
+        return self._state.onoff != MODE_OFF
 
-    def turn_on(self, **kwargs):
+    async def async_turn_on(self, **kwargs):
         """Turn the device on."""
-        self._client.set_onoff(self._id, "on")
-        self._onoff = "on"
+        self._state.onoff = "on"
+        self.async_write_ha_state()
+        await self._async_client.set_onoff(self._id, "on")
 
-    def turn_off(self, **kwargs):
+    async def async_turn_off(self, **kwargs):
         """Turn the device off."""
-        self._client.set_onoff(self._id, "off")
-        self._onoff = MODE_OFF
+        self._state.onoff = MODE_OFF
+        self.async_write_ha_state()
+        await self._async_client.set_onoff(self._id, "off")
 
     @property  
     def keypad_status(self):
         """Return current keypad status, unlocked, locked or partially locked"""
-        if self._keypad != None:
-            return lock_to_ha(self._keypad)
+        if self._state.keypad != None:
+            return lock_to_ha(self._state.keypad)
         return False
 
     @property
     def current_temperature(self):
         """Return the current controler temperature."""
         if self._is_zb_control or self._is_sedna_control or self._is_tank_load:
-            return self._room_temp
+            return self._state.room_temp
         else:
-            return self._cur_temp
+            return self._state.cur_temp
 
     @property
     def extra_state_attributes(self):
         """Return the extra state attributes."""
         data = {}
-        data.update({'onOff': self._onoff,
-               'Wattage_instant': self._current_power_w,
-               'hourly_kwh_count': self._hour_energy_kwh_count,
-               'daily_kwh_count': self._today_energy_kwh_count,
-               'monthly_kwh_count': self._month_energy_kwh_count,
-               'hourly_kwh': self._hour_kwh,
-               'daily_kwh': self._today_kwh,
-               'monthly_kwh': self._month_kwh,
+        data.update({'onOff': self._state.onoff,
+               'Wattage_instant': self._state.current_power_w,
                'sku': self._sku,
                'device_model': str(self._device_model),
                'device_model_cfg': self._device_model_cfg,
                'firmware': self._firmware,
-               'Activation': self._activ,
+               'Activation': self.activ,
                'device_type': self._device_type,
+               'poll_interval': self.coordinator.poll_interval(self._id),
                'id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
 
     @property
     def battery_voltage(self):
@@ -732,12 +926,12 @@ class Neviweb130Switch(SwitchEntity):
             type = 2
         else:
             type = 4
-        return voltage_to_percentage(self._battery_voltage, type)
+        return voltage_to_percentage(self._state.battery_voltage, type)
 
     @property
     def is_standby(self):
         """Return true if device is in standby."""
-        return self._current_power_w == 0
+        return self._state.current_power_w == 0
 
     def set_control_onoff(self, value):
         """Set onOff or onOff2 to on or off"""
@@ -747,9 +941,9 @@ class Neviweb130Switch(SwitchEntity):
         self._client.set_control_onoff(
             entity, onoff_no, status)
         if onoff_no == 1:
-            self._onoff = status
+            self._state.onoff = status
         else:
-            self._onoff2 = status
+            self._state.onoff2 = status
 
     def set_keypad_lock(self, value):
         """Lock or unlock device's keypad, lock = locked, unlock = unlocked, partiallyLocked - partial lock."""
@@ -757,7 +951,7 @@ class Neviweb130Switch(SwitchEntity):
         entity = value["id"]
         self._client.set_keypad_lock(
             entity, lock, False)
-        self._keypad = lock
+        self._state.keypad = lock
 
     def set_timer(self, value):
         """Set device timer, 0 = off, 1 to 255 = timer length"""
@@ -765,7 +959,7 @@ class Neviweb130Switch(SwitchEntity):
         entity = value["id"]
         self._client.set_timer(
             entity, time)
-        self._timer = time
+        self._state.timer = time
 
     def set_timer2(self, value):
         """Set device timer 2 for Multi controller, 0 = off, 1 to 255 = timer length"""
@@ -773,7 +967,7 @@ class Neviweb130Switch(SwitchEntity):
         entity = value["id"]
         self._client.set_timer2(
             entity, time)
-        self._timer2 = time
+        self._state.timer2 = time
 
     def set_load_dr_options(self, value):
         """ set load controler Éco Sinopé attributes """
@@ -783,9 +977,9 @@ class Neviweb130Switch(SwitchEntity):
         dr = value["dractive"]
         self._client.set_load_dr_options(
             entity, onoff, optout, dr)
-        self._drstatus_active = dr
-        self._drstatus_optout = optout
-        self._drstatus_onoff = onoff
+        self._state.drstatus_active = dr
+        self._state.drstatus_optout = optout
+        self._state.drstatus_onoff = onoff
 
     def set_tank_size(self, value):
         """ set water tank size for RM3500ZB Calypso controler. """
@@ -794,7 +988,7 @@ class Neviweb130Switch(SwitchEntity):
         size = [v for k, v in HA_TO_NEVIWEB_SIZE.items() if k == val][0]
         self._client.set_tank_size(
             entity, size)
-        self._tank_size = size
+        self._state.tank_size = size
 
     def set_controlled_device(self, value):
         """ set device name controlled by RM3250ZB load controler. """
@@ -803,7 +997,7 @@ class Neviweb130Switch(SwitchEntity):
         tipe = [v for k, v in HA_TO_NEVIWEB_CONTROLLED.items() if k == val][0]
         self._client.set_controlled_device(
             entity, tipe)
-        self._controlled_device = tipe
+        self._state.controlled_device = tipe
 
     def set_low_temp_protection(self, value):
         """ Set water temperature protection for Calypso """
@@ -811,19 +1005,19 @@ class Neviweb130Switch(SwitchEntity):
         entity = value["id"]
         self._client.set_low_temp_protection(
             entity, temp)
-        self._water_temp_min = temp
+        self._state.water_temp_min = temp
 
     def set_activation(self, value):
         """ Activate or deactivate neviweb polling for a missing device """
         action = value["active"]
-        self._activ = action
+        self.coordinator.breaker(self.unique_id).set_active(action)
 
     def set_remaining_time(self, value):
         """ set coldLoadPickupRemainingTime value."""
         time = value["time"]
         entity = value["id"]
         self._client.set_remaining_time(entity, time)
-        self._cold_load_remaining_time = time
+        self._state.cold_load_remaining_time = time
 
     def set_on_off_input_delay(self, value):
         """ set input 1 or 2 on/off delay in seconds"""
@@ -836,15 +1030,15 @@ class Neviweb130Switch(SwitchEntity):
         if inputnumber == 1:
             match value["onoff"]:
                 case "on":
-                    self._input_1_on_delay = delay
+                    self._state.input_1_on_delay = delay
                 case _:
-                    self._input_1_off_delay = delay
+                    self._state.input_1_off_delay = delay
         else:
             match value["onoff"]:
                 case "on":
-                    self._input_2_on_delay = delay
+                    self._state.input_2_on_delay = delay
                 case _:
-                    self._input_2_off_delay = delay
+                    self._state.input_2_off_delay = delay
 
     def set_input_output_names(self, value):
         """ Set names for input 1 and 2, output 1 and 2 for MC3100ZB device. """
@@ -866,50 +1060,43 @@ class Neviweb130Switch(SwitchEntity):
             out_2 = ""
         entity = value["id"]
         self._client.set_input_output_names(entity, in_1, in_2, out_1, out_2)
-        self._input_name_1 = in_1
-        self._input_name_2 = in_2
-        self._output_name_1 = out_1
-        self._output_name_2 = out_2
-
-    def do_stat(self, start):
-        """ Get device energy statistic """
-        if start - self._energy_stat_time > STAT_INTERVAL and self._energy_stat_time != 0:
-            device_hourly_stats = self._client.get_device_hourly_stats(self._id)
-#            _LOGGER.warning("%s device_hourly_stats = %s", self._name, device_hourly_stats)
-            if device_hourly_stats is not None and len(device_hourly_stats) > 1:
-                self._hour_energy_kwh_count = device_hourly_stats[1]["counter"] / 1000
-                self._hour_kwh = device_hourly_stats[1]["period"] / 1000
+        self._state.input_name_1 = in_1
+        self._state.input_name_2 = in_2
+        self._state.output_name_1 = out_1
+        self._state.output_name_2 = out_2
+
+    def update_energy_stats(self, hourly, daily, monthly):
+        """ Update device energy statistic, None for a period not fetched """
+        if hourly is not None:
+            if len(hourly) > 1:
+                self._state.hour_energy_kwh_count = hourly[1]["counter"] / 1000
+                self._state.hour_kwh = hourly[1]["period"] / 1000
             else:
                 _LOGGER.warning("Got None for device_hourly_stats")
-            device_daily_stats = self._client.get_device_daily_stats(self._id)
-#            _LOGGER.warning("%s device_daily_stats = %s", self._name, device_daily_stats)
-            if device_daily_stats is not None and len(device_daily_stats) > 1:
-                self._today_energy_kwh_count = device_daily_stats[0]["counter"] / 1000
-                self._today_kwh = device_daily_stats[0]["period"] / 1000
+        if daily is not None:
+            if len(daily) > 1:
+                self._state.today_energy_kwh_count = daily[0]["counter"] / 1000
+                self._state.today_kwh = daily[0]["period"] / 1000
             else:
                 _LOGGER.warning("Got None for device_daily_stats")
-            device_monthly_stats = self._client.get_device_monthly_stats(self._id)
-#            _LOGGER.warning("%s device_monthly_stats = %s", self._name, device_monthly_stats)
-            if device_monthly_stats is not None and len(device_monthly_stats) > 1:
-                self._month_energy_kwh_count = device_monthly_stats[0]["counter"] / 1000
-                self._month_kwh = device_monthly_stats[0]["period"] / 1000
+        if monthly is not None:
+            if len(monthly) > 1:
+                self._state.month_energy_kwh_count = monthly[0]["counter"] / 1000
+                self._state.month_kwh = monthly[0]["period"] / 1000
             else:
                 _LOGGER.warning("Got None for device_monthly_stats")
-            self._energy_stat_time = time.time()
-        if self._energy_stat_time == 0:
-            self._energy_stat_time = start
 
-    def log_error(self, error_data):
+    async def async_log_error(self, error_data):
         """ Send error message to LOG """
         if error_data == "USRSESSEXP":
             _LOGGER.warning("Session expired... reconnecting...")
-            self._client.reconnect()
+            await self._async_client.reconnect()
         elif error_data == "ACCSESSEXC":
             _LOGGER.warning("Maximun session number reached...Close other connections and try again.")
-            self.notify_ha(
+            await self.async_notify_ha(
                 f"Warning: Maximun Neviweb session number reached...Close other connections and try again."
             )
-            self._client.reconnect()
+            await self._async_client.reconnect()
         elif error_data == "DVCATTRNSPTD":
                 _LOGGER.warning("Device attribute not supported for %s: %s...(SKU: %s)", self._name, device_data, self._sku)
         elif error_data == "DVCACTNSPTD":
@@ -922,19 +1109,17 @@ class Neviweb130Switch(SwitchEntity):
             _LOGGER.warning("Device busy can't reach (neviweb update ?), retry later %s: %s...(SKU: %s)", self._name, device_data, self._sku)
         elif error_data == "DVCUNVLB":
             _LOGGER.warning("Device %s is disconected from Neviweb: %s...(SKU: %s)", self._name, device_data, self._sku)
-            _LOGGER.warning("This device %s is de-activated and won't be updated for 20 minutes.",self._name)
-            _LOGGER.warning("You can re-activate device %s with service.neviweb130_set_activation or wait 20 minutes for update to restart or just restart HA.",self._name)
-            self._activ = False
-            self._snooze = time.time()
-            self.notify_ha(
-                f"Warning: Received message from Neviweb, device disconnected... Check you log... Neviweb update will be halted for 20 minutes for " + self._name + ", Sku: " + self._sku
+            _LOGGER.warning("This device %s is de-activated and will be probed with a growing delay until it answers again.",self._name)
+            _LOGGER.warning("You can re-activate device %s with service.neviweb130_set_activation or wait for update to restart or just restart HA.",self._name)
+            await self.async_notify_ha(
+                f"Warning: Received message from Neviweb, device disconnected... Check you log... Neviweb update will be halted until the device answers again for " + self._name + ", Sku: " + self._sku
             )
         else:
             _LOGGER.warning("Unknown error for %s: %s...(SKU: %s) Report to maintainer.", self._name, device_data, self._sku)
 
-    def notify_ha(self, msg: str, title: str = "Neviweb130 integration "+VERSION):
+    async def async_notify_ha(self, msg: str, title: str = "Neviweb130 integration "+VERSION):
         """Notify user via HA web frontend."""
-        self.hass.services.call(
+        await self.hass.services.async_call(
             PN_DOMAIN,
             "create",
             service_data={
@@ -954,104 +1139,61 @@ class Neviweb130PowerSwitch(Neviweb130Switch):
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
         self._device_type = device_type
-        self._current_power_w = 0
-        self._wattage = 0
-        self._hour_energy_kwh_count = None
-        self._today_energy_kwh_count = None
-        self._month_energy_kwh_count = None
-        self._hour_kwh = None
-        self._today_kwh = None
-        self._month_kwh = None
-        self._onoff = None
-        self._timer = 0
-        self._keypad = None
-        self._drstatus_active = "off"
-        self._drstatus_optout = "off"
-        self._drstatus_onoff = "off"
-        self._relayK1 = None
-        self._relayK2 = None
-        self._rssi = None
-        self._controlled_device = None
+        self._state = Neviweb130LoadControllerState()
         self._is_load = device_info["signature"]["model"] in \
             IMPLEMENTED_LOAD_DEVICES
-        self._energy_stat_time = time.time() - 1500
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
-            LOAD_ATTRIBUTES = [ATTR_WATTAGE, ATTR_WATTAGE_INSTANT, ATTR_TIMER, ATTR_KEYPAD, ATTR_DRSTATUS, ATTR_RSSI, ATTR_CONTROLLED_DEVICE, ATTR_ERROR_CODE_SET1]
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        LOAD_ATTRIBUTES = [ATTR_WATTAGE, ATTR_WATTAGE_INSTANT, ATTR_TIMER, ATTR_KEYPAD, ATTR_DRSTATUS, ATTR_RSSI, ATTR_CONTROLLED_DEVICE, ATTR_ERROR_CODE_SET1]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from Neviweb and update the state."""
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES)
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
             if "error" not in device_data:
                 if "errorCode" not in device_data:
-                    self._onoff = device_data[ATTR_ONOFF]
-                    self._current_power_w = device_data[ATTR_WATTAGE_INSTANT]
-                    self._wattage = device_data[ATTR_WATTAGE]
-                    self._keypad = STATE_KEYPAD_STATUS if \
-                        device_data[ATTR_KEYPAD] == STATE_KEYPAD_STATUS else "locked" 
-                    self._timer = device_data[ATTR_TIMER]
-                    if ATTR_DRSTATUS in device_data:
-                        self._drstatus_active = device_data[ATTR_DRSTATUS][ATTR_DRACTIVE]
-                        self._drstatus_optout = device_data[ATTR_DRSTATUS][ATTR_OPTOUT]
-                        self._drstatus_onoff = device_data[ATTR_DRSTATUS][ATTR_ONOFF]
-                    if ATTR_ERROR_CODE_SET1 in device_data and len(device_data[ATTR_ERROR_CODE_SET1]) > 0:
-                        self._relayK1 = device_data[ATTR_ERROR_CODE_SET1]["relayK1"]
-                        self._relayK2 = device_data[ATTR_ERROR_CODE_SET1]["relayK2"]
-                    if ATTR_RSSI in device_data:
-                        self._rssi = device_data[ATTR_RSSI]
-                    self._controlled_device = device_data[ATTR_CONTROLLED_DEVICE]
+                    parse(POWER_SWITCH_PARSER, self._state, device_data, self._name)
                 else:
                     _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
             else:
-                self.log_error(device_data["error"]["code"])
-            self.do_stat(start)
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
 
     @property
     def extra_state_attributes(self):
         """Return the extra state attributes."""
         data = {}
-        data.update({'onOff': self._onoff,
-               'Controlled_device': neviweb_to_ha_controlled(self._controlled_device),
-               'Wattage': self._wattage,
-               'Wattage_instant': self._current_power_w,
-               'hourly_kwh_count': self._hour_energy_kwh_count,
-               'daily_kwh_count': self._today_energy_kwh_count,
-               'monthly_kwh_count': self._month_energy_kwh_count,
-               'hourly_kwh': self._hour_kwh,
-               'daily_kwh': self._today_kwh,
-               'monthly_kwh': self._month_kwh,
-               'Keypad': lock_to_ha(self._keypad),
-               'Timer': self._timer,
-               'eco_status': self._drstatus_active,
-               'eco_optOut': self._drstatus_optout,
-               'eco_onoff': self._drstatus_onoff,
-               'RelayK1': self._relayK1,
-               'RelayK2': self._relayK2,
-               'Rssi': self._rssi,
+        data.update({'onOff': self._state.onoff,
+               'Controlled_device': neviweb_to_ha_controlled(self._state.controlled_device),
+               'Wattage': self._state.wattage,
+               'Wattage_instant': self._state.current_power_w,
+               'Keypad': lock_to_ha(self._state.keypad),
+               'Timer': self._state.timer,
+               'eco_status': self._state.drstatus_active,
+               'eco_optOut': self._state.drstatus_optout,
+               'eco_onoff': self._state.drstatus_onoff,
+               'RelayK1': self._state.relayK1,
+               'RelayK2': self._state.relayK2,
+               'Rssi': self._state.rssi,
                'sku': self._sku,
                'device_model': str(self._device_model),
                'device_model_cfg': self._device_model_cfg,
                'firmware': self._firmware,
-               'Activation': self._activ,
+               'Activation': self.activ,
                'device_type': self._device_type,
+               'poll_interval': self.coordinator.poll_interval(self._id),
                'id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
 
 class Neviweb130TankPowerSwitch(Neviweb130Switch):
     """Implementation of a Neviweb water heater power controler switch, RM3500ZB."""
@@ -1062,145 +1204,76 @@ class Neviweb130TankPowerSwitch(Neviweb130Switch):
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
         self._device_type = device_type
-        self._hour_energy_kwh_count = None
-        self._today_energy_kwh_count = None
-        self._month_energy_kwh_count = None
-        self._hour_kwh = None
-        self._today_kwh = None
-        self._month_kwh = None
-        self._onoff = None
-        self._current_power_w = 0
-        self._wattage = 0
-        self._drstatus_active = "off"
-        self._drstatus_optout = "off"
-        self._drstatus_onoff = "off"
-        self._drstatus_optout_reason = "off"
-        self._water_temp = None
-        self._water_temp_min = None
-        self._water_temp_time = None
-        self._rssi = None
-        self._temperature = None
-        self._water_leak_status = None
-        self._cold_load_status = None
-        self._cold_load_remaining_time = 0
-        self._tank_size = None
-        self._consumption = None
-        self._consumption_time = None
-        self._watt_time_on = None
-        self._stm_mcu = None
-        self._temp_status = None
-        self._thermal_overload = None
-        self._current_overload = None
-        self._j2connector = None
-        self._j3connector = None
-        self._line_error = None
+        self._state = Neviweb130LoadControllerState()
         self._is_tank_load = device_info["signature"]["model"] in \
             IMPLEMENTED_WATER_HEATER_LOAD_MODEL
-        self._energy_stat_time = time.time() - 1500
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
-            LOAD_ATTRIBUTES = [ATTR_WATER_LEAK_STATUS, ATTR_ROOM_TEMPERATURE, ATTR_ERROR_CODE_SET1, ATTR_WATTAGE, ATTR_WATTAGE_INSTANT, ATTR_COLD_LOAD_PICKUP_STATUS, ATTR_TANK_SIZE, ATTR_WATER_TEMP_MIN, ATTR_WATT_TIME_ON,
-                ATTR_DR_WATER_TEMP_TIME, ATTR_RSSI, ATTR_DRSTATUS, ATTR_DR_PROTEC_STATUS, ATTR_COLD_LOAD_PICKUP_REMAIN_TIME]
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        LOAD_ATTRIBUTES = [ATTR_WATER_LEAK_STATUS, ATTR_ROOM_TEMPERATURE, ATTR_ERROR_CODE_SET1, ATTR_WATTAGE, ATTR_WATTAGE_INSTANT, ATTR_COLD_LOAD_PICKUP_STATUS, ATTR_TANK_SIZE, ATTR_WATER_TEMP_MIN, ATTR_WATT_TIME_ON,
+            ATTR_DR_WATER_TEMP_TIME, ATTR_RSSI, ATTR_DRSTATUS, ATTR_DR_PROTEC_STATUS, ATTR_COLD_LOAD_PICKUP_REMAIN_TIME]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from Neviweb and update the state."""
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES)
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
             if "error" not in device_data:
                 if "errorCode" not in device_data:
-                    self._onoff = device_data[ATTR_ONOFF]
-                    self._water_leak_status = device_data[ATTR_WATER_LEAK_STATUS]
-                    self._water_temp = device_data[ATTR_ROOM_TEMPERATURE]
-                    if ATTR_ERROR_CODE_SET1 in device_data and len(device_data[ATTR_ERROR_CODE_SET1]) > 0:
-                        self._temp_status = device_data[ATTR_ERROR_CODE_SET1]["temperatureSensor"]
-                        self._stm_mcu = device_data[ATTR_ERROR_CODE_SET1]["stm_mcu"]
-                        self._thermal_overload = device_data[ATTR_ERROR_CODE_SET1]["thermalOverload"]
-                        self._current_overload = device_data[ATTR_ERROR_CODE_SET1]["currentOverload"]
-                        self._j2connector = device_data[ATTR_ERROR_CODE_SET1]["j2Connector"]
-                        self._j3connector = device_data[ATTR_ERROR_CODE_SET1]["j3Connector"]
-                        self._line_error = device_data[ATTR_ERROR_CODE_SET1]["lineError"]
-                    self._wattage = device_data[ATTR_WATTAGE]
-                    self._current_power_w = device_data[ATTR_WATTAGE_INSTANT]
-                    self._cold_load_status = device_data[ATTR_COLD_LOAD_PICKUP_STATUS]
-                    self._cold_load_remaining_time = device_data[ATTR_COLD_LOAD_PICKUP_REMAIN_TIME]
-                    self._rssi = device_data[ATTR_RSSI]
-                    self._tank_size = device_data[ATTR_TANK_SIZE]
-                    if ATTR_DRSTATUS in device_data:
-                        self._drstatus_active = device_data[ATTR_DRSTATUS][ATTR_DRACTIVE]
-                        self._drstatus_optout = device_data[ATTR_DRSTATUS][ATTR_OPTOUT]
-                        self._drstatus_onoff = device_data[ATTR_DRSTATUS][ATTR_ONOFF]
-                        self._drstatus_optout_reason = device_data[ATTR_DRSTATUS]["optOutReason"]
-                    self._water_temp_min = device_data[ATTR_WATER_TEMP_MIN]
-                    self._watt_time_on = device_data[ATTR_WATT_TIME_ON]
-                    self._water_temp_time = device_data[ATTR_DR_WATER_TEMP_TIME]
-                    self._temperature = device_data[ATTR_DR_PROTEC_STATUS]["temperature"]
-                    self._consumption = device_data[ATTR_DR_PROTEC_STATUS]["consumption"]
-                    self._consumption_time = device_data[ATTR_DR_PROTEC_STATUS]["consumptionOverTime"]
+                    parse(TANK_SWITCH_PARSER, self._state, device_data, self._name)
                 else:
                     _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
             else:
-                self.log_error(device_data["error"]["code"])
-            self.do_stat(start)
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
 
     @property
     def extra_state_attributes(self):
         """Return the extra state attributes."""
         data = {}
-        data.update({'onOff': self._onoff,
-               'Wattage': self._wattage,
-               'Wattage_instant': self._current_power_w,
-               'hourly_kwh_count': self._hour_energy_kwh_count,
-               'daily_kwh_count': self._today_energy_kwh_count,
-               'monthly_kwh_count': self._month_energy_kwh_count,
-               'hourly_kwh': self._hour_kwh,
-               'daily_kwh': self._today_kwh,
-               'monthly_kwh': self._month_kwh,
-               'Water_leak_status': self._water_leak_status,
-               'Water_temperature': self._water_temp,
-               'Cold_load_pickup_status': self._cold_load_status,
-               'Cold_load_remaining_time': self._cold_load_remaining_time,
-               'Tank_size': neviweb_to_ha(self._tank_size),
-               'Temperature_status': self._temp_status,
-               'Stm_Mcu': self._stm_mcu,
-               'Thermal_overload': self._thermal_overload,
-               'Current_overload': self._current_overload,
-               'j2Connector': self._j2connector,
-               'j3Connector': self._j3connector,
-               'Line_error': self._line_error,
-               'eco_status': self._drstatus_active,
-               'eco_optOut': self._drstatus_optout,
-               'eco_onoff': self._drstatus_onoff,
-               'eco_optout_reason': self._drstatus_optout_reason,
-               'Water_temp_min': self._water_temp_min,
-               'Water_time_on': self._watt_time_on,
-               'Water_temp_time': self._water_temp_time,
-               'Protection_Temperature': self._temperature,
-               'Protection_Consumption': self._consumption,
-               'Protection_consumption_overtime': self._consumption_time,
-               'Rssi': self._rssi,
+        data.update({'onOff': self._state.onoff,
+               'Wattage': self._state.wattage,
+               'Wattage_instant': self._state.current_power_w,
+               'Water_leak_status': self._state.water_leak_status,
+               'Water_temperature': self._state.water_temp,
+               'Cold_load_pickup_status': self._state.cold_load_status,
+               'Cold_load_remaining_time': self._state.cold_load_remaining_time,
+               'Tank_size': neviweb_to_ha(self._state.tank_size),
+               'Temperature_status': self._state.temp_status,
+               'Stm_Mcu': self._state.stm_mcu,
+               'Thermal_overload': self._state.thermal_overload,
+               'Current_overload': self._state.current_overload,
+               'j2Connector': self._state.j2connector,
+               'j3Connector': self._state.j3connector,
+               'Line_error': self._state.line_error,
+               'eco_status': self._state.drstatus_active,
+               'eco_optOut': self._state.drstatus_optout,
+               'eco_onoff': self._state.drstatus_onoff,
+               'eco_optout_reason': self._state.drstatus_optout_reason,
+               'Water_temp_min': self._state.water_temp_min,
+               'Water_time_on': self._state.watt_time_on,
+               'Water_temp_time': self._state.water_temp_time,
+               'Protection_Temperature': self._state.temperature,
+               'Protection_Consumption': self._state.consumption,
+               'Protection_consumption_overtime': self._state.consumption_time,
+               'Rssi': self._state.rssi,
                'sku': self._sku,
                'device_model': str(self._device_model),
                'device_model_cfg': self._device_model_cfg,
                'firmware': self._firmware,
-               'Activation': self._activ,
+               'Activation': self.activ,
                'device_type': self._device_type,
+               'poll_interval': self.coordinator.poll_interval(self._id),
                'id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
 
 class Neviweb130WifiTankPowerSwitch(Neviweb130Switch):
     """Implementation of a Neviweb wifi power controler switch, RM3500WF."""
@@ -1211,145 +1284,78 @@ class Neviweb130WifiTankPowerSwitch(Neviweb130Switch):
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
         self._device_type = device_type
-        self._hour_energy_kwh_count = None
-        self._today_energy_kwh_count = None
-        self._month_energy_kwh_count = None
-        self._hour_kwh = None
-        self._today_kwh = None
-        self._month_kwh = None
-        self._onoff = None
-        self._wattage = 0
-        self._current_power_w = 0
-        self._drstatus_active = "off"
-        self._drstatus_optout = "off"
-        self._drstatus_onoff = "off"
-        self._drstatus_optout_reason = "off"
-        self._cold_load_status = None
-        self._cold_load_remaining_time = 0
-        self._cold_load_temp = None
-        self._water_temp = None
-        self._water_temp_min = None
-        self._water_temp_time = None
-        self._water_leak_disconected_status = None
-        self._water_tank_on = None
-        self._water_leak_status = None
-        self._tank_size = None
-        self._stm_mcu = None
-        self._temp_status = None
-        self._thermal_overload = None
-        self._current_overload = None
-        self._j2connector = None
-        self._j3connector = None
-        self._line_error = None
-        self._rssi = None
-        self._leg_status = None
-        self._mode = None
-        self._away_action = None
+        self._state = Neviweb130LoadControllerState()
         self._is_wifi_tank_load = device_info["signature"]["model"] in \
             IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL
-        self._energy_stat_time = time.time() - 1500
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
-            LOAD_ATTRIBUTES = [ATTR_WATER_LEAK_ALARM_STATUS, ATTR_WATER_TEMPERATURE, ATTR_WATER_LEAK_DISCONECTED_STATUS, ATTR_ERROR_CODE_SET1, ATTR_WIFI_WATTAGE, ATTR_WIFI_WATT_NOW, ATTR_COLD_LOAD_PICKUP_STATUS, ATTR_TANK_SIZE, ATTR_MIN_WATER_TEMP, ATTR_WATER_TANK_ON,
-                ATTR_WATER_TEMP_TIME, ATTR_WIFI, ATTR_DRSTATUS, ATTR_LEG_PROTEC_STATUS, ATTR_COLD_LOAD_PICKUP_REMAIN_TIME, ATTR_SYSTEM_MODE, ATTR_COLD_LOAD_PICKUP_TEMP, ATTR_AWAY_ACTION]
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        LOAD_ATTRIBUTES = [ATTR_WATER_LEAK_ALARM_STATUS, ATTR_WATER_TEMPERATURE, ATTR_WATER_LEAK_DISCONECTED_STATUS, ATTR_ERROR_CODE_SET1, ATTR_WIFI_WATTAGE, ATTR_WIFI_WATT_NOW, ATTR_COLD_LOAD_PICKUP_STATUS, ATTR_TANK_SIZE, ATTR_MIN_WATER_TEMP, ATTR_WATER_TANK_ON,
+            ATTR_WATER_TEMP_TIME, ATTR_WIFI, ATTR_DRSTATUS, ATTR_LEG_PROTEC_STATUS, ATTR_COLD_LOAD_PICKUP_REMAIN_TIME, ATTR_SYSTEM_MODE, ATTR_COLD_LOAD_PICKUP_TEMP, ATTR_AWAY_ACTION]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from Neviweb and update the state."""
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES)
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
             if "error" not in device_data:
                 if "errorCode" not in device_data:
-                    self._onoff = device_data[ATTR_ONOFF]
-                    self._water_leak_status = device_data[ATTR_WATER_LEAK_ALARM_STATUS]
-                    self._water_leak_disconected_status = device_data[ATTR_WATER_LEAK_DISCONECTED_STATUS]
-                    self._water_temp = device_data[ATTR_WATER_TEMPERATURE]
-                    if ATTR_ERROR_CODE_SET1 in device_data and len(device_data[ATTR_ERROR_CODE_SET1]) > 0:
-                        self._temp_status = device_data[ATTR_ERROR_CODE_SET1]["temperatureSensor"]
-                        self._stm_mcu = device_data[ATTR_ERROR_CODE_SET1]["stm_mcu"]
-                        self._thermal_overload = device_data[ATTR_ERROR_CODE_SET1]["thermalOverload"]
-                        self._current_overload = device_data[ATTR_ERROR_CODE_SET1]["currentOverload"]
-                        self._j2connector = device_data[ATTR_ERROR_CODE_SET1]["j2Connector"]
-                        self._j3connector = device_data[ATTR_ERROR_CODE_SET1]["j3Connector"]
-                        self._line_error = device_data[ATTR_ERROR_CODE_SET1]["lineError"]
-                    if ATTR_DRSTATUS in device_data:
-                        self._drstatus_active = device_data[ATTR_DRSTATUS][ATTR_DRACTIVE]
-                        self._drstatus_optout = device_data[ATTR_DRSTATUS][ATTR_OPTOUT]
-                        self._drstatus_onoff = device_data[ATTR_DRSTATUS][ATTR_ONOFF]
-                        self._drstatus_optout_reason = device_data[ATTR_DRSTATUS]["optOutReason"]
-                    self._current_power_w = device_data[ATTR_WIFI_WATT_NOW]
-                    self._wattage = device_data[ATTR_WIFI_WATTAGE]
-                    self._cold_load_status = device_data[ATTR_COLD_LOAD_PICKUP_STATUS]
-                    self._cold_load_temp = device_data[ATTR_COLD_LOAD_PICKUP_TEMP]
-                    self._cold_load_remaining_time = device_data[ATTR_COLD_LOAD_PICKUP_REMAIN_TIME]
-                    self._rssi = device_data[ATTR_WIFI]
-                    self._mode = device_data[ATTR_SYSTEM_MODE]
-                    self._tank_size = device_data[ATTR_TANK_SIZE]
-                    self._away_action = device_data[ATTR_AWAY_ACTION]
-                    self._leg_status = device_data[ATTR_LEG_PROTEC_STATUS]
-                    self._water_temp_min = device_data[ATTR_MIN_WATER_TEMP]
-                    self._water_tank_on = device_data[ATTR_WATER_TANK_ON]
-                    self._water_temp_time = device_data[ATTR_WATER_TEMP_TIME]
+                    parse(WIFI_TANK_SWITCH_PARSER, self._state, device_data, self._name)
                 else:
                     _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
             else:
-                self.log_error(device_data["error"]["code"])
-            self.do_stat(start)
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
 
     @property
     def extra_state_attributes(self):
         """Return the extra state attributes."""
         data = {}
-        data.update({'onOff': self._onoff,
-               'Wattage': self._wattage,
-               'Wattage_instant': self._current_power_w,
-               'Water_leak_status': self._water_leak_status,
-               'Water_leak_disconect_status': self._water_leak_disconected_status,
-               'Water_temperature': self._water_temp,
-               'Cold_load_pickup_status': self._cold_load_status,
-               'Cold_load_remaining_time': self._cold_load_remaining_time,
-               'Cold_load_temperature': self._cold_load_temp,
-               'Tank_size': neviweb_to_ha(self._tank_size),
-               'Temperature_status': self._temp_status,
-               'Stm_Mcu': self._stm_mcu,
-               'Thermal_overload': self._thermal_overload,
-               'Current_overload': self._current_overload,
-               'j2Connector': self._j2connector,
-               'j3Connector': self._j3connector,
-               'Line_error': self._line_error,
-               'eco_status': self._drstatus_active,
-               'eco_optOut': self._drstatus_optout,
-               'eco_onoff': self._drstatus_onoff,
-               'eco_optout_reason': self._drstatus_optout_reason,
-               'Water_temp_min': self._water_temp_min,
-               'Water_time_on': self._water_tank_on,
-               'Water_temp_time': self._water_temp_time,
-               'Away_action': self._away_action,
-               'Mode': self._mode,
-               'Leg_status': self._leg_status,
-               'Rssi': self._rssi,
+        data.update({'onOff': self._state.onoff,
+               'Wattage': self._state.wattage,
+               'Wattage_instant': self._state.current_power_w,
+               'Water_leak_status': self._state.water_leak_status,
+               'Water_leak_disconect_status': self._state.water_leak_disconected_status,
+               'Water_temperature': self._state.water_temp,
+               'Cold_load_pickup_status': self._state.cold_load_status,
+               'Cold_load_remaining_time': self._state.cold_load_remaining_time,
+               'Cold_load_temperature': self._state.cold_load_temp,
+               'Tank_size': neviweb_to_ha(self._state.tank_size),
+               'Temperature_status': self._state.temp_status,
+               'Stm_Mcu': self._state.stm_mcu,
+               'Thermal_overload': self._state.thermal_overload,
+               'Current_overload': self._state.current_overload,
+               'j2Connector': self._state.j2connector,
+               'j3Connector': self._state.j3connector,
+               'Line_error': self._state.line_error,
+               'eco_status': self._state.drstatus_active,
+               'eco_optOut': self._state.drstatus_optout,
+               'eco_onoff': self._state.drstatus_onoff,
+               'eco_optout_reason': self._state.drstatus_optout_reason,
+               'Water_temp_min': self._state.water_temp_min,
+               'Water_time_on': self._state.water_tank_on,
+               'Water_temp_time': self._state.water_temp_time,
+               'Away_action': self._state.away_action,
+               'Mode': self._state.mode,
+               'Leg_status': self._state.leg_status,
+               'Rssi': self._state.rssi,
                'sku': self._sku,
                'device_model': str(self._device_model),
                'device_model_cfg': self._device_model_cfg,
                'firmware': self._firmware,
-               'Activation': self._activ,
+               'Activation': self.activ,
                'device_type': self._device_type,
+               'poll_interval': self.coordinator.poll_interval(self._id),
                'id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
 
 class Neviweb130ControlerSwitch(Neviweb130Switch):
     """Implementation of a Neviweb multi controler switch, MC3100ZB connected to GT130 or Sedna."""
@@ -1360,145 +1366,94 @@ class Neviweb130ControlerSwitch(Neviweb130Switch):
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
         self._device_type = device_type
-        self._hour_energy_kwh_count = None
-        self._today_energy_kwh_count = None
-        self._month_energy_kwh_count = None
-        self._hour_kwh = None
-        self._today_kwh = None
-        self._month_kwh = None
-        self._onoff = None
-        self._onoff2 = None
-        self._battery_voltage = 0
-        self._battery_status = None
-        self._batt_percent_normal = None
-        self._batt_status_normal = None
-        self._batt_info = None
-        self._timer = 0
-        self._timer2 = 0
-        self._drstatus_active = "off"
-        self._drstatus_optout = "off"
-        self._drstatus_onoff = "off"
-        self._drstatus_optout_reason = "off"
-        self._humidity = None
-        self._ext_temp = None
-        self._room_temp = None
-        self._input_status = None
-        self._input2_status = None
-        self._rssi = None
-        self._input_name_1 = "Not set"
-        self._input_name_2 = "Not set"
-        self._output_name_1 = "Not set"
-        self._output_name_2 = "Not set"
-        self._input_1_on_delay = 0
-        self._input_2_on_delay = 0
-        self._input_1_off_delay = 0
-        self._input_2_off_delay = 0
+        self._state = Neviweb130LoadControllerState()
         self._is_zb_control = device_info["signature"]["model"] in \
             IMPLEMENTED_ZB_DEVICE_CONTROL
         self._is_sedna_control = device_info["signature"]["model"] in \
             IMPLEMENTED_SED_DEVICE_CONTROL
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
-            if self._is_zb_control:
-                NAME_ATTRIBUTES = [ATTR_NAME_1, ATTR_NAME_2, ATTR_OUTPUT_NAME_1, ATTR_OUTPUT_NAME_2]
+    @property
+    def energy_stats(self):
+        """Return True if energy statistics are fetched for this device."""
+        return False
+
+    @property
+    def power_sensor(self):
+        """Return True if the power drawn by this device is known."""
+        return False
+
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        if self._is_zb_control:
+            NAME_ATTRIBUTES = [ATTR_NAME_1, ATTR_NAME_2, ATTR_OUTPUT_NAME_1, ATTR_OUTPUT_NAME_2]
+        else:
+            NAME_ATTRIBUTES = []
+        if self._is_zb_control or self._is_sedna_control:
+            if self._firmware == "0.1.1":
+                LOAD_ATTRIBUTES = [ATTR_ONOFF2, ATTR_BATTERY_VOLTAGE, ATTR_BATTERY_STATUS, ATTR_EXT_TEMP, ATTR_REL_HUMIDITY, ATTR_INPUT_STATUS, ATTR_INPUT2_STATUS, ATTR_ROOM_TEMPERATURE, ATTR_TIMER, ATTR_TIMER2, ATTR_RSSI, ATTR_BATT_INFO, ATTR_INPUT_1_ON_DELAY, ATTR_INPUT_2_ON_DELAY, ATTR_INPUT_1_OFF_DELAY,
+                ATTR_INPUT_2_OFF_DELAY, ATTR_BATT_PERCENT_NORMAL, ATTR_BATT_STATUS_NORMAL]
             else:
-                NAME_ATTRIBUTES = []
-            if self._is_zb_control or self._is_sedna_control:
-                if self._firmware == "0.1.1":
-                    LOAD_ATTRIBUTES = [ATTR_ONOFF2, ATTR_BATTERY_VOLTAGE, ATTR_BATTERY_STATUS, ATTR_EXT_TEMP, ATTR_REL_HUMIDITY, ATTR_INPUT_STATUS, ATTR_INPUT2_STATUS, ATTR_ROOM_TEMPERATURE, ATTR_TIMER, ATTR_TIMER2, ATTR_RSSI, ATTR_BATT_INFO, ATTR_INPUT_1_ON_DELAY, ATTR_INPUT_2_ON_DELAY, ATTR_INPUT_1_OFF_DELAY,
-                    ATTR_INPUT_2_OFF_DELAY, ATTR_BATT_PERCENT_NORMAL, ATTR_BATT_STATUS_NORMAL]
-                else:
-                    LOAD_ATTRIBUTES = [ATTR_ONOFF2, ATTR_BATTERY_VOLTAGE, ATTR_BATTERY_STATUS, ATTR_EXT_TEMP, ATTR_REL_HUMIDITY, ATTR_INPUT_STATUS, ATTR_INPUT2_STATUS, ATTR_ROOM_TEMPERATURE, ATTR_TIMER, ATTR_TIMER2, ATTR_RSSI]
+                LOAD_ATTRIBUTES = [ATTR_ONOFF2, ATTR_BATTERY_VOLTAGE, ATTR_BATTERY_STATUS, ATTR_EXT_TEMP, ATTR_REL_HUMIDITY, ATTR_INPUT_STATUS, ATTR_INPUT2_STATUS, ATTR_ROOM_TEMPERATURE, ATTR_TIMER, ATTR_TIMER2, ATTR_RSSI]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES + NAME_ATTRIBUTES
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from Neviweb and update the state."""
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES + NAME_ATTRIBUTES)
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
             if "error" not in device_data:
                 if "errorCode" not in device_data:
-                    if self._is_zb_control or self._is_sedna_control:
-                        self._onoff = device_data[ATTR_ONOFF]
-                        self._onoff2 = device_data[ATTR_ONOFF2]
-                        self._battery_status = device_data[ATTR_BATTERY_STATUS]
-                        self._battery_voltage = device_data[ATTR_BATTERY_VOLTAGE]
-                        self._input_status = device_data[ATTR_INPUT_STATUS]
-                        self._input2_status = device_data[ATTR_INPUT2_STATUS]
-                        self._humidity = device_data[ATTR_REL_HUMIDITY]
-                        self._room_temp = device_data[ATTR_ROOM_TEMPERATURE]
-                        self._ext_temp = device_data[ATTR_EXT_TEMP]
-                        self._timer = device_data[ATTR_TIMER]
-                        self._timer2 = device_data[ATTR_TIMER2]
-                        if ATTR_BATT_INFO in device_data:
-                            self._batt_info = device_data[ATTR_BATT_INFO]
-                        if ATTR_INPUT_1_ON_DELAY in device_data:
-                            self._input_1_on_delay = device_data[ATTR_INPUT_1_ON_DELAY]
-                            self._input_2_on_delay = device_data[ATTR_INPUT_2_ON_DELAY]
-                            self._input_1_off_delay = device_data[ATTR_INPUT_1_OFF_DELAY]
-                            self._input_2_off_delay = device_data[ATTR_INPUT_2_OFF_DELAY]
-                        if ATTR_BATT_PERCENT_NORMAL in device_data:
-                            self._batt_percent_normal = device_data[ATTR_BATT_PERCENT_NORMAL]
-                        if ATTR_BATT_STATUS_NORMAL in device_data:
-                            self._batt_status_normal = device_data[ATTR_BATT_STATUS_NORMAL]
-                        if ATTR_RSSI in device_data:
-                            self._rssi = device_data[ATTR_RSSI]
                     if self._is_zb_control:
-                        self._input_name_1 = device_data[ATTR_NAME_1]
-                        self._input_name_2 = device_data[ATTR_NAME_2]
-                        self._output_name_1 = device_data[ATTR_OUTPUT_NAME_1]
-                        self._output_name_2 = device_data[ATTR_OUTPUT_NAME_2]
+                        parse(CONTROLLER_ZB_PARSER, self._state, device_data, self._name)
+                    elif self._is_sedna_control:
+                        parse(CONTROLLER_PARSER, self._state, device_data, self._name)
                 else:
                     _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
             else:
-                self.log_error(device_data["error"]["code"])
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
 
     @property
     def extra_state_attributes(self):
         """Return the extra state attributes."""
         data = {}
-        data.update({'Battery_level': voltage_to_percentage(self._battery_voltage, 2),
-               'Battery_display_info': self._batt_info,
-               'Battery_voltage': self._battery_voltage,
-               'Battery_status': self._battery_status,
-               'Battery_percent_normalized': self._batt_percent_normal,
-               'Battery_status_normalized': self._batt_status_normal,
-               'Extern_temperature': self._ext_temp,
-               'Room_temperature': self._room_temp,
-               'Room_humidity': self._humidity,
-               'Timer': self._timer,
-               'Timer2': self._timer2,
-               'Input1_status': self._input_status,
-               'Input2_status': self._input2_status,
-               'onOff': self._onoff,
-               'onOff2': self._onoff2,
-               'Input1_on_delay': neviweb_to_ha_delay(self._input_1_on_delay),
-               'Input2_on_delay': neviweb_to_ha_delay(self._input_2_on_delay),
-               'Input1_off_delay': neviweb_to_ha_delay(self._input_1_off_delay),
-               'Input2_off_delay': neviweb_to_ha_delay(self._input_2_off_delay),
-               'Input1_name': self._input_name_1,
-               'Input2_name': self._input_name_2,
-               'Output1_name': self._output_name_1,
-               'Output2_name': self._output_name_2,
-               'Rssi': self._rssi,
+        data.update({'Battery_level': voltage_to_percentage(self._state.battery_voltage, 2),
+               'Battery_display_info': self._state.batt_info,
+               'Battery_voltage': self._state.battery_voltage,
+               'Battery_status': self._state.battery_status,
+               'Battery_percent_normalized': self._state.batt_percent_normal,
+               'Battery_status_normalized': self._state.batt_status_normal,
+               'Extern_temperature': self._state.ext_temp,
+               'Room_temperature': self._state.room_temp,
+               'Room_humidity': self._state.humidity,
+               'Timer': self._state.timer,
+               'Timer2': self._state.timer2,
+               'Input1_status': self._state.input_status,
+               'Input2_status': self._state.input2_status,
+               'onOff': self._state.onoff,
+               'onOff2': self._state.onoff2,
+               'Input1_on_delay': neviweb_to_ha_delay(self._state.input_1_on_delay),
+               'Input2_on_delay': neviweb_to_ha_delay(self._state.input_2_on_delay),
+               'Input1_off_delay': neviweb_to_ha_delay(self._state.input_1_off_delay),
+               'Input2_off_delay': neviweb_to_ha_delay(self._state.input_2_off_delay),
+               'Input1_name': self._state.input_name_1,
+               'Input2_name': self._state.input_name_2,
+               'Output1_name': self._state.output_name_1,
+               'Output2_name': self._state.output_name_2,
+               'Rssi': self._state.rssi,
                'sku': self._sku,
                'device_model': str(self._device_model),
                'device_model_cfg': self._device_model_cfg,
                'firmware': self._firmware,
-               'Activation': self._activ,
+               'Activation': self.activ,
                'device_type': self._device_type,
+               'poll_interval': self.coordinator.poll_interval(self._id),
                'id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
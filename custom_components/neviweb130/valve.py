@@ -31,7 +31,7 @@ import voluptuous as vol
 import time
 
 import custom_components.neviweb130 as neviweb130
-from . import (SCAN_INTERVAL, STAT_INTERVAL, VERSION)
+from . import (SCAN_INTERVAL, VERSION)
 from homeassistant.components.valve import (
     ValveDeviceClass,
     ValveEntity,
@@ -73,8 +73,14 @@ from homeassistant.components.persistent_notification import DOMAIN as PN_DOMAIN
 from datetime import timedelta
 from homeassistant.helpers.event import track_time_interval
 from homeassistant.helpers.icon import icon_for_battery_level
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
     DOMAIN,
+    UNRECORDED_ATTRIBUTES,
+    SIGNAL_DEVICES_DISCOVERED,
+    ENDPOINT_ALERT,
     ATTR_ACTIVE,
     ATTR_AWAY_ACTION,
     ATTR_BATT_ACTION_LOW,
@@ -123,6 +129,8 @@ from .const import (
     SERVICE_SET_ACTIVATION,
 )
 
+from .diagnostics import device_attributes
+from .parsers import KEEP, Field, compile_parser, item, parse
 from .schema import (
     FLOW_MODEL,
     FLOW_DURATION,
@@ -134,17 +142,28 @@ from .schema import (
     SET_POWER_SUPPLY_SCHEMA,
     SET_ACTIVATION_SCHEMA,
 )
+from .state import (
+    Neviweb130ValveState,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity updates and commands are not limited by Home Assistant. Device
+# polls are limited by the coordinator, blocking commands by the
+# Neviweb130Executor.
+PARALLEL_UPDATES = 0
+
 DEFAULT_NAME = 'neviweb130 valve'
 DEFAULT_NAME_2 = 'neviweb130 valve 2'
-SNOOZE_TIME = 1200
 
 SUPPORT_FLAGS = (ValveEntityFeature.OPEN | ValveEntityFeature.CLOSE)
 
 UPDATE_ATTRIBUTES = [ATTR_ONOFF]
 
+WARM_ATTRIBUTES = [ATTR_RSSI, ATTR_WIFI, ATTR_BATTERY_VOLTAGE, ATTR_BATT_PERCENT_NORMAL, ATTR_POWER_SUPPLY, ATTR_BATT_ALERT, ATTR_TEMP_ACTION_LOW, ATTR_BATT_ACTION_LOW, ATTR_OCCUPANCY_SENSOR_DELAY, ATTR_AWAY_ACTION,
+    ATTR_FLOW_ALARM1, ATTR_FLOW_ALARM2, ATTR_FLOW_THRESHOLD, ATTR_FLOW_ALARM1_PERIOD, ATTR_FLOW_ALARM1_LENGHT, ATTR_FLOW_ALARM1_OPTION, ATTR_FLOW_ENABLED]
+COLD_ATTRIBUTES = [ATTR_FLOW_METER_CONFIG]
+
 HA_TO_NEVIWEB_DELAY = {
     "off": 0,
     "1 min": 60,
@@ -193,48 +212,63 @@ async def async_setup_platform(
     """Set up the Neviweb130 valve."""
     data = hass.data[DOMAIN]
 
-    entities = []
-    for device_info in data.neviweb130_client.gateway_data:
-        if "signature" in device_info and \
-            "model" in device_info["signature"] and \
-            device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
-            device_name = '{} {}'.format(DEFAULT_NAME, device_info["name"])
-            device_sku = device_info["sku"]
-            device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
-            if device_info["signature"]["model"] in IMPLEMENTED_ZB_VALVE_MODEL:
-                device_type = "valve"
-                entities.append(Neviweb130Valve(data, device_info, device_name, device_sku, device_firmware, device_type))
-            elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_VALVE_MODEL:
-                device_type = "valve"
-                entities.append(Neviweb130WifiValve(data, device_info, device_name, device_sku, device_firmware, device_type))
-            elif device_info["signature"]["model"] in IMPLEMENTED_ZB_MESH_VALVE_MODEL:
-                device_type = "flow"
-                entities.append(Neviweb130MeshValve(data, device_info, device_name, device_sku, device_firmware, device_type))
-            else:
-                device_type = "flow"
-                entities.append(Neviweb130WifiMeshValve(data, device_info, device_name, device_sku, device_firmware, device_type))
-    for device_info in data.neviweb130_client.gateway_data2:
-        if "signature" in device_info and \
-            "model" in device_info["signature"] and \
-            device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
-            device_name = '{} {}'.format(DEFAULT_NAME_2, device_info["name"])
-            device_sku = device_info["sku"]
-            device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
-            if device_info["signature"]["model"] in IMPLEMENTED_ZB_VALVE_MODEL:
-                device_type = "valve"
-                entities.append(Neviweb130Valve(data, device_info, device_name, device_sku, device_firmware, device_type))
-            elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_VALVE_MODEL:
-                device_type = "valve"
-                entities.append(Neviweb130WifiValve(data, device_info, device_name, device_sku, device_firmware, device_type))
-            elif device_info["signature"]["model"] in IMPLEMENTED_ZB_MESH_VALVE_MODEL:
-                device_type = "flow"
-                entities.append(Neviweb130MeshValve(data, device_info, device_name, device_sku, device_firmware, device_type))
-            else:
-                device_type = "flow"
-                entities.append(Neviweb130WifiMeshValve(data, device_info, device_name, device_sku, device_firmware, device_type))
+    def build_entities(devices, devices2):
+        """Create entities for devices of both gateways."""
+        new_entities = []
+        for device_info in devices:
+            if "signature" in device_info and \
+                "model" in device_info["signature"] and \
+                device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
+                device_name = '{} {}'.format(DEFAULT_NAME, device_info["name"])
+                device_sku = device_info["sku"]
+                device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
+                if device_info["signature"]["model"] in IMPLEMENTED_ZB_VALVE_MODEL:
+                    device_type = "valve"
+                    new_entities.append(Neviweb130Valve(data, device_info, device_name, device_sku, device_firmware, device_type))
+                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_VALVE_MODEL:
+                    device_type = "valve"
+                    new_entities.append(Neviweb130WifiValve(data, device_info, device_name, device_sku, device_firmware, device_type))
+                elif device_info["signature"]["model"] in IMPLEMENTED_ZB_MESH_VALVE_MODEL:
+                    device_type = "flow"
+                    new_entities.append(Neviweb130MeshValve(data, device_info, device_name, device_sku, device_firmware, device_type))
+                else:
+                    device_type = "flow"
+                    new_entities.append(Neviweb130WifiMeshValve(data, device_info, device_name, device_sku, device_firmware, device_type))
+        for device_info in devices2:
+            if "signature" in device_info and \
+                "model" in device_info["signature"] and \
+                device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL:
+                device_name = '{} {}'.format(DEFAULT_NAME_2, device_info["name"])
+                device_sku = device_info["sku"]
+                device_firmware = "{}.{}.{}".format(device_info["signature"]["softVersion"]["major"],device_info["signature"]["softVersion"]["middle"],device_info["signature"]["softVersion"]["minor"])
+                if device_info["signature"]["model"] in IMPLEMENTED_ZB_VALVE_MODEL:
+                    device_type = "valve"
+                    new_entities.append(Neviweb130Valve(data, device_info, device_name, device_sku, device_firmware, device_type))
+                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_VALVE_MODEL:
+                    device_type = "valve"
+                    new_entities.append(Neviweb130WifiValve(data, device_info, device_name, device_sku, device_firmware, device_type))
+                elif device_info["signature"]["model"] in IMPLEMENTED_ZB_MESH_VALVE_MODEL:
+                    device_type = "flow"
+                    new_entities.append(Neviweb130MeshValve(data, device_info, device_name, device_sku, device_firmware, device_type))
+                else:
+                    device_type = "flow"
+                    new_entities.append(Neviweb130WifiMeshValve(data, device_info, device_name, device_sku, device_firmware, device_type))
+        return new_entities
 
+    entities = build_entities(data.neviweb130_client.gateway_data,
+        data.neviweb130_client.gateway_data2)
     async_add_entities(entities, True)
 
+    @callback
+    def async_add_discovered_entities(devices, devices2):
+        """Add devices whose signature was fetched after startup."""
+        new_entities = build_entities(devices, devices2)
+        entities.extend(new_entities)
+        async_add_entities(new_entities, True)
+
+    async_dispatcher_connect(hass, SIGNAL_DEVICES_DISCOVERED,
+        async_add_discovered_entities)
+
     def set_valve_alert_service(service):
         """ Set alert for water valve """
         entity_id = service.data[ATTR_ENTITY_ID]
@@ -243,7 +277,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "batt": service.data[ATTR_BATT_ALERT]}
                 switch.set_valve_alert(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_valve_temp_alert_service(service):
@@ -254,7 +288,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "temp": service.data[ATTR_TEMP_ALERT]}
                 switch.set_valve_temp_alert(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_flow_meter_model_service(service):
@@ -265,7 +299,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "model": service.data[ATTR_FLOW_MODEL_CONFIG][0]}
                 switch.set_flow_meter_model(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_flow_meter_delay_service(service):
@@ -276,7 +310,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "delay": service.data[ATTR_FLOW_ALARM1_PERIOD][0]}
                 switch.set_flow_meter_delay(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_flow_meter_options_service(service):
@@ -287,7 +321,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "alarm": service.data[ATTR_TRIGGER_ALARM], "close": service.data[ATTR_CLOSE_VALVE]}
                 switch.set_flow_meter_options(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_power_supply_service(service):
@@ -298,7 +332,7 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "supply": service.data[ATTR_POWER_SUPPLY]}
                 switch.set_power_supply(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     def set_activation_service(service):
@@ -309,55 +343,55 @@ async def async_setup_platform(
             if switch.entity_id == entity_id:
                 value = {"id": switch.unique_id, "active": service.data[ATTR_ACTIVE]}
                 switch.set_activation(value)
-                switch.schedule_update_ha_state(True)
+                switch.schedule_update_ha_state()
                 break
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_VALVE_ALERT,
-        set_valve_alert_service,
+        data.executor.job(set_valve_alert_service),
         schema=SET_VALVE_ALERT_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_VALVE_TEMP_ALERT,
-        set_valve_temp_alert_service,
+        data.executor.job(set_valve_temp_alert_service),
         schema=SET_VALVE_TEMP_ALERT_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_FLOW_METER_MODEL,
-        set_flow_meter_model_service,
+        data.executor.job(set_flow_meter_model_service),
         schema=SET_FLOW_METER_MODEL_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_FLOW_METER_DELAY,
-        set_flow_meter_delay_service,
+        data.executor.job(set_flow_meter_delay_service),
         schema=SET_FLOW_METER_DELAY_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_FLOW_METER_OPTIONS,
-        set_flow_meter_options_service,
+        data.executor.job(set_flow_meter_options_service),
         schema=SET_FLOW_METER_OPTIONS_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_POWER_SUPPLY,
-        set_power_supply_service,
+        data.executor.job(set_power_supply_service),
         schema=SET_POWER_SUPPLY_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_ACTIVATION,
-        set_activation_service,
+        data.executor.job(set_activation_service),
         schema=SET_ACTIVATION_SCHEMA,
     )
 
@@ -418,30 +452,126 @@ def model_to_HA(value):
     else:
         return "No flow meter"
 
-class Neviweb130Valve(ValveEntity):
+def if_timer_set(timer, value):
+    """Return value of a flow alarm setting when the flow alarm timer is
+    set."""
+    return value if timer != 0 else None
+
+# Parsers of device data, by valve model
+
+BATTERY_FIELDS = (
+    Field("battery_voltage", ATTR_BATTERY_VOLTAGE, None, 0),
+    Field("battery_status", ATTR_BATTERY_STATUS),
+    Field("power_supply", ATTR_POWER_SUPPLY),
+)
+
+BATTERY_NORMAL_FIELDS = (
+    Field("batt_percent_normal", ATTR_BATT_PERCENT_NORMAL),
+    Field("batt_status_normal", ATTR_BATT_STATUS_NORMAL),
+)
+
+ZB_VALVE_FIELDS = BATTERY_FIELDS + BATTERY_NORMAL_FIELDS + (
+    Field("valve_status", ATTR_ONOFF, lambda onoff: STATE_VALVE_STATUS
+        if onoff == "on" else "closed", "closed"),
+    Field("onoff", ATTR_ONOFF),
+    Field("rssi", ATTR_RSSI),
+)
+
+WIFI_VALVE_FIELDS = BATTERY_FIELDS + (
+    Field("valve_status", ATTR_MOTOR_POS, lambda position: STATE_VALVE_STATUS
+        if position == 100 else "closed", "closed"),
+    Field("onoff", ATTR_MOTOR_POS, lambda position: "on"
+        if position == 100 else MODE_OFF, MODE_OFF),
+    Field("temp_alert", ATTR_TEMP_ALARM),
+    Field("motor_target", ATTR_MOTOR_TARGET),
+    Field("valve_info_status", ATTR_VALVE_INFO, item("status")),
+    Field("valve_info_cause", ATTR_VALVE_INFO, item("cause")),
+    Field("valve_info_id", ATTR_VALVE_INFO, item("identifier")),
+    Field("flow_alarm_1", ATTR_FLOW_ALARM1),
+    Field("flow_alarm_2", ATTR_FLOW_ALARM2),
+    Field("temp_action_low", ATTR_TEMP_ACTION_LOW),
+    Field("batt_action_low", ATTR_BATT_ACTION_LOW),
+)
+
+FLOW_METER_FIELDS = (
+    Field("flowmeter_multiplier", ATTR_FLOW_METER_CONFIG, item("multiplier")),
+    Field("flowmeter_offset", ATTR_FLOW_METER_CONFIG, item("offset")),
+    Field("flowmeter_divisor", ATTR_FLOW_METER_CONFIG, item("divisor")),
+    Field("water_leak_status", ATTR_WATER_LEAK_STATUS),
+)
+
+MESH_FLOW_METER_FIELDS = FLOW_METER_FIELDS + (
+    Field("flowmeter_model", ATTR_FLOW_METER_CONFIG,
+        lambda config: model_to_HA(config["multiplier"])),
+    Field("stm8Error_motorJam", ATTR_STM8_ERROR, item("motorJam")),
+    Field("stm8Error_motorLimit", ATTR_STM8_ERROR, item("motorLimit")),
+    Field("stm8Error_motorPosition", ATTR_STM8_ERROR, item("motorPosition")),
+    Field("flowmeter_timer", ATTR_FLOW_ALARM_TIMER),
+)
+
+VALVE_PARSER = compile_parser("valve", Neviweb130ValveState,
+    ZB_VALVE_FIELDS)
+
+WIFI_VALVE_PARSER = compile_parser("wifi_valve", Neviweb130ValveState,
+    WIFI_VALVE_FIELDS + FLOW_METER_FIELDS + BATTERY_NORMAL_FIELDS + (
+    Field("battery_alert", ATTR_BATT_ALERT),
+    Field("valve_closure", ATTR_VALVE_CLOSURE, item("source")),
+    Field("stm8Error_motorJam", ATTR_STM8_ERROR, item("motorJam")),
+    Field("occupancy_delay", ATTR_OCCUPANCY_SENSOR_DELAY),
+    Field("rssi", ATTR_WIFI),
+    Field("away_action", ATTR_AWAY_ACTION),
+))
+
+MESH_VALVE_PARSER = compile_parser("mesh_valve", Neviweb130ValveState,
+    ZB_VALVE_FIELDS + MESH_FLOW_METER_FIELDS + (
+    Field("flowmeter_threshold", ATTR_FLOW_THRESHOLD),
+    Field("flowmeter_alert_delay", ATTR_FLOW_ALARM1_PERIOD),
+    Field("flowmeter_alarm_lenght", ATTR_FLOW_ALARM1_LENGHT),
+    Field("flowmeter_opt_alarm", ATTR_FLOW_ALARM1_OPTION,
+        item(ATTR_TRIGGER_ALARM)),
+    Field("flowmeter_opt_action", ATTR_FLOW_ALARM1_OPTION,
+        item(ATTR_CLOSE_VALVE)),
+    Field("flowmeter_enabled", ATTR_FLOW_ENABLED),
+    Field("error_code", ATTR_ERROR_CODE_SET1, lambda codes: "Present, see logs"
+        if len(codes) > 0 else None, KEEP),
+))
+
+WIFI_MESH_VALVE_PARSER = compile_parser("wifi_mesh_valve",
+    Neviweb130ValveState, WIFI_VALVE_FIELDS + MESH_FLOW_METER_FIELDS + (
+    Field("flowmeter_threshold", (ATTR_FLOW_ALARM_TIMER, ATTR_FLOW_THRESHOLD),
+        if_timer_set, KEEP),
+    Field("flowmeter_alert_delay",
+        (ATTR_FLOW_ALARM_TIMER, ATTR_FLOW_ALARM1_PERIOD), if_timer_set, KEEP),
+    Field("flowmeter_alarm_lenght",
+        (ATTR_FLOW_ALARM_TIMER, ATTR_FLOW_ALARM1_LENGHT), if_timer_set, KEEP),
+    Field("flowmeter_opt_alarm",
+        (ATTR_FLOW_ALARM_TIMER, ATTR_FLOW_ALARM1_OPTION),
+        lambda timer, option: if_timer_set(timer, option[ATTR_TRIGGER_ALARM]),
+        KEEP),
+    Field("flowmeter_opt_action",
+        (ATTR_FLOW_ALARM_TIMER, ATTR_FLOW_ALARM1_OPTION),
+        lambda timer, option: if_timer_set(timer, option[ATTR_CLOSE_VALVE]),
+        KEEP),
+))
+
+class Neviweb130Valve(CoordinatorEntity, ValveEntity):
     """Implementation of a Neviweb valve."""
 
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
+
     def __init__(self, data, device_info, name, sku, firmware, device_type):
         """Initialize."""
         self._name = name
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
         self._device_type = device_type
-        self._onoff = None
-        self._reports_position = False
-        self._valve_status = None
-        self._battery_voltage = 0
-        self._battery_status = None
-        self._battery_alert = 0
-        self._batt_percent_normal = None
-        self._batt_status_normal = None
-        self._power_supply = None
-        self._temp_alert = None
-        self._rssi = None
+        self._state = Neviweb130ValveState()
         self._is_zb_valve = device_info["signature"]["model"] in \
             IMPLEMENTED_ZB_VALVE_MODEL
         self._is_wifi_valve = device_info["signature"]["model"] in \
@@ -450,52 +580,93 @@ class Neviweb130Valve(ValveEntity):
             IMPLEMENTED_ZB_MESH_VALVE_MODEL
         self._is_wifi_mesh_valve = device_info["signature"]["model"] in \
             IMPLEMENTED_WIFI_MESH_VALVE_MODEL
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
-            LOAD_ATTRIBUTES = [ATTR_BATTERY_VOLTAGE, ATTR_BATTERY_STATUS, ATTR_POWER_SUPPLY, ATTR_RSSI, ATTR_BATT_PERCENT_NORMAL, ATTR_BATT_STATUS_NORMAL]
+    def attribute_tiers(self):
+        """Return attributes refreshed on the warm and cold tiers."""
+        return WARM_ATTRIBUTES, COLD_ATTRIBUTES
+
+    def update_endpoints(self):
+        """Return endpoints read by the coordinator besides attributes."""
+        if self._is_zb_valve or self._is_zb_mesh_valve:
+            return [ENDPOINT_ALERT]
+        return []
+
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        LOAD_ATTRIBUTES = [ATTR_BATTERY_VOLTAGE, ATTR_BATTERY_STATUS, ATTR_POWER_SUPPLY, ATTR_RSSI, ATTR_BATT_PERCENT_NORMAL, ATTR_BATT_STATUS_NORMAL]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from Neviweb and update the state."""
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES)
             end = time.time()
             elapsed = round(end - start, 3)
-            if self._is_zb_valve or self._is_zb_mesh_valve:
-                device_alert = self._client.get_device_alert(self._id)
-                _LOGGER.debug("Updating alert for %s (%s sec): %s",self._name, elapsed, device_alert)
+            device_alert = device_data.get(ENDPOINT_ALERT, {})
             _LOGGER.debug("Updating %s (%s sec): %s",
                 self._name, elapsed, device_data)
             if "error" not in device_data:
                 if "errorCode" not in device_data:
-                    self._valve_status = STATE_VALVE_STATUS if \
-                        device_data[ATTR_ONOFF] == "on" else "closed"
-                    self._onoff = device_data[ATTR_ONOFF]
-                    self._battery_voltage = device_data[ATTR_BATTERY_VOLTAGE] if \
-                        device_data[ATTR_BATTERY_VOLTAGE] is not None else 0
-                    self._battery_status = device_data[ATTR_BATTERY_STATUS]
-                    self._power_supply = device_data[ATTR_POWER_SUPPLY]
+                    parse(VALVE_PARSER, self._state, device_data, self._name)
                     if ATTR_BATT_ALERT in device_alert:
-                        self._battery_alert = device_alert[ATTR_BATT_ALERT]
+                        self._state.battery_alert = device_alert[ATTR_BATT_ALERT]
                     if ATTR_TEMP_ALERT in device_alert:
-                        self._temp_alert = device_alert[ATTR_TEMP_ALERT]
-                    if ATTR_RSSI in device_data:
-                        self._rssi = device_data[ATTR_RSSI]
-                    if ATTR_BATT_PERCENT_NORMAL in device_data:
-                        self._batt_percent_normal = device_data[ATTR_BATT_PERCENT_NORMAL]
-                    if ATTR_BATT_STATUS_NORMAL in device_data:
-                        self._batt_status_normal = device_data[ATTR_BATT_STATUS_NORMAL]
+                        self._state.temp_alert = device_alert[ATTR_TEMP_ALERT]
                 else:
                     _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
             else:
-                self.log_error(device_data["error"]["code"])
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
+
+    @property
+    def activ(self):
+        """Return False when Neviweb polling is halted for this device."""
+        return self.coordinator.breaker(self.unique_id).closed
+
+    @property
+    def available(self):
+        """Return False while the gateway of the device is offline."""
+        return super().available and \
+            self.coordinator.device_available(self.unique_id)
+
+    @property
+    def device_signature(self):
+        """Return model and firmware of the device."""
+        return self._device_model, self._firmware
+
+    @property
+    def device_state(self):
+        """Return the values last read from Neviweb for this device."""
+        return self._state
+
+    @property
+    def energy_stats(self):
+        """Return True if energy statistics are fetched for this device."""
+        return False
+
+    @property
+    def energy_unit(self):
+        """Return the unit of water flow statistics of this device."""
+        return UnitOfVolume.CUBIC_METERS
+
+    @property
+    def energy_counters(self):
+        """Return water flow counters and last period usage in m³, shown by
+        the water sensor of this device."""
+        return {'hourly_flow_count': L_2_sqm(self._state.hour_energy_kwh_count),
+            'daily_flow_count': L_2_sqm(self._state.today_energy_kwh_count),
+            'monthly_flow_count': L_2_sqm(self._state.month_energy_kwh_count),
+            'hourly_flow': L_2_sqm(self._state.hour_kwh),
+            'daily_flow': L_2_sqm(self._state.today_kwh),
+            'monthly_flow': L_2_sqm(self._state.month_kwh)}
+
+    @property
+    def power_sensor(self):
+        """Return True if the power drawn by this device is known."""
+        return False
+
+    async def async_update(self):
+        """Refresh this device only, at startup or after a command."""
+        await self.coordinator.async_refresh_device(self)
 
     @property
     def unique_id(self):
@@ -523,66 +694,71 @@ class Neviweb130Valve(ValveEntity):
     @property  
     def is_open(self):
         """Return current operation i.e. OPEN, CLOSED """
-        return self._onoff != MODE_OFF
+        return self._state.onoff != MODE_OFF
 
     @property  
     def is_closed(self):
         """Return current operation i.e. ON, OFF """
-        return self._onoff == MODE_OFF
+        return self._state.onoff == MODE_OFF
 
     @property  
     def reports_position(self):
         """Return current position True or False """
-        return self._reports_position
-
-    def open_valve(self, **kwargs):
-        """Open the valve."""
-        if self._is_wifi_valve or self._is_wifi_mesh_valve:
-            self._client.set_valve_onoff(self._id, 100)
-            self._valve_status = "open"
+        return self._state.reports_position
+
+    async def async_open_valve(self, **kwargs):
+        """Open the valve. The new state is shown at once, the write is then
+        verified by a read of the device."""
+        wifi = self._is_wifi_valve or self._is_wifi_mesh_valve
+        if wifi or self._is_zb_valve or self._is_zb_mesh_valve:
+            self._state.valve_status = "open"
+        self._state.onoff = "on"
+        self.async_write_ha_state()
+        if wifi:
+            await self._async_client.set_valve_onoff(self._id, 100)
         else:
-            self._client.set_onoff(self._id, "on")
-            if self._is_zb_valve or self._is_zb_mesh_valve:
-                self._valve_status = "open"
-        self._onoff = "on"
-
-    def close_valve(self, **kwargs):
-        """Close the valve."""
-        if self._is_wifi_valve or self._is_wifi_mesh_valve:
-            self._client.set_valve_onoff(self._id, 0)
-            self._valve_status = "closed"
+            await self._async_client.set_onoff(self._id, "on")
+
+    async def async_close_valve(self, **kwargs):
+        """Close the valve. The new state is shown at once, the write is
+        then verified by a read of the device."""
+        wifi = self._is_wifi_valve or self._is_wifi_mesh_valve
+        if wifi or self._is_zb_valve or self._is_zb_mesh_valve:
+            self._state.valve_status = "closed"
+        self._state.onoff = MODE_OFF
+        self.async_write_ha_state()
+        if wifi:
+            await self._async_client.set_valve_onoff(self._id, 0)
         else:
-            self._client.set_onoff(self._id, "off")
-            if self._is_zb_valve or self._is_zb_mesh_valve:
-                self._valve_status = "closed"
-        self._onoff = MODE_OFF
+            await self._async_client.set_onoff(self._id, "off")
 
     @property  
     def valve_status(self):
         """Return current valve status, open or closed"""
-        return self._valve_status != None
+        return self._state.valve_status != None
 
     @property
     def extra_state_attributes(self):
         """Return the extra state attributes."""
         data = {}
-        data.update({'Valve_status': self._valve_status,
-               'Battery_level': voltage_to_percentage(self._battery_voltage, 4),
-               'Battery_voltage': self._battery_voltage,
-               'Battery_status': self._battery_status,
-               'Power_supply': self._power_supply,
-               'Battery_alert': alert_to_text(self._battery_alert, "bat"),
-               'Temperature_alert': alert_to_text(self._temp_alert, "temp"),
-               'Battery_percent_normalized': self._batt_percent_normal,
-               'Battery_status_normalized': self._batt_status_normal,
+        data.update({'Valve_status': self._state.valve_status,
+               'Battery_level': voltage_to_percentage(self._state.battery_voltage, 4),
+               'Battery_voltage': self._state.battery_voltage,
+               'Battery_status': self._state.battery_status,
+               'Power_supply': self._state.power_supply,
+               'Battery_alert': alert_to_text(self._state.battery_alert, "bat"),
+               'Temperature_alert': alert_to_text(self._state.temp_alert, "temp"),
+               'Battery_percent_normalized': self._state.batt_percent_normal,
+               'Battery_status_normalized': self._state.batt_status_normal,
                'sku': self._sku,
                'device_model': str(self._device_model),
                'device_model_cfg': self._device_model_cfg,
                'firmware': self._firmware,
-               'Activation': self._activ,
+               'Activation': self.activ,
                'device_type': self._device_type,
+               'poll_interval': self.coordinator.poll_interval(self._id),
                'id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
 
     @property
     def supported_features(self):
@@ -596,7 +772,7 @@ class Neviweb130Valve(ValveEntity):
             type = 2
         else:
             type = 4
-        return voltage_to_percentage(self._battery_voltage, type)
+        return voltage_to_percentage(self._state.battery_voltage, type)
 
     def set_valve_alert(self, value):
         """ Set valve batt alert action"""
@@ -610,7 +786,7 @@ class Neviweb130Valve(ValveEntity):
         entity = value["id"]
         self._client.set_valve_alert(
             entity, batt)
-        self._battery_alert = batt
+        self._state.battery_alert = batt
 
     def set_valve_temp_alert(self, value):
         """ Set valve temperature alert action """
@@ -618,14 +794,14 @@ class Neviweb130Valve(ValveEntity):
         entity = value["id"]
         self._client.set_valve_temp_alert(
             entity, temp)
-        self._temp_alert = temp
+        self._state.temp_alert = temp
 
     def set_flow_meter_model(self, value):
         """ Set water valve flow meter model connected """
         model = value["model"]
         entity = value["id"]
         self._client.set_flow_meter_model(entity, model)
-        self._flowmeter_model = model
+        self._state.flowmeter_model = model
 
     def set_flow_meter_delay(self, value):
         """ Set water valve flow meter delay befor alert """
@@ -633,7 +809,7 @@ class Neviweb130Valve(ValveEntity):
         delay = [v for k, v in HA_TO_NEVIWEB_DELAY.items() if k == val][0]
         entity = value["id"]
         self._client.set_flow_meter_delay(entity, delay)
-        self._flowmeter_alert_delay = val
+        self._state.flowmeter_alert_delay = val
 
     def set_power_supply(self, value):
         """ Set water valve power supply type """
@@ -646,7 +822,7 @@ class Neviweb130Valve(ValveEntity):
                 sup = "both"
         entity = value["id"]
         self._client.set_power_supply(entity, sup)
-        self._power_supply = sup
+        self._state.power_supply = sup
 
     def set_flow_meter_options(self, value):
         """ Set water valve flow meter options when leak detected """
@@ -666,55 +842,48 @@ class Neviweb130Valve(ValveEntity):
             threshold = 1
         entity = value["id"]
         self._client.set_flow_meter_options(entity, alarm, action, lenght, threshold)
-        self._flowmeter_opt_alarm = alarm
-        self._flowmeter_opt_action = action
-        self._flowmeter_threshold = threshold
-        self._flowmeter_alarm_lenght = lenght
+        self._state.flowmeter_opt_alarm = alarm
+        self._state.flowmeter_opt_action = action
+        self._state.flowmeter_threshold = threshold
+        self._state.flowmeter_alarm_lenght = lenght
 
     def set_activation(self, value):
         """ Activate or deactivate neviweb polling for a missing device """
         action = value["active"]
-        self._activ = action
-
-    def do_stat(self, start):
-        """ Get device energy statistic """
-        if start - self._energy_stat_time > STAT_INTERVAL and self._energy_stat_time != 0:
-            device_hourly_stats = self._client.get_device_hourly_stats(self._id)
-#            _LOGGER.warning("%s device_hourly_stats = %s", self._name, device_hourly_stats)
-            if device_hourly_stats is not None and len(device_hourly_stats) > 1:
-                self._hour_energy_kwh_count = device_hourly_stats[1]["counter"] / 1000
-                self._hour_kwh = device_hourly_stats[1]["period"] / 1000
+        self.coordinator.breaker(self.unique_id).set_active(action)
+
+    def update_energy_stats(self, hourly, daily, monthly):
+        """ Update device energy statistic, None for a period not fetched """
+        if hourly is not None:
+            if len(hourly) > 1:
+                self._state.hour_energy_kwh_count = hourly[1]["counter"] / 1000
+                self._state.hour_kwh = hourly[1]["period"] / 1000
             else:
                 _LOGGER.warning("Got None for device_hourly_stats")
-            device_daily_stats = self._client.get_device_daily_stats(self._id)
-#            _LOGGER.warning("%s device_daily_stats = %s", self._name, device_daily_stats)
-            if device_daily_stats is not None and len(device_daily_stats) > 1:
-                self._today_energy_kwh_count = device_daily_stats[0]["counter"] / 1000
-                self._today_kwh = device_daily_stats[0]["period"] / 1000
+        if daily is not None:
+            if len(daily) > 1:
+                self._state.today_energy_kwh_count = daily[0]["counter"] / 1000
+                self._state.today_kwh = daily[0]["period"] / 1000
             else:
                 _LOGGER.warning("Got None for device_daily_stats")
-            device_monthly_stats = self._client.get_device_monthly_stats(self._id)
-#            _LOGGER.warning("%s device_monthly_stats = %s", self._name, device_monthly_stats)
-            if device_monthly_stats is not None and len(device_monthly_stats) > 1:
-                self._month_energy_kwh_count = device_monthly_stats[0]["counter"] / 1000
-                self._month_kwh = device_monthly_stats[0]["period"] / 1000
+        if monthly is not None:
+            if len(monthly) > 1:
+                self._state.month_energy_kwh_count = monthly[0]["counter"] / 1000
+                self._state.month_kwh = monthly[0]["period"] / 1000
             else:
                 _LOGGER.warning("Got None for device_monthly_stats")
-            self._energy_stat_time = time.time()
-        if self._energy_stat_time == 0:
-            self._energy_stat_time = start
 
-    def log_error(self, error_data):
+    async def async_log_error(self, error_data):
         """ Send error message to LOG """
         if error_data == "USRSESSEXP":
             _LOGGER.warning("Session expired... reconnecting...")
-            self._client.reconnect()
+            await self._async_client.reconnect()
         elif error_data == "ACCSESSEXC":
             _LOGGER.warning("Maximun session number reached...Close other connections and try again.")
-            self.notify_ha(
+            await self.async_notify_ha(
                 f"Warning: Maximun Neviweb session number reached...Close other connections and try again."
             )
-            self._client.reconnect()
+            await self._async_client.reconnect()
         elif error_data == "DVCATTRNSPTD":
                 _LOGGER.warning("Device attribute not supported for %s: %s...(SKU: %s)", self._name, device_data, self._sku)
         elif error_data == "DVCACTNSPTD":
@@ -727,19 +896,17 @@ class Neviweb130Valve(ValveEntity):
             _LOGGER.warning("Device busy can't reach (neviweb update ?), retry later %s: %s...(SKU: %s)", self._name, device_data, self._sku)
         elif error_data == "DVCUNVLB":
             _LOGGER.warning("Device %s is disconected from Neviweb: %s...(SKU: %s)", self._name, device_data, self._sku)
-            _LOGGER.warning("This device %s is de-activated and won't be updated for 20 minutes.",self._name)
-            _LOGGER.warning("You can re-activate device %s with service.neviweb130_set_activation or wait 20 minutes for update to restart or just restart HA.",self._name)
-            self._activ = False
-            self._snooze = time.time()
-            self.notify_ha(
-                f"Warning: Received message from Neviweb, device disconnected... Check you log... Neviweb update will be halted for 20 minutes for " + self._name + ", Sku: " + self._sku
+            _LOGGER.warning("This device %s is de-activated and will be probed with a growing delay until it answers again.",self._name)
+            _LOGGER.warning("You can re-activate device %s with service.neviweb130_set_activation or wait for update to restart or just restart HA.",self._name)
+            await self.async_notify_ha(
+                f"Warning: Received message from Neviweb, device disconnected... Check you log... Neviweb update will be halted until the device answers again for " + self._name + ", Sku: " + self._sku
             )
         else:
             _LOGGER.warning("Unknown error for %s: %s...(SKU: %s) Report to maintainer.", self._name, device_data, self._sku)
 
-    def notify_ha(self, msg: str, title: str = "Neviweb130 integration "+VERSION):
+    async def async_notify_ha(self, msg: str, title: str = "Neviweb130 integration "+VERSION):
         """Notify user via HA web frontend."""
-        self.hass.services.call(
+        await self.hass.services.async_call(
             PN_DOMAIN,
             "create",
             service_data={
@@ -759,165 +926,84 @@ class Neviweb130WifiValve(Neviweb130Valve):
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
         self._device_type = device_type
-        self._hour_energy_kwh_count = None
-        self._today_energy_kwh_count = None
-        self._month_energy_kwh_count = None
-        self._hour_kwh = None
-        self._today_kwh = None
-        self._month_kwh = None
-        self._onoff = None
-        self._reports_position = False
-        self._rssi = None
-        self._valve_status = None
-        self._battery_voltage = 0
-        self._battery_status = None
-        self._power_supply = None
-        self._valve_closure = None
-        self._battery_alert = 0
-        self._batt_percent_normal = None
-        self._batt_status_normal = None
-        self._temp_alert = None
-        self._flowmeter_multiplier = 0
-        self._flowmeter_offset = 0
-        self._flowmeter_divisor = 1
-        self._flowmeter_model = None
-        self._stm8Error_motorJam = None
-        self._motor_target = None
-        self._valve_info_status = None
-        self._valve_info_cause = None
-        self._valve_info_id = None
-        self._occupancy_delay = None
-        self._water_leak_status = None
-        self._flow_alarm_1 = None
-        self._flow_alarm_2 = None
-        self._temp_action_low = None
-        self._batt_action_low = None
-        self._away_action = None
+        self._state = Neviweb130ValveState()
         self._is_wifi_valve = device_info["signature"]["model"] in \
             IMPLEMENTED_WIFI_VALVE_MODEL
         self._is_wifi_mesh_valve = False
         self._is_zb_valve = False
         self._is_zb_mesh_valve = False
-        self._energy_stat_time = time.time() - 1500
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
-            LOAD_ATTRIBUTES = [ATTR_WIFI, ATTR_MOTOR_POS, ATTR_MOTOR_TARGET, ATTR_TEMP_ALARM, ATTR_VALVE_INFO, ATTR_BATTERY_VOLTAGE, ATTR_BATTERY_STATUS, ATTR_POWER_SUPPLY, ATTR_VALVE_CLOSURE, ATTR_BATT_ALERT, ATTR_STM8_ERROR, ATTR_FLOW_METER_CONFIG, ATTR_FLOW_ALARM1, ATTR_FLOW_ALARM2, ATTR_TEMP_ACTION_LOW, ATTR_BATT_ACTION_LOW,
-                            ATTR_OCCUPANCY_SENSOR_DELAY, ATTR_BATT_STATUS_NORMAL, ATTR_BATT_PERCENT_NORMAL, ATTR_WATER_LEAK_STATUS, ATTR_AWAY_ACTION]
+    @property
+    def energy_stats(self):
+        """Return True if energy statistics are fetched for this device."""
+        return True
+
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        LOAD_ATTRIBUTES = [ATTR_WIFI, ATTR_MOTOR_POS, ATTR_MOTOR_TARGET, ATTR_TEMP_ALARM, ATTR_VALVE_INFO, ATTR_BATTERY_VOLTAGE, ATTR_BATTERY_STATUS, ATTR_POWER_SUPPLY, ATTR_VALVE_CLOSURE, ATTR_BATT_ALERT, ATTR_STM8_ERROR, ATTR_FLOW_METER_CONFIG, ATTR_FLOW_ALARM1, ATTR_FLOW_ALARM2, ATTR_TEMP_ACTION_LOW, ATTR_BATT_ACTION_LOW,
+                        ATTR_OCCUPANCY_SENSOR_DELAY, ATTR_BATT_STATUS_NORMAL, ATTR_BATT_PERCENT_NORMAL, ATTR_WATER_LEAK_STATUS, ATTR_AWAY_ACTION]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from Neviweb and update the state."""
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES)
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
             if "error" not in device_data:
                 if "errorCode" not in device_data:
-                    self._valve_status = STATE_VALVE_STATUS if \
-                        device_data[ATTR_MOTOR_POS] == 100 else "closed"
-                    self._onoff = "on" if self._valve_status == STATE_VALVE_STATUS else MODE_OFF
-                    self._temp_alert = device_data[ATTR_TEMP_ALARM]
-                    self._battery_voltage = device_data[ATTR_BATTERY_VOLTAGE] if \
-                        device_data[ATTR_BATTERY_VOLTAGE] is not None else 0
-                    self._battery_status = device_data[ATTR_BATTERY_STATUS]
-                    self._power_supply = device_data[ATTR_POWER_SUPPLY]
-                    self._battery_alert = device_data[ATTR_BATT_ALERT]
-                    if ATTR_WATER_LEAK_STATUS in device_data:
-                        self._water_leak_status = device_data[ATTR_WATER_LEAK_STATUS]
-                    if ATTR_MOTOR_TARGET in device_data:
-                        self._motor_target = device_data[ATTR_MOTOR_TARGET]
-                    if ATTR_VALVE_CLOSURE in device_data:
-                        self._valve_closure = device_data[ATTR_VALVE_CLOSURE]["source"]
-                    if ATTR_VALVE_INFO in device_data:
-                        self._valve_info_status = device_data[ATTR_VALVE_INFO]["status"]
-                        self._valve_info_cause = device_data[ATTR_VALVE_INFO]["cause"]
-                        self._valve_info_id = device_data[ATTR_VALVE_INFO]["identifier"]
-                    if ATTR_STM8_ERROR in device_data:
-                        self._stm8Error_motorJam = device_data[ATTR_STM8_ERROR]["motorJam"]
-                    if ATTR_FLOW_METER_CONFIG in device_data:
-                        self._flowmeter_multiplier = device_data[ATTR_FLOW_METER_CONFIG]["multiplier"]
-                        self._flowmeter_offset = device_data[ATTR_FLOW_METER_CONFIG]["offset"]
-                        self._flowmeter_divisor = device_data[ATTR_FLOW_METER_CONFIG]["divisor"]
-                    if ATTR_FLOW_ALARM1 in device_data:
-                        self._flow_alarm_1 = device_data[ATTR_FLOW_ALARM1]
-                    if ATTR_FLOW_ALARM2 in device_data:
-                        self._flow_alarm_2 = device_data[ATTR_FLOW_ALARM2]
-                    if ATTR_TEMP_ACTION_LOW in device_data:
-                        self._temp_action_low = device_data[ATTR_TEMP_ACTION_LOW]
-                    if ATTR_BATT_ACTION_LOW in device_data:
-                        self._batt_action_low = device_data[ATTR_BATT_ACTION_LOW]
-                    if ATTR_OCCUPANCY_SENSOR_DELAY in device_data:
-                        self._occupancy_delay = device_data[ATTR_OCCUPANCY_SENSOR_DELAY]
-                    if ATTR_WIFI in device_data:
-                        self._rssi = device_data[ATTR_WIFI]
-                    if ATTR_BATT_PERCENT_NORMAL in device_data:
-                        self._batt_percent_normal = device_data[ATTR_BATT_PERCENT_NORMAL]
-                    if ATTR_BATT_STATUS_NORMAL in device_data:
-                        self._batt_status_normal = device_data[ATTR_BATT_STATUS_NORMAL]
-                    if ATTR_AWAY_ACTION in device_data:
-                        self._away_action = device_data[ATTR_AWAY_ACTION]
+                    parse(WIFI_VALVE_PARSER, self._state, device_data, self._name)
                 else:
                     _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
             else:
-                self.log_error(device_data["error"]["code"])
-            self.do_stat(start)
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
 
     @property
     def extra_state_attributes(self):
         """Return the extra state attributes."""
         data = {}
-        data.update({'Valve_status': self._valve_status,
-               'Temperature_alert': self._temp_alert,
-               'Battery_level': voltage_to_percentage(self._battery_voltage, 4),
-               'Battery_voltage': self._battery_voltage,
-               'Battery_status': self._battery_status,
-               'Power_supply': self._power_supply,
-               'Valve_closure_source': self._valve_closure,
-               'Battery_alert': self._battery_alert,
-               'Motor_target_position': self._motor_target,
-               'Water_leak_status': self._water_leak_status,
-               'Valve_status': self._valve_info_status,
-               'Valve_cause': self._valve_info_cause,
-               'Valve_info_id': self._valve_info_id,
-               'Alert_motor_jam': self._stm8Error_motorJam,
-               'away_action': self._away_action,
-               'Flow_alarm1': self._flow_alarm_1,
-               'Flow_alarm2': self._flow_alarm_2,
-               'Temp_action_low': self._temp_action_low,
-               'Batt_action_low': self._batt_action_low,
-               'Battery_percent_normalized': self._batt_percent_normal,
-               'Battery_status_normalized': self._batt_status_normal,
-               'Flow_meter_multiplier': self._flowmeter_multiplier,
-               'Flow_meter_offset': self._flowmeter_offset,
-               'Flow_meter_divisor': self._flowmeter_divisor,
-               'occupancy_sensor_delay': self._occupancy_delay,
-               'hourly_flow_count': L_2_sqm(self._hour_energy_kwh_count),
-               'daily_flow_count': L_2_sqm(self._today_energy_kwh_count),
-               'monthly_flow_count': L_2_sqm(self._month_energy_kwh_count),
-               'hourly_flow': L_2_sqm(self._hour_kwh),
-               'daily_flow': L_2_sqm(self._today_kwh),
-               'monthly_flow': L_2_sqm(self._month_kwh),
-               'rssi': self._rssi,
+        data.update({'Valve_status': self._state.valve_status,
+               'Temperature_alert': self._state.temp_alert,
+               'Battery_level': voltage_to_percentage(self._state.battery_voltage, 4),
+               'Battery_voltage': self._state.battery_voltage,
+               'Battery_status': self._state.battery_status,
+               'Power_supply': self._state.power_supply,
+               'Valve_closure_source': self._state.valve_closure,
+               'Battery_alert': self._state.battery_alert,
+               'Motor_target_position': self._state.motor_target,
+               'Water_leak_status': self._state.water_leak_status,
+               'Valve_status': self._state.valve_info_status,
+               'Valve_cause': self._state.valve_info_cause,
+               'Valve_info_id': self._state.valve_info_id,
+               'Alert_motor_jam': self._state.stm8Error_motorJam,
+               'away_action': self._state.away_action,
+               'Flow_alarm1': self._state.flow_alarm_1,
+               'Flow_alarm2': self._state.flow_alarm_2,
+               'Temp_action_low': self._state.temp_action_low,
+               'Batt_action_low': self._state.batt_action_low,
+               'Battery_percent_normalized': self._state.batt_percent_normal,
+               'Battery_status_normalized': self._state.batt_status_normal,
+               'Flow_meter_multiplier': self._state.flowmeter_multiplier,
+               'Flow_meter_offset': self._state.flowmeter_offset,
+               'Flow_meter_divisor': self._state.flowmeter_divisor,
+               'occupancy_sensor_delay': self._state.occupancy_delay,
+               'rssi': self._state.rssi,
                'sku': self._sku,
                'device_model': str(self._device_model),
                'device_model_cfg': self._device_model_cfg,
                'firmware': self._firmware,
-               'Activation': self._activ,
+               'Activation': self.activ,
                'device_type': self._device_type,
+               'poll_interval': self.coordinator.poll_interval(self._id),
                'id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
 
 class Neviweb130MeshValve(Neviweb130Valve):
     """Implementation of a Neviweb mesh valve switch VA4220ZB and ACT4220ZB-M."""
@@ -928,154 +1014,83 @@ class Neviweb130MeshValve(Neviweb130Valve):
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
         self._device_type = device_type
-        self._hour_energy_kwh_count = None
-        self._today_energy_kwh_count = None
-        self._month_energy_kwh_count = None
-        self._hour_kwh = None
-        self._today_kwh = None
-        self._month_kwh = None
-        self._onoff = None
-        self._reports_position = False
-        self._valve_status = None
-        self._battery_voltage = 0
-        self._battery_status = None
-        self._batt_percent_normal = None
-        self._batt_status_normal = None
-        self._power_supply = None
-        self._battery_alert = 0
-        self._rssi = None
-        self._flowmeter_multiplier = 0
-        self._flowmeter_offset = 0
-        self._flowmeter_divisor = 1
-        self._flowmeter_model = None
-        self._flowmeter_timer = 0
-        self._flowmeter_threshold = 1
-        self._flowmeter_alarm_lenght = 0
-        self._flowmeter_alert_delay = 0
-        self._flowmeter_opt_alarm = None
-        self._flowmeter_opt_action = None
-        self._flowmeter_enabled = None
-        self._stm8Error_motorJam = None
-        self._stm8Error_motorPosition = None
-        self._stm8Error_motorLimit = None
-        self._error_code = None
-        self._water_leak_status = None
+        self._state = Neviweb130ValveState()
         self._is_zb_mesh_valve = device_info["signature"]["model"] in \
             IMPLEMENTED_ZB_MESH_VALVE_MODEL
         self._is_wifi_valve = False
         self._is_wifi_mesh_valve = False
         self._is_zb_valve = False
-        self._energy_stat_time = time.time() - 1500
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
-            LOAD_ATTRIBUTES = [ATTR_RSSI, ATTR_BATTERY_VOLTAGE, ATTR_BATTERY_STATUS, ATTR_POWER_SUPPLY, ATTR_STM8_ERROR, ATTR_WATER_LEAK_STATUS, ATTR_FLOW_METER_CONFIG, ATTR_FLOW_ALARM_TIMER,
-                ATTR_FLOW_THRESHOLD, ATTR_FLOW_ALARM1_PERIOD, ATTR_FLOW_ALARM1_LENGHT, ATTR_FLOW_ALARM1_OPTION, ATTR_FLOW_ENABLED, ATTR_BATT_STATUS_NORMAL, ATTR_BATT_PERCENT_NORMAL, ATTR_ERROR_CODE_SET1]
+    @property
+    def energy_stats(self):
+        """Return True if energy statistics are fetched for this device."""
+        return True
+
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        LOAD_ATTRIBUTES = [ATTR_RSSI, ATTR_BATTERY_VOLTAGE, ATTR_BATTERY_STATUS, ATTR_POWER_SUPPLY, ATTR_STM8_ERROR, ATTR_WATER_LEAK_STATUS, ATTR_FLOW_METER_CONFIG, ATTR_FLOW_ALARM_TIMER,
+            ATTR_FLOW_THRESHOLD, ATTR_FLOW_ALARM1_PERIOD, ATTR_FLOW_ALARM1_LENGHT, ATTR_FLOW_ALARM1_OPTION, ATTR_FLOW_ENABLED, ATTR_BATT_STATUS_NORMAL, ATTR_BATT_PERCENT_NORMAL, ATTR_ERROR_CODE_SET1]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from Neviweb and update the state."""
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES)
             end = time.time()
             elapsed = round(end - start, 3)
-            if self._is_zb_valve or self._is_zb_mesh_valve:
-                device_alert = self._client.get_device_alert(self._id)
-                _LOGGER.debug("Updating alert for %s (%s sec): %s",self._name, elapsed, device_alert)
+            device_alert = device_data.get(ENDPOINT_ALERT, {})
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
             if "error" not in device_data:
                 if "errorCode" not in device_data:
-                    self._valve_status = STATE_VALVE_STATUS if \
-                        device_data[ATTR_ONOFF] == "on" else "closed"
-                    self._onoff = device_data[ATTR_ONOFF]
-                    self._battery_voltage = device_data[ATTR_BATTERY_VOLTAGE] if \
-                        device_data[ATTR_BATTERY_VOLTAGE] is not None else 0
-                    self._battery_status = device_data[ATTR_BATTERY_STATUS]
-                    self._power_supply = device_data[ATTR_POWER_SUPPLY]
+                    parse(MESH_VALVE_PARSER, self._state, device_data, self._name)
                     if ATTR_BATT_ALERT in device_alert:
-                        self._battery_alert = device_alert[ATTR_BATT_ALERT]
-                    if ATTR_STM8_ERROR in device_data:
-                        self._stm8Error_motorJam = device_data[ATTR_STM8_ERROR]["motorJam"]
-                        self._stm8Error_motorLimit = device_data[ATTR_STM8_ERROR]["motorLimit"]
-                        self._stm8Error_motorPosition = device_data[ATTR_STM8_ERROR]["motorPosition"]
-                    if ATTR_FLOW_METER_CONFIG in device_data:
-                        self._flowmeter_multiplier = device_data[ATTR_FLOW_METER_CONFIG]["multiplier"]
-                        self._flowmeter_offset = device_data[ATTR_FLOW_METER_CONFIG]["offset"]
-                        self._flowmeter_divisor = device_data[ATTR_FLOW_METER_CONFIG]["divisor"]
-                        self._flowmeter_model = model_to_HA(self._flowmeter_multiplier)
-                    self._water_leak_status = device_data[ATTR_WATER_LEAK_STATUS]
-                    self._flowmeter_timer = device_data[ATTR_FLOW_ALARM_TIMER]
-                    self._flowmeter_threshold = device_data[ATTR_FLOW_THRESHOLD]
-                    self._flowmeter_alert_delay = device_data[ATTR_FLOW_ALARM1_PERIOD]
-                    self._flowmeter_alarm_lenght = device_data[ATTR_FLOW_ALARM1_LENGHT]
-                    self._flowmeter_opt_alarm = device_data[ATTR_FLOW_ALARM1_OPTION][ATTR_TRIGGER_ALARM]
-                    self._flowmeter_opt_action = device_data[ATTR_FLOW_ALARM1_OPTION][ATTR_CLOSE_VALVE]
-                    if ATTR_BATT_PERCENT_NORMAL in device_data:
-                        self._batt_percent_normal = device_data[ATTR_BATT_PERCENT_NORMAL]
-                    if ATTR_BATT_STATUS_NORMAL in device_data:
-                        self._batt_status_normal = device_data[ATTR_BATT_STATUS_NORMAL]
-                    if ATTR_RSSI in device_data:
-                        self._rssi = device_data[ATTR_RSSI]
-                    if ATTR_FLOW_ENABLED in device_data:
-                        self._flowmeter_enabled = device_data[ATTR_FLOW_ENABLED]
-                    if ATTR_ERROR_CODE_SET1 in device_data and len(device_data[ATTR_ERROR_CODE_SET1]) > 0:
-                        self._error_code = "Present, see logs"
+                        self._state.battery_alert = device_alert[ATTR_BATT_ALERT]
                 else:
                     _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
             else:
-                self.log_error(device_data["error"]["code"])
-            self.do_stat(start)
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
 
     @property
     def extra_state_attributes(self):
         """Return the extra state attributes."""
         data = {}
-        data.update({'Valve_status': self._valve_status,
-               'Battery_level': voltage_to_percentage(self._battery_voltage, 4),
-               'Battery_voltage': self._battery_voltage,
-               'Battery_status': self._battery_status,
-               'Battery_percent_normalized': self._batt_percent_normal,
-               'Battery_status_normalized': self._batt_status_normal,
-               'Power_supply': self._power_supply,
-               'Alert_motor_jam': self._stm8Error_motorJam,
-               'Alert_motor_position': self._stm8Error_motorPosition,
-               'Alert_motor_limit': self._stm8Error_motorLimit,
-               'Error_code': self._error_code,
-               'Flow_meter_multiplier': self._flowmeter_multiplier,
-               'Flow_meter_offset': self._flowmeter_offset,
-               'Flow_meter_divisor': self._flowmeter_divisor,
-               'Flow_meter_model': self._flowmeter_model,
-               'Flow_meter_alert_delay': neviweb_to_ha_delay(self._flowmeter_alert_delay),
-               'Flow_meter_alarm_length': self._flowmeter_alarm_lenght,
-               'Flowmeter_options': trigger_close(self._flowmeter_opt_action, self._flowmeter_opt_alarm),
-               'Flowmeter_enabled': self._flowmeter_enabled,
-               'Water_leak_status': self._water_leak_status,
-               'Battery_alert': alert_to_text(self._battery_alert, "bat"),
-               'hourly_flow_count': L_2_sqm(self._hour_energy_kwh_count),
-               'daily_flow_count': L_2_sqm(self._today_energy_kwh_count),
-               'monthly_flow_count': L_2_sqm(self._month_energy_kwh_count),
-               'hourly_flow': L_2_sqm(self._hour_kwh),
-               'daily_flow': L_2_sqm(self._today_kwh),
-               'monthly_flow': L_2_sqm(self._month_kwh),
-               'rssi': self._rssi,
+        data.update({'Valve_status': self._state.valve_status,
+               'Battery_level': voltage_to_percentage(self._state.battery_voltage, 4),
+               'Battery_voltage': self._state.battery_voltage,
+               'Battery_status': self._state.battery_status,
+               'Battery_percent_normalized': self._state.batt_percent_normal,
+               'Battery_status_normalized': self._state.batt_status_normal,
+               'Power_supply': self._state.power_supply,
+               'Alert_motor_jam': self._state.stm8Error_motorJam,
+               'Alert_motor_position': self._state.stm8Error_motorPosition,
+               'Alert_motor_limit': self._state.stm8Error_motorLimit,
+               'Error_code': self._state.error_code,
+               'Flow_meter_multiplier': self._state.flowmeter_multiplier,
+               'Flow_meter_offset': self._state.flowmeter_offset,
+               'Flow_meter_divisor': self._state.flowmeter_divisor,
+               'Flow_meter_model': self._state.flowmeter_model,
+               'Flow_meter_alert_delay': neviweb_to_ha_delay(self._state.flowmeter_alert_delay),
+               'Flow_meter_alarm_length': self._state.flowmeter_alarm_lenght,
+               'Flowmeter_options': trigger_close(self._state.flowmeter_opt_action, self._state.flowmeter_opt_alarm),
+               'Flowmeter_enabled': self._state.flowmeter_enabled,
+               'Water_leak_status': self._state.water_leak_status,
+               'Battery_alert': alert_to_text(self._state.battery_alert, "bat"),
+               'rssi': self._state.rssi,
                'sku': self._sku,
                'device_model': str(self._device_model),
                'device_model_cfg': self._device_model_cfg,
                'firmware': self._firmware,
-               'Activation': self._activ,
+               'Activation': self.activ,
                'device_type': self._device_type,
+               'poll_interval': self.coordinator.poll_interval(self._id),
                'id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
 
 class Neviweb130WifiMeshValve(Neviweb130Valve):
     """Implementation of a Neviweb wifi mesh valve switch, ACT4220WF-M, ACT4221WF-M."""
@@ -1086,159 +1101,76 @@ class Neviweb130WifiMeshValve(Neviweb130Valve):
         self._sku = sku
         self._firmware = firmware
         self._client = data.neviweb130_client
+        self._async_client = data.neviweb130_async_client
         self._id = device_info["id"]
+        CoordinatorEntity.__init__(self, data.get_coordinator(self._id), self)
         self._device_model = device_info["signature"]["model"]
         self._device_model_cfg = device_info["signature"]["modelCfg"]
         self._device_type = device_type
-        self._hour_energy_kwh_count = None
-        self._today_energy_kwh_count = None
-        self._month_energy_kwh_count = None
-        self._hour_kwh = None
-        self._today_kwh = None
-        self._month_kwh = None
-        self._onoff = None
-        self._reports_position = False
-        self._valve_status = None
-        self._battery_voltage = 0
-        self._battery_status = None
-        self._power_supply = None
-        self._flow_alarm_1 = None
-        self._flow_alarm_2 = None
-        self._flowmeter_multiplier = 0
-        self._flowmeter_offset = 0
-        self._flowmeter_divisor = 1
-        self._flowmeter_model = None
-        self._flowmeter_timer = 0
-        self._flowmeter_threshold = 1
-        self._flowmeter_alarm_lenght = 0
-        self._flowmeter_alert_delay = 0
-        self._flowmeter_opt_alarm = None
-        self._flowmeter_opt_action = None
-        self._stm8Error_motorJam = None
-        self._stm8Error_motorPosition = None
-        self._stm8Error_motorLimit = None
-        self._motor_target = None
-        self._valve_info_status = None
-        self._valve_info_cause = None
-        self._valve_info_id = None
-        self._water_leak_status = None
-        self._temp_alert = None
-        self._temp_action_low = None
-        self._batt_action_low = None
-        self._rssi = None
+        self._state = Neviweb130ValveState()
         self._is_wifi_mesh_valve = device_info["signature"]["model"] in \
             IMPLEMENTED_WIFI_MESH_VALVE_MODEL
         self._is_wifi_valve = False
         self._is_zb_valve = False
         self._is_zb_mesh_valve = False
-        self._energy_stat_time = time.time() - 1500
-        self._snooze = 0
-        self._activ = True
         _LOGGER.debug("Setting up %s: %s", self._name, device_info)
 
-    def update(self):
-        if self._activ:
-            LOAD_ATTRIBUTES = [ATTR_MOTOR_POS, ATTR_MOTOR_TARGET, ATTR_TEMP_ALARM, ATTR_VALVE_INFO, ATTR_BATTERY_STATUS, ATTR_POWER_SUPPLY, ATTR_BATTERY_VOLTAGE, ATTR_STM8_ERROR, ATTR_FLOW_METER_CONFIG, ATTR_WATER_LEAK_STATUS, ATTR_FLOW_ALARM_TIMER,
-                ATTR_FLOW_THRESHOLD, ATTR_FLOW_ALARM1_PERIOD, ATTR_FLOW_ALARM1_LENGHT, ATTR_FLOW_ALARM1_OPTION, ATTR_FLOW_ALARM1, ATTR_FLOW_ALARM2, ATTR_TEMP_ACTION_LOW, ATTR_BATT_ACTION_LOW]
+    def update_attributes(self):
+        """Return attributes polled by the coordinator."""
+        LOAD_ATTRIBUTES = [ATTR_MOTOR_POS, ATTR_MOTOR_TARGET, ATTR_TEMP_ALARM, ATTR_VALVE_INFO, ATTR_BATTERY_STATUS, ATTR_POWER_SUPPLY, ATTR_BATTERY_VOLTAGE, ATTR_STM8_ERROR, ATTR_FLOW_METER_CONFIG, ATTR_WATER_LEAK_STATUS, ATTR_FLOW_ALARM_TIMER,
+            ATTR_FLOW_THRESHOLD, ATTR_FLOW_ALARM1_PERIOD, ATTR_FLOW_ALARM1_LENGHT, ATTR_FLOW_ALARM1_OPTION, ATTR_FLOW_ALARM1, ATTR_FLOW_ALARM2, ATTR_TEMP_ACTION_LOW, ATTR_BATT_ACTION_LOW]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update_from_data(self, device_data, start, verify=False):
+        if self.activ:
             """Get the latest data from Neviweb and update the state."""
-            start = time.time()
-            device_data = self._client.get_device_attributes(self._id, UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES)
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s",
                 self._name, elapsed, device_data)
             if "error" not in device_data:
                 if "errorCode" not in device_data:
-                    self._valve_status = STATE_VALVE_STATUS if \
-                        device_data[ATTR_MOTOR_POS] == 100 else "closed"
-                    self._onoff = "on" if self._valve_status == STATE_VALVE_STATUS else MODE_OFF
-                    self._motor_target = device_data[ATTR_MOTOR_TARGET]
-                    self._temp_alert = device_data[ATTR_TEMP_ALARM]
-                    if ATTR_VALVE_INFO in device_data:
-                        self._valve_info_status = device_data[ATTR_VALVE_INFO]["status"]
-                        self._valve_info_cause = device_data[ATTR_VALVE_INFO]["cause"]
-                        self._valve_info_id = device_data[ATTR_VALVE_INFO]["identifier"]
-                    self._battery_status = device_data[ATTR_BATTERY_STATUS]
-                    self._power_supply = device_data[ATTR_POWER_SUPPLY]
-                    self._battery_voltage = device_data[ATTR_BATTERY_VOLTAGE] if \
-                        device_data[ATTR_BATTERY_VOLTAGE] is not None else 0
-                    if ATTR_STM8_ERROR in device_data:
-                        self._stm8Error_motorJam = device_data[ATTR_STM8_ERROR]["motorJam"]
-                        self._stm8Error_motorLimit = device_data[ATTR_STM8_ERROR]["motorLimit"]
-                        self._stm8Error_motorPosition = device_data[ATTR_STM8_ERROR]["motorPosition"]
-                    if ATTR_FLOW_METER_CONFIG in device_data:
-                        self._flowmeter_multiplier = device_data[ATTR_FLOW_METER_CONFIG]["multiplier"]
-                        self._flowmeter_offset = device_data[ATTR_FLOW_METER_CONFIG]["offset"]
-                        self._flowmeter_divisor = device_data[ATTR_FLOW_METER_CONFIG]["divisor"]
-                        self._flowmeter_model = model_to_HA(self._flowmeter_multiplier)
-                    self._water_leak_status = device_data[ATTR_WATER_LEAK_STATUS]
-                    if ATTR_FLOW_ALARM_TIMER in device_data:
-                        self._flowmeter_timer = device_data[ATTR_FLOW_ALARM_TIMER]
-                        if self._flowmeter_timer != 0:
-                            self._flowmeter_threshold = device_data[ATTR_FLOW_THRESHOLD]
-                            self._flowmeter_alert_delay = device_data[ATTR_FLOW_ALARM1_PERIOD]
-                            self._flowmeter_alarm_lenght = device_data[ATTR_FLOW_ALARM1_LENGHT]
-                            self._flowmeter_opt_alarm = device_data[ATTR_FLOW_ALARM1_OPTION][ATTR_TRIGGER_ALARM]
-                            self._flowmeter_opt_action = device_data[ATTR_FLOW_ALARM1_OPTION][ATTR_CLOSE_VALVE]
-                    if ATTR_FLOW_ALARM1 in device_data:
-                        self._flow_alarm_1 = device_data[ATTR_FLOW_ALARM1]
-                    if ATTR_FLOW_ALARM2 in device_data:
-                        self._flow_alarm_2 = device_data[ATTR_FLOW_ALARM2]
-                    if ATTR_TEMP_ACTION_LOW in device_data:
-                        self._temp_action_low = device_data[ATTR_TEMP_ACTION_LOW]
-                    if ATTR_BATT_ACTION_LOW in device_data:
-                        self._batt_action_low = device_data[ATTR_BATT_ACTION_LOW]
+                    parse(WIFI_MESH_VALVE_PARSER, self._state, device_data, self._name)
                 else:
                     _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
             else:
-                self.log_error(device_data["error"]["code"])
-        else:
-            if time.time() - self._snooze > SNOOZE_TIME:
-                self._activ = True
-                self.notify_ha(
-                    f"Warning: Neviweb Device update restarted for " + self._name + ", Sku: " + self._sku
-                )
+                await self.async_log_error(device_data["error"]["code"])
 
     @property
     def extra_state_attributes(self):
         """Return the extra state attributes."""
         data = {}
-        data.update({'Valve_status': self._valve_status,
-               'Motor_target_position': self._motor_target,
-               'Temperature_alert': self._temp_alert,
-               'Valve_status': self._valve_info_status,
-               'Valve_cause': self._valve_info_cause,
-               'Valve_info_id': self._valve_info_id,
-               'Battery_level': voltage_to_percentage(self._battery_voltage, 4),
-               'Battery_voltage': self._battery_voltage,
-               'Battery_status': self._battery_status,
-               'Power_supply': self._power_supply,
-               'Alert_motor_jam': self._stm8Error_motorJam,
-               'Alert_motor_position': self._stm8Error_motorPosition,
-               'Alert_motor_limit': self._stm8Error_motorLimit,
-               'Flow_alarm1': self._flow_alarm_1,
-               'Flow_alarm2': self._flow_alarm_2,
-               'Temp_action_low': self._temp_action_low,
-               'Batt_action_low': self._batt_action_low,
-               'Flow_meter_multiplier': self._flowmeter_multiplier,
-               'Flow_meter_offset': self._flowmeter_offset,
-               'Flow_meter_divisor': self._flowmeter_divisor,
-               'Flow_meter_model': self._flowmeter_model,
-               'Flow_meter_alert_delay': neviweb_to_ha_delay(self._flowmeter_alert_delay),
-               'Flow_meter_alarm_length': self._flowmeter_alarm_lenght,
-               'Flowmeter_options': trigger_close(self._flowmeter_opt_action, self._flowmeter_opt_alarm),
-               'Water_leak_status': self._water_leak_status,
-               'hourly_flow_count': L_2_sqm(self._hour_energy_kwh_count),
-               'daily_flow_count': L_2_sqm(self._today_energy_kwh_count),
-               'monthly_flow_count': L_2_sqm(self._month_energy_kwh_count),
-               'hourly_flow': L_2_sqm(self._hour_kwh),
-               'daily_flow': L_2_sqm(self._today_kwh),
-               'monthly_flow': L_2_sqm(self._month_kwh),
+        data.update({'Valve_status': self._state.valve_status,
+               'Motor_target_position': self._state.motor_target,
+               'Temperature_alert': self._state.temp_alert,
+               'Valve_status': self._state.valve_info_status,
+               'Valve_cause': self._state.valve_info_cause,
+               'Valve_info_id': self._state.valve_info_id,
+               'Battery_level': voltage_to_percentage(self._state.battery_voltage, 4),
+               'Battery_voltage': self._state.battery_voltage,
+               'Battery_status': self._state.battery_status,
+               'Power_supply': self._state.power_supply,
+               'Alert_motor_jam': self._state.stm8Error_motorJam,
+               'Alert_motor_position': self._state.stm8Error_motorPosition,
+               'Alert_motor_limit': self._state.stm8Error_motorLimit,
+               'Flow_alarm1': self._state.flow_alarm_1,
+               'Flow_alarm2': self._state.flow_alarm_2,
+               'Temp_action_low': self._state.temp_action_low,
+               'Batt_action_low': self._state.batt_action_low,
+               'Flow_meter_multiplier': self._state.flowmeter_multiplier,
+               'Flow_meter_offset': self._state.flowmeter_offset,
+               'Flow_meter_divisor': self._state.flowmeter_divisor,
+               'Flow_meter_model': self._state.flowmeter_model,
+               'Flow_meter_alert_delay': neviweb_to_ha_delay(self._state.flowmeter_alert_delay),
+               'Flow_meter_alarm_length': self._state.flowmeter_alarm_lenght,
+               'Flowmeter_options': trigger_close(self._state.flowmeter_opt_action, self._state.flowmeter_opt_alarm),
+               'Water_leak_status': self._state.water_leak_status,
                'sku': self._sku,
                'device_model': str(self._device_model),
                'device_model_cfg': self._device_model_cfg,
                'firmware': self._firmware,
-               'Activation': self._activ,
+               'Activation': self.activ,
                'device_type': self._device_type,
+               'poll_interval': self.coordinator.poll_interval(self._id),
                'id': str(self._id)})
-        return data
+        return device_attributes(data, neviweb130.RECORDER_MODE)
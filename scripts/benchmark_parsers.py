@@ -0,0 +1,70 @@
+"""Time the compiled device data parsers.
+
+Each parser runs ROUNDS times on device data into a new state and the mean
+time per parse is printed in microseconds. Without argument, every parser
+parses the attribute values of the fake Neviweb server. With a file, the
+response of the neviweb130.get_diagnostics service saved from developer
+tools (yaml or json), each device is timed with its own parser over the
+last data received from it.
+
+    python scripts/benchmark_parsers.py [diagnostics.yaml]
+
+Needs Home Assistant installed, the platforms register their parsers when
+imported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import sys
+import time
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from custom_components.neviweb130.parsers import PARSERS  # noqa: E402
+from fake_neviweb import VALUES  # noqa: E402
+
+PLATFORMS = ("climate", "light", "sensor", "switch", "valve")
+ROUNDS = 200
+
+
+def time_parser(name, data, rounds):
+    """Return the mean microseconds parser name takes to parse data."""
+    state_class, parser = PARSERS[name]
+    state = state_class()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parser(state, data)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("diagnostics", nargs="?",
+        help="response of neviweb130.get_diagnostics")
+    parser.add_argument("--rounds", type=int, default=ROUNDS)
+    args = parser.parse_args()
+    for platform in PLATFORMS:
+        importlib.import_module("custom_components.neviweb130." + platform)
+    if args.diagnostics is None:
+        samples = [("fake Neviweb values", name, VALUES)
+            for name in sorted(PARSERS)]
+    else:
+        with open(args.diagnostics, encoding="utf-8") as file:
+            devices = yaml.safe_load(file)["devices"]
+        samples = [(entity_id, device["parse"]["parser"],
+            device["poll"]["device_data"])
+            for entity_id, device in sorted(devices.items())
+            if device["parse"] and device["poll"]["device_data"]]
+    for label, name, data in samples:
+        print("%-50s %-20s %8.1f us" % (label, name,
+            time_parser(name, data, args.rounds)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Fake Neviweb server for the measurement scripts.
+
+Serves login, locations, devices, device attributes, status, alert and
+energy history for a fleet of devices, with a fixed latency per device
+request. It counts requests by kind and new connections, and records
+the requests waiting for an answer over time, so scripts can report what
+the integration sends to Neviweb.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from aiohttp import web
+
+# Device id, name, sku and signature model of the base fleet, one device
+# of each platform. Extra thermostats are added by FakeNeviweb.
+DEVICES = [
+    (1, "Thermo", "TH1123ZB", 1123),
+    (2, "Light", "SW2500ZB", 2121),
+    (3, "Dimmer", "DM2500ZB", 2131),
+    (4, "Load", "RM3250ZB", 2506),
+    (5, "Outlet", "SP2600ZB", 2600),
+    (6, "Leak", "WL4200", 5051),
+    (7, "Valve", "VA4201WZ", 3150),
+    (8, "GT130", "GT130", 130),
+]
+
+# Attribute values answered for every device.
+VALUES = {
+    "roomTemperature": {"value": 20.5}, "roomSetpoint": 21.0,
+    "roomSetpointMin": 5, "roomSetpointMax": 30,
+    "temperatureFormat": "celsius", "timeFormat": "24h",
+    "roomTemperatureDisplay": 20.5, "config2ndDisplay": "auto",
+    "drSetpoint": {"status": "off", "value": 0},
+    "drStatus": {"drActive": "off", "optOut": "off", "setpoint": "off",
+        "powerAbsolute": None, "powerRelative": None, "onOff": "off"},
+    "outputPercentDisplay": 10, "lockKeypad": "unlocked",
+    "backlightAdaptive": "on", "cycleLength": 15, "rssi": -60,
+    "systemMode": "auto", "loadConnected": 1000, "onOff": "on",
+    "intensity": 50, "intensityMin": 5,
+    "loadWattOutput1": {"status": "on", "value": 100}, "powerTimer": 0,
+    "statusLedOnIntensity": 50, "statusLedOffIntensity": 10,
+    "statusLedOnColor": {"red": 0, "green": 0, "blue": 255},
+    "statusLedOffColor": {"red": 0, "green": 0, "blue": 0},
+    "phaseControl": "forward", "configKeyDoubleUp": "off",
+    "wattageInstant": 500, "powerMode": "manual", "alertLowBatt": True,
+    "alertLowTemp": True, "alertWaterLeak": True, "batteryVoltage": 3.0,
+    "batteryStatus": "ok", "waterLeakStatus": "ok",
+    "roomTemperatureAlarmStatus": "ok", "temperature": 20,
+    "batteryType": "alkaline", "motorPosition": 100,
+    "motorTargetPosition": 100, "backupPowerSupply": "none",
+    "temperatureAlarmStatus": "ok", "valveClosureSource": {"source": "none"},
+    "cfgValveClosure": "off", "batteryPercentNormalized": 90,
+    "batteryStatusNormalized": "ok", "occupancyMode": "home",
+    "errorCodeSet1": {}, "setpointMode": "auto",
+    "waterLeakAlarmStatus": "ok", "wifiRssi": -50,
+}
+
+
+class FakeNeviweb:
+    """Fake Neviweb server with extra thermostats added to the base fleet
+    and latency seconds of delay on each device request."""
+
+    def __init__(self, extra_devices=0, latency=0.02, changing=False):
+        """Initialize the fleet and the counters. With changing, the room
+        temperature and signal strength change at each read, as they do on
+        a live fleet."""
+        self.devices = list(DEVICES) + [(100 + index, "Th%d" % index,
+            "TH1123ZB", 1123) for index in range(extra_devices)]
+        self.latency = latency
+        self.changing = changing
+        self._reads = 0
+        self.url = None
+        self._runner = None
+        self._session = 0
+        self._attrs = {}
+        self._transports = set()
+        self.counts = {}
+        self.connections = 0
+        self.in_flight = 0
+        # Time and number of requests waiting for an answer, at each change
+        self.timeline = []
+
+    def _count(self, request, kind):
+        """Count a request, and its connection if not seen yet."""
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        if request.transport not in self._transports:
+            self._transports.add(request.transport)
+            self.connections += 1
+
+    def _flight(self, change):
+        """Record a request starting (1) or answered (-1)."""
+        self.in_flight += change
+        self.timeline.append((time.monotonic(), self.in_flight))
+
+    async def _login(self, request):
+        self._count(request, "login")
+        self._session += 1
+        return web.json_response({"user": {}, "account": {"id": 1},
+            "session": "s%d" % self._session})
+
+    async def _locations(self, request):
+        self._count(request, "locations")
+        return web.json_response([{"id": 100, "name": "Home"}])
+
+    async def _devices(self, request):
+        self._count(request, "devices")
+        return web.json_response([{"id": device_id, "name": name, "sku": sku}
+            for device_id, name, sku, _ in self.devices])
+
+    async def _device(self, request, kind, answer):
+        """Answer a device request after the latency."""
+        self._count(request, kind)
+        self._flight(1)
+        try:
+            await asyncio.sleep(self.latency)
+            if request.headers.get("Session-Id") != "s%d" % self._session:
+                return web.json_response({"error": {"code": "USRSESSEXP"}})
+            return web.json_response(await answer())
+        finally:
+            self._flight(-1)
+
+    async def _attribute(self, request):
+        device_id = int(request.match_info["id"])
+        values = self._attrs.setdefault(device_id, dict(VALUES))
+        if request.method == "PUT":
+            async def put():
+                body = await request.json()
+                values.update(body)
+                return body
+            return await self._device(request, "put", put)
+        attributes = request.query["attributes"].split(",")
+        if attributes == ["signature"]:
+            model = next(model for known, _, _, model in self.devices
+                if known == device_id)
+
+            async def signature():
+                return {"signature": {"model": model, "modelCfg": 0,
+                    "softVersion": {"major": 1, "middle": 2, "minor": 3},
+                    "hardRev": 1, "protocol": "sinopcom"}}
+            return await self._device(request, "signature", signature)
+
+        async def read():
+            if self.changing:
+                self._reads += 1
+                values["roomTemperature"] = {"value": 20 + self._reads % 5 / 2}
+                values["rssi"] = -60 - self._reads % 7
+            return {attribute: values.get(attribute, 0)
+                for attribute in attributes}
+        return await self._device(request, "attributes", read)
+
+    async def _status(self, request):
+        async def status():
+            return {"status": "online"}
+        return await self._device(request, "status", status)
+
+    async def _alert(self, request):
+        async def alert():
+            return {}
+        return await self._device(request, "alert", alert)
+
+    async def _energy(self, request):
+        async def energy():
+            return {"history": [{"period": 100, "counter": 1000,
+                "date": "2026-01-01"}] * 3}
+        return await self._device(request,
+            "energy_" + request.match_info["period"], energy)
+
+    async def start(self):
+        """Start serving on a free local port, set url."""
+        app = web.Application()
+        app.router.add_post("/api/login", self._login)
+        app.router.add_get("/api/locations", self._locations)
+        app.router.add_get("/api/devices", self._devices)
+        app.router.add_route("*", "/api/device/{id}/attribute",
+            self._attribute)
+        app.router.add_get("/api/device/{id}/status", self._status)
+        app.router.add_get("/api/device/{id}/alert", self._alert)
+        app.router.add_get("/api/device/{id}/energy/{period}", self._energy)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = "http://127.0.0.1:%d" % site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Stop serving."""
+        await self._runner.cleanup()
+
+    def peak_in_flight(self, start, end):
+        """Return the highest number of requests waiting for an answer
+        between monotonic times start and end."""
+        peak = 0
+        for when, count in self.timeline:
+            if when > end:
+                break
+            if when >= start:
+                peak = max(peak, count)
+            else:
+                peak = count
+        return peak
@@ -0,0 +1,48 @@
+"""Count requests, new connections and request time per poll cycle.
+
+Each new connection to Neviweb costs a TCP and TLS handshake. The fake
+server counts the connections opened by the integration, and the clients
+give their cumulated request time. One line is printed per scan interval.
+
+    python scripts/measure_connections.py --devices 40 --cycles 5
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from neviweb_harness import argument_parser, integration, run
+
+SCAN_INTERVAL = 20
+
+
+def request_time(data):
+    """Return seconds spent in requests by both clients."""
+    return data.neviweb130_client.get_stats()["request_time"] + \
+        data.neviweb130_async_client.get_stats()["request_time"]
+
+
+async def measure(args):
+    config = {"scan_interval": args.scan_interval,
+        "min_scan_interval": args.scan_interval,
+        "max_scan_interval": args.scan_interval}
+    async with integration(args, config) as (fake, hass, module):
+        data = hass.data["neviweb130"]
+        print("startup: %s requests, %s connections" % (
+            sum(fake.counts.values()), fake.connections))
+        for cycle in range(1, args.cycles + 1):
+            requests = sum(fake.counts.values())
+            connections = fake.connections
+            seconds = request_time(data)
+            await asyncio.sleep(args.scan_interval)
+            print("cycle %s: %s requests, %s new connections, %.2f s "
+                "request time" % (cycle, sum(fake.counts.values()) - requests,
+                fake.connections - connections,
+                request_time(data) - seconds))
+
+
+if __name__ == "__main__":
+    parser = argument_parser(__doc__.split("\n")[0])
+    parser.add_argument("--scan-interval", type=int, default=SCAN_INTERVAL)
+    parser.add_argument("--cycles", type=int, default=3)
+    run(measure(parser.parse_args()))
@@ -0,0 +1,49 @@
+"""Print the memory taken by each device entity.
+
+The size of an entity is the size of its attribute dict, of every key
+and value in it, recursively through dicts, and of its state container
+when it has one. Objects shared between entities are counted once.
+
+    python scripts/measure_entity_size.py
+"""
+
+from __future__ import annotations
+
+import sys
+
+from neviweb_harness import argument_parser, integration, run
+
+
+def deep_size(value, seen):
+    """Return the size of value and of the dicts, lists and tuples it
+    holds, not counting objects already in seen."""
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_size(key, seen) + deep_size(item, seen)
+            for key, item in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(deep_size(item, seen) for item in value)
+    return size
+
+
+async def measure(args):
+    async with integration(args, {}) as (fake, hass, module):
+        data = hass.data["neviweb130"]
+        seen = set()
+        total = 0
+        for coordinator in (data.coordinator, data.coordinator2):
+            for entity in coordinator.async_contexts():
+                size = deep_size(entity.__dict__, seen)
+                state = getattr(entity, "_state", None)
+                if hasattr(state, "__slots__"):
+                    size += deep_size(state, seen)
+                total += size
+                print("%-50s %8d bytes" % (entity.entity_id, size))
+        print("%-50s %8d bytes" % ("total", total))
+
+
+if __name__ == "__main__":
+    run(measure(argument_parser(__doc__.split("\n")[0]).parse_args()))
@@ -0,0 +1,43 @@
+"""Print the peak of requests waiting for Neviweb in each time window.
+
+Polls bunched at the start of each scan interval show as high peaks with
+idle windows between them, polls spread over the interval as low and
+steady peaks. The read rate limit is off so it does not spread polls
+itself.
+
+    python scripts/measure_poll_spread.py --devices 40 --latency 0.3
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from neviweb_harness import argument_parser, integration, run
+
+SCAN_INTERVAL = 20
+WINDOW = 5
+
+
+async def measure(args):
+    config = {"scan_interval": args.scan_interval,
+        "min_scan_interval": args.scan_interval,
+        "max_scan_interval": args.scan_interval, "read_rate": 0}
+    async with integration(args, config) as (fake, hass, module):
+        start = time.monotonic()
+        reads = fake.counts.get("attributes", 0)
+        await asyncio.sleep(args.duration)
+        peaks = []
+        while start + WINDOW <= time.monotonic():
+            peaks.append(fake.peak_in_flight(start, start + WINDOW))
+            start += WINDOW
+        print("peak requests waiting per %s s window: %s" % (WINDOW, peaks))
+        print("device reads: %s" % (fake.counts.get("attributes", 0) - reads))
+
+
+if __name__ == "__main__":
+    parser = argument_parser(__doc__.split("\n")[0])
+    parser.add_argument("--scan-interval", type=int, default=SCAN_INTERVAL)
+    parser.add_argument("--duration", type=int, default=60,
+        help="seconds measured after startup")
+    run(measure(parser.parse_args()))
@@ -0,0 +1,43 @@
+"""Estimate recorder bytes written per device and per day in each recorder
+mode.
+
+The integration runs once with recorder_mode full and once with
+recorder_mode reduced against the fake Neviweb server, whose room
+temperature and signal strength change at each read. The recorder meter
+of the integration gives, for each run, the states written and the bytes
+per device-day with every attribute and with recorded attributes only.
+
+    python scripts/measure_recorder.py --devices 20 --duration 120
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from neviweb_harness import argument_parser, integration, run
+
+SCAN_INTERVAL = 20
+MODES = ("full", "reduced")
+
+
+async def measure(args):
+    for mode in MODES:
+        config = {"scan_interval": args.scan_interval,
+            "min_scan_interval": args.scan_interval,
+            "max_scan_interval": args.scan_interval, "recorder_mode": mode}
+        async with integration(args, config) as (fake, hass, module):
+            data = hass.data["neviweb130"]
+            fake.changing = True
+            await asyncio.sleep(args.duration)
+            devices = sum(1 for coordinator in (data.coordinator,
+                data.coordinator2) for _ in coordinator.async_contexts())
+            print("recorder_mode %s: %s" % (mode,
+                data.meter.get_stats(devices)))
+
+
+if __name__ == "__main__":
+    parser = argument_parser(__doc__.split("\n")[0])
+    parser.add_argument("--scan-interval", type=int, default=SCAN_INTERVAL)
+    parser.add_argument("--duration", type=int, default=60,
+        help="seconds measured in each mode")
+    run(measure(parser.parse_args()))
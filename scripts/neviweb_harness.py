@@ -0,0 +1,90 @@
+"""Run the neviweb130 integration in a bare Home Assistant instance against
+the fake Neviweb server, for the measurement scripts.
+
+The integration is loaded from the checkout holding this script, or from
+the directory given by --package, so the same measurement can be run on
+a checkout of an older commit to compare.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from contextlib import asynccontextmanager
+import importlib
+import logging
+import os
+import shutil
+import sys
+import tempfile
+
+from homeassistant import config_entries, loader
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import (
+    area_registry,
+    device_registry,
+    entity,
+    entity_registry,
+    issue_registry,
+)
+from homeassistant.setup import async_setup_component
+
+from fake_neviweb import FakeNeviweb
+
+PACKAGE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def argument_parser(description):
+    """Return an argument parser with the options of every script."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--package", default=PACKAGE,
+        help="checkout holding custom_components/neviweb130")
+    parser.add_argument("--devices", type=int, default=0,
+        help="thermostats added to the 8 devices of the fake fleet")
+    parser.add_argument("--latency", type=float, default=0.02,
+        help="seconds the fake server takes to answer a device request")
+    return parser
+
+
+@asynccontextmanager
+async def integration(args, config):
+    """Start the fake server and Home Assistant with neviweb130 set up
+    with config, yield the fake server, hass and the integration module."""
+    fake = FakeNeviweb(args.devices, args.latency)
+    await fake.start()
+    config_dir = tempfile.mkdtemp()
+    os.symlink(os.path.join(os.path.abspath(args.package),
+        "custom_components"), os.path.join(config_dir, "custom_components"))
+    sys.path.insert(0, config_dir)
+    hass = HomeAssistant(config_dir)
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    entity.async_setup(hass)
+    for registry in (area_registry, device_registry, entity_registry,
+            issue_registry):
+        await registry.async_load(hass)
+    hass.state = CoreState.running
+    module = importlib.import_module("custom_components.neviweb130")
+    module.HOST = fake.url
+    module.LOGIN_URL = fake.url + "/api/login"
+    module.LOCATIONS_URL = fake.url + "/api/locations?account$id="
+    module.GATEWAY_DEVICE_URL = fake.url + "/api/devices?location$id="
+    module.DEVICE_DATA_URL = fake.url + "/api/device/"
+    config = dict(config, username="user", password="password")
+    try:
+        if not await async_setup_component(hass, "neviweb130",
+                {"neviweb130": config}):
+            raise RuntimeError("neviweb130 setup failed")
+        await hass.async_block_till_done()
+        yield fake, hass, module
+    finally:
+        await hass.async_stop()
+        await fake.stop()
+        shutil.rmtree(config_dir)
+
+
+def run(coroutine):
+    """Run coroutine with warnings only in the log."""
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(coroutine)
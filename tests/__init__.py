@@ -0,0 +1 @@
+"""Tests of the neviweb130 integration."""
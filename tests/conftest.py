@@ -0,0 +1,34 @@
+"""Fixtures of the neviweb130 tests."""
+
+from __future__ import annotations
+
+import pytest
+
+
+class Clock:
+    """Monotonic clock moved forward by the tests instead of by time."""
+
+    def __init__(self):
+        """Initialize the clock at an arbitrary time."""
+        self.now = 1000.0
+
+    def monotonic(self):
+        """Return the current time."""
+        return self.now
+
+    def sleep(self, seconds):
+        """Move the clock forward instead of sleeping."""
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Return a Clock and a function replacing the time module of a module
+    by it."""
+    fake = Clock()
+
+    def use(module):
+        monkeypatch.setattr(module, "time", fake)
+
+    fake.use = use
+    return fake
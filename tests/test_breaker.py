@@ -0,0 +1,108 @@
+"""Tests of the circuit breaker of device polls."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.neviweb130 import breaker
+from custom_components.neviweb130.breaker import (
+    REASON_DEACTIVATED,
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    Neviweb130CircuitBreaker,
+)
+
+ERRORS = {"DVCCOMMTO", "ReadTimeout", "DVCUNVLB"}
+
+
+@pytest.fixture
+def device_breaker(clock):
+    """Return a breaker opening after 3 failures for 60 to 240 seconds."""
+    clock.use(breaker)
+    return Neviweb130CircuitBreaker(ERRORS, 3, 60, 240)
+
+
+def test_opens_after_threshold(device_breaker):
+    assert not device_breaker.record("DVCCOMMTO")
+    assert not device_breaker.record("ReadTimeout")
+    assert device_breaker.closed
+    assert device_breaker.record("DVCCOMMTO")
+    assert device_breaker.state == STATE_OPEN
+    assert device_breaker.reason == "DVCCOMMTO"
+    assert not device_breaker.allow()
+    assert device_breaker.diagnostics() == {"state": STATE_OPEN,
+        "failures": 3, "trips": 1, "total_trips": 1, "reason": "DVCCOMMTO",
+        "retry_in": 60}
+
+
+def test_success_resets_failures(device_breaker):
+    device_breaker.record("DVCCOMMTO")
+    device_breaker.record("DVCCOMMTO")
+    assert not device_breaker.record(None)
+    assert device_breaker.failures == 0
+    device_breaker.record("DVCCOMMTO")
+    device_breaker.record("DVCCOMMTO")
+    assert device_breaker.closed
+
+
+def test_other_errors_count_as_success(device_breaker):
+    device_breaker.record("DVCCOMMTO")
+    device_breaker.record("DVCCOMMTO")
+    assert not device_breaker.record("DVCATTRNSPTD")
+    assert device_breaker.failures == 0
+
+
+def test_trips_at_once_when_unavailable(device_breaker):
+    assert device_breaker.record("DVCUNVLB")
+    assert device_breaker.state == STATE_OPEN
+
+
+def test_half_open_after_open_time(clock, device_breaker):
+    device_breaker.record("DVCUNVLB")
+    clock.sleep(59)
+    assert not device_breaker.allow()
+    clock.sleep(1)
+    assert device_breaker.allow()
+    assert device_breaker.state == STATE_HALF_OPEN
+    assert device_breaker.allow()
+
+
+def test_half_open_probe_closes(clock, device_breaker):
+    device_breaker.record("DVCUNVLB")
+    clock.sleep(60)
+    device_breaker.allow()
+    assert device_breaker.record(None)
+    assert device_breaker.closed
+    assert device_breaker.trips == 0
+    assert device_breaker.total_trips == 1
+
+
+def test_half_open_probe_failing_doubles_open_time(clock, device_breaker):
+    device_breaker.record("DVCUNVLB")
+    for open_time in (120, 240, 240):
+        clock.sleep(device_breaker.open_time())
+        assert device_breaker.allow()
+        assert device_breaker.record("DVCCOMMTO")
+        assert device_breaker.open_time() == open_time
+        assert device_breaker.retry_in() == open_time
+    assert device_breaker.total_trips == 4
+
+
+def test_open_ignores_results(device_breaker):
+    device_breaker.record("DVCUNVLB")
+    assert not device_breaker.record(None)
+    assert device_breaker.state == STATE_OPEN
+
+
+def test_deactivated_stays_open(clock, device_breaker):
+    device_breaker.set_active(False)
+    assert device_breaker.reason == REASON_DEACTIVATED
+    assert device_breaker.retry_in() is None
+    clock.sleep(10000)
+    assert not device_breaker.allow()
+    assert device_breaker.diagnostics()["retry_in"] is None
+    device_breaker.set_active(True)
+    assert device_breaker.state == STATE_CLOSED
+    assert device_breaker.reason is None
+    assert device_breaker.allow()
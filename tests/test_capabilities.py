@@ -0,0 +1,129 @@
+"""Tests of the probe of attributes not supported by a device."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.neviweb130 import capabilities
+from custom_components.neviweb130.capabilities import Neviweb130Capabilities
+
+SIGNATURE = (1123, "1.2.3")
+ATTRIBUTES = ["roomTemperature", "roomSetpoint", "rssi", "cycleLength",
+    "lockKeypad", "backlightAdaptive", "drStatus"]
+UNSUPPORTED = {"error": {"code": "DVCATTRNSPTD"}}
+
+
+class FakeStore:
+    """Store keeping the data saved in memory."""
+
+    def __init__(self, hass, version, key):
+        """Initialize an empty store."""
+        self.data = None
+        self.saves = 0
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay):
+        self.saves += 1
+        self.data = data_func()
+
+
+class FakeClient:
+    """Client refusing requests with one of unsupported attributes."""
+
+    def __init__(self, unsupported, error=None):
+        """Initialize the client, error is answered to every request with
+        only supported attributes."""
+        self.unsupported = unsupported
+        self.error = error
+        self.requests = []
+
+    async def get_device_attributes(self, device_id, attributes):
+        self.requests.append(attributes)
+        if any(attribute in self.unsupported for attribute in attributes):
+            return UNSUPPORTED
+        if self.error:
+            return self.error
+        return {attribute: 0 for attribute in attributes}
+
+
+@pytest.fixture
+def device_capabilities(monkeypatch):
+    """Return capabilities saved in a FakeStore."""
+    monkeypatch.setattr(capabilities, "Store", FakeStore)
+    return Neviweb130Capabilities(None)
+
+
+def probe(device_capabilities, client, signature=SIGNATURE):
+    """Run a probe of device 1 and return its result."""
+    return asyncio.run(device_capabilities.async_probe(client, 1, signature,
+        ATTRIBUTES))
+
+
+def test_unsupported_error():
+    assert capabilities.unsupported_error(UNSUPPORTED)
+    assert not capabilities.unsupported_error({"error": {"code": "DVCBUSY"}})
+    assert not capabilities.unsupported_error({"roomTemperature": 1})
+    assert not capabilities.unsupported_error(None)
+
+
+def test_probe_finds_attributes_by_halves(device_capabilities):
+    client = FakeClient({"cycleLength", "drStatus"})
+    assert probe(device_capabilities, client)
+    assert client.requests == [ATTRIBUTES,
+        ["roomTemperature", "roomSetpoint", "rssi"],
+        ["cycleLength", "lockKeypad", "backlightAdaptive", "drStatus"],
+        ["cycleLength", "lockKeypad"], ["cycleLength"], ["lockKeypad"],
+        ["backlightAdaptive", "drStatus"], ["backlightAdaptive"],
+        ["drStatus"]]
+    assert device_capabilities.supported(SIGNATURE, ATTRIBUTES) == [
+        "roomTemperature", "roomSetpoint", "rssi", "lockKeypad",
+        "backlightAdaptive"]
+    assert device_capabilities.get_stats() == {"probes": 1,
+        "probe_requests": 9,
+        "unsupported": {"1123:1.2.3": ["cycleLength", "drStatus"]}}
+    assert device_capabilities._store.data == {
+        "1123:1.2.3": ["cycleLength", "drStatus"]}
+
+
+def test_probe_once_per_model_and_firmware(device_capabilities):
+    client = FakeClient({"rssi"})
+    assert probe(device_capabilities, client)
+    requests = len(client.requests)
+    assert not probe(device_capabilities, client)
+    assert len(client.requests) == requests
+    # A new firmware is probed again
+    assert probe(device_capabilities, client, (1123, "1.2.4"))
+    assert device_capabilities.probes == 2
+
+
+def test_probe_all_supported(device_capabilities):
+    client = FakeClient(set())
+    assert not probe(device_capabilities, client)
+    assert client.requests == [ATTRIBUTES]
+    assert device_capabilities.supported(SIGNATURE, ATTRIBUTES) == ATTRIBUTES
+    assert device_capabilities.get_stats()["unsupported"] == {}
+    assert not probe(device_capabilities, client)
+    assert len(client.requests) == 1
+
+
+def test_probe_stopped_by_other_error(device_capabilities):
+    client = FakeClient({"rssi"}, {"error": {"code": "DVCCOMMTO"}})
+    assert not probe(device_capabilities, client)
+    assert device_capabilities.probes == 0
+    assert device_capabilities._store.saves == 0
+    # Probed again on next failure
+    client.error = None
+    assert probe(device_capabilities, client)
+
+
+def test_load_probed_capabilities(device_capabilities):
+    device_capabilities._store.data = {"1123:1.2.3": ["rssi"]}
+    asyncio.run(device_capabilities.async_load())
+    client = FakeClient({"rssi"})
+    assert not probe(device_capabilities, client)
+    assert client.requests == []
+    assert "rssi" not in device_capabilities.supported(SIGNATURE, ATTRIBUTES)
@@ -0,0 +1,213 @@
+"""Tests of the energy history import into long-term statistics."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from homeassistant.const import UnitOfEnergy
+import homeassistant.util.dt as dt_util
+
+from custom_components.neviweb130 import energy
+from custom_components.neviweb130.energy import (
+    Neviweb130EnergyImporter,
+    _bucket,
+)
+from custom_components.neviweb130.stats import DAILY, HOURLY, MONTHLY
+
+ENTITY = SimpleNamespace(unique_id=1, name="Thermo",
+    energy_unit=UnitOfEnergy.KILO_WATT_HOUR)
+
+
+class FakeStore:
+    """Store keeping the data saved in memory."""
+
+    def __init__(self, hass, version, key):
+        """Initialize an empty store."""
+        self.data = None
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay):
+        self.data = data_func()
+
+
+class FakeRecorder:
+    """Recorder keeping the statistics added and cleared."""
+
+    def __init__(self):
+        """Initialize without statistics."""
+        self.added = []
+        self.cleared = []
+
+    def add(self, hass, metadata, statistics):
+        self.added.append((metadata, statistics))
+
+    def async_clear_statistics(self, statistic_ids):
+        self.cleared += statistic_ids
+
+
+def at(text):
+    """Return a UTC datetime."""
+    return datetime.fromisoformat(text).replace(tzinfo=timezone.utc)
+
+
+def history(*items):
+    """Return a history of (date, Wh) items."""
+    return [{"date": date, "period": wh, "counter": 0} for date, wh in items]
+
+
+def sums(statistics):
+    """Return start and sum of statistics added."""
+    return [(item["start"], round(item["sum"], 3)) for item in statistics]
+
+
+@pytest.fixture(autouse=True)
+def utc():
+    """Run in UTC, so days and months start at midnight UTC."""
+    zone = dt_util.DEFAULT_TIME_ZONE
+    dt_util.set_default_time_zone(timezone.utc)
+    yield
+    dt_util.set_default_time_zone(zone)
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    """Return the FakeRecorder used by the importer."""
+    fake = FakeRecorder()
+    monkeypatch.setattr(energy, "Store", FakeStore)
+    monkeypatch.setattr(energy, "async_add_external_statistics", fake.add)
+    monkeypatch.setattr(energy, "get_instance", lambda hass: fake)
+    return fake
+
+
+@pytest.fixture
+def importer(recorder):
+    """Return an importer with the recorder loaded."""
+    hass = SimpleNamespace(config=SimpleNamespace(components={"recorder"}))
+    return Neviweb130EnergyImporter(hass)
+
+
+def run(importer, histories):
+    """Import histories of ENTITY."""
+    asyncio.run(importer.async_import(ENTITY, histories))
+
+
+@pytest.mark.parametrize("period, date, start, end", [
+    (HOURLY, "2026-01-02T05:30:00", "2026-01-02T05:00", "2026-01-02T06:00"),
+    (DAILY, "2026-01-31", "2026-01-31T00:00", "2026-02-01T00:00"),
+    (MONTHLY, "2025-12-15", "2025-12-01T00:00", "2026-01-01T00:00"),
+    (MONTHLY, "2026-02-01T00:00:00+00:00", "2026-02-01T00:00",
+        "2026-03-01T00:00"),
+])
+def test_bucket(period, date, start, end):
+    assert _bucket(period, {"date": date, "period": 1500}, 1000) == (
+        at(start), at(end), 1.5)
+
+
+@pytest.mark.parametrize("item", [
+    {"period": 100},
+    {"date": "soon", "period": 100},
+    {"date": None, "period": 100},
+    {"date": "2026-01-01", "period": None},
+])
+def test_bucket_unusable(item):
+    assert _bucket(HOURLY, item, 1000) is None
+
+
+def test_first_import_fills_with_coarser_history(importer, recorder):
+    run(importer, {
+        MONTHLY: history(("2025-12-01", 31000)),
+        DAILY: history(("2025-12-31", 1000), ("2026-01-01", 2000)),
+        HOURLY: history(("2026-01-02T00:00:00", 100),
+            ("2026-01-02T01:00:00", 200)),
+    })
+    metadata, statistics = recorder.added[0]
+    assert metadata["statistic_id"] == "neviweb130:energy_1"
+    assert metadata["name"] == "Thermo energy"
+    assert sums(statistics) == [(at("2025-12-01T00:00"), 31),
+        (at("2026-01-01T00:00"), 33), (at("2026-01-02T00:00"), 33.1),
+        (at("2026-01-02T01:00"), 33.3)]
+    assert importer._checkpoints["1"] == {"end": "2026-01-02T02:00:00+00:00",
+        "sum": 33.3, "periods": [HOURLY, DAILY, MONTHLY],
+        "tallies": {"day": ["2026-01-02T00:00:00+00:00", 0.3],
+            "month": ["2026-01-01T00:00:00+00:00", 2.3]}}
+    assert importer._store.data == importer._checkpoints
+
+
+def test_next_import_adds_new_periods_only(importer, recorder):
+    run(importer, {HOURLY: history(("2026-01-02T00:00:00", 100)),
+        DAILY: [], MONTHLY: []})
+    run(importer, {HOURLY: history(("2026-01-02T00:00:00", 100),
+        ("2026-01-02T01:00:00", 200)), DAILY: [], MONTHLY: []})
+    assert sums(recorder.added[1][1]) == [(at("2026-01-02T01:00"), 0.3)]
+    run(importer, {HOURLY: history(("2026-01-02T01:00:00", 200)),
+        DAILY: [], MONTHLY: []})
+    assert len(recorder.added) == 2
+
+
+def test_checkpoint_inside_day_adds_rest_of_day(importer, recorder):
+    run(importer, {HOURLY: history(("2026-01-02T00:00:00", 100),
+        ("2026-01-02T01:00:00", 200)), DAILY: [], MONTHLY: []})
+    # HA stopped until the next day, the day total covers the hours missed
+    run(importer, {HOURLY: history(("2026-01-03T00:00:00", 50)),
+        DAILY: history(("2026-01-02", 1000)), MONTHLY: []})
+    assert sums(recorder.added[1][1]) == [(at("2026-01-02T02:00"), 1),
+        (at("2026-01-03T00:00"), 1.05)]
+
+
+def test_checkpoint_inside_day_covered_by_hours(importer, recorder):
+    run(importer, {HOURLY: history(("2026-01-02T00:00:00", 100)),
+        DAILY: [], MONTHLY: []})
+    run(importer, {HOURLY: history(("2026-01-02T01:00:00", 200)),
+        DAILY: history(("2026-01-02", 1000)), MONTHLY: []})
+    assert sums(recorder.added[1][1]) == [(at("2026-01-02T01:00"), 0.3)]
+
+
+def test_checkpoint_without_tallies_skips_rest_of_day(importer, recorder):
+    importer._store.data = {"1": {"end": "2026-01-02T02:00:00+00:00",
+        "sum": 10.0}}
+    asyncio.run(importer.async_load())
+    run(importer, {HOURLY: history(("2026-01-03T00:00:00", 50)),
+        DAILY: history(("2026-01-02", 1000)), MONTHLY: []})
+    assert sums(recorder.added[0][1]) == [(at("2026-01-03T00:00"), 10.05)]
+
+
+def test_period_missing_from_first_import_rebuilds(importer, recorder):
+    run(importer, {HOURLY: history(("2026-01-02T00:00:00", 100))})
+    assert importer._checkpoints["1"]["periods"] == [HOURLY]
+    run(importer, {DAILY: history(("2026-01-01", 2000)), MONTHLY: []})
+    assert recorder.cleared == ["neviweb130:energy_1"]
+    assert sums(recorder.added[1][1]) == [(at("2026-01-01T00:00"), 2),
+        (at("2026-01-02T00:00"), 2.1)]
+    assert importer._checkpoints["1"]["periods"] == [HOURLY, DAILY, MONTHLY]
+    assert importer._histories == {}
+
+
+def test_periods_not_ended_are_not_imported(importer, recorder):
+    now = dt_util.now().replace(minute=0, second=0, microsecond=0)
+    run(importer, {HOURLY: history((now.isoformat(), 100)), DAILY: [],
+        MONTHLY: []})
+    assert recorder.added == []
+    assert importer._checkpoints == {}
+
+
+def test_no_import_without_recorder(importer, recorder):
+    importer._hass.config.components = set()
+    run(importer, {HOURLY: history(("2026-01-02T00:00:00", 100))})
+    assert recorder.added == []
+
+
+def test_reset_clears_statistics(importer, recorder):
+    run(importer, {HOURLY: history(("2026-01-02T00:00:00", 100)),
+        DAILY: [], MONTHLY: []})
+    importer.async_reset(ENTITY)
+    assert importer._checkpoints == {}
+    assert recorder.cleared == ["neviweb130:energy_1"]
+    run(importer, {HOURLY: history(("2026-01-02T00:00:00", 100)),
+        DAILY: [], MONTHLY: []})
+    assert sums(recorder.added[1][1]) == [(at("2026-01-02T00:00"), 0.1)]
@@ -0,0 +1,100 @@
+"""Tests of the token bucket rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.neviweb130 import limiter
+from custom_components.neviweb130.limiter import (
+    READ,
+    STAT,
+    WRITE,
+    Neviweb130RateLimiter,
+    TokenBucket,
+)
+
+
+@pytest.fixture(autouse=True)
+def fake_time(clock):
+    """Run the limiter on the test clock."""
+    clock.use(limiter)
+    return clock
+
+
+def test_bucket_allows_burst_then_delays(clock):
+    bucket = TokenBucket(2, 3)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    # Waiting callers are served in order, each one token later
+    assert bucket.reserve() == pytest.approx(1.0)
+    assert bucket.requests == 5
+    assert bucket.delayed == 2
+    assert bucket.delay == pytest.approx(1.5)
+
+
+def test_bucket_refills_at_rate_up_to_burst(clock):
+    bucket = TokenBucket(2, 3)
+    for _ in range(3):
+        bucket.reserve()
+    clock.sleep(1)
+    assert [bucket.reserve() for _ in range(2)] == [0, 0]
+    assert bucket.reserve() > 0
+    clock.sleep(60)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_bucket_rate_zero_never_delays():
+    bucket = TokenBucket(0, 1)
+    assert [bucket.reserve() for _ in range(100)] == [0] * 100
+    assert bucket.requests == 100
+    assert bucket.delayed == 0
+
+
+def test_bucket_burst_at_least_one():
+    bucket = TokenBucket(1, 0)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(1)
+
+
+@pytest.mark.parametrize("method, url, kind", [
+    ("POST", "https://neviweb.com/api/login", None),
+    ("GET", "https://neviweb.com/api/device/1/energy/daily", STAT),
+    ("PUT", "https://neviweb.com/api/device/1/attribute", WRITE),
+    ("post", "https://neviweb.com/api/device/1/attribute", WRITE),
+    ("GET", "https://neviweb.com/api/device/1/attribute", READ),
+    ("GET", "https://neviweb.com/api/devices?location$id=1", READ),
+])
+def test_request_kind(method, url, kind):
+    assert Neviweb130RateLimiter.request_kind(method, url) == kind
+
+
+def test_limiter_budgets_are_separate(clock):
+    rate_limiter = Neviweb130RateLimiter(1, 1, 1, 1, 1, 1)
+    read = "https://neviweb.com/api/device/1/attribute"
+    stat = "https://neviweb.com/api/device/1/energy/hourly"
+    assert rate_limiter.reserve("GET", read) == 0
+    assert rate_limiter.reserve("GET", read) == pytest.approx(1)
+    assert rate_limiter.reserve("PUT", read) == 0
+    assert rate_limiter.reserve("GET", stat) == 0
+    stats = rate_limiter.get_stats()
+    assert stats[READ] == {"requests": 2, "delayed": 1, "delay": 1.0}
+    assert stats[WRITE] == {"requests": 1, "delayed": 0, "delay": 0.0}
+    assert stats[STAT] == {"requests": 1, "delayed": 0, "delay": 0.0}
+
+
+def test_limiter_never_delays_login(clock):
+    rate_limiter = Neviweb130RateLimiter(1, 1, 1, 1, 1, 1)
+    login = "https://neviweb.com/api/login"
+    assert [rate_limiter.reserve("POST", login) for _ in range(5)] == [0] * 5
+    assert all(kind["requests"] == 0
+        for kind in rate_limiter.get_stats().values())
+
+
+def test_limiter_wait_sleeps_for_the_delay(clock):
+    rate_limiter = Neviweb130RateLimiter(4, 1, 1, 1, 1, 1)
+    url = "https://neviweb.com/api/device/1/attribute"
+    assert rate_limiter.wait("GET", url) == 0
+    start = clock.now
+    assert rate_limiter.wait("GET", url) == pytest.approx(0.25)
+    assert clock.now - start == pytest.approx(0.25)
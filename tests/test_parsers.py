@@ -0,0 +1,135 @@
+"""Tests of the declarative device data parsers."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.neviweb130 import parsers
+from custom_components.neviweb130.parsers import (
+    KEEP,
+    Field,
+    chain,
+    compile_parser,
+    entry,
+    if_on,
+    item,
+    last_parse,
+    parse,
+)
+from custom_components.neviweb130.state import Neviweb130DeviceState
+
+
+class SampleState(Neviweb130DeviceState):
+    """State of the parsers tested."""
+
+    __slots__ = ("temperature", "setpoint", "load", "error", "display",
+        "mode")
+
+    _defaults = {"mode": "auto"}
+
+
+FIELDS = (
+    Field("temperature", "roomTemperature", item("value")),
+    Field("setpoint", "roomSetpoint", None, 5),
+    Field("load", "loadWattOutput1", if_on("value")),
+    Field("error", "errorCodeSet1", chain(entry("temperature"), str.upper),
+        KEEP),
+    Field("display", ("roomTemperatureDisplay", "temperatureFormat"),
+        lambda value, unit: "%s %s" % (value, unit)),
+    Field("mode", "systemMode", None, KEEP),
+    Field("rssi", "rssi"),
+)
+
+DATA = {
+    "roomTemperature": {"value": 20.5},
+    "roomSetpoint": 21,
+    "loadWattOutput1": {"status": "on", "value": 100},
+    "errorCodeSet1": {"temperature": "err"},
+    "roomTemperatureDisplay": 20.5,
+    "temperatureFormat": "celsius",
+    "systemMode": "manual",
+    "rssi": -60,
+}
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    """Keep parsers and parse times of the tests apart."""
+    monkeypatch.setattr(parsers, "PARSERS", {})
+    monkeypatch.setattr(parsers, "_DEVICE_PARSES", {})
+
+
+def test_parser_sets_every_slot():
+    parser = compile_parser("sample", SampleState, FIELDS)
+    state = SampleState()
+    assert parser(state, DATA) == []
+    assert state.as_dict() == {"rssi": -60, "temperature": 20.5,
+        "setpoint": 21, "load": 100, "error": "ERR",
+        "display": "20.5 celsius", "mode": "manual"}
+    assert parsers.PARSERS["sample"] == (SampleState, parser)
+
+
+def test_parser_none_values():
+    parser = compile_parser("sample", SampleState, FIELDS)
+    state = SampleState()
+    state.error = "ERR"
+    data = dict(DATA, roomTemperature=None, roomSetpoint=None,
+        loadWattOutput1={"status": "off", "value": 100}, errorCodeSet1={},
+        systemMode=None)
+    assert parser(state, data) == []
+    assert state.temperature is None
+    assert state.setpoint == 5
+    assert state.load is None
+    assert state.error == "ERR"
+    assert state.mode == "auto"
+
+
+def test_parser_keeps_slots_of_bad_attributes():
+    parser = compile_parser("sample", SampleState, FIELDS)
+    state = SampleState()
+    state.temperature = 19
+    data = dict(DATA, roomTemperature=20)
+    del data["rssi"]
+    del data["temperatureFormat"]
+    assert parser(state, data) == ["roomTemperature",
+        ("roomTemperatureDisplay", "temperatureFormat"), "rssi"]
+    assert state.temperature == 19
+    assert state.display is None
+    assert state.setpoint == 21
+
+
+def test_compile_rejects_unknown_slots():
+    with pytest.raises(ValueError, match="missing"):
+        compile_parser("sample", SampleState, (Field("missing", "rssi"),))
+    assert "sample" not in parsers.PARSERS
+
+
+def test_parse_records_last_parse(caplog):
+    parser = compile_parser("sample", SampleState, FIELDS)
+    assert last_parse("Thermo") is None
+    with caplog.at_level("DEBUG", logger=parsers.__name__):
+        parse(parser, SampleState(), {"rssi": -60}, "Thermo")
+    result = last_parse("Thermo")
+    assert result["parser"] == "sample"
+    assert result["last_parse_us"] >= 0
+    assert "Attributes missing or not parsed for Thermo" in caplog.text
+
+
+def test_light_parser():
+    from custom_components.neviweb130.light import LIGHT_PARSER
+    from custom_components.neviweb130.state import Neviweb130LightState
+
+    state = Neviweb130LightState()
+    data = {"statusLedOnIntensity": 50,
+        "statusLedOnColor": {"red": 0, "green": 0, "blue": 255},
+        "statusLedOffIntensity": 10,
+        "statusLedOffColor": {"red": 1, "green": 2, "blue": 3},
+        "onOff": "on", "loadWattOutput1": {"status": "on", "value": 60},
+        "errorCodeSet1": {}, "lockKeypad": "unlocked", "powerTimer": 0,
+        "rssi": -70}
+    assert LIGHT_PARSER(state, data) == []
+    assert state.led_on == "50,0,0,255"
+    assert state.led_off == "10,1,2,3"
+    assert state.wattage == 60
+    assert state.wattage_status == "on"
+    assert state.temp_status is None
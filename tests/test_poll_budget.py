@@ -0,0 +1,71 @@
+"""Tests of the poll interval budget."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.neviweb130.coordinator import Neviweb130PollBudget
+
+
+def budget(max_polls=0, scan=60, minimum=15, maximum=600):
+    """Return a budget with intervals in seconds."""
+    return Neviweb130PollBudget(timedelta(seconds=scan),
+        timedelta(seconds=minimum), timedelta(seconds=maximum), max_polls)
+
+
+def test_new_device_at_scan_interval():
+    assert budget().interval(1) == 60
+
+
+def test_unchanged_device_slows_down_to_max_interval():
+    poll_budget = budget()
+    assert poll_budget.adapt(1, False) == 75
+    assert poll_budget.adapt(1, False) == pytest.approx(93.75)
+    for _ in range(20):
+        poll_budget.adapt(1, False)
+    assert poll_budget.interval(1) == 600
+
+
+def test_changed_device_speeds_up_to_min_interval():
+    poll_budget = budget(max_polls=1000)
+    assert poll_budget.adapt(1, True) == 30
+    assert poll_budget.adapt(1, True) == 15
+    assert poll_budget.adapt(1, True) == 15
+
+
+def test_no_budget_never_faster_than_scan_interval():
+    poll_budget = budget()
+    assert poll_budget.adapt(1, True) == 60
+    poll_budget.adapt(2, False)
+    # Device 2 polled less often leaves polls to device 1
+    assert poll_budget.adapt(1, True) == pytest.approx(3600 / (120 - 48))
+
+
+def test_budget_shared_between_devices():
+    poll_budget = budget(max_polls=240)
+    for _ in range(3):
+        poll_budget.adapt(1, True)
+    assert poll_budget.interval(1) == 15
+    # 240 polls per hour taken by device 1, device 2 gets the longest
+    assert poll_budget.adapt(2, True) == 600
+    assert poll_budget.polls_per_hour() == 246
+
+
+def test_bounds_limit_scan_interval():
+    poll_budget = budget(scan=60, minimum=90, maximum=30)
+    assert poll_budget.min_interval == 60
+    assert poll_budget.max_interval == 60
+    assert poll_budget.adapt(1, True) == 60
+    assert poll_budget.adapt(1, False) == 60
+
+
+def test_release_frees_the_budget():
+    poll_budget = budget(max_polls=240)
+    for _ in range(3):
+        poll_budget.adapt(1, True)
+    poll_budget.release(1)
+    assert poll_budget.interval(1) == 60
+    assert poll_budget.polls_per_hour() == 0
+    assert poll_budget.adapt(2, True) == 30
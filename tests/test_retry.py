@@ -0,0 +1,72 @@
+"""Tests of the retry policy."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.neviweb130 import retry
+from custom_components.neviweb130.retry import Neviweb130RetryPolicy, error_code
+
+
+@pytest.fixture(autouse=True)
+def fake_time(clock, monkeypatch):
+    """Run the policy on the test clock, with the highest jitter."""
+    clock.use(retry)
+    monkeypatch.setattr(retry.random, "uniform", lambda low, high: high)
+    return clock
+
+
+@pytest.mark.parametrize("data, code", [
+    ({"error": {"code": "DVCBUSY"}}, "DVCBUSY"),
+    ({"errorCode": "SVCERR"}, "SVCERR"),
+    ({"roomTemperature": {"value": 20}}, None),
+    ([{"id": 1}], None),
+    (None, None),
+])
+def test_error_code(data, code):
+    assert error_code(data) == code
+
+
+def test_delay_doubles_up_to_max_delay():
+    policy = Neviweb130RetryPolicy(10, 0.5, 3, 100, 60)
+    assert [policy.next_delay(attempt, "DVCBUSY") for attempt in range(5)] \
+        == [0.5, 1, 2, 3, 3]
+
+
+def test_delay_is_jittered_from_zero(monkeypatch):
+    calls = []
+    monkeypatch.setattr(retry.random, "uniform",
+        lambda low, high: calls.append((low, high)) or low)
+    policy = Neviweb130RetryPolicy(3, 1, 10, 10, 60)
+    assert policy.next_delay(2, "DVCCOMMTO") == 0
+    assert calls == [(0, 4)]
+
+
+def test_error_not_retryable():
+    policy = Neviweb130RetryPolicy(3, 1, 10, 10, 60)
+    assert policy.next_delay(0, "DVCATTRNSPTD") is None
+    assert policy.next_delay(0, None) is None
+    assert policy.get_stats() == {"retries": 0, "retries_by_code": {},
+        "given_up": 0, "budget_exhausted": 0}
+
+
+def test_gives_up_after_max_retries():
+    policy = Neviweb130RetryPolicy(2, 1, 10, 10, 60)
+    assert policy.next_delay(1, "DVCBUSY") is not None
+    assert policy.next_delay(2, "DVCBUSY") is None
+    assert policy.get_stats()["given_up"] == 1
+
+
+def test_budget_limits_retries_per_cycle(clock):
+    policy = Neviweb130RetryPolicy(3, 1, 10, 2, 60)
+    assert policy.next_delay(0, "DVCBUSY") is not None
+    assert policy.next_delay(0, "ReadTimeout") is not None
+    assert policy.next_delay(0, "DVCBUSY") is None
+    clock.sleep(59)
+    assert policy.next_delay(0, "DVCBUSY") is None
+    assert policy.get_stats() == {"retries": 2,
+        "retries_by_code": {"DVCBUSY": 1, "ReadTimeout": 1},
+        "given_up": 0, "budget_exhausted": 2}
+    clock.sleep(1)
+    assert policy.next_delay(0, "SVCERR") is not None
+    assert policy.get_stats()["retries"] == 3